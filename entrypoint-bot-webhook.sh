@@ -0,0 +1,15 @@
+#!/bin/sh
+set -e
+
+# The app splits the rate limit and turns off per-process caches by
+# `webhook.workers`, so granian runs exactly that many workers
+BOT_WORKERS=$(uv run python -c "from src.infrastructure.config import load_config; print(load_config().webhook.workers)")
+
+echo "Starting bot webhook with $BOT_WORKERS workers..."
+
+exec uv run granian src.presentation.bot.webhook:create_app \
+    --factory \
+    --host 0.0.0.0 --port 8081 \
+    --interface asgi \
+    --workers "$BOT_WORKERS" \
+    --log --log-level info
@@ -0,0 +1,2 @@
+# Broadcast messages, sent with /broadcast <key>
+broadcast-example = Hello! Thank you for using the bot.
@@ -5,12 +5,35 @@ stats-overview =
     Referred: { $referred } ({ $referred_pct }%)
     Organic: { $organic } ({ $organic_pct }%)
 
+    Updated: { $computed_at }
+
+stats-estimated = ≈ Estimates from table statistics and a sample, not exact counts
+
 stats-top-inviters-btn = 🏆 Top inviters
 
 stats-top-inviters-header = 🏆 Top { $limit } inviters:
 
 stats-no-inviters = No inviters yet
 
+stats-daily-btn = 📈 Daily stats
+
+stats-daily-period-btn = { $days } days
+
+stats-daily-overview =
+    📈 Last { $days } days
+
+    New users: { $new }
+    Referred: { $referred } ({ $referred_pct }%)
+    Organic: { $organic } ({ $organic_pct }%)
+    Active users: { $active_avg } a day on average
+    Languages: { $languages }
+
+stats-daily-day = { $day }: +{ $new } new, { $active } active
+
+stats-daily-today = today
+
+stats-daily-empty = No daily stats yet: they appear after the first rollup.
+
 referral-info =
     🔗 Your referral link:
     { $link }
@@ -0,0 +1,2 @@
+# Сообщения рассылок, отправляются командой /broadcast <ключ>
+broadcast-example = Привет! Спасибо, что пользуетесь ботом.
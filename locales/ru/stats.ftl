@@ -5,12 +5,35 @@ stats-overview =
     По рефералам: { $referred } ({ $referred_pct }%)
     Органика: { $organic } ({ $organic_pct }%)
 
+    Обновлено: { $computed_at }
+
+stats-estimated = ≈ Оценка по статистике таблицы и выборке, а не точный подсчёт
+
 stats-top-inviters-btn = 🏆 Топ инвайтеров
 
 stats-top-inviters-header = 🏆 Топ-{ $limit } инвайтеров:
 
 stats-no-inviters = Пока нет инвайтеров
 
+stats-daily-btn = 📈 По дням
+
+stats-daily-period-btn = { $days } дн.
+
+stats-daily-overview =
+    📈 За последние { $days } дн.
+
+    Новых пользователей: { $new }
+    По рефералам: { $referred } ({ $referred_pct }%)
+    Органика: { $organic } ({ $organic_pct }%)
+    Активных: { $active_avg } в день в среднем
+    Языки: { $languages }
+
+stats-daily-day = { $day }: +{ $new } новых, { $active } активных
+
+stats-daily-today = сегодня
+
+stats-daily-empty = Статистики по дням пока нет: она появится после первого подсчёта.
+
 referral-info =
     🔗 Ваша реферальная ссылка:
     { $link }
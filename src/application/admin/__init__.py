@@ -3,11 +3,33 @@ from .check_alive import (
     CheckAliveInteractor,
     CheckAliveProgress,
     CheckAliveResult,
+    GetRunningCheckRunsInteractor,
+    SampleCheckInput,
+    SampleEstimate,
+    StartCheckAliveInteractor,
 )
+from .rollup import (
+    DailyStatsDTO,
+    DailyStatsSummary,
+    GetDailyStatsInteractor,
+    RollupDailyStatsInteractor,
+    summarize,
+)
+from .sampling import Estimate
 
 __all__ = [
     "CheckAliveInput",
     "CheckAliveInteractor",
     "CheckAliveProgress",
     "CheckAliveResult",
+    "DailyStatsDTO",
+    "DailyStatsSummary",
+    "Estimate",
+    "GetDailyStatsInteractor",
+    "GetRunningCheckRunsInteractor",
+    "RollupDailyStatsInteractor",
+    "SampleCheckInput",
+    "SampleEstimate",
+    "StartCheckAliveInteractor",
+    "summarize",
 ]
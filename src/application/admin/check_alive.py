@@ -1,6 +1,8 @@
 import asyncio
-from collections.abc import AsyncGenerator
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Callable
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
 import logging
 
 from aiogram import Bot
@@ -11,12 +13,35 @@ from aiogram.exceptions import (
     TelegramRetryAfter,
 )
 
-from src.domain.admin import AdminRepository
+from src.application.admin.sampling import Estimate, estimate_share, sample_size
+from src.application.common.concurrency import AdaptiveConcurrency
+from src.application.common.interactor import Interactor
+from src.application.common.transaction import TransactionManager
+from src.domain.admin import (
+    AdminRepository,
+    CheckRun,
+    CheckRunRepository,
+    CheckRunStatus,
+    Reachability,
+    ReachabilityCheck,
+)
 
 logger = logging.getLogger(__name__)
 
-BATCH_SIZE = 20
 PROGRESS_INTERVAL = 100
+# User ids read from the database per query; also the most ids held at once
+PAGE_SIZE = 1000
+# Checks in flight: start low and let AdaptiveConcurrency find the rate
+INITIAL_CONCURRENCY = 10
+MAX_CONCURRENCY = 100
+# Slower checks mean the bot session is queueing them, so back off
+TARGET_LATENCY = 2.0
+# Flood-waited users are re-queued this many times before giving up
+MAX_ATTEMPTS = 3
+# Users checked between two commits of their results and the run checkpoint
+CHECKPOINT_INTERVAL = 1000
+# Default precision of a sampled check: shares within +-3 points at 95%
+SAMPLE_MARGIN = 0.03
 
 
 @dataclass
@@ -28,17 +53,56 @@ class CheckAliveResult:
     rate_limited: int = 0
     other_errors: int = 0
 
+    @property
+    def processed(self) -> int:
+        return (
+            self.alive
+            + self.blocked
+            + self.deleted
+            + self.rate_limited
+            + self.other_errors
+        )
+
+
+@dataclass(frozen=True)
+class SampleEstimate:
+    """Shares of the filtered users estimated from a random sample."""
+
+    population: int
+    # Sampled users with a conclusive result; the shares are of these
+    sample_size: int
+    alive: Estimate
+    blocked: Estimate
+    deleted: Estimate
+    # The population itself was estimated rather than counted
+    population_estimated: bool = False
+
 
 @dataclass
 class CheckAliveProgress:
     processed: int
     total: int
     current_result: CheckAliveResult
+    # Set on the last progress of a sampled check
+    estimate: SampleEstimate | None = None
+    # The total is an estimate until the check is over
+    total_estimated: bool = False
 
 
 @dataclass
 class CheckAliveInput:
+    created_by: int
     active_since_days: int | None = None
+    # Skip users whose reachability was checked within this many days
+    unchecked_for_days: int | None = None
+
+
+@dataclass
+class SampleCheckInput:
+    active_since_days: int | None = None
+    unchecked_for_days: int | None = None
+    # Target half-width of the confidence intervals
+    margin: float = SAMPLE_MARGIN
 
 
 @dataclass
@@ -48,9 +112,113 @@ class UserCheckResult:
     error_type: str | None = None
 
 
+# Check outcomes worth remembering; other errors say nothing about the user
+REACHABILITY_BY_ERROR: dict[str | None, Reachability] = {
+    None: Reachability.ALIVE,
+    "blocked": Reachability.BLOCKED,
+    "deleted": Reachability.DELETED,
+}
+
+
+class StartCheckAliveInteractor(Interactor[CheckAliveInput, CheckRun]):
+    """Create a run to pass to `CheckAliveInteractor`.
+
+    Runs left unfinished are abandoned: only the latest one can be resumed.
+    """
+
+    def __init__(
+        self,
+        check_run_repository: CheckRunRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._check_run_repo = check_run_repository
+        self._transaction_manager = transaction_manager
+
+    async def __call__(self, data: CheckAliveInput) -> CheckRun:
+        await self._check_run_repo.abandon_running()
+        run = await self._check_run_repo.create(
+            created_by=data.created_by,
+            active_since_days=data.active_since_days,
+            unchecked_for_days=data.unchecked_for_days,
+        )
+        await self._transaction_manager.commit()
+        return run
+
+
+class GetRunningCheckRunsInteractor(Interactor[None, list[CheckRun]]):
+    def __init__(self, check_run_repository: CheckRunRepository) -> None:
+        self._check_run_repo = check_run_repository
+
+    async def __call__(self, data: None = None) -> list[CheckRun]:
+        return await self._check_run_repo.get_running()
+
+
+@dataclass
+class _Pipeline:
+    """State shared by the producer, the workers and the progress loop."""
+
+    # Run to checkpoint; None for a sampled check, which is not resumable
+    run: CheckRun | None
+    # One slot per id read but not passed by the checkpoint yet
+    capacity: asyncio.Semaphore
+    concurrency: AdaptiveConcurrency
+    # Ids handed to the workers, in order, until the checkpoint passes them
+    produced: deque[int] = field(default_factory=deque)
+    # Final results of produced ids, until the checkpoint passes them
+    done: dict[int, UserCheckResult] = field(default_factory=dict)
+    # Users the checkpoint passed
+    passed: int = 0
+    # (user id, attempt) waiting for a worker
+    pending: asyncio.Queue[tuple[int, int]] = field(default_factory=asyncio.Queue)
+    # Final results; None once the producer is done
+    finished: asyncio.Queue[UserCheckResult | None] = field(
+        default_factory=asyncio.Queue
+    )
+    # Results of users the checkpoint passed, not saved yet
+    checked: list[ReachabilityCheck] = field(default_factory=list)
+
+
+async def _iterate(user_ids: list[int]) -> AsyncIterator[int]:
+    for user_id in user_ids:
+        yield user_id
+
+
 class CheckAliveInteractor:
-    def __init__(self, admin_repository: AdminRepository) -> None:
+    def __init__(
+        self,
+        admin_repository: AdminRepository,
+        check_run_repository: CheckRunRepository,
+        transaction_manager: TransactionManager,
+        page_size: int = PAGE_SIZE,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+        approximate_counts: bool = False,
+    ) -> None:
         self._admin_repo = admin_repository
+        self._check_run_repo = check_run_repository
+        self._transaction_manager = transaction_manager
+        self._page_size = page_size
+        self._checkpoint_interval = checkpoint_interval
+        self._clock = clock
+        # Estimate totals instead of counting the users to check
+        self._approximate_counts = approximate_counts
+
+    async def _count_users(
+        self,
+        active_since_days: int | None,
+        unchecked_for_days: int | None,
+        after_user_id: int | None = None,
+    ) -> int:
+        count = (
+            self._admin_repo.estimate_users
+            if self._approximate_counts
+            else self._admin_repo.count_users
+        )
+        return await count(
+            active_since_days=active_since_days,
+            unchecked_for_days=unchecked_for_days,
+            after_user_id=after_user_id,
+        )
 
     async def _check_user(self, bot: Bot, user_id: int) -> UserCheckResult:
         """Check if a single user is alive by sending chat action."""
@@ -66,9 +234,8 @@ class CheckAliveInteractor:
                 )
             logger.warning("TelegramBadRequest for user %d: %s", user_id, e)
             return UserCheckResult(user_id=user_id, success=False, error_type="other")
-        except TelegramRetryAfter as e:
-            logger.warning("Rate limited, waiting %d seconds", e.retry_after)
-            await asyncio.sleep(e.retry_after)
+        except TelegramRetryAfter:
+            # The bot session already paused all requests; worth a retry later
             return UserCheckResult(
                 user_id=user_id, success=False, error_type="rate_limited"
             )
@@ -76,51 +243,223 @@ class CheckAliveInteractor:
             logger.exception("Unexpected error checking user %d", user_id)
             return UserCheckResult(user_id=user_id, success=False, error_type="other")
 
-    async def _process_batch(
-        self, bot: Bot, user_ids: list[int]
-    ) -> list[UserCheckResult]:
-        """Process a batch of users concurrently."""
-        tasks = [self._check_user(bot, user_id) for user_id in user_ids]
-        return await asyncio.gather(*tasks)
+    @staticmethod
+    def _count(
+        result: CheckAliveResult | CheckRun, check_result: UserCheckResult
+    ) -> None:
+        if check_result.success:
+            result.alive += 1
+        elif check_result.error_type == "blocked":
+            result.blocked += 1
+        elif check_result.error_type == "deleted":
+            result.deleted += 1
+        elif check_result.error_type == "rate_limited":
+            result.rate_limited += 1
+        else:
+            result.other_errors += 1
+
+    def _advance(self, pipeline: _Pipeline) -> None:
+        """Move the checkpoint past the leading users with a final result."""
+        run = pipeline.run
+        while pipeline.produced and pipeline.produced[0] in pipeline.done:
+            user_id = pipeline.produced.popleft()
+            check_result = pipeline.done.pop(user_id)
+            pipeline.passed += 1
+            if run is not None:
+                self._count(run, check_result)
+                run.last_user_id = user_id
+            reachability = REACHABILITY_BY_ERROR.get(check_result.error_type)
+            if reachability is not None:
+                pipeline.checked.append(
+                    ReachabilityCheck(user_id, reachability, self._clock())
+                )
+            pipeline.capacity.release()
+
+    async def _checkpoint(self, pipeline: _Pipeline) -> None:
+        # Snapshot first: workers move the checkpoint on during the awaits
+        run = replace(pipeline.run) if pipeline.run is not None else None
+        checks = pipeline.checked.copy()
+        pipeline.checked.clear()
+        await self._admin_repo.save_reachability(checks)
+        if run is not None:
+            await self._check_run_repo.save(run)
+        await self._transaction_manager.commit()
+
+    async def _produce(self, pipeline: _Pipeline, user_ids: AsyncIterable[int]) -> None:
+        # The only task touching the database: the id stream queries
+        # between items, so saving here never overlaps with it
+        saved = 0
+        try:
+            async for user_id in user_ids:
+                await pipeline.capacity.acquire()
+                pipeline.produced.append(user_id)
+                pipeline.pending.put_nowait((user_id, 1))
+                if pipeline.passed - saved >= self._checkpoint_interval:
+                    saved = pipeline.passed
+                    await self._checkpoint(pipeline)
+            # All slots are back once the checkpoint passed every id
+            for _ in range(self._page_size):
+                await pipeline.capacity.acquire()
+            if pipeline.run is not None:
+                pipeline.run.status = CheckRunStatus.COMPLETED
+            await self._checkpoint(pipeline)
+        finally:
+            pipeline.finished.put_nowait(None)
+
+    async def _work(self, pipeline: _Pipeline, bot: Bot) -> None:
+        while True:
+            user_id, attempt = await pipeline.pending.get()
+            started = await pipeline.concurrency.acquire()
+            check_result = await self._check_user(bot, user_id)
+            flood_wait = check_result.error_type == "rate_limited"
+            await pipeline.concurrency.release(started, overloaded=flood_wait)
+            if flood_wait and attempt < MAX_ATTEMPTS:
+                pipeline.pending.put_nowait((user_id, attempt + 1))
+                continue
+            pipeline.done[user_id] = check_result
+            pipeline.finished.put_nowait(check_result)
+            self._advance(pipeline)
+
+    async def _check(
+        self,
+        bot: Bot,
+        user_ids: AsyncIterable[int],
+        result: CheckAliveResult,
+        run: CheckRun | None = None,
+        total_estimated: bool = False,
+    ) -> AsyncGenerator[CheckAliveProgress]:
+        """Check `user_ids`, counting into `result`; yields intermediate progress.
+
+        A producer streams user ids into a queue and a pool of workers
+        checks them, as many at a time as `AdaptiveConcurrency` allows.
+        Flood-waited users go back to the queue.
+        """
+        pipeline = _Pipeline(
+            run=run,
+            capacity=asyncio.Semaphore(self._page_size),
+            concurrency=AdaptiveConcurrency(
+                initial=INITIAL_CONCURRENCY,
+                maximum=MAX_CONCURRENCY,
+                target_latency=TARGET_LATENCY,
+            ),
+        )
+        producer = asyncio.create_task(self._produce(pipeline, user_ids))
+        workers = [
+            asyncio.create_task(self._work(pipeline, bot))
+            for _ in range(MAX_CONCURRENCY)
+        ]
+        try:
+            while (check_result := await pipeline.finished.get()) is not None:
+                self._count(result, check_result)
+                if result.processed % PROGRESS_INTERVAL == 0:
+                    yield CheckAliveProgress(
+                        processed=result.processed,
+                        total=max(result.total, result.processed),
+                        current_result=result,
+                        total_estimated=total_estimated,
+                    )
+            # Re-raises an error of the id stream
+            await producer
+        finally:
+            for task in (producer, *workers):
+                task.cancel()
+            await asyncio.gather(producer, *workers, return_exceptions=True)
 
     async def execute(
         self,
         bot: Bot,
-        data: CheckAliveInput,
+        run_id: int,
+    ) -> AsyncGenerator[CheckAliveProgress]:
+        """
+        Run or resume the alive check and yield progress updates.
+
+        The run's checkpoint is the last user id before which every user
+        has a result; it is committed with those results every
+        CHECKPOINT_INTERVAL users, and a resumed run starts after it with
+        the counters saved there.
+
+        Yields CheckAliveProgress every PROGRESS_INTERVAL users and once
+        more when the run is completed. Yields nothing if the run is not
+        found or already finished.
+        """
+        run = await self._check_run_repo.get(run_id)
+        if run is None or run.status != CheckRunStatus.RUNNING:
+            return
+
+        remaining = await self._count_users(
+            active_since_days=run.active_since_days,
+            unchecked_for_days=run.unchecked_for_days,
+            after_user_id=run.last_user_id,
+        )
+        result = CheckAliveResult(
+            total=run.processed + remaining,
+            alive=run.alive,
+            blocked=run.blocked,
+            deleted=run.deleted,
+            rate_limited=run.rate_limited,
+            other_errors=run.other_errors,
+        )
+        user_ids = self._admin_repo.iter_user_ids(
+            active_since_days=run.active_since_days,
+            page_size=self._page_size,
+            unchecked_for_days=run.unchecked_for_days,
+            after_user_id=run.last_user_id,
+        )
+        async for progress in self._check(
+            bot, user_ids, result, run, total_estimated=self._approximate_counts
+        ):
+            yield progress
+
+        # Users may join or go idle after the count was taken
+        result.total = result.processed
+        yield CheckAliveProgress(
+            processed=result.processed,
+            total=result.total,
+            current_result=result,
+        )
+
+    async def sample(
+        self,
+        bot: Bot,
+        data: SampleCheckInput,
     ) -> AsyncGenerator[CheckAliveProgress]:
         """
-        Execute the alive check and yield progress updates.
+        Check a uniform random sample of the users and estimate the shares.
 
-        Yields CheckAliveProgress every PROGRESS_INTERVAL users.
+        The sample is as large as `data.margin` requires. Results are saved
+        as the sampled users' reachability, but nothing is resumable: an
+        interrupted sample is simply drawn again.
+
+        Yields CheckAliveProgress every PROGRESS_INTERVAL users and once
+        more with the estimate when the sample is checked.
         """
-        user_ids = await self._admin_repo.get_all_user_ids(
+        population = await self._count_users(
             active_since_days=data.active_since_days,
+            unchecked_for_days=data.unchecked_for_days,
+        )
+        user_ids = await self._admin_repo.sample_user_ids(
+            size=sample_size(population, data.margin),
+            active_since_days=data.active_since_days,
+            unchecked_for_days=data.unchecked_for_days,
+            population=population,
+        )
+        result = CheckAliveResult(total=len(user_ids))
+        async for progress in self._check(bot, _iterate(user_ids), result):
+            yield progress
+
+        # Flood waits and unexpected errors say nothing about the user
+        conclusive = result.alive + result.blocked + result.deleted
+        population = max(population, result.processed)
+        yield CheckAliveProgress(
+            processed=result.processed,
+            total=result.total,
+            current_result=result,
+            estimate=SampleEstimate(
+                population=population,
+                sample_size=conclusive,
+                alive=estimate_share(result.alive, conclusive, population),
+                blocked=estimate_share(result.blocked, conclusive, population),
+                deleted=estimate_share(result.deleted, conclusive, population),
+                population_estimated=self._approximate_counts,
+            ),
         )
-        total = len(user_ids)
-        result = CheckAliveResult(total=total)
-        processed = 0
-
-        for i in range(0, total, BATCH_SIZE):
-            batch = user_ids[i : i + BATCH_SIZE]
-            batch_results = await self._process_batch(bot, batch)
-
-            for check_result in batch_results:
-                if check_result.success:
-                    result.alive += 1
-                elif check_result.error_type == "blocked":
-                    result.blocked += 1
-                elif check_result.error_type == "deleted":
-                    result.deleted += 1
-                elif check_result.error_type == "rate_limited":
-                    result.rate_limited += 1
-                else:
-                    result.other_errors += 1
-
-            processed += len(batch)
-
-            if processed % PROGRESS_INTERVAL < BATCH_SIZE or processed == total:
-                yield CheckAliveProgress(
-                    processed=processed,
-                    total=total,
-                    current_result=result,
-                )
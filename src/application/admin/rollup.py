@@ -0,0 +1,131 @@
+"""Per-day user stats, rolled up incrementally for trends and charts."""
+
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+from src.application.common.interactor import Interactor
+from src.application.common.transaction import TransactionManager
+from src.domain.admin import DailyStats, DailyStatsRepository
+
+# Longest period the stats can be read for at once
+MAX_DAYS = 366
+
+
+@dataclass
+class DailyStatsDTO:
+    day: date
+    new_users: int
+    referred_users: int
+    organic_users: int
+    active_users: int
+    languages: dict[str, int]
+    final: bool
+
+
+@dataclass(frozen=True)
+class DailyStatsSummary:
+    """Totals over a period of daily stats."""
+
+    days: int
+    new_users: int
+    referred_users: int
+    organic_users: int
+    referred_percent: float
+    organic_percent: float
+    # Mean of the days' active users
+    active_average: float
+    # New users by language code, most frequent first
+    languages: dict[str, int]
+
+
+def summarize(stats: list[DailyStatsDTO]) -> DailyStatsSummary:
+    new_users = sum(day.new_users for day in stats)
+    referred_users = sum(day.referred_users for day in stats)
+    organic_users = new_users - referred_users
+    languages: Counter[str] = Counter()
+    for day in stats:
+        languages.update(day.languages)
+
+    return DailyStatsSummary(
+        days=len(stats),
+        new_users=new_users,
+        referred_users=referred_users,
+        organic_users=organic_users,
+        referred_percent=round(referred_users / new_users * 100, 1) if new_users else 0,
+        organic_percent=round(organic_users / new_users * 100, 1) if new_users else 0,
+        active_average=(
+            sum(day.active_users for day in stats) / len(stats) if stats else 0.0
+        ),
+        languages=dict(languages.most_common()),
+    )
+
+
+class RollupDailyStatsInteractor(Interactor[None, list[DailyStats]]):
+    """Roll up the days after the watermark, the last day whose stats are final.
+
+    Days before today become final; today is rolled up again by every run.
+    Active users are only known as of each user's last visit, so a day's
+    count is exact up to the last run on that day, and the job should run
+    often enough, e.g. hourly.
+    """
+
+    def __init__(
+        self,
+        daily_stats_repository: DailyStatsRepository,
+        transaction_manager: TransactionManager,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.daily_stats_repository = daily_stats_repository
+        self.transaction_manager = transaction_manager
+        self._clock = clock
+
+    async def __call__(self, data: None = None) -> list[DailyStats]:
+        today = self._clock().astimezone(UTC).date()
+        watermark = await self.daily_stats_repository.get_watermark()
+        if watermark is not None:
+            since = watermark + timedelta(days=1)
+        else:
+            # First run: everything since the first user signed up
+            since = await self.daily_stats_repository.get_first_signup_day() or today
+        if since > today:
+            return []
+
+        stats = await self.daily_stats_repository.aggregate(since, today)
+        for day in stats:
+            day.final = day.day < today
+        await self.daily_stats_repository.save(stats)
+        await self.transaction_manager.commit()
+        return stats
+
+
+class GetDailyStatsInteractor(Interactor[int, list[DailyStatsDTO]]):
+    """Stats of the last `data` days, today included, oldest first."""
+
+    def __init__(
+        self,
+        daily_stats_repository: DailyStatsRepository,
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self.daily_stats_repository = daily_stats_repository
+        self._clock = clock
+
+    async def __call__(self, data: int = 30) -> list[DailyStatsDTO]:
+        days = min(max(data, 1), MAX_DAYS)
+        today = self._clock().astimezone(UTC).date()
+        stats = await self.daily_stats_repository.list_since(
+            today - timedelta(days=days - 1)
+        )
+        return [
+            DailyStatsDTO(
+                day=day.day,
+                new_users=day.new_users,
+                referred_users=day.referred_users,
+                organic_users=day.organic_users,
+                active_users=day.active_users,
+                languages=day.languages,
+                final=day.final,
+            )
+            for day in stats
+        ]
@@ -0,0 +1,60 @@
+"""Sample sizes and confidence intervals for estimating shares of users."""
+
+from dataclasses import dataclass
+import math
+
+# z-score of a two-sided 95% confidence level
+Z_95 = 1.96
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """Share of the population, within [low, high] at the confidence level."""
+
+    share: float
+    low: float
+    high: float
+
+    @property
+    def margin(self) -> float:
+        return max(self.share - self.low, self.high - self.share)
+
+
+def sample_size(population: int, margin: float, z: float = Z_95) -> int:
+    """Users to check so that any share is known within +-`margin`.
+
+    Assumes the worst case share of 50% and corrects for a finite
+    population, so a small base is checked almost entirely.
+    """
+    if population <= 0:
+        return 0
+    infinite = z * z * 0.25 / (margin * margin)
+    return min(population, math.ceil(infinite / (1 + (infinite - 1) / population)))
+
+
+def estimate_share(
+    count: int, sample: int, population: int, z: float = Z_95
+) -> Estimate:
+    """Wilson score interval of `count` hits in a sample drawn without replacement.
+
+    Unlike the normal approximation it stays within [0, 1] and is not empty
+    for shares near 0% or 100%.
+    """
+    if sample <= 0:
+        return Estimate(share=0.0, low=0.0, high=1.0)
+    share = count / sample
+    # Finite population correction: checking everyone leaves no uncertainty
+    correction = (population - sample) / (population - 1) if population > 1 else 0.0
+    z2 = z * z * max(correction, 0.0)
+    denominator = 1 + z2 / sample
+    center = (share + z2 / (2 * sample)) / denominator
+    spread = (
+        math.sqrt(share * (1 - share) / sample + z2 / (4 * sample * sample))
+        * math.sqrt(z2)
+        / denominator
+    )
+    return Estimate(
+        share=share,
+        low=max(0.0, center - spread),
+        high=min(1.0, center + spread),
+    )
@@ -0,0 +1,21 @@
+from .create import (
+    CancelBroadcastInteractor,
+    CreateBroadcastDTO,
+    CreateBroadcastInteractor,
+)
+from .run import (
+    BroadcastProgress,
+    GetBroadcastInteractor,
+    GetRunningBroadcastsInteractor,
+    RunBroadcastInteractor,
+)
+
+__all__ = [
+    "BroadcastProgress",
+    "CancelBroadcastInteractor",
+    "CreateBroadcastDTO",
+    "CreateBroadcastInteractor",
+    "GetBroadcastInteractor",
+    "GetRunningBroadcastsInteractor",
+    "RunBroadcastInteractor",
+]
@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.application.common.transaction import TransactionManager
+from src.domain.broadcast import Broadcast, BroadcastRepository, BroadcastStatus
+
+
+@dataclass(frozen=True)
+class CreateBroadcastDTO:
+    message_key: str
+    created_by: int
+
+
+class CreateBroadcastInteractor(Interactor[CreateBroadcastDTO, Broadcast]):
+    def __init__(
+        self,
+        broadcast_repository: BroadcastRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._broadcast_repo = broadcast_repository
+        self._transaction_manager = transaction_manager
+
+    async def __call__(self, data: CreateBroadcastDTO) -> Broadcast:
+        broadcast = await self._broadcast_repo.create(
+            message_key=data.message_key, created_by=data.created_by
+        )
+        await self._transaction_manager.commit()
+        return broadcast
+
+
+class CancelBroadcastInteractor(Interactor[int, Broadcast | None]):
+    """Cancel a broadcast that has not been started yet."""
+
+    def __init__(
+        self,
+        broadcast_repository: BroadcastRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
+        self._broadcast_repo = broadcast_repository
+        self._transaction_manager = transaction_manager
+
+    async def __call__(self, data: int) -> Broadcast | None:
+        broadcast = await self._broadcast_repo.get(data)
+        if broadcast is None or broadcast.status != BroadcastStatus.DRAFT:
+            return None
+
+        broadcast.status = BroadcastStatus.CANCELLED
+        await self._broadcast_repo.save(broadcast)
+        await self._transaction_manager.commit()
+        return broadcast
@@ -0,0 +1,170 @@
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator, Callable
+from dataclasses import dataclass, replace
+import logging
+import time
+
+from aiogram import Bot
+from aiogram.exceptions import (
+    TelegramAPIError,
+    TelegramBadRequest,
+    TelegramForbiddenError,
+)
+from fluentogram import TranslatorHub
+
+from src.application.common.interactor import Interactor
+from src.application.common.transaction import TransactionManager
+from src.domain.broadcast import (
+    Broadcast,
+    BroadcastRepository,
+    BroadcastStatus,
+    Delivery,
+    DeliveryStatus,
+    Recipient,
+)
+
+logger = logging.getLogger(__name__)
+
+# Recipients loaded, sent and checkpointed at a time
+PAGE_SIZE = 500
+# Concurrent senders; the bot session paces them to Telegram's limits
+CONCURRENCY = 30
+# Seconds between progress updates
+PROGRESS_INTERVAL = 5.0
+
+# Bad requests meaning the recipient is gone rather than the message broken
+UNREACHABLE_ERRORS = ("chat not found", "user is deactivated", "bot was blocked")
+
+
+@dataclass
+class BroadcastProgress:
+    # Snapshot of the broadcast when the progress was reported
+    broadcast: Broadcast
+    total: int
+
+
+class RunBroadcastInteractor:
+    """Send a broadcast to every user, resuming from its checkpoint.
+
+    Recipients are read page by page in user id order. Each page is sent
+    by a pool of concurrent senders, then its results and the new
+    checkpoint are committed together, so a restarted run re-sends at
+    most the page it was interrupted in.
+    """
+
+    def __init__(
+        self,
+        broadcast_repository: BroadcastRepository,
+        transaction_manager: TransactionManager,
+        hub: TranslatorHub,
+        default_locale: str,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._broadcast_repo = broadcast_repository
+        self._transaction_manager = transaction_manager
+        self._hub = hub
+        self._default_locale = default_locale
+        self._clock = clock
+
+    async def execute(
+        self,
+        bot: Bot,
+        broadcast_id: int,
+    ) -> AsyncGenerator[BroadcastProgress]:
+        """
+        Run the broadcast and yield progress updates.
+
+        Yields at most once per PROGRESS_INTERVAL seconds, and once more
+        when the broadcast is completed.
+        """
+        broadcast = await self._broadcast_repo.get(broadcast_id)
+        if broadcast is None or broadcast.is_finished:
+            return
+
+        if broadcast.status == BroadcastStatus.DRAFT:
+            broadcast.status = BroadcastStatus.RUNNING
+            await self._broadcast_repo.save(broadcast)
+            await self._transaction_manager.commit()
+
+        total = await self._broadcast_repo.count_recipients()
+        texts: dict[str, str] = {}
+        reported_at = self._clock()
+
+        while recipients := await self._broadcast_repo.get_recipients(
+            after_user_id=broadcast.last_user_id, limit=PAGE_SIZE
+        ):
+            deliveries = await self._send_page(bot, broadcast, recipients, texts)
+            broadcast.record(deliveries, last_user_id=recipients[-1].user_id)
+            await self._broadcast_repo.save(broadcast, deliveries)
+            await self._transaction_manager.commit()
+
+            if self._clock() - reported_at >= PROGRESS_INTERVAL:
+                reported_at = self._clock()
+                yield BroadcastProgress(broadcast=replace(broadcast), total=total)
+
+        broadcast.status = BroadcastStatus.COMPLETED
+        await self._broadcast_repo.save(broadcast)
+        await self._transaction_manager.commit()
+        yield BroadcastProgress(broadcast=replace(broadcast), total=total)
+
+    async def _send_page(
+        self,
+        bot: Bot,
+        broadcast: Broadcast,
+        recipients: list[Recipient],
+        texts: dict[str, str],
+    ) -> list[Delivery]:
+        queue = deque(recipients)
+        deliveries: list[Delivery] = []
+
+        async def sender() -> None:
+            while queue:
+                recipient = queue.popleft()
+                text = self._render(broadcast.message_key, recipient, texts)
+                status = await self._send(bot, recipient.user_id, text)
+                deliveries.append(Delivery(user_id=recipient.user_id, status=status))
+
+        await asyncio.gather(*(sender() for _ in range(min(CONCURRENCY, len(queue)))))
+        return deliveries
+
+    def _render(
+        self, message_key: str, recipient: Recipient, texts: dict[str, str]
+    ) -> str:
+        # Rendered once per locale for the whole run
+        locale = recipient.language_code or self._default_locale
+        if locale not in texts:
+            translator = self._hub.get_translator_by_locale(locale)
+            texts[locale] = translator.get(message_key)
+        return texts[locale]
+
+    async def _send(self, bot: Bot, user_id: int, text: str) -> DeliveryStatus:
+        try:
+            await bot.send_message(chat_id=user_id, text=text)
+        except TelegramForbiddenError:
+            return DeliveryStatus.BLOCKED
+        except TelegramBadRequest as e:
+            if any(error in str(e).lower() for error in UNREACHABLE_ERRORS):
+                return DeliveryStatus.BLOCKED
+            logger.warning("TelegramBadRequest for user %d: %s", user_id, e)
+            return DeliveryStatus.FAILED
+        except TelegramAPIError as e:
+            logger.warning("Failed to send broadcast to user %d: %s", user_id, e)
+            return DeliveryStatus.FAILED
+        return DeliveryStatus.DELIVERED
+
+
+class GetRunningBroadcastsInteractor(Interactor[None, list[Broadcast]]):
+    def __init__(self, broadcast_repository: BroadcastRepository) -> None:
+        self._broadcast_repo = broadcast_repository
+
+    async def __call__(self, data: None = None) -> list[Broadcast]:
+        return await self._broadcast_repo.get_running()
+
+
+class GetBroadcastInteractor(Interactor[int, Broadcast | None]):
+    def __init__(self, broadcast_repository: BroadcastRepository) -> None:
+        self._broadcast_repo = broadcast_repository
+
+    async def __call__(self, data: int) -> Broadcast | None:
+        return await self._broadcast_repo.get(data)
@@ -0,0 +1,64 @@
+"""Concurrency limit that adapts to how the remote side copes with load."""
+
+import asyncio
+from collections.abc import Callable
+import time
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on the number of calls in flight.
+
+    Every call that finishes within `target_latency` raises the limit by
+    `1 / limit`, i.e. about one slot per round of calls. A slow or
+    overloaded call (e.g. a flood wait) halves it. Calls started before the
+    last decrease cannot decrease it again, so one burst of errors costs
+    one halving, not one per call.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 100,
+        target_latency: float = 1.0,
+        backoff: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum")
+        self._limit = float(initial)
+        self._minimum = minimum
+        self._maximum = maximum
+        self._target_latency = target_latency
+        self._backoff = backoff
+        self._clock = clock
+        self._in_flight = 0
+        self._last_decrease = float("-inf")
+        self._changed = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def acquire(self) -> float:
+        """Wait for a free slot; returns the start time to pass to `release`."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        return self._clock()
+
+    async def release(self, started: float, *, overloaded: bool = False) -> None:
+        now = self._clock()
+        async with self._changed:
+            self._in_flight -= 1
+            if overloaded or now - started > self._target_latency:
+                if started >= self._last_decrease:
+                    self._limit = max(self._minimum, self._limit * self._backoff)
+                    self._last_decrease = now
+            else:
+                self._limit = min(self._maximum, self._limit + 1 / self._limit)
+            self._changed.notify_all()
@@ -0,0 +1,11 @@
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol
+
+from src.domain.user.vo import UserId
+
+
+class ActivityRecorder(Protocol):
+    @abstractmethod
+    def record(self, user_id: UserId, seen_at: datetime) -> None:
+        """Remember that the user was active; persisted asynchronously."""
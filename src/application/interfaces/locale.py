@@ -0,0 +1,13 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from src.domain.user.vo import LanguageCode, UserId
+
+
+class LocaleCache(Protocol):
+    @abstractmethod
+    def get(self, user_id: UserId) -> LanguageCode | None: ...
+
+    @abstractmethod
+    async def set(self, user_id: UserId, language_code: LanguageCode) -> None:
+        """Store the saved language and propagate it to other processes."""
@@ -0,0 +1,11 @@
+from abc import abstractmethod
+from contextlib import AbstractAsyncContextManager
+from typing import Protocol
+
+
+class JobLock(Protocol):
+    """Locks shared by every bot process, e.g. to run a job in one of them."""
+
+    @abstractmethod
+    def hold(self, key: str) -> AbstractAsyncContextManager[bool]:
+        """Try to take `key`; yields whether it was taken, frees it on exit."""
@@ -33,15 +33,11 @@ class ProcessReferralInteractor(Interactor[ProcessReferralInputDTO, bool]):
         if referrer_id == data.new_user_id:
             return False
 
-        # Verify referrer exists
-        referrer = await self.user_repository.get_user(UserId(referrer_id))
-        if referrer is None:
-            return False
-
-        await self.user_repository.set_referred_by(
+        applied = await self.user_repository.apply_referral(
             UserId(data.new_user_id), UserId(referrer_id)
         )
-        await self.user_repository.increment_referral_count(UserId(referrer_id))
-        await self.transaction_manager.commit()
+        if not applied:
+            return False
 
+        await self.transaction_manager.commit()
         return True
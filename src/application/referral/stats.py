@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
+from src.application.common.transaction import TransactionManager
 from src.domain.user import UserRepository
+from src.domain.user.repository import ReferralStats
 
 
 @dataclass
@@ -11,29 +13,59 @@ class StatsOutputDTO:
     referred_percent: float
     organic_count: int
     organic_percent: float
+    estimated: bool = False
+
+
+def _to_dto(stats: ReferralStats) -> StatsOutputDTO:
+    if stats.total_users > 0:
+        referred_pct = stats.referred_count / stats.total_users * 100
+        organic_pct = stats.organic_count / stats.total_users * 100
+    else:
+        referred_pct = 0
+        organic_pct = 0
+
+    return StatsOutputDTO(
+        total_users=stats.total_users,
+        referred_count=stats.referred_count,
+        referred_percent=round(referred_pct, 1),
+        organic_count=stats.organic_count,
+        organic_percent=round(organic_pct, 1),
+        estimated=stats.estimated,
+    )
 
 
 class GetStatsInteractor(Interactor[None, StatsOutputDTO]):
-    def __init__(self, user_repository: UserRepository) -> None:
+    """Referral stats; estimated rather than counted when `approximate`."""
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        approximate: bool = False,
+    ) -> None:
+        self.user_repository = user_repository
+        self.approximate = approximate
+
+    async def __call__(self, data: None = None) -> StatsOutputDTO:
+        if self.approximate:
+            return _to_dto(await self.user_repository.estimate_referral_stats())
+        return _to_dto(await self.user_repository.get_referral_stats())
+
+
+class RecountStatsInteractor(Interactor[None, StatsOutputDTO]):
+    """Rebuild the stored stats counters from a full count of the users."""
+
+    def __init__(
+        self,
+        user_repository: UserRepository,
+        transaction_manager: TransactionManager,
+    ) -> None:
         self.user_repository = user_repository
+        self.transaction_manager = transaction_manager
 
     async def __call__(self, data: None = None) -> StatsOutputDTO:
-        stats = await self.user_repository.get_referral_stats()
-
-        if stats.total_users > 0:
-            referred_pct = stats.referred_count / stats.total_users * 100
-            organic_pct = stats.organic_count / stats.total_users * 100
-        else:
-            referred_pct = 0
-            organic_pct = 0
-
-        return StatsOutputDTO(
-            total_users=stats.total_users,
-            referred_count=stats.referred_count,
-            referred_percent=round(referred_pct, 1),
-            organic_count=stats.organic_count,
-            organic_percent=round(organic_pct, 1),
-        )
+        stats = await self.user_repository.recount_referral_stats()
+        await self.transaction_manager.commit()
+        return _to_dto(stats)
 
 
 @dataclass
@@ -1,3 +1,9 @@
+from .touch import TouchUserDTO, TouchUserInteractor
 from .update_language import UpdateLanguageDTO, UpdateLanguageInteractor
 
-__all__ = ["UpdateLanguageDTO", "UpdateLanguageInteractor"]
+__all__ = [
+    "TouchUserDTO",
+    "TouchUserInteractor",
+    "UpdateLanguageDTO",
+    "UpdateLanguageInteractor",
+]
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from src.application.common.interactor import Interactor
+from src.application.user.service import UserService
+from src.domain.user.vo import UserId
+
+
+@dataclass(frozen=True)
+class TouchUserDTO:
+    user_id: UserId
+
+
+class TouchUserInteractor(Interactor[TouchUserDTO, None]):
+    def __init__(self, user_service: UserService) -> None:
+        self._user_service = user_service
+
+    async def __call__(self, data: TouchUserDTO) -> None:
+        self._user_service.touch(data.user_id)
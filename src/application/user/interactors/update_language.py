@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from src.application.common.interactor import Interactor
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.locale import LocaleCache
 from src.domain.user import UserRepository
 from src.domain.user.vo import LanguageCode, UserId
 
@@ -17,9 +18,11 @@ class UpdateLanguageInteractor(Interactor[UpdateLanguageDTO, None]):
         self,
         user_repository: UserRepository,
         transaction_manager: TransactionManager,
+        locale_cache: LocaleCache,
     ) -> None:
         self._user_repository = user_repository
         self._transaction_manager = transaction_manager
+        self._locale_cache = locale_cache
 
     async def __call__(self, data: UpdateLanguageDTO) -> None:
         await self._user_repository.update_language(
@@ -27,3 +30,5 @@ class UpdateLanguageInteractor(Interactor[UpdateLanguageDTO, None]):
             language_code=data.language_code,
         )
         await self._transaction_manager.commit()
+        # Write through only once the change is durable
+        await self._locale_cache.set(data.user_id, data.language_code)
@@ -1,3 +1,16 @@
-from .repository import AdminRepository
+from .check_run import CheckRun, CheckRunStatus
+from .daily_stats import DailyStats
+from .reachability import UNREACHABLE, Reachability, ReachabilityCheck
+from .repository import AdminRepository, CheckRunRepository, DailyStatsRepository
 
-__all__ = ["AdminRepository"]
+__all__ = [
+    "UNREACHABLE",
+    "AdminRepository",
+    "CheckRun",
+    "CheckRunRepository",
+    "CheckRunStatus",
+    "DailyStats",
+    "DailyStatsRepository",
+    "Reachability",
+    "ReachabilityCheck",
+]
@@ -0,0 +1,37 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class CheckRunStatus(StrEnum):
+    RUNNING = "running"
+    COMPLETED = "completed"
+    # Replaced by a newer run before it finished
+    ABANDONED = "abandoned"
+
+
+@dataclass
+class CheckRun:
+    """An alive check over the users matching its filters, in user id order."""
+
+    id: int
+    created_by: int
+    active_since_days: int | None = None
+    unchecked_for_days: int | None = None
+    status: CheckRunStatus = CheckRunStatus.RUNNING
+    # Checkpoint: users with ids up to this one have been checked
+    last_user_id: int | None = None
+    alive: int = 0
+    blocked: int = 0
+    deleted: int = 0
+    rate_limited: int = 0
+    other_errors: int = 0
+
+    @property
+    def processed(self) -> int:
+        return (
+            self.alive
+            + self.blocked
+            + self.deleted
+            + self.rate_limited
+            + self.other_errors
+        )
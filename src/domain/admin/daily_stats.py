@@ -0,0 +1,24 @@
+from dataclasses import dataclass, field
+from datetime import date
+
+
+@dataclass
+class DailyStats:
+    """Users of one UTC day, rolled up from `users`.
+
+    Until the day is `final` its counts are of the day so far.
+    """
+
+    day: date
+    new_users: int = 0
+    # New users who came by a referral link
+    referred_users: int = 0
+    # Users last seen on the day when it was rolled up
+    active_users: int = 0
+    # New users by language code
+    languages: dict[str, int] = field(default_factory=dict)
+    final: bool = False
+
+    @property
+    def organic_users(self) -> int:
+        return self.new_users - self.referred_users
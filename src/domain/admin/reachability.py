@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class Reachability(StrEnum):
+    ALIVE = "alive"
+    BLOCKED = "blocked"
+    DELETED = "deleted"
+
+
+# Users the bot cannot message; a new check may still find them alive
+UNREACHABLE = frozenset({Reachability.BLOCKED, Reachability.DELETED})
+
+
+@dataclass(frozen=True)
+class ReachabilityCheck:
+    user_id: int
+    reachability: Reachability
+    checked_at: datetime
@@ -1,17 +1,123 @@
 from abc import abstractmethod
+from collections.abc import AsyncIterator
+from datetime import date
 from typing import Protocol
 
+from src.domain.admin.check_run import CheckRun
+from src.domain.admin.daily_stats import DailyStats
+from src.domain.admin.reachability import ReachabilityCheck
+
 
 class AdminRepository(Protocol):
     @abstractmethod
-    async def get_all_user_ids(self, active_since_days: int | None = None) -> list[int]:
+    def iter_user_ids(
+        self,
+        active_since_days: int | None = None,
+        page_size: int = 1000,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> AsyncIterator[int]:
         """
-        Get all user IDs, optionally filtered by recent activity.
+        Stream user IDs in ascending order, optionally filtered by recent activity.
 
         Args:
-            active_since_days: If provided, only return users who logged in
+            active_since_days: If provided, only yield users who logged in
                               within the last N days. None means all users.
+            page_size: Number of IDs fetched per query.
+            unchecked_for_days: If provided, skip users whose reachability
+                               was checked within the last N days.
+            after_user_id: If provided, start after this user ID.
 
         Returns:
-            List of Telegram user IDs.
+            Async iterator of Telegram user IDs.
+        """
+
+    @abstractmethod
+    async def count_users(
+        self,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> int:
+        """Number of users `iter_user_ids` would yield at the time of the call."""
+
+    @abstractmethod
+    async def estimate_users(
+        self,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> int:
+        """
+        Approximate `count_users`, as fast however many users there are.
+
+        Small tables may still be counted exactly.
+        """
+
+    @abstractmethod
+    async def sample_user_ids(
+        self,
+        size: int,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        population: int | None = None,
+    ) -> list[int]:
+        """
+        A uniform random sample of the users `iter_user_ids` would yield.
+
+        Returns about `size` IDs in ascending order; fewer if there are not
+        that many users, and possibly a few fewer by chance. `population`
+        is the number of those users if already counted or estimated.
         """
+
+    @abstractmethod
+    async def save_reachability(self, checks: list[ReachabilityCheck]) -> None:
+        """Store check results in bulk, overwriting earlier ones."""
+
+
+class CheckRunRepository(Protocol):
+    @abstractmethod
+    async def create(
+        self,
+        created_by: int,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+    ) -> CheckRun: ...
+
+    @abstractmethod
+    async def get(self, run_id: int) -> CheckRun | None: ...
+
+    @abstractmethod
+    async def get_running(self) -> list[CheckRun]: ...
+
+    @abstractmethod
+    async def save(self, run: CheckRun) -> None: ...
+
+    @abstractmethod
+    async def abandon_running(self) -> None:
+        """Mark every unfinished run as abandoned."""
+
+
+class DailyStatsRepository(Protocol):
+    @abstractmethod
+    async def get_watermark(self) -> date | None:
+        """Last day whose stats are final."""
+
+    @abstractmethod
+    async def get_first_signup_day(self) -> date | None: ...
+
+    @abstractmethod
+    async def aggregate(self, since: date, until: date) -> list[DailyStats]:
+        """Count the users of every day from `since` to `until` inclusive.
+
+        Active users of a day are those last seen on it; on the current day
+        that is everyone seen so far.
+        """
+
+    @abstractmethod
+    async def save(self, stats: list[DailyStats]) -> None:
+        """Store stats of days, keeping the higher count of active users."""
+
+    @abstractmethod
+    async def list_since(self, since: date) -> list[DailyStats]:
+        """Stored stats from `since` on, oldest first."""
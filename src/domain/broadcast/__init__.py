@@ -0,0 +1,17 @@
+from .entity import (
+    Broadcast,
+    BroadcastStatus,
+    Delivery,
+    DeliveryStatus,
+    Recipient,
+)
+from .repository import BroadcastRepository
+
+__all__ = [
+    "Broadcast",
+    "BroadcastRepository",
+    "BroadcastStatus",
+    "Delivery",
+    "DeliveryStatus",
+    "Recipient",
+]
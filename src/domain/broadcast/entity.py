@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from enum import StrEnum
+
+
+class BroadcastStatus(StrEnum):
+    DRAFT = "draft"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+
+
+class DeliveryStatus(StrEnum):
+    DELIVERED = "delivered"
+    BLOCKED = "blocked"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class Recipient:
+    user_id: int
+    language_code: str | None
+
+
+@dataclass(frozen=True)
+class Delivery:
+    user_id: int
+    status: DeliveryStatus
+
+
+@dataclass
+class Broadcast:
+    id: int
+    # Fluent message rendered in each recipient's language
+    message_key: str
+    created_by: int
+    status: BroadcastStatus = BroadcastStatus.DRAFT
+    # Checkpoint: recipients with ids up to this one have been sent to
+    last_user_id: int | None = None
+    delivered: int = 0
+    blocked: int = 0
+    failed: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.delivered + self.blocked + self.failed
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (BroadcastStatus.COMPLETED, BroadcastStatus.CANCELLED)
+
+    def record(self, deliveries: list[Delivery], last_user_id: int) -> None:
+        """Count a sent page of recipients and move the checkpoint past it."""
+        for delivery in deliveries:
+            match delivery.status:
+                case DeliveryStatus.DELIVERED:
+                    self.delivered += 1
+                case DeliveryStatus.BLOCKED:
+                    self.blocked += 1
+                case DeliveryStatus.FAILED:
+                    self.failed += 1
+        self.last_user_id = last_user_id
@@ -0,0 +1,34 @@
+from abc import abstractmethod
+from typing import Protocol
+
+from src.domain.broadcast.entity import Broadcast, Delivery, Recipient
+
+
+class BroadcastRepository(Protocol):
+    @abstractmethod
+    async def create(self, message_key: str, created_by: int) -> Broadcast: ...
+
+    @abstractmethod
+    async def get(self, broadcast_id: int) -> Broadcast | None: ...
+
+    @abstractmethod
+    async def get_running(self) -> list[Broadcast]: ...
+
+    @abstractmethod
+    async def count_recipients(self) -> int:
+        """Number of users not known to be unreachable."""
+
+    @abstractmethod
+    async def get_recipients(
+        self, after_user_id: int | None, limit: int
+    ) -> list[Recipient]:
+        """Next `limit` recipients ordered by user id, after `after_user_id`.
+
+        Users a check-alive run found blocked or deleted are skipped.
+        """
+
+    @abstractmethod
+    async def save(
+        self, broadcast: Broadcast, deliveries: list[Delivery] | None = None
+    ) -> None:
+        """Store the broadcast state together with new delivery results."""
@@ -11,6 +11,8 @@ class ReferralStats:
     total_users: int
     referred_count: int
     organic_count: int
+    # Estimated from table statistics and a sample rather than counted
+    estimated: bool = False
 
 
 @dataclass
@@ -39,6 +41,9 @@ class UserRepository(Protocol):
     @abstractmethod
     async def update_user(self, user: User) -> User: ...
 
+    @abstractmethod
+    async def upsert_user(self, user: User) -> User: ...
+
     @abstractmethod
     async def delete_user(self, user_id: UserId) -> None: ...
 
@@ -48,9 +53,25 @@ class UserRepository(Protocol):
     @abstractmethod
     async def increment_referral_count(self, user_id: UserId) -> None: ...
 
+    @abstractmethod
+    async def apply_referral(self, user_id: UserId, referrer_id: UserId) -> bool:
+        """Credit `referrer_id` with referring `user_id`, at most once.
+
+        Nothing changes unless the referrer exists, is not the user and the
+        user has no referrer yet. Returns whether the referral was applied.
+        """
+
     @abstractmethod
     async def get_referral_stats(self) -> ReferralStats: ...
 
+    @abstractmethod
+    async def estimate_referral_stats(self) -> ReferralStats:
+        """Like `get_referral_stats`, but estimates where it would count."""
+
+    @abstractmethod
+    async def recount_referral_stats(self) -> ReferralStats:
+        """Count the stats from scratch and correct stored counters with them."""
+
     @abstractmethod
     async def get_top_referrers(self, limit: int = 10) -> list[TopReferrer]: ...
 
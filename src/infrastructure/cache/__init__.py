@@ -0,0 +1,28 @@
+from .admin_stats import AdminStatsCache
+from .locale import (
+    InMemoryLocaleCache,
+    LocaleChangeCallback,
+    LocaleNotifier,
+    NullLocaleNotifier,
+    ReconnectCallback,
+)
+from .render import MessageRenderCache
+from .swr import Cached, StaleWhileRevalidateCache
+from .ttl import CacheStats, TTLCache
+from .user_profile import ProfileFingerprint, UserProfileCache
+
+__all__ = [
+    "AdminStatsCache",
+    "CacheStats",
+    "Cached",
+    "InMemoryLocaleCache",
+    "LocaleChangeCallback",
+    "LocaleNotifier",
+    "MessageRenderCache",
+    "NullLocaleNotifier",
+    "ProfileFingerprint",
+    "ReconnectCallback",
+    "StaleWhileRevalidateCache",
+    "TTLCache",
+    "UserProfileCache",
+]
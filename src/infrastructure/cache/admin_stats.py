@@ -0,0 +1,30 @@
+"""Cache of the numbers behind the admin /stats screens."""
+
+from src.application.referral.stats import StatsOutputDTO, TopReferrerDTO
+from src.infrastructure.cache.swr import Cached, StaleWhileRevalidateCache
+
+
+class AdminStatsCache:
+    """Results of the stats interactors, shared by all admins of the process.
+
+    Admins go back and forth between the screens while the numbers barely
+    move, so a result that is a minute old is as good as a new one.
+    """
+
+    def __init__(
+        self,
+        stats: StaleWhileRevalidateCache[None, StatsOutputDTO],
+        top_referrers: StaleWhileRevalidateCache[int, list[TopReferrerDTO]],
+    ) -> None:
+        self._stats = stats
+        self._top_referrers = top_referrers
+
+    async def get_stats(self) -> Cached[StatsOutputDTO]:
+        return await self._stats.get(None)
+
+    async def get_top_referrers(self, limit: int) -> Cached[list[TopReferrerDTO]]:
+        return await self._top_referrers.get(limit)
+
+    async def close(self) -> None:
+        await self._stats.close()
+        await self._top_referrers.close()
@@ -0,0 +1,79 @@
+"""Per-user cache of saved languages."""
+
+from abc import abstractmethod
+from collections.abc import Callable
+from typing import Protocol
+
+from src.application.interfaces.locale import LocaleCache
+from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.cache.ttl import CacheStats, TTLCache
+
+type LocaleChangeCallback = Callable[[int, str], None]
+type ReconnectCallback = Callable[[], None]
+
+
+class LocaleNotifier(Protocol):
+    """Broadcasts language changes to caches living in other processes."""
+
+    @abstractmethod
+    async def publish(self, user_id: int, language_code: str) -> None: ...
+
+    @abstractmethod
+    async def subscribe(
+        self,
+        callback: LocaleChangeCallback,
+        on_reconnect: ReconnectCallback | None = None,
+    ) -> None:
+        """Deliver changes to `callback`.
+
+        `on_reconnect` runs after the subscription was lost and restored,
+        since changes published in between were never delivered.
+        """
+
+    @abstractmethod
+    async def close(self) -> None: ...
+
+
+class NullLocaleNotifier(LocaleNotifier):
+    """Notifier for a single process deployment: nothing to tell anyone."""
+
+    async def publish(self, user_id: int, language_code: str) -> None:
+        return None
+
+    async def subscribe(
+        self,
+        callback: LocaleChangeCallback,
+        on_reconnect: ReconnectCallback | None = None,
+    ) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+
+class InMemoryLocaleCache(LocaleCache):
+    def __init__(self, cache: TTLCache[int, str], notifier: LocaleNotifier) -> None:
+        self._cache = cache
+        self._notifier = notifier
+
+    def get(self, user_id: UserId) -> LanguageCode | None:
+        language_code = self._cache.get(user_id.value)
+        return LanguageCode(language_code) if language_code else None
+
+    async def set(self, user_id: UserId, language_code: LanguageCode) -> None:
+        self.put(user_id.value, language_code.value)
+        await self._notifier.publish(user_id.value, language_code.value)
+
+    def put(self, user_id: int, language_code: str) -> None:
+        """Store a language known to this process only, e.g. read from the DB."""
+        self._cache.set(user_id, language_code)
+
+    def invalidate(self, user_id: int) -> None:
+        self._cache.pop(user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._cache.stats
@@ -0,0 +1,44 @@
+"""Cache of what the bot last rendered into its messages."""
+
+from src.infrastructure.cache.ttl import CacheStats, TTLCache
+
+type MessageKey = tuple[int, int]
+
+
+class MessageRenderCache:
+    """Remembers a fingerprint of the content of each message the bot sent or
+    edited, keyed by (chat_id, message_id).
+
+    A hit means an edit would not change the message, so the Bot API call
+    can be skipped. Every hit is one saved call, and Telegram would also
+    have rejected it with "message is not modified".
+
+    Fingerprints are kept per process, so every edit of a message has to
+    go through the same process. A disabled cache remembers nothing and
+    never skips an edit.
+    """
+
+    def __init__(self, cache: TTLCache[MessageKey, int], enabled: bool = True) -> None:
+        self._cache = cache
+        self._enabled = enabled
+        self._hits = 0
+        self._misses = 0
+
+    def is_rendered(self, chat_id: int, message_id: int, fingerprint: int) -> bool:
+        if self._enabled and self._cache.get((chat_id, message_id)) == fingerprint:
+            self._hits += 1
+            return True
+
+        self._misses += 1
+        return False
+
+    def put(self, chat_id: int, message_id: int, fingerprint: int) -> None:
+        if self._enabled:
+            self._cache.set((chat_id, message_id), fingerprint)
+
+    def invalidate(self, chat_id: int, message_id: int) -> None:
+        self._cache.pop((chat_id, message_id))
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._cache))
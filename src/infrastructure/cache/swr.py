@@ -0,0 +1,105 @@
+"""In-process result cache that serves stale results while refreshing them."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import partial
+import logging
+import time
+
+from src.infrastructure.cache.ttl import CacheStats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Cached[V]:
+    value: V
+    computed_at: datetime
+
+
+@dataclass(frozen=True)
+class _Entry[V]:
+    result: Cached[V]
+    # Clock reading when the load started
+    loaded_at: float
+
+
+class StaleWhileRevalidateCache[K, V]:
+    """Results of `load` by key, computed at most once at a time per key.
+
+    A result is fresh for `ttl_seconds`. For `max_stale_seconds` more it is
+    still returned at once while a refresh runs in the background, so a slow
+    load holds up only callers without a usable result. Those wait for the
+    refresh, and all of them share a single call of `load`.
+
+    Meant for a handful of keys: results are never evicted.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[K], Awaitable[V]],
+        ttl_seconds: float,
+        max_stale_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._load = load
+        self._ttl = ttl_seconds
+        self._max_age = ttl_seconds + max_stale_seconds
+        self._clock = clock
+        self._entries: dict[K, _Entry[V]] = {}
+        self._refreshes: dict[K, asyncio.Task[Cached[V]]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    async def get(self, key: K) -> Cached[V]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.loaded_at
+            if age < self._max_age:
+                if age >= self._ttl:
+                    self._refresh(key)
+                self._hits += 1
+                return entry.result
+
+        self._misses += 1
+        # A cancelled caller must not cancel the load others are waiting for
+        return await asyncio.shield(self._refresh(key))
+
+    def is_refreshing(self, key: K) -> bool:
+        return key in self._refreshes
+
+    async def close(self) -> None:
+        """Cancel running refreshes and wait for them to finish."""
+        tasks = list(self._refreshes.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _refresh(self, key: K) -> asyncio.Task[Cached[V]]:
+        task = self._refreshes.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load_entry(key))
+            self._refreshes[key] = task
+            task.add_done_callback(partial(self._refreshed, key))
+        return task
+
+    async def _load_entry(self, key: K) -> Cached[V]:
+        loaded_at = self._clock()
+        result = Cached(value=await self._load(key), computed_at=datetime.now(UTC))
+        self._entries[key] = _Entry(result=result, loaded_at=loaded_at)
+        return result
+
+    def _refreshed(self, key: K, task: asyncio.Task[Cached[V]]) -> None:
+        self._refreshes.pop(key, None)
+        # Retrieved here too, as a background refresh may have no waiters
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.warning("Failed to refresh %r", key, exc_info=error)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self))
@@ -0,0 +1,59 @@
+"""Cache of recently upserted Telegram profiles."""
+
+from dataclasses import dataclass, replace
+
+from src.application.user.dtos import CreateUserOutputDTO
+from src.infrastructure.cache.ttl import CacheStats, TTLCache
+
+
+@dataclass(frozen=True)
+class ProfileFingerprint:
+    username: str | None
+    first_name: str
+    last_name: str | None
+
+
+class UserProfileCache:
+    """Remembers the last upsert result per user.
+
+    A hit means the Telegram profile has not changed since the user was
+    written within the TTL, so the upsert (and its commit) can be skipped.
+    """
+
+    def __init__(
+        self,
+        cache: TTLCache[int, tuple[ProfileFingerprint, CreateUserOutputDTO]],
+    ) -> None:
+        self._cache = cache
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, user_id: int, fingerprint: ProfileFingerprint
+    ) -> CreateUserOutputDTO | None:
+        entry = self._cache.get(user_id)
+        if entry is None or entry[0] != fingerprint:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        return entry[1]
+
+    def put(self, user: CreateUserOutputDTO) -> None:
+        fingerprint = ProfileFingerprint(
+            username=user.username,
+            first_name=user.first_name,
+            last_name=user.last_name,
+        )
+        # Only the first update of a user may be reported as new.
+        self._cache.set(user.id, (fingerprint, replace(user, is_new=False)))
+
+    def invalidate(self, user_id: int) -> None:
+        self._cache.pop(user_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        return CacheStats(hits=self._hits, misses=self._misses, size=len(self._cache))
@@ -1,6 +1,7 @@
 from pathlib import Path
+from typing import Literal, Self
 
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 import yaml
 
 
@@ -11,11 +12,24 @@ class PostgresConfig(BaseModel):
     password: str
     db: str
     echo: bool = False
+    # Connections of the whole bot; split evenly between sharding or webhook
+    # workers, each of which has its own engine
+    pool_size: int = Field(default=30, gt=0)
+    max_overflow: int = Field(default=20, ge=0)
 
     @property
     def url(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.db}"
 
+    def split(self, processes: int) -> Self:
+        """Pool of one of `processes` processes sharing the connections."""
+        return self.model_copy(
+            update={
+                "pool_size": max(1, self.pool_size // processes),
+                "max_overflow": self.max_overflow // processes,
+            }
+        )
+
     @field_validator("port")
     @classmethod
     def port_validator(cls, v: int) -> int:
@@ -30,17 +44,153 @@ class AuthConfig(BaseModel):
     access_token_expire_minutes: int
 
 
+class BotSessionConfig(BaseModel):
+    # Simultaneous connections to the Bot API, in total and per host
+    # (0 means no per-host limit)
+    pool_size: int = Field(default=100, gt=0)
+    pool_size_per_host: int = Field(default=0, ge=0)
+    keepalive_timeout: float = Field(default=60, gt=0)
+    dns_cache_ttl: int = Field(default=3_600, ge=0)
+    request_timeout: float = Field(default=60, gt=0)
+    # Self-hosted Bot API server, e.g. "http://telegram-bot-api:8081"
+    api_server: str | None = None
+    # Server started with --local: no upload limit, files passed by path
+    api_server_local: bool = False
+
+
 class TelegramConfig(BaseModel):
     bot_token: str
     admin_ids: list[int]
     bot_username: str
     tg_init_data: str = "for-auth-endpoint-tests"
+    session: BotSessionConfig = Field(default_factory=BotSessionConfig)
+
+
+class RateLimitConfig(BaseModel):
+    # Outgoing calls per second of the whole bot; Telegram allows about 30
+    # messages per second per bot. Split evenly between the processes that
+    # send: sharding workers, or webhook workers in webhook mode
+    global_rate: float = Field(default=30, gt=0)
+    global_burst: float = Field(default=5, ge=1)
+    # Share of global_rate broadcasts and alive checks may use; the rest is
+    # kept for answering users while they run
+    bulk_share: float = Field(default=0.8, gt=0, le=1)
+    # About one message per second in a chat, 20 per minute in a group.
+    # Enforced per process: a chat's updates reach one sharding worker, but
+    # any of the webhook workers
+    chat_rate: float = Field(default=1, gt=0)
+    group_rate: float = Field(default=20 / 60, gt=0)
+    chat_burst: float = Field(default=3, ge=1)
+    # Flood-wait errors retried before giving up
+    max_retries: int = Field(default=3, ge=0)
+
+
+class WebhookConfig(BaseModel):
+    # Public HTTPS address Telegram delivers to, path included
+    url: str
+    path: str = "/webhook"
+    # Echoed by Telegram in X-Telegram-Bot-Api-Secret-Token
+    secret_token: str = Field(pattern=r"^[A-Za-z0-9_-]{1,256}$")
+    # Worker processes serving the app; entrypoint-bot-webhook.sh passes it
+    # to granian's --workers
+    workers: int = Field(default=1, gt=0)
+
+
+class ShardingConfig(BaseModel):
+    # More than one worker runs the bot as a receiver plus worker processes
+    workers: int = Field(default=1, gt=0)
+    queue_size: int = Field(default=1_000, gt=0)
+    report_interval_seconds: float = Field(default=60, gt=0)
+
+
+class SchedulerConfig(BaseModel):
+    # Updates processed at once; defaults to `postgres.pool_size`, since
+    # each of them may hold a connection
+    max_concurrency: int | None = Field(default=None, gt=0)
+    # Accepted but unfinished updates before polling is paused
+    queue_size: int = Field(default=1_000, gt=0)
+    # How often the scheduler and cache stats of each process are logged
+    report_interval_seconds: float = Field(default=60, gt=0)
+
+
+class UserCacheConfig(BaseModel):
+    max_size: int = Field(default=10_000, gt=0)
+    ttl_seconds: float = Field(default=300, gt=0)
+
+
+class LocaleCacheConfig(BaseModel):
+    max_size: int = Field(default=100_000, gt=0)
+    ttl_seconds: float = Field(default=3_600, gt=0)
+    # "postgres" keeps caches of several bot/API processes in sync; required
+    # with more than one webhook or sharding worker
+    notifier: Literal["none", "postgres"] = "none"
+
+
+class RenderCacheConfig(BaseModel):
+    # Per process; off when `webhook.workers` is above 1
+    max_size: int = Field(default=10_000, gt=0)
+    # Bounds how long a message edited by other means may be seen as current
+    ttl_seconds: float = Field(default=3_600, gt=0)
+
+
+class StatsCacheConfig(BaseModel):
+    # Admin stats are recomputed once they are older than this
+    ttl_seconds: float = Field(default=60, gt=0)
+    # Older stats are still shown, while recomputed in the background, for this
+    # long; after that admins wait for the new numbers
+    max_stale_seconds: float = Field(default=86_400, ge=0)
+
+
+class StatsRollupConfig(BaseModel):
+    # Active users of a day are counted exactly up to the last run on that day
+    interval_seconds: float = Field(default=3_600, gt=0)
+
+
+class StatsCountsConfig(BaseModel):
+    # Estimate user counts on admin screens from table statistics and samples
+    # instead of counting, so they stay fast however large `users` grows
+    approximate: bool = False
+
+
+class ActivityConfig(BaseModel):
+    flush_interval_seconds: float = Field(default=5, gt=0)
+    max_batch_size: int = Field(default=1_000, gt=0)
 
 
 class Config(BaseModel):
     postgres: PostgresConfig
     auth: AuthConfig
     telegram: TelegramConfig
+    webhook: WebhookConfig | None = None
+    rate_limit: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    sharding: ShardingConfig = Field(default_factory=ShardingConfig)
+    scheduler: SchedulerConfig = Field(default_factory=SchedulerConfig)
+    user_cache: UserCacheConfig = Field(default_factory=UserCacheConfig)
+    activity: ActivityConfig = Field(default_factory=ActivityConfig)
+    locale_cache: LocaleCacheConfig = Field(default_factory=LocaleCacheConfig)
+    render_cache: RenderCacheConfig = Field(default_factory=RenderCacheConfig)
+    stats_cache: StatsCacheConfig = Field(default_factory=StatsCacheConfig)
+    stats_rollup: StatsRollupConfig = Field(default_factory=StatsRollupConfig)
+    stats_counts: StatsCountsConfig = Field(default_factory=StatsCountsConfig)
+
+    @property
+    def bot_processes(self) -> int:
+        """Most bot processes handling updates at once, in either mode."""
+        webhook_workers = self.webhook.workers if self.webhook else 1
+        return max(webhook_workers, self.sharding.workers)
+
+    def for_processes(self, processes: int) -> Self:
+        """Config of one of `processes` bot processes sharing the database."""
+        return self.model_copy(update={"postgres": self.postgres.split(processes)})
+
+    @model_validator(mode="after")
+    def locale_notifier_validator(self) -> Self:
+        # Otherwise a language changed in one process stays cached in others
+        if self.bot_processes > 1 and self.locale_cache.notifier == "none":
+            raise ValueError(
+                "locale_cache.notifier must be 'postgres' with several bot workers"
+            )
+        return self
 
 
 def load_config(file_name: str = "config.yaml") -> Config:
@@ -0,0 +1,111 @@
+"""Write-behind buffer for user activity touches."""
+
+import asyncio
+from contextlib import suppress
+from datetime import datetime
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.interfaces.activity import ActivityRecorder
+from src.domain.user.vo import UserId
+
+logger = logging.getLogger(__name__)
+
+# Only moves last_login_at forward, so a late flush never undoes an upsert.
+FLUSH_STMT = text(
+    """
+    UPDATE users
+    SET last_login_at = touches.seen_at
+    FROM unnest(CAST(:ids AS bigint[]), CAST(:seen AS timestamptz[]))
+        AS touches(id, seen_at)
+    WHERE users.id = touches.id AND users.last_login_at < touches.seen_at
+    """
+)
+
+
+class ActivityBuffer(ActivityRecorder):
+    """Collects the latest touch per user and persists them in batches.
+
+    A flush runs every `flush_interval` seconds, or as soon as
+    `max_batch_size` users are pending, with a single UPDATE statement.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        flush_interval: float,
+        max_batch_size: int,
+    ) -> None:
+        self._session_maker = session_maker
+        self._flush_interval = flush_interval
+        self._max_batch_size = max_batch_size
+        self._pending: dict[int, datetime] = {}
+        self._batch_full = asyncio.Event()
+        self._flusher: asyncio.Task[None] | None = None
+
+    def record(self, user_id: UserId, seen_at: datetime) -> None:
+        last_seen = self._pending.get(user_id.value)
+        if last_seen is None or last_seen < seen_at:
+            self._pending[user_id.value] = seen_at
+
+        if len(self._pending) >= self._max_batch_size:
+            self._batch_full.set()
+
+        # Restart the flusher if something killed it, so touches do not pile up
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.get_running_loop().create_task(self._run())
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Persist all pending touches and return how many were written."""
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, {}
+        # Rows are locked in id order, so concurrent flushes cannot deadlock
+        ids = sorted(batch)
+        try:
+            async with self._session_maker() as session:
+                await session.execute(
+                    FLUSH_STMT,
+                    {"ids": ids, "seen": [batch[user_id] for user_id in ids]},
+                )
+                await session.commit()
+        except BaseException:
+            # Put the batch back so the next flush retries it
+            for user_id, seen_at in batch.items():
+                last_seen = self._pending.get(user_id)
+                if last_seen is None or last_seen < seen_at:
+                    self._pending[user_id] = seen_at
+            raise
+
+        return len(batch)
+
+    async def close(self) -> None:
+        """Stop the periodic flush and drain what is left."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._flusher
+            self._flusher = None
+
+        try:
+            await self.flush()
+        except Exception:
+            logger.exception("Dropped %d activity touches on shutdown", self.pending)
+
+    async def _run(self) -> None:
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_full.wait(), self._flush_interval)
+            self._batch_full.clear()
+
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Failed to flush %d activity touches", self.pending)
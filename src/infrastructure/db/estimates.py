@@ -0,0 +1,51 @@
+from sqlalchemy import func, tablesample, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.util import AliasedClass
+
+from src.infrastructure.db.models.base import BaseORMModel
+
+# Rows read by a sampled estimate; smaller tables are simply counted
+SAMPLE_ROWS = 10_000
+
+# The planner's estimate: rows per page as of the last ANALYZE or VACUUM,
+# times the pages the table has now
+ESTIMATE_ROWS_STMT = text(
+    """
+    SELECT CASE WHEN relpages > 0
+        THEN reltuples / relpages
+            * (pg_relation_size(oid) / current_setting('block_size')::int)
+        ELSE reltuples
+    END
+    FROM pg_class
+    WHERE oid = to_regclass(:table)
+    """
+)
+
+
+async def estimate_rows(session: AsyncSession, model: type[BaseORMModel]) -> int | None:
+    """Rows of the model's table as the planner estimates them.
+
+    None when counting them is about as cheap as estimating: the table
+    holds no more than SAMPLE_ROWS, or was never analyzed.
+    """
+    rows = await session.scalar(ESTIMATE_ROWS_STMT, {"table": model.__tablename__})
+    if rows is None or rows <= SAMPLE_ROWS:
+        return None
+    return round(rows)
+
+
+def sample_of[M: BaseORMModel](model: type[M], rows: int) -> AliasedClass[M]:
+    """About SAMPLE_ROWS rows of a table of `rows`, read page by page.
+
+    SYSTEM sampling skips the pages it leaves out instead of reading the
+    whole table like BERNOULLI, at the price of rows being sampled in
+    clusters.
+    """
+    percent = min(100.0, SAMPLE_ROWS / rows * 100)
+    return aliased(model, tablesample(model.__table__, func.system(percent)))
+
+
+def scale(rows: int, matched: int, sampled: int) -> int:
+    """Rows of a table of `rows` matching like `matched` of `sampled` did."""
+    return round(rows * matched / sampled) if sampled else 0
@@ -16,18 +16,16 @@ def create_pool(db_config: PostgresConfig) -> async_sessionmaker[AsyncSession]:
 
 def create_engine(
     db_config: PostgresConfig,
-    pool_size: int = 30,
     pool_timeout: int = 30,
     pool_recycle: int = 3600,
-    max_overflow: int = 20,
 ) -> AsyncEngine:
     return create_async_engine(
         url=make_url(db_config.url),
         echo=db_config.echo,
-        pool_size=pool_size,
+        pool_size=db_config.pool_size,
         pool_timeout=pool_timeout,
         pool_recycle=pool_recycle,
-        max_overflow=max_overflow,
+        max_overflow=db_config.max_overflow,
     )
 
 
@@ -1,10 +1,21 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.infrastructure.db.repos import AdminRepositoryImpl, UserRepositoryImpl
+from src.infrastructure.db.identity_map import UserIdentityMap
+from src.infrastructure.db.repos import (
+    AdminRepositoryImpl,
+    BroadcastRepositoryImpl,
+    CheckRunRepositoryImpl,
+    DailyStatsRepositoryImpl,
+    UserRepositoryImpl,
+)
 
 
 class HolderDao:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
-        self.user_repo = UserRepositoryImpl(session)
+        self.users = UserIdentityMap()
+        self.user_repo = UserRepositoryImpl(session, self.users)
         self.admin_repo = AdminRepositoryImpl(session)
+        self.broadcast_repo = BroadcastRepositoryImpl(session)
+        self.check_run_repo = CheckRunRepositoryImpl(session)
+        self.daily_stats_repo = DailyStatsRepositoryImpl(session)
@@ -0,0 +1,66 @@
+"""Per-request caches sitting between the repositories and the session."""
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState
+
+from src.domain.user import User
+from src.domain.user.vo import UserId
+
+
+class UserIdentityMap:
+    """Users already loaded or written within one request, keyed by id.
+
+    Repositories keep it in sync with their own writes; changes made by
+    other sessions are not visible until the request ends.
+    """
+
+    def __init__(self) -> None:
+        self._users: dict[int, User] = {}
+
+    def get(self, user_id: UserId) -> User | None:
+        return self._users.get(user_id.value)
+
+    def put(self, user: User) -> User:
+        self._users[user.id.value] = user
+        return user
+
+    def evict(self, user_id: UserId) -> None:
+        self._users.pop(user_id.value, None)
+
+    def clear(self) -> None:
+        self._users.clear()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+
+class StatementCounter:
+    """Counts statements executed through a session, split into reads and writes.
+
+    Meant for tests and debugging: it listens on the session until
+    `close` is called. Textual statements are neither reads nor writes
+    and are counted as `other`.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.reads = 0
+        self.writes = 0
+        self.other = 0
+        self._session = session.sync_session
+        event.listen(self._session, "do_orm_execute", self._on_execute)
+
+    @property
+    def total(self) -> int:
+        return self.reads + self.writes + self.other
+
+    def close(self) -> None:
+        event.remove(self._session, "do_orm_execute", self._on_execute)
+
+    def _on_execute(self, state: ORMExecuteState) -> None:
+        if state.is_select:
+            self.reads += 1
+        elif state.is_insert or state.is_update or state.is_delete:
+            self.writes += 1
+        else:
+            self.other += 1
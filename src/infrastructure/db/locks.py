@@ -0,0 +1,37 @@
+"""Cross-process job locks over Postgres advisory locks."""
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.interfaces.lock import JobLock
+
+TRY_LOCK_STMT = text("SELECT pg_try_advisory_lock(hashtext(:key))")
+UNLOCK_STMT = text("SELECT pg_advisory_unlock(hashtext(:key))")
+
+
+class AdvisoryJobLock(JobLock):
+    """Session-level advisory locks, each held on a pooled connection.
+
+    Postgres frees a lock when its connection ends, so the locks of a
+    process that died are free again. Every held lock keeps one connection
+    of the pool busy.
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self._engine = engine
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[bool]:
+        async with self._engine.connect() as connection:
+            acquired = bool(await connection.scalar(TRY_LOCK_STMT, {"key": key}))
+            # The lock outlives the transaction; do not sit idle in one
+            await connection.commit()
+            try:
+                yield acquired
+            finally:
+                if acquired:
+                    await connection.execute(UNLOCK_STMT, {"key": key})
+                    await connection.commit()
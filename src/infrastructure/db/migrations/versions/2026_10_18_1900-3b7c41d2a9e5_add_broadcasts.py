@@ -0,0 +1,64 @@
+"""add_broadcasts
+
+Revision ID: 3b7c41d2a9e5
+Revises: e0b5590257d6
+Create Date: 2026-10-18 19:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7c41d2a9e5"
+down_revision: str | Sequence[str] | None = "e0b5590257d6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create broadcasts and their per-user delivery log."""
+    op.create_table(
+        "broadcasts",
+        sa.Column("id", sa.INTEGER(), autoincrement=True, nullable=False),
+        sa.Column("message_key", sa.String(128), nullable=False),
+        sa.Column("created_by", sa.BIGINT(), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("last_user_id", sa.BIGINT(), nullable=True),
+        sa.Column("delivered", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("blocked", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("failed", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_broadcasts_status", "broadcasts", ["status"])
+    op.create_table(
+        "broadcast_deliveries",
+        sa.Column("broadcast_id", sa.INTEGER(), nullable=False),
+        sa.Column("user_id", sa.BIGINT(), nullable=False),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["broadcast_id"], ["broadcasts.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("broadcast_id", "user_id"),
+    )
+
+
+def downgrade() -> None:
+    """Drop broadcasts and their delivery log."""
+    op.drop_table("broadcast_deliveries")
+    op.drop_index("ix_broadcasts_status", table_name="broadcasts")
+    op.drop_table("broadcasts")
@@ -0,0 +1,59 @@
+"""add_user_reachability
+
+Revision ID: 5d2e8f1a7c43
+Revises: 3b7c41d2a9e5
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2e8f1a7c43"
+down_revision: str | Sequence[str] | None = "3b7c41d2a9e5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add last check-alive result columns to users."""
+    op.add_column("users", sa.Column("reachability", sa.String(16), nullable=True))
+    op.add_column(
+        "users",
+        sa.Column(
+            "reachability_checked_at", sa.TIMESTAMP(timezone=True), nullable=True
+        ),
+    )
+    # Built without blocking writes to users for the whole build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_reachability_checked_at",
+            "users",
+            ["reachability_checked_at"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_users_reachable_id",
+            "users",
+            ["id"],
+            postgresql_where=sa.text("reachability IS NULL OR reachability = 'alive'"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop check-alive result columns from users."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_reachable_id", table_name="users", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_users_reachability_checked_at",
+            table_name="users",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("users", "reachability_checked_at")
+    op.drop_column("users", "reachability")
@@ -0,0 +1,56 @@
+"""add_check_runs
+
+Revision ID: 8c1f4b6e2d97
+Revises: 5d2e8f1a7c43
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8c1f4b6e2d97"
+down_revision: str | Sequence[str] | None = "5d2e8f1a7c43"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create alive check runs with their checkpoints."""
+    op.create_table(
+        "check_runs",
+        sa.Column("id", sa.INTEGER(), autoincrement=True, nullable=False),
+        sa.Column("created_by", sa.BIGINT(), nullable=False),
+        sa.Column("active_since_days", sa.INTEGER(), nullable=True),
+        sa.Column("unchecked_for_days", sa.INTEGER(), nullable=True),
+        sa.Column("status", sa.String(16), nullable=False),
+        sa.Column("last_user_id", sa.BIGINT(), nullable=True),
+        sa.Column("alive", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("blocked", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("deleted", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("rate_limited", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("other_errors", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_check_runs_status", "check_runs", ["status"])
+
+
+def downgrade() -> None:
+    """Drop alive check runs."""
+    op.drop_index("ix_check_runs_status", table_name="check_runs")
+    op.drop_table("check_runs")
@@ -0,0 +1,105 @@
+"""add_user_counters
+
+Revision ID: 4a9d2c7e1b58
+Revises: 8c1f4b6e2d97
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "4a9d2c7e1b58"
+down_revision: str | Sequence[str] | None = "8c1f4b6e2d97"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+COUNT_USERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION users_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    users_delta integer := 0;
+    referred_delta integer := 0;
+    user_slot smallint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        users_delta := 1;
+        referred_delta := (NEW.referred_by IS NOT NULL)::integer;
+        user_slot := mod(NEW.id, 16);
+    ELSIF TG_OP = 'DELETE' THEN
+        users_delta := -1;
+        referred_delta := -(OLD.referred_by IS NOT NULL)::integer;
+        user_slot := mod(OLD.id, 16);
+    ELSE
+        referred_delta := (NEW.referred_by IS NOT NULL)::integer
+            - (OLD.referred_by IS NOT NULL)::integer;
+        user_slot := mod(NEW.id, 16);
+    END IF;
+
+    IF users_delta <> 0 THEN
+        INSERT INTO user_counters (name, slot, value)
+        VALUES ('users', user_slot, users_delta)
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = user_counters.value + EXCLUDED.value;
+    END IF;
+    IF referred_delta <> 0 THEN
+        INSERT INTO user_counters (name, slot, value)
+        VALUES ('referred_users', user_slot, referred_delta)
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = user_counters.value + EXCLUDED.value;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+COUNT_USERS_TRIGGER = """
+CREATE OR REPLACE TRIGGER users_count
+AFTER INSERT OR DELETE OR UPDATE OF referred_by ON users
+FOR EACH ROW EXECUTE FUNCTION users_count()
+"""
+
+# Every slot of both counters, so an empty base reads as counted
+BACKFILL_COUNTERS = """
+INSERT INTO user_counters (name, slot, value)
+SELECT counters.name, slots.slot,
+       CASE counters.name
+           WHEN 'users' THEN coalesce(per_slot.users, 0)
+           ELSE coalesce(per_slot.referred, 0)
+       END
+FROM generate_series(0, 15) AS slots(slot)
+CROSS JOIN (VALUES ('users'), ('referred_users')) AS counters(name)
+LEFT JOIN (
+    SELECT mod(id, 16) AS slot,
+           count(*) AS users,
+           count(*) FILTER (WHERE referred_by IS NOT NULL) AS referred
+    FROM users
+    GROUP BY 1
+) AS per_slot ON per_slot.slot = slots.slot
+"""
+
+
+def upgrade() -> None:
+    """Count users and referred users in a table kept current by a trigger."""
+    op.create_table(
+        "user_counters",
+        sa.Column("name", sa.String(32), nullable=False),
+        sa.Column("slot", sa.SMALLINT(), nullable=False),
+        sa.Column("value", sa.BIGINT(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("name", "slot"),
+    )
+    # No user may be added between the backfill and the trigger
+    op.execute("LOCK TABLE users IN SHARE MODE")
+    op.execute(COUNT_USERS_FUNCTION)
+    op.execute(COUNT_USERS_TRIGGER)
+    op.execute(BACKFILL_COUNTERS)
+
+
+def downgrade() -> None:
+    """Drop the counters and their trigger."""
+    op.execute("DROP TRIGGER users_count ON users")
+    op.execute("DROP FUNCTION users_count()")
+    op.drop_table("user_counters")
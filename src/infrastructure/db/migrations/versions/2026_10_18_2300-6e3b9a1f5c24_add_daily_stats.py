@@ -0,0 +1,61 @@
+"""add_daily_stats
+
+Revision ID: 6e3b9a1f5c24
+Revises: 4a9d2c7e1b58
+Create Date: 2026-10-18 23:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "6e3b9a1f5c24"
+down_revision: str | Sequence[str] | None = "4a9d2c7e1b58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create per-day user stats; the rollup job fills them on its first run."""
+    op.create_table(
+        "daily_stats",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("new_users", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("referred_users", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column("active_users", sa.INTEGER(), server_default="0", nullable=False),
+        sa.Column(
+            "languages",
+            postgresql.JSONB(astext_type=sa.Text()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column("final", sa.Boolean(), server_default="false", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("day"),
+    )
+    # Built without blocking writes to users for the whole build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_created_at",
+            "users",
+            ["created_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop per-day user stats."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_created_at", table_name="users", postgresql_concurrently=True
+        )
+    op.drop_table("daily_stats")
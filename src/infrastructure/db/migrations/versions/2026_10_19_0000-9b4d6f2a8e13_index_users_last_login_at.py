@@ -0,0 +1,37 @@
+"""index_users_last_login_at
+
+Revision ID: 9b4d6f2a8e13
+Revises: 6e3b9a1f5c24
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4d6f2a8e13"
+down_revision: str | Sequence[str] | None = "6e3b9a1f5c24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index last logins for the rollup's and the broadcasts' active filters."""
+    # Built without blocking writes to users for the whole build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_users_last_login_at",
+            "users",
+            ["last_login_at"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop the last login index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_last_login_at", table_name="users", postgresql_concurrently=True
+        )
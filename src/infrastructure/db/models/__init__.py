@@ -1,5 +1,14 @@
+from .broadcast import BroadcastDeliveryModel, BroadcastModel
+from .check_run import CheckRunModel
+from .counters import UserCounterModel
+from .daily_stats import DailyStatsModel
 from .user import UserModel
 
 __all__ = [
+    "BroadcastDeliveryModel",
+    "BroadcastModel",
+    "CheckRunModel",
+    "DailyStatsModel",
+    "UserCounterModel",
     "UserModel",
 ]
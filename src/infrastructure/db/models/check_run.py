@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, BigInteger, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+
+class CheckRunModel(BaseORMModel):
+    __tablename__ = "check_runs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    created_by: Mapped[int] = mapped_column(BigInteger)
+    active_since_days: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    unchecked_for_days: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    status: Mapped[str] = mapped_column(String(16), index=True)
+    last_user_id: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    alive: Mapped[int] = mapped_column(Integer, server_default="0")
+    blocked: Mapped[int] = mapped_column(Integer, server_default="0")
+    deleted: Mapped[int] = mapped_column(Integer, server_default="0")
+    rate_limited: Mapped[int] = mapped_column(Integer, server_default="0")
+    other_errors: Mapped[int] = mapped_column(Integer, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
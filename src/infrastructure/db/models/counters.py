@@ -0,0 +1,75 @@
+from sqlalchemy import DDL, BigInteger, SmallInteger, String, event
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+# Rows per counter: concurrent sign-ups add to different rows, mostly
+SLOTS = 16
+
+USERS_COUNTER = "users"
+REFERRED_USERS_COUNTER = "referred_users"
+
+
+class UserCounterModel(BaseORMModel):
+    """Counts over `users`, kept current by the `users_count` trigger.
+
+    A counter is the sum of its slots; a user counts in slot `id % SLOTS`.
+    """
+
+    __tablename__ = "user_counters"
+
+    name: Mapped[str] = mapped_column(String(32), primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    value: Mapped[int] = mapped_column(BigInteger, server_default="0")
+
+
+# Spells out SLOTS and the counter names; the same statements are in the
+# migration that created the trigger
+COUNT_USERS_FUNCTION = """
+CREATE OR REPLACE FUNCTION users_count() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    users_delta integer := 0;
+    referred_delta integer := 0;
+    user_slot smallint;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        users_delta := 1;
+        referred_delta := (NEW.referred_by IS NOT NULL)::integer;
+        user_slot := mod(NEW.id, 16);
+    ELSIF TG_OP = 'DELETE' THEN
+        users_delta := -1;
+        referred_delta := -(OLD.referred_by IS NOT NULL)::integer;
+        user_slot := mod(OLD.id, 16);
+    ELSE
+        referred_delta := (NEW.referred_by IS NOT NULL)::integer
+            - (OLD.referred_by IS NOT NULL)::integer;
+        user_slot := mod(NEW.id, 16);
+    END IF;
+
+    IF users_delta <> 0 THEN
+        INSERT INTO user_counters (name, slot, value)
+        VALUES ('users', user_slot, users_delta)
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = user_counters.value + EXCLUDED.value;
+    END IF;
+    IF referred_delta <> 0 THEN
+        INSERT INTO user_counters (name, slot, value)
+        VALUES ('referred_users', user_slot, referred_delta)
+        ON CONFLICT (name, slot)
+        DO UPDATE SET value = user_counters.value + EXCLUDED.value;
+    END IF;
+    RETURN NULL;
+END;
+$$
+"""
+
+COUNT_USERS_TRIGGER = """
+CREATE OR REPLACE TRIGGER users_count
+AFTER INSERT OR DELETE OR UPDATE OF referred_by ON users
+FOR EACH ROW EXECUTE FUNCTION users_count()
+"""
+
+# Lets `metadata.create_all` build a working schema, e.g. in tests
+event.listen(BaseORMModel.metadata, "after_create", DDL(COUNT_USERS_FUNCTION))
+event.listen(BaseORMModel.metadata, "after_create", DDL(COUNT_USERS_TRIGGER))
@@ -0,0 +1,24 @@
+from datetime import date, datetime
+
+from sqlalchemy import TIMESTAMP, Boolean, Date, Integer, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import BaseORMModel
+
+
+class DailyStatsModel(BaseORMModel):
+    """Per-day rollup of `users`, one row per UTC day."""
+
+    __tablename__ = "daily_stats"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    new_users: Mapped[int] = mapped_column(Integer, server_default="0")
+    referred_users: Mapped[int] = mapped_column(Integer, server_default="0")
+    active_users: Mapped[int] = mapped_column(Integer, server_default="0")
+    # New users by language code
+    languages: Mapped[dict[str, int]] = mapped_column(JSONB, server_default="{}")
+    final: Mapped[bool] = mapped_column(Boolean, server_default="false")
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -1,8 +1,9 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey, func
+from sqlalchemy import TIMESTAMP, ForeignKey, Index, String, func, literal, or_
 from sqlalchemy.orm import Mapped, mapped_column
 
+from src.domain.admin import Reachability
 from src.domain.user.vo import (
     Bio,
     FirstName,
@@ -35,14 +36,15 @@ class UserModel(BaseORMModel):
         UsernameType, nullable=True, unique=False
     )
     bio: Mapped[Bio | None] = mapped_column(BioType, nullable=True)
+    # Indexed for the daily rollups, which read recent signups only
     created_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=func.now()
+        TIMESTAMP(timezone=True), server_default=func.now(), index=True
     )
     updated_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now()
     )
     last_login_at: Mapped[datetime] = mapped_column(
-        TIMESTAMP(timezone=True), server_default=func.now()
+        TIMESTAMP(timezone=True), server_default=func.now(), index=True
     )
     referred_by: Mapped[UserId | None] = mapped_column(
         UserIdType, ForeignKey("users.id"), nullable=True
@@ -53,3 +55,20 @@ class UserModel(BaseORMModel):
     language_code: Mapped[LanguageCode | None] = mapped_column(
         LanguageCodeType, server_default="en", nullable=True
     )
+    # Last check-alive result; NULL until the user is checked
+    reachability: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    reachability_checked_at: Mapped[datetime | None] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=True, index=True
+    )
+
+
+# Users not known to be unreachable. Queries filtering on it in the exact
+# same form can walk this partial index instead of the whole table. The
+# value is inlined: the planner cannot match a bind parameter of a generic
+# prepared plan to the index condition.
+IS_REACHABLE = or_(
+    UserModel.reachability.is_(None),
+    UserModel.reachability == literal(Reachability.ALIVE.value, literal_execute=True),
+)
+
+Index("ix_users_reachable_id", UserModel.id, postgresql_where=IS_REACHABLE)
@@ -0,0 +1,143 @@
+"""Cross-process locale change notifications over Postgres LISTEN/NOTIFY."""
+
+import asyncio
+from contextlib import suppress
+import logging
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from src.infrastructure.cache.locale import (
+    LocaleChangeCallback,
+    LocaleNotifier,
+    ReconnectCallback,
+)
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "user_locale_changed"
+
+
+class PostgresLocaleNotifier(LocaleNotifier):
+    """Publishes `<user_id>:<language_code>` payloads on a Postgres channel.
+
+    Subscribing holds one pooled connection for the lifetime of the
+    notifier; every process, the publisher included, receives each change.
+    When that connection drops, the notifier listens again on a new one,
+    retrying with exponential backoff from `reconnect_delay` up to
+    `max_reconnect_delay` seconds.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+    ) -> None:
+        self._engine = engine
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._listener: AsyncConnection | None = None
+        self._reconnecting: asyncio.Task[None] | None = None
+        self._callbacks: list[LocaleChangeCallback] = []
+        self._reconnect_callbacks: list[ReconnectCallback] = []
+
+    async def publish(self, user_id: int, language_code: str) -> None:
+        async with self._engine.begin() as connection:
+            await connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": CHANNEL, "payload": f"{user_id}:{language_code}"},
+            )
+
+    async def subscribe(
+        self,
+        callback: LocaleChangeCallback,
+        on_reconnect: ReconnectCallback | None = None,
+    ) -> None:
+        self._callbacks.append(callback)
+        if on_reconnect is not None:
+            self._reconnect_callbacks.append(on_reconnect)
+        if self._listener is not None or self._reconnecting is not None:
+            return
+
+        await self._listen()
+
+    async def close(self) -> None:
+        if self._reconnecting is not None:
+            self._reconnecting.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._reconnecting
+            self._reconnecting = None
+
+        if self._listener is None:
+            return
+
+        raw_connection = await self._listener.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        driver_connection.remove_termination_listener(self._on_termination)
+        await driver_connection.remove_listener(CHANNEL, self._on_notification)
+        await self._listener.close()
+        self._listener = None
+
+    async def _listen(self) -> None:
+        listener = await self._engine.connect()
+        try:
+            raw_connection = await listener.get_raw_connection()
+            driver_connection = raw_connection.driver_connection
+            await driver_connection.add_listener(CHANNEL, self._on_notification)
+            driver_connection.add_termination_listener(self._on_termination)
+        except BaseException:
+            await listener.close()
+            raise
+        self._listener = listener
+
+    def _on_termination(self, connection: Any) -> None:  # noqa: ANN401
+        if self._reconnecting is not None:
+            return
+
+        logger.warning("Locale listener connection lost, reconnecting")
+        self._reconnecting = asyncio.get_running_loop().create_task(self._reconnect())
+
+    async def _reconnect(self) -> None:
+        lost, self._listener = self._listener, None
+        if lost is not None:
+            # The pool must not hand the dead connection out again
+            with suppress(Exception):
+                await lost.invalidate()
+                await lost.close()
+
+        delay = self._reconnect_delay
+        while True:
+            try:
+                await self._listen()
+            except Exception:
+                logger.warning(
+                    "Failed to reconnect the locale listener, retrying in %.1fs",
+                    delay,
+                    exc_info=True,
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+            else:
+                break
+
+        self._reconnecting = None
+        logger.info("Locale listener reconnected")
+        for on_reconnect in self._reconnect_callbacks:
+            on_reconnect()
+
+    def _on_notification(
+        self,
+        connection: Any,  # noqa: ANN401
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        raw_user_id, _, language_code = payload.partition(":")
+        if not raw_user_id.isdigit() or not language_code:
+            logger.warning("Ignoring malformed locale notification %r", payload)
+            return
+
+        for callback in self._callbacks:
+            callback(int(raw_user_id), language_code)
@@ -1,7 +1,13 @@
 from .admin import AdminRepositoryImpl
+from .broadcast import BroadcastRepositoryImpl
+from .check_run import CheckRunRepositoryImpl
+from .daily_stats import DailyStatsRepositoryImpl
 from .user import UserRepositoryImpl
 
 __all__ = [
     "AdminRepositoryImpl",
+    "BroadcastRepositoryImpl",
+    "CheckRunRepositoryImpl",
+    "DailyStatsRepositoryImpl",
     "UserRepositoryImpl",
 ]
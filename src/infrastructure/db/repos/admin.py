@@ -1,20 +1,172 @@
+from collections.abc import AsyncIterator
 from datetime import UTC, datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import (
+    BigInteger,
+    ColumnElement,
+    and_,
+    func,
+    or_,
+    select,
+    tablesample,
+    text,
+    true,
+    type_coerce,
+)
+from sqlalchemy.orm import aliased
+from sqlalchemy.orm.util import AliasedClass
 
+from src.domain.admin import ReachabilityCheck
 from src.domain.admin.repository import AdminRepository
+from src.infrastructure.db.estimates import estimate_rows, sample_of, scale
 from src.infrastructure.db.models.user import UserModel
 from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
 
+SAVE_REACHABILITY_STMT = text(
+    """
+    UPDATE users
+    SET reachability = checks.reachability,
+        reachability_checked_at = checks.checked_at
+    FROM unnest(
+        CAST(:ids AS bigint[]),
+        CAST(:reachability AS varchar[]),
+        CAST(:checked_at AS timestamptz[])
+    ) AS checks(id, reachability, checked_at)
+    WHERE users.id = checks.id
+    """
+)
+
+# Rows sampled per wanted user: the filters drop rows after sampling, and
+# Bernoulli sampling returns a random number of them
+SAMPLE_OVERSAMPLING = 1.5
+
+
+def _users_filter(
+    active_since_days: int | None,
+    unchecked_for_days: int | None,
+    after_user_id: int | None = None,
+    users: type[UserModel] | AliasedClass[UserModel] = UserModel,
+) -> ColumnElement[bool]:
+    now = datetime.now(UTC)
+    conditions: list[ColumnElement[bool]] = []
+    if after_user_id is not None:
+        conditions.append(users.id > after_user_id)
+    if active_since_days is not None:
+        conditions.append(
+            users.last_login_at >= now - timedelta(days=active_since_days)
+        )
+    if unchecked_for_days is not None:
+        conditions.append(
+            or_(
+                users.reachability_checked_at.is_(None),
+                users.reachability_checked_at
+                < now - timedelta(days=unchecked_for_days),
+            )
+        )
+    return and_(true(), *conditions)
+
 
 class AdminRepositoryImpl(AdminRepository, BaseSQLAlchemyRepo):
-    async def get_all_user_ids(self, active_since_days: int | None = None) -> list[int]:
-        stmt = select(UserModel.id)
+    async def iter_user_ids(
+        self,
+        active_since_days: int | None = None,
+        page_size: int = 1000,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> AsyncIterator[int]:
+        # Plain ints: no UserId value object per row
+        user_id = type_coerce(UserModel.id, BigInteger)
+        # Cutoffs are fixed once, so pages agree on who is included
+        stmt = (
+            select(user_id)
+            .where(_users_filter(active_since_days, unchecked_for_days, after_user_id))
+            .order_by(user_id)
+            .limit(page_size)
+        )
+
+        last_id: int | None = None
+        while True:
+            # Keyset pagination: each page is an index range scan on users.id
+            page_stmt = stmt if last_id is None else stmt.where(user_id > last_id)
+            page = (await self._session.scalars(page_stmt)).all()
+            for value in page:
+                yield value
+            if len(page) < page_size:
+                return
+            last_id = page[-1]
+
+    async def count_users(
+        self,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> int:
+        stmt = select(func.count()).where(
+            _users_filter(active_since_days, unchecked_for_days, after_user_id)
+        )
+        return await self._session.scalar(stmt.select_from(UserModel)) or 0
+
+    async def estimate_users(
+        self,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> int:
+        rows = await estimate_rows(self._session, UserModel)
+        if rows is None:
+            return await self.count_users(
+                active_since_days, unchecked_for_days, after_user_id
+            )
+        if (active_since_days, unchecked_for_days, after_user_id) == (None,) * 3:
+            return rows
+
+        sampled = sample_of(UserModel, rows)
+        stmt = select(
+            func.count(),
+            func.count().filter(
+                _users_filter(
+                    active_since_days, unchecked_for_days, after_user_id, sampled
+                )
+            ),
+        ).select_from(sampled)
+        sampled_rows, matched = (await self._session.execute(stmt)).one()
+        return scale(rows, matched, sampled_rows)
+
+    async def sample_user_ids(
+        self,
+        size: int,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        population: int | None = None,
+    ) -> list[int]:
+        if population is None:
+            population = await self.count_users(active_since_days, unchecked_for_days)
+        if size <= 0 or population == 0:
+            return []
 
-        if active_since_days is not None:
-            cutoff = datetime.now(UTC) - timedelta(days=active_since_days)
-            stmt = stmt.where(UserModel.last_login_at >= cutoff)
+        # BERNOULLI keeps every row with the same probability, unlike SYSTEM
+        # which keeps whole pages; ORDER BY random() trims the excess evenly
+        percent = min(100.0, size / population * 100 * SAMPLE_OVERSAMPLING)
+        sampled = aliased(
+            UserModel, tablesample(UserModel.__table__, func.bernoulli(percent))
+        )
+        user_id = type_coerce(sampled.id, BigInteger)
+        stmt = (
+            select(user_id)
+            .where(_users_filter(active_since_days, unchecked_for_days, users=sampled))
+            .order_by(func.random())
+            .limit(size)
+        )
+        return sorted((await self._session.scalars(stmt)).all())
 
-        result = await self._session.execute(stmt)
-        # UserModel.id is a UserId value object, extract .value
-        return [row[0].value for row in result.all()]
+    async def save_reachability(self, checks: list[ReachabilityCheck]) -> None:
+        if not checks:
+            return
+        await self._session.execute(
+            SAVE_REACHABILITY_STMT,
+            {
+                "ids": [check.user_id for check in checks],
+                "reachability": [check.reachability.value for check in checks],
+                "checked_at": [check.checked_at for check in checks],
+            },
+        )
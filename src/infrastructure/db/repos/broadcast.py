@@ -0,0 +1,116 @@
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert
+
+from src.domain.broadcast import (
+    Broadcast,
+    BroadcastRepository,
+    BroadcastStatus,
+    Delivery,
+    Recipient,
+)
+from src.infrastructure.db.models.broadcast import (
+    BroadcastDeliveryModel,
+    BroadcastModel,
+)
+from src.infrastructure.db.models.user import IS_REACHABLE, UserModel
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+
+
+class BroadcastRepositoryImpl(BroadcastRepository, BaseSQLAlchemyRepo):
+    async def create(self, message_key: str, created_by: int) -> Broadcast:
+        model = BroadcastModel(
+            message_key=message_key,
+            created_by=created_by,
+            status=BroadcastStatus.DRAFT,
+            delivered=0,
+            blocked=0,
+            failed=0,
+        )
+        self._session.add(model)
+        await self._session.flush()
+        return self._to_domain(model)
+
+    async def get(self, broadcast_id: int) -> Broadcast | None:
+        model = await self._session.get(BroadcastModel, broadcast_id)
+        return self._to_domain(model) if model else None
+
+    async def get_running(self) -> list[Broadcast]:
+        stmt = (
+            select(BroadcastModel)
+            .where(BroadcastModel.status == BroadcastStatus.RUNNING)
+            .order_by(BroadcastModel.id)
+        )
+        result = await self._session.scalars(stmt)
+        return [self._to_domain(model) for model in result]
+
+    async def count_recipients(self) -> int:
+        return await self._session.scalar(
+            select(func.count()).select_from(UserModel).where(IS_REACHABLE)
+        )
+
+    async def get_recipients(
+        self, after_user_id: int | None, limit: int
+    ) -> list[Recipient]:
+        # Keyset pagination over the partial index of reachable users
+        stmt = (
+            select(UserModel.id, UserModel.language_code)
+            .where(IS_REACHABLE)
+            .order_by(UserModel.id)
+        )
+        if after_user_id is not None:
+            stmt = stmt.where(UserModel.id > after_user_id)
+
+        result = await self._session.execute(stmt.limit(limit))
+        return [
+            Recipient(
+                user_id=user_id.value,
+                language_code=language_code.value if language_code else None,
+            )
+            for user_id, language_code in result
+        ]
+
+    async def save(
+        self, broadcast: Broadcast, deliveries: list[Delivery] | None = None
+    ) -> None:
+        if deliveries:
+            # Re-sent recipients of an interrupted page keep their first result
+            await self._session.execute(
+                insert(BroadcastDeliveryModel)
+                .values(
+                    [
+                        {
+                            "broadcast_id": broadcast.id,
+                            "user_id": delivery.user_id,
+                            "status": delivery.status,
+                        }
+                        for delivery in deliveries
+                    ]
+                )
+                .on_conflict_do_nothing()
+            )
+
+        await self._session.execute(
+            update(BroadcastModel)
+            .where(BroadcastModel.id == broadcast.id)
+            .values(
+                status=broadcast.status,
+                last_user_id=broadcast.last_user_id,
+                delivered=broadcast.delivered,
+                blocked=broadcast.blocked,
+                failed=broadcast.failed,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _to_domain(model: BroadcastModel) -> Broadcast:
+        return Broadcast(
+            id=model.id,
+            message_key=model.message_key,
+            created_by=model.created_by,
+            status=BroadcastStatus(model.status),
+            last_user_id=model.last_user_id,
+            delivered=model.delivered,
+            blocked=model.blocked,
+            failed=model.failed,
+        )
@@ -0,0 +1,81 @@
+from sqlalchemy import select, update
+
+from src.domain.admin import CheckRun, CheckRunRepository, CheckRunStatus
+from src.infrastructure.db.models.check_run import CheckRunModel
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+
+
+class CheckRunRepositoryImpl(CheckRunRepository, BaseSQLAlchemyRepo):
+    async def create(
+        self,
+        created_by: int,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+    ) -> CheckRun:
+        model = CheckRunModel(
+            created_by=created_by,
+            active_since_days=active_since_days,
+            unchecked_for_days=unchecked_for_days,
+            status=CheckRunStatus.RUNNING,
+            alive=0,
+            blocked=0,
+            deleted=0,
+            rate_limited=0,
+            other_errors=0,
+        )
+        self._session.add(model)
+        await self._session.flush()
+        return self._to_domain(model)
+
+    async def get(self, run_id: int) -> CheckRun | None:
+        model = await self._session.get(CheckRunModel, run_id)
+        return self._to_domain(model) if model else None
+
+    async def get_running(self) -> list[CheckRun]:
+        stmt = (
+            select(CheckRunModel)
+            .where(CheckRunModel.status == CheckRunStatus.RUNNING)
+            .order_by(CheckRunModel.id)
+        )
+        result = await self._session.scalars(stmt)
+        return [self._to_domain(model) for model in result]
+
+    async def save(self, run: CheckRun) -> None:
+        await self._session.execute(
+            update(CheckRunModel)
+            .where(CheckRunModel.id == run.id)
+            .values(
+                status=run.status,
+                last_user_id=run.last_user_id,
+                alive=run.alive,
+                blocked=run.blocked,
+                deleted=run.deleted,
+                rate_limited=run.rate_limited,
+                other_errors=run.other_errors,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def abandon_running(self) -> None:
+        await self._session.execute(
+            update(CheckRunModel)
+            .where(CheckRunModel.status == CheckRunStatus.RUNNING)
+            .values(status=CheckRunStatus.ABANDONED)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def _to_domain(model: CheckRunModel) -> CheckRun:
+        return CheckRun(
+            id=model.id,
+            created_by=model.created_by,
+            active_since_days=model.active_since_days,
+            unchecked_for_days=model.unchecked_for_days,
+            status=CheckRunStatus(model.status),
+            last_user_id=model.last_user_id,
+            alive=model.alive,
+            blocked=model.blocked,
+            deleted=model.deleted,
+            rate_limited=model.rate_limited,
+            other_errors=model.other_errors,
+        )
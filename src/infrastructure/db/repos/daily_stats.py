@@ -0,0 +1,128 @@
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import Date, String, cast, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.sql.elements import ColumnElement
+
+from src.domain.admin import DailyStats, DailyStatsRepository
+from src.infrastructure.db.models.daily_stats import DailyStatsModel
+from src.infrastructure.db.models.user import UserModel
+from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
+
+# Key of new users without a language code
+UNKNOWN_LANGUAGE = "unknown"
+
+
+def _day_of(column: ColumnElement[datetime]) -> ColumnElement[date]:
+    return cast(func.timezone("UTC", column), Date)
+
+
+def _start_of(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=UTC)
+
+
+class DailyStatsRepositoryImpl(DailyStatsRepository, BaseSQLAlchemyRepo):
+    async def get_watermark(self) -> date | None:
+        return await self._session.scalar(
+            select(func.max(DailyStatsModel.day)).where(DailyStatsModel.final)
+        )
+
+    async def get_first_signup_day(self) -> date | None:
+        first_signup = await self._session.scalar(
+            select(func.min(UserModel.created_at))
+        )
+        return first_signup.astimezone(UTC).date() if first_signup else None
+
+    async def aggregate(self, since: date, until: date) -> list[DailyStats]:
+        start, end = _start_of(since), _start_of(until + timedelta(days=1))
+        days = {
+            since + timedelta(days=offset): DailyStats(
+                day=since + timedelta(days=offset)
+            )
+            for offset in range((until - since).days + 1)
+        }
+
+        signup_day = _day_of(UserModel.created_at)
+        language = func.coalesce(
+            type_coerce(UserModel.language_code, String), UNKNOWN_LANGUAGE
+        )
+        signups = await self._session.execute(
+            select(
+                signup_day,
+                language,
+                func.count(),
+                func.count(UserModel.referred_by),
+            )
+            .where(UserModel.created_at >= start, UserModel.created_at < end)
+            .group_by(signup_day, language)
+        )
+        for day, language_code, new_users, referred_users in signups:
+            stats = days[day]
+            stats.new_users += new_users
+            stats.referred_users += referred_users
+            stats.languages[language_code] = new_users
+
+        seen_day = _day_of(UserModel.last_login_at)
+        active = await self._session.execute(
+            select(seen_day, func.count())
+            .where(UserModel.last_login_at >= start, UserModel.last_login_at < end)
+            .group_by(seen_day)
+        )
+        for day, active_users in active:
+            days[day].active_users = active_users
+
+        return list(days.values())
+
+    async def save(self, stats: list[DailyStats]) -> None:
+        if not stats:
+            return
+
+        stmt = insert(DailyStatsModel).values(
+            [
+                {
+                    "day": day.day,
+                    "new_users": day.new_users,
+                    "referred_users": day.referred_users,
+                    "active_users": day.active_users,
+                    "languages": day.languages,
+                    "final": day.final,
+                }
+                for day in stats
+            ]
+        )
+        await self._session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=[DailyStatsModel.day],
+                set_={
+                    "new_users": stmt.excluded.new_users,
+                    "referred_users": stmt.excluded.referred_users,
+                    # Users seen earlier in the day may have been seen again
+                    # since; the earlier count of a day still running has them
+                    "active_users": func.greatest(
+                        DailyStatsModel.active_users, stmt.excluded.active_users
+                    ),
+                    "languages": stmt.excluded.languages,
+                    "final": stmt.excluded.final,
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    async def list_since(self, since: date) -> list[DailyStats]:
+        result = await self._session.scalars(
+            select(DailyStatsModel)
+            .where(DailyStatsModel.day >= since)
+            .order_by(DailyStatsModel.day)
+        )
+        return [self._to_domain(model) for model in result]
+
+    @staticmethod
+    def _to_domain(model: DailyStatsModel) -> DailyStats:
+        return DailyStats(
+            day=model.day,
+            new_users=model.new_users,
+            referred_users=model.referred_users,
+            active_users=model.active_users,
+            languages=dict(model.languages),
+            final=model.final,
+        )
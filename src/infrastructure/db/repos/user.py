@@ -1,17 +1,41 @@
-from sqlalchemy import func, select, update
+from dataclasses import replace
+
+from sqlalchemy import delete, exists, func, literal, select, text, update
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.domain.user.entity import User
 from src.domain.user.repository import ReferralStats, TopReferrer, UserRepository
 from src.domain.user.vo import LanguageCode, UserId, Username
+from src.infrastructure.db.estimates import estimate_rows, sample_of, scale
+from src.infrastructure.db.identity_map import UserIdentityMap
 from src.infrastructure.db.mappers import UserMapper
+from src.infrastructure.db.models.counters import (
+    REFERRED_USERS_COUNTER,
+    SLOTS,
+    USERS_COUNTER,
+    UserCounterModel,
+)
 from src.infrastructure.db.models.user import UserModel
 from src.infrastructure.db.repos.base import BaseSQLAlchemyRepo
 
 
 class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
+    def __init__(
+        self,
+        session: AsyncSession,
+        identity_map: UserIdentityMap | None = None,
+    ) -> None:
+        BaseSQLAlchemyRepo.__init__(self, session)
+        self._identity_map = (
+            identity_map if identity_map is not None else UserIdentityMap()
+        )
+
     async def get_user(self, identifier: UserId | Username) -> User | None:
         if isinstance(identifier, UserId):
+            if cached := self._identity_map.get(identifier):
+                return cached
             stmt = select(UserModel).where(UserModel.id == identifier)
         else:  # by == "username"
             stmt = select(UserModel).where(UserModel.username == identifier)
@@ -19,8 +43,10 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         result = await self._session.execute(stmt)
 
         user_model = result.scalars().first()
+        if user_model is None:
+            return None
 
-        return UserMapper.to_domain(user_model) if user_model else None
+        return self._identity_map.put(UserMapper.to_domain(user_model))
 
     async def create_user(self, user: User) -> User:
         stmt = (
@@ -39,7 +65,7 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
 
         result = await self._session.execute(stmt)
         orm_model = result.scalar_one()
-        return UserMapper.to_domain(orm_model)
+        return self._identity_map.put(UserMapper.to_domain(orm_model))
 
     async def update_user(self, user: User) -> User:
         stmt = (
@@ -56,7 +82,38 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
         )
         result = await self._session.execute(stmt)
         orm_model = result.scalar_one()
-        return UserMapper.to_domain(orm_model)
+        return self._identity_map.put(UserMapper.to_domain(orm_model))
+
+    async def upsert_user(self, user: User) -> User:
+        stmt = insert(UserModel).values(
+            id=user.id.value,
+            username=user.username.value if user.username else None,
+            first_name=user.first_name.value,
+            last_name=user.last_name.value if user.last_name else None,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login_at=user.last_login_at,
+        )
+        # `created_at` is left untouched on conflict, so `User.is_new` of the
+        # returned row tells an insert from an update.
+        stmt = (
+            stmt.on_conflict_do_update(
+                index_elements=[UserModel.id],
+                set_={
+                    "username": stmt.excluded.username,
+                    "first_name": stmt.excluded.first_name,
+                    "last_name": stmt.excluded.last_name,
+                    "updated_at": stmt.excluded.updated_at,
+                    "last_login_at": stmt.excluded.last_login_at,
+                },
+            )
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
+        )
+
+        result = await self._session.execute(stmt)
+        orm_model = result.scalar_one()
+        return self._identity_map.put(UserMapper.to_domain(orm_model))
 
     async def delete_user(self, user_id: UserId) -> None:
         raise NotImplementedError
@@ -68,6 +125,7 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
             .values(referred_by=referrer_id)
         )
         await self._session.execute(stmt)
+        self._identity_map.evict(user_id)
 
     async def increment_referral_count(self, user_id: UserId) -> None:
         stmt = (
@@ -76,24 +134,143 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
             .values(referral_count=UserModel.referral_count + 1)
         )
         await self._session.execute(stmt)
+        self._identity_map.evict(user_id)
+
+    async def apply_referral(self, user_id: UserId, referrer_id: UserId) -> bool:
+        # One statement: a repeated /start waits for the first one's row lock,
+        # then finds referred_by set and credits nobody
+        referrer = aliased(UserModel)
+        referred = (
+            update(UserModel)
+            .where(
+                UserModel.id == user_id,
+                UserModel.id != referrer_id,
+                UserModel.referred_by.is_(None),
+                exists().where(referrer.id == referrer_id),
+            )
+            .values(referred_by=referrer_id)
+            .returning(UserModel.id)
+            .cte("referred")
+        )
+        credited = (
+            update(UserModel)
+            .where(UserModel.id == referrer_id, exists(select(referred.c.id)))
+            .values(referral_count=UserModel.referral_count + 1)
+            .returning(UserModel.id)
+            .cte("credited")
+        )
+        applied = await self._session.scalar(select(exists(select(credited.c.id))))
+        if applied:
+            self._identity_map.evict(user_id)
+            self._identity_map.evict(referrer_id)
+        return bool(applied)
 
     async def get_referral_stats(self) -> ReferralStats:
-        total_query = select(func.count()).select_from(UserModel)
-        referred_query = (
-            select(func.count())
-            .select_from(UserModel)
-            .where(UserModel.referred_by.isnot(None))
+        if stats := await self._read_counters():
+            return stats
+        # Not counted yet: no user was ever added and no recount was run
+        return await self.count_referral_stats()
+
+    async def estimate_referral_stats(self) -> ReferralStats:
+        # The counters are exact and as cheap as any estimate
+        if stats := await self._read_counters():
+            return stats
+        rows = await estimate_rows(self._session, UserModel)
+        if rows is None:
+            return await self.count_referral_stats()
+
+        sampled = sample_of(UserModel, rows)
+        stmt = select(
+            func.count(),
+            func.count().filter(sampled.referred_by.isnot(None)),
+        ).select_from(sampled)
+        sampled_rows, matched = (await self._session.execute(stmt)).one()
+        referred = scale(rows, matched, sampled_rows)
+        return ReferralStats(
+            total_users=rows,
+            referred_count=referred,
+            organic_count=rows - referred,
+            estimated=True,
+        )
+
+    async def _read_counters(self) -> ReferralStats | None:
+        # A primary key range read of the counters the trigger keeps current
+        stmt = (
+            select(UserCounterModel.name, func.sum(UserCounterModel.value))
+            .where(UserCounterModel.name.in_([USERS_COUNTER, REFERRED_USERS_COUNTER]))
+            .group_by(UserCounterModel.name)
         )
+        counters = dict((await self._session.execute(stmt)).tuples().all())
+        if USERS_COUNTER not in counters:
+            return None
 
-        total = (await self._session.execute(total_query)).scalar() or 0
-        referred = (await self._session.execute(referred_query)).scalar() or 0
+        total = int(counters[USERS_COUNTER])
+        referred = int(counters.get(REFERRED_USERS_COUNTER, 0))
+        return ReferralStats(
+            total_users=total,
+            referred_count=referred,
+            organic_count=total - referred,
+        )
 
+    async def count_referral_stats(self) -> ReferralStats:
+        """Referral stats from one scan of `users`, ignoring the counters."""
+        stmt = select(
+            func.count(),
+            func.count().filter(UserModel.referred_by.isnot(None)),
+        ).select_from(UserModel)
+        total, referred = (await self._session.execute(stmt)).one()
         return ReferralStats(
             total_users=total,
             referred_count=referred,
             organic_count=total - referred,
         )
 
+    async def recount_referral_stats(self) -> ReferralStats:
+        # Blocks writes to users until commit, so no trigger update lands
+        # between the scan and the rewrite; reads go on
+        await self._session.execute(text("LOCK TABLE users IN SHARE MODE"))
+        await self._session.execute(
+            delete(UserCounterModel).where(
+                UserCounterModel.name.in_([USERS_COUNTER, REFERRED_USERS_COUNTER])
+            )
+        )
+
+        slot = func.mod(UserModel.id, SLOTS)
+        per_slot = (
+            select(
+                slot.label("slot"),
+                func.count().label("users"),
+                func.count()
+                .filter(UserModel.referred_by.isnot(None))
+                .label("referred"),
+            )
+            .group_by(slot)
+            .subquery()
+        )
+        # Every slot gets a row, so an empty base reads as zero, not "not counted"
+        slots = (
+            func.generate_series(0, SLOTS - 1)
+            .table_valued("slot")
+            .render_derived(name="slots")
+        )
+        for name, column in (
+            (USERS_COUNTER, per_slot.c.users),
+            (REFERRED_USERS_COUNTER, per_slot.c.referred),
+        ):
+            await self._session.execute(
+                insert(UserCounterModel).from_select(
+                    ["name", "slot", "value"],
+                    select(
+                        literal(name),
+                        slots.c.slot,
+                        func.coalesce(column, 0),
+                    ).select_from(
+                        slots.outerjoin(per_slot, per_slot.c.slot == slots.c.slot)
+                    ),
+                )
+            )
+        return await self.get_referral_stats()
+
     async def get_top_referrers(self, limit: int = 10) -> list[TopReferrer]:
         query = (
             select(UserModel)
@@ -123,3 +300,5 @@ class UserRepositoryImpl(UserRepository, BaseSQLAlchemyRepo):
             .values(language_code=language_code)
         )
         await self._session.execute(stmt)
+        if cached := self._identity_map.get(user_id):
+            self._identity_map.put(replace(cached, language_code=language_code))
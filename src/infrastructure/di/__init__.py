@@ -1,6 +1,7 @@
 from src.infrastructure.i18n import I18nProvider
 
 from .auth import AuthProvider
+from .cache import CacheProvider
 from .db import DBProvider
 from .interactors import AuthInteractorProvider, interactor_providers
 
@@ -11,6 +12,7 @@ infra_providers = [
 
 __all__ = [
     "AuthProvider",
+    "CacheProvider",
     "DBProvider",
     "I18nProvider",
     "infra_providers",
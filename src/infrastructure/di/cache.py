@@ -0,0 +1,124 @@
+from collections.abc import AsyncIterable
+
+from dishka import AsyncContainer, Provider, Scope, alias, provide
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.interfaces.locale import LocaleCache
+from src.application.referral.stats import (
+    GetStatsInteractor,
+    GetTopReferrersInteractor,
+    StatsOutputDTO,
+    TopReferrerDTO,
+)
+from src.infrastructure.cache import (
+    AdminStatsCache,
+    InMemoryLocaleCache,
+    LocaleNotifier,
+    MessageRenderCache,
+    NullLocaleNotifier,
+    StaleWhileRevalidateCache,
+    TTLCache,
+    UserProfileCache,
+)
+from src.infrastructure.config import Config
+from src.infrastructure.db.notifier import PostgresLocaleNotifier
+
+
+class CacheProvider(Provider):
+    scope = Scope.APP
+
+    locale_cache = alias(source=InMemoryLocaleCache, provides=LocaleCache)
+
+    @provide(scope=Scope.APP)
+    def get_user_profile_cache(self, config: Config) -> UserProfileCache:
+        return UserProfileCache(
+            TTLCache(
+                max_size=config.user_cache.max_size,
+                ttl_seconds=config.user_cache.ttl_seconds,
+            )
+        )
+
+    @provide(scope=Scope.APP)
+    def get_render_cache(self, config: Config) -> MessageRenderCache:
+        # Webhook workers get a chat's callbacks in turns, so a fingerprint
+        # one of them kept may be stale and skip an edit that is needed
+        webhook_workers = config.webhook.workers if config.webhook else 1
+        return MessageRenderCache(
+            TTLCache(
+                max_size=config.render_cache.max_size,
+                ttl_seconds=config.render_cache.ttl_seconds,
+            ),
+            enabled=webhook_workers == 1,
+        )
+
+    @provide(scope=Scope.APP)
+    async def get_admin_stats_cache(
+        self,
+        config: Config,
+        container: AsyncContainer,
+    ) -> AsyncIterable[AdminStatsCache]:
+        # Refreshes outlive the request that started them, so each one runs
+        # in a request scope of its own
+
+        async def load_stats(_: None) -> StatsOutputDTO:
+            async with container() as request_container:
+                interactor = await request_container.get(GetStatsInteractor)
+                return await interactor()
+
+        async def load_top_referrers(limit: int) -> list[TopReferrerDTO]:
+            async with container() as request_container:
+                interactor = await request_container.get(GetTopReferrersInteractor)
+                return await interactor(limit)
+
+        ttl_seconds = config.stats_cache.ttl_seconds
+        max_stale_seconds = config.stats_cache.max_stale_seconds
+        stats_cache = AdminStatsCache(
+            StaleWhileRevalidateCache(load_stats, ttl_seconds, max_stale_seconds),
+            StaleWhileRevalidateCache(
+                load_top_referrers, ttl_seconds, max_stale_seconds
+            ),
+        )
+        yield stats_cache
+        await stats_cache.close()
+
+    @provide(scope=Scope.APP)
+    async def get_locale_notifier(
+        self,
+        config: Config,
+        engine: AsyncEngine,
+    ) -> AsyncIterable[LocaleNotifier]:
+        notifier: LocaleNotifier
+        if config.locale_cache.notifier == "postgres":
+            notifier = PostgresLocaleNotifier(engine)
+        else:
+            notifier = NullLocaleNotifier()
+        yield notifier
+        await notifier.close()
+
+    @provide(scope=Scope.APP)
+    async def get_locale_cache(
+        self,
+        config: Config,
+        notifier: LocaleNotifier,
+        profile_cache: UserProfileCache,
+    ) -> AsyncIterable[InMemoryLocaleCache]:
+        locale_cache = InMemoryLocaleCache(
+            TTLCache(
+                max_size=config.locale_cache.max_size,
+                ttl_seconds=config.locale_cache.ttl_seconds,
+            ),
+            notifier,
+        )
+
+        def apply_remote_change(user_id: int, language_code: str) -> None:
+            locale_cache.put(user_id, language_code)
+            # The cached profile carries the old language
+            profile_cache.invalidate(user_id)
+
+        def drop_missed_changes() -> None:
+            # Changes published while the listener was down never arrived
+            locale_cache.clear()
+            profile_cache.clear()
+
+        await notifier.subscribe(apply_remote_change, drop_missed_changes)
+        yield locale_cache
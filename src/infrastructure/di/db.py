@@ -4,11 +4,20 @@ from dishka import Provider, Scope, provide
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.application.common.transaction import TransactionManager
-from src.domain.admin import AdminRepository
+from src.application.interfaces.activity import ActivityRecorder
+from src.application.interfaces.lock import JobLock
+from src.domain.admin import (
+    AdminRepository,
+    CheckRunRepository,
+    DailyStatsRepository,
+)
+from src.domain.broadcast import BroadcastRepository
 from src.domain.user import UserRepository
 from src.infrastructure.config import Config
+from src.infrastructure.db.activity import ActivityBuffer
 from src.infrastructure.db.factory import create_engine, create_session_maker
 from src.infrastructure.db.holder import HolderDao
+from src.infrastructure.db.locks import AdvisoryJobLock
 from src.infrastructure.db.transaction import TransactionManagerImpl
 
 
@@ -28,6 +37,24 @@ class DBProvider(Provider):
     ) -> async_sessionmaker[AsyncSession]:
         return create_session_maker(engine)
 
+    @provide(scope=Scope.APP)
+    def get_job_lock(self, engine: AsyncEngine) -> JobLock:
+        return AdvisoryJobLock(engine)
+
+    @provide(scope=Scope.APP)
+    async def get_activity_recorder(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        config: Config,
+    ) -> AsyncIterable[ActivityRecorder]:
+        buffer = ActivityBuffer(
+            session_maker,
+            flush_interval=config.activity.flush_interval_seconds,
+            max_batch_size=config.activity.max_batch_size,
+        )
+        yield buffer
+        await buffer.close()
+
     @provide(scope=Scope.REQUEST)
     async def get_session(
         self,
@@ -63,3 +90,24 @@ class DBProvider(Provider):
         holder_dao: HolderDao,
     ) -> AdminRepository:
         return holder_dao.admin_repo
+
+    @provide(scope=Scope.REQUEST)
+    async def get_broadcast_repository(
+        self,
+        holder_dao: HolderDao,
+    ) -> BroadcastRepository:
+        return holder_dao.broadcast_repo
+
+    @provide(scope=Scope.REQUEST)
+    async def get_check_run_repository(
+        self,
+        holder_dao: HolderDao,
+    ) -> CheckRunRepository:
+        return holder_dao.check_run_repo
+
+    @provide(scope=Scope.REQUEST)
+    async def get_daily_stats_repository(
+        self,
+        holder_dao: HolderDao,
+    ) -> DailyStatsRepository:
+        return holder_dao.daily_stats_repo
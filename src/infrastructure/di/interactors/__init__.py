@@ -1,11 +1,13 @@
 from .admin import AdminInteractorProvider
 from .auth import AuthInteractorProvider
+from .broadcast import BroadcastInteractorProvider
 from .referral import ReferralInteractorProvider
 from .user import UserInteractorProvider
 
 interactor_providers = [
     AdminInteractorProvider,
     AuthInteractorProvider,
+    BroadcastInteractorProvider,
     ReferralInteractorProvider,
     UserInteractorProvider,
 ]
@@ -13,6 +15,7 @@ interactor_providers = [
 __all__ = [
     "AdminInteractorProvider",
     "AuthInteractorProvider",
+    "BroadcastInteractorProvider",
     "ReferralInteractorProvider",
     "UserInteractorProvider",
     "interactor_providers",
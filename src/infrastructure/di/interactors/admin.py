@@ -1,15 +1,71 @@
 from dishka import Provider, Scope, provide
 
-from src.application.admin import CheckAliveInteractor
-from src.domain.admin import AdminRepository
+from src.application.admin import (
+    CheckAliveInteractor,
+    GetDailyStatsInteractor,
+    GetRunningCheckRunsInteractor,
+    RollupDailyStatsInteractor,
+    StartCheckAliveInteractor,
+)
+from src.application.common.transaction import TransactionManager
+from src.domain.admin import (
+    AdminRepository,
+    CheckRunRepository,
+    DailyStatsRepository,
+)
+from src.infrastructure.config import Config
 
 
 class AdminInteractorProvider(Provider):
     scope = Scope.REQUEST
 
+    @provide
+    def provide_start_check_alive_interactor(
+        self,
+        check_run_repository: CheckRunRepository,
+        transaction_manager: TransactionManager,
+    ) -> StartCheckAliveInteractor:
+        return StartCheckAliveInteractor(
+            check_run_repository=check_run_repository,
+            transaction_manager=transaction_manager,
+        )
+
     @provide
     def provide_check_alive_interactor(
         self,
         admin_repository: AdminRepository,
+        check_run_repository: CheckRunRepository,
+        transaction_manager: TransactionManager,
+        config: Config,
     ) -> CheckAliveInteractor:
-        return CheckAliveInteractor(admin_repository=admin_repository)
+        return CheckAliveInteractor(
+            admin_repository=admin_repository,
+            check_run_repository=check_run_repository,
+            transaction_manager=transaction_manager,
+            approximate_counts=config.stats_counts.approximate,
+        )
+
+    @provide
+    def provide_get_running_check_runs_interactor(
+        self,
+        check_run_repository: CheckRunRepository,
+    ) -> GetRunningCheckRunsInteractor:
+        return GetRunningCheckRunsInteractor(check_run_repository=check_run_repository)
+
+    @provide
+    def provide_rollup_daily_stats_interactor(
+        self,
+        daily_stats_repository: DailyStatsRepository,
+        transaction_manager: TransactionManager,
+    ) -> RollupDailyStatsInteractor:
+        return RollupDailyStatsInteractor(
+            daily_stats_repository=daily_stats_repository,
+            transaction_manager=transaction_manager,
+        )
+
+    @provide
+    def provide_get_daily_stats_interactor(
+        self,
+        daily_stats_repository: DailyStatsRepository,
+    ) -> GetDailyStatsInteractor:
+        return GetDailyStatsInteractor(daily_stats_repository=daily_stats_repository)
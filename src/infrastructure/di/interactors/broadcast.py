@@ -0,0 +1,67 @@
+from dishka import Provider, Scope, provide
+from fluentogram import TranslatorHub
+
+from src.application.broadcast import (
+    CancelBroadcastInteractor,
+    CreateBroadcastInteractor,
+    GetBroadcastInteractor,
+    GetRunningBroadcastsInteractor,
+    RunBroadcastInteractor,
+)
+from src.application.common.transaction import TransactionManager
+from src.domain.broadcast import BroadcastRepository
+from src.infrastructure.i18n import DEFAULT_LANGUAGE
+
+
+class BroadcastInteractorProvider(Provider):
+    scope = Scope.REQUEST
+
+    @provide
+    def provide_create_broadcast_interactor(
+        self,
+        broadcast_repository: BroadcastRepository,
+        transaction_manager: TransactionManager,
+    ) -> CreateBroadcastInteractor:
+        return CreateBroadcastInteractor(
+            broadcast_repository=broadcast_repository,
+            transaction_manager=transaction_manager,
+        )
+
+    @provide
+    def provide_cancel_broadcast_interactor(
+        self,
+        broadcast_repository: BroadcastRepository,
+        transaction_manager: TransactionManager,
+    ) -> CancelBroadcastInteractor:
+        return CancelBroadcastInteractor(
+            broadcast_repository=broadcast_repository,
+            transaction_manager=transaction_manager,
+        )
+
+    @provide
+    def provide_run_broadcast_interactor(
+        self,
+        broadcast_repository: BroadcastRepository,
+        transaction_manager: TransactionManager,
+        hub: TranslatorHub,
+    ) -> RunBroadcastInteractor:
+        return RunBroadcastInteractor(
+            broadcast_repository=broadcast_repository,
+            transaction_manager=transaction_manager,
+            hub=hub,
+            default_locale=DEFAULT_LANGUAGE,
+        )
+
+    @provide
+    def provide_get_running_broadcasts_interactor(
+        self,
+        broadcast_repository: BroadcastRepository,
+    ) -> GetRunningBroadcastsInteractor:
+        return GetRunningBroadcastsInteractor(broadcast_repository=broadcast_repository)
+
+    @provide
+    def provide_get_broadcast_interactor(
+        self,
+        broadcast_repository: BroadcastRepository,
+    ) -> GetBroadcastInteractor:
+        return GetBroadcastInteractor(broadcast_repository=broadcast_repository)
@@ -3,7 +3,11 @@ from dishka import Provider, Scope, provide
 from src.application.common.transaction import TransactionManager
 from src.application.referral.get_info import GetReferralInfoInteractor
 from src.application.referral.process import ProcessReferralInteractor
-from src.application.referral.stats import GetStatsInteractor, GetTopReferrersInteractor
+from src.application.referral.stats import (
+    GetStatsInteractor,
+    GetTopReferrersInteractor,
+    RecountStatsInteractor,
+)
 from src.domain.user import UserRepository
 from src.infrastructure.config import Config
 
@@ -39,8 +43,12 @@ class ReferralInteractorProvider(Provider):
     def provide_get_stats_interactor(
         self,
         user_repository: UserRepository,
+        config: Config,
     ) -> GetStatsInteractor:
-        return GetStatsInteractor(user_repository=user_repository)
+        return GetStatsInteractor(
+            user_repository=user_repository,
+            approximate=config.stats_counts.approximate,
+        )
 
     @provide
     def provide_get_top_referrers_interactor(
@@ -48,3 +56,14 @@ class ReferralInteractorProvider(Provider):
         user_repository: UserRepository,
     ) -> GetTopReferrersInteractor:
         return GetTopReferrersInteractor(user_repository=user_repository)
+
+    @provide
+    def provide_recount_stats_interactor(
+        self,
+        user_repository: UserRepository,
+        transaction_manager: TransactionManager,
+    ) -> RecountStatsInteractor:
+        return RecountStatsInteractor(
+            user_repository=user_repository,
+            transaction_manager=transaction_manager,
+        )
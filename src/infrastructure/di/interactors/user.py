@@ -1,8 +1,11 @@
 from dishka import Provider, Scope, provide
 
 from src.application.common.transaction import TransactionManager
+from src.application.interfaces.activity import ActivityRecorder
+from src.application.interfaces.locale import LocaleCache
 from src.application.user.create import CreateUserInteractor
 from src.application.user.get_me import GetUserProfileInteractor
+from src.application.user.interactors.touch import TouchUserInteractor
 from src.application.user.interactors.update_language import UpdateLanguageInteractor
 from src.application.user.service import UserService
 from src.domain.user import UserRepository
@@ -15,8 +18,9 @@ class UserInteractorProvider(Provider):
     def provide_user_service(
         self,
         user_repository: UserRepository,
+        activity_recorder: ActivityRecorder,
     ) -> UserService:
-        return UserService(user_repository)
+        return UserService(user_repository, activity_recorder)
 
     @provide
     def provide_user_profile_interactor(
@@ -43,8 +47,17 @@ class UserInteractorProvider(Provider):
         self,
         user_repository: UserRepository,
         transaction_manager: TransactionManager,
+        locale_cache: LocaleCache,
     ) -> UpdateLanguageInteractor:
         return UpdateLanguageInteractor(
             user_repository=user_repository,
             transaction_manager=transaction_manager,
+            locale_cache=locale_cache,
         )
+
+    @provide
+    def provide_touch_user_interactor(
+        self,
+        user_service: UserService,
+    ) -> TouchUserInteractor:
+        return TouchUserInteractor(user_service=user_service)
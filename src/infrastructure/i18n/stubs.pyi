@@ -12,6 +12,7 @@ class TranslatorRunner:
     """Type stubs for FluentTranslator with all available translation keys."""
 
     def bot_started(self) -> str: ...
+    def broadcast_example(self) -> str: ...
     def btn_back(self) -> str: ...
     def btn_language(self) -> str: ...
     def btn_settings(self) -> str: ...
@@ -24,6 +25,26 @@ class TranslatorRunner:
     def settings_language_changed(self) -> str: ...
     def settings_language_title(self) -> str: ...
     def settings_title(self) -> str: ...
+    def stats_daily_btn(self) -> str: ...
+    def stats_daily_day(
+        self, *, day: _I18nArg, new: _I18nArg, active: _I18nArg
+    ) -> str: ...
+    def stats_daily_empty(self) -> str: ...
+    def stats_daily_overview(
+        self,
+        *,
+        days: _I18nArg,
+        new: _I18nArg,
+        referred: _I18nArg,
+        referred_pct: _I18nArg,
+        organic: _I18nArg,
+        organic_pct: _I18nArg,
+        active_avg: _I18nArg,
+        languages: _I18nArg,
+    ) -> str: ...
+    def stats_daily_period_btn(self, *, days: _I18nArg) -> str: ...
+    def stats_daily_today(self) -> str: ...
+    def stats_estimated(self) -> str: ...
     def stats_no_inviters(self) -> str: ...
     def stats_overview(
         self,
@@ -33,6 +54,7 @@ class TranslatorRunner:
         referred_pct: _I18nArg,
         organic: _I18nArg,
         organic_pct: _I18nArg,
+        computed_at: _I18nArg,
     ) -> str: ...
     def stats_top_inviters_btn(self) -> str: ...
     def stats_top_inviters_header(self, *, limit: _I18nArg) -> str: ...
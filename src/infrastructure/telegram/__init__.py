@@ -0,0 +1,12 @@
+from .factory import create_api_server, create_session
+from .rate_limit import RateLimiter, TokenBucket, bulk_calls
+from .session import RateLimitedSession
+
+__all__ = [
+    "RateLimitedSession",
+    "RateLimiter",
+    "TokenBucket",
+    "bulk_calls",
+    "create_api_server",
+    "create_session",
+]
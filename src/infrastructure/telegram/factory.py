@@ -0,0 +1,44 @@
+from aiogram.client.telegram import PRODUCTION, TelegramAPIServer
+
+from src.infrastructure.config import RateLimitConfig, TelegramConfig
+from src.infrastructure.telegram.rate_limit import RateLimiter
+from src.infrastructure.telegram.session import RateLimitedSession
+
+
+def create_api_server(telegram: TelegramConfig) -> TelegramAPIServer:
+    session = telegram.session
+    if session.api_server is None:
+        return PRODUCTION
+    return TelegramAPIServer.from_base(
+        session.api_server, is_local=session.api_server_local
+    )
+
+
+def create_session(
+    telegram: TelegramConfig,
+    rate_limit: RateLimitConfig,
+    processes: int = 1,
+) -> RateLimitedSession:
+    """Session of one of `processes` processes sending as the same bot.
+
+    Each process gets an equal share of the bot's global rate limit.
+    """
+    limiter = RateLimiter(
+        global_rate=rate_limit.global_rate / processes,
+        global_burst=max(1.0, rate_limit.global_burst / processes),
+        chat_rate=rate_limit.chat_rate,
+        group_rate=rate_limit.group_rate,
+        chat_burst=rate_limit.chat_burst,
+        bulk_rate=rate_limit.global_rate * rate_limit.bulk_share / processes,
+    )
+    session = telegram.session
+    return RateLimitedSession(
+        limiter,
+        max_retries=rate_limit.max_retries,
+        limit=session.pool_size,
+        limit_per_host=session.pool_size_per_host,
+        keepalive_timeout=session.keepalive_timeout,
+        dns_cache_ttl=session.dns_cache_ttl,
+        api=create_api_server(telegram),
+        timeout=session.request_timeout,
+    )
@@ -0,0 +1,134 @@
+"""Token buckets pacing outgoing Bot API calls."""
+
+import asyncio
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+
+from src.infrastructure.cache import TTLCache
+
+# Buckets of chats that did not send for this long are full again anyway
+CHAT_BUCKET_TTL = 60
+MAX_CHAT_BUCKETS = 100_000
+
+_bulk: ContextVar[bool] = ContextVar("bulk_calls", default=False)
+
+
+@contextmanager
+def bulk_calls() -> Iterator[None]:
+    """Mark the Bot API calls made inside as bulk ones, e.g. of a broadcast.
+
+    Tasks created inside inherit the mark.
+    """
+    token = _bulk.set(True)
+    try:
+        yield
+    finally:
+        _bulk.reset(token)
+
+
+class TokenBucket:
+    """Allows `rate` calls per second with bursts of up to `capacity` calls."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long to wait before using it.
+
+        Tokens are taken even when there are none left, so concurrent
+        callers are served in the order they reserved.
+        """
+        now = self._clock()
+        self._tokens = min(
+            self._capacity, self._tokens + (now - self._updated_at) * self._rate
+        )
+        self._updated_at = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+class RateLimiter:
+    """Telegram's global and per-chat limits, plus a shared flood-wait pause.
+
+    Bulk calls (see `bulk_calls`) also wait for a bucket of `bulk_rate`, so
+    broadcasts and alive checks leave the rest of the global rate to calls
+    answering users.
+
+    Not thread-safe: meant to be shared by coroutines of a single event loop.
+    """
+
+    def __init__(
+        self,
+        global_rate: float,
+        global_burst: float,
+        chat_rate: float,
+        group_rate: float,
+        chat_burst: float,
+        bulk_rate: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._global = TokenBucket(global_rate, global_burst, clock)
+        # Bulk calls come in steady streams, so they get no burst
+        self._bulk = TokenBucket(bulk_rate, 1, clock) if bulk_rate else None
+        self._chat_rate = chat_rate
+        self._group_rate = group_rate
+        self._chat_burst = chat_burst
+        self._clock = clock
+        self._chats: TTLCache[Hashable, TokenBucket] = TTLCache(
+            max_size=MAX_CHAT_BUCKETS, ttl_seconds=CHAT_BUCKET_TTL, clock=clock
+        )
+        self._paused_until = 0.0
+
+    async def acquire(self, chat_id: Hashable | None = None) -> None:
+        """Wait until a call to `chat_id` (or to no chat) may be made."""
+        await self._wait_out_pause()
+
+        # Global tokens are taken last, so calls held back by their chat or
+        # by the bulk rate do not hold them while they wait
+        if chat_id is not None:
+            await self._wait(self._chat_bucket(chat_id).reserve())
+        if self._bulk is not None and _bulk.get():
+            await self._wait(self._bulk.reserve())
+        await self._wait(self._global.reserve())
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every call for `seconds`, e.g. after a flood-wait error."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    async def _wait(self, delay: float) -> None:
+        if delay > 0:
+            await asyncio.sleep(delay)
+            # A flood wait may have paused the bot while this call waited
+            await self._wait_out_pause()
+
+    async def _wait_out_pause(self) -> None:
+        # The pause may be extended while we sleep, so check it again after
+        while True:
+            pause = self._paused_until - self._clock()
+            if pause <= 0:
+                return
+            await asyncio.sleep(pause)
+
+    def _chat_bucket(self, chat_id: Hashable) -> TokenBucket:
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            # Groups and channels have negative ids and a stricter limit
+            is_group = isinstance(chat_id, str) or (
+                isinstance(chat_id, int) and chat_id < 0
+            )
+            rate = self._group_rate if is_group else self._chat_rate
+            bucket = TokenBucket(rate, self._chat_burst, self._clock)
+        # Refreshes the TTL, so only idle buckets expire
+        self._chats.set(chat_id, bucket)
+        return bucket
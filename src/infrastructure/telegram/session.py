@@ -0,0 +1,92 @@
+"""Aiogram session that paces requests through a `RateLimiter`."""
+
+import logging
+import ssl
+from typing import Any
+
+from aiogram import Bot, __version__
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import GetUpdates, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiohttp import ClientSession, TCPConnector
+from aiohttp.hdrs import USER_AGENT
+from aiohttp.http import SERVER_SOFTWARE
+import certifi
+
+from src.infrastructure.telegram.rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimitedSession(AiohttpSession):
+    """Waits for the limiter before each call and retries flood-waits.
+
+    A `retry_after` answer pauses every caller of the limiter, not only the
+    one that received it.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        max_retries: int = 3,
+        limit: int = 100,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = 60,
+        dns_cache_ttl: int = 3_600,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._connector_options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "keepalive_timeout": keepalive_timeout,
+            "ttl_dns_cache": dns_cache_ttl,
+        }
+        self._client: ClientSession | None = None
+        self._limiter = limiter
+        self._max_retries = max_retries
+
+    async def create_session(self) -> ClientSession:
+        # Owns its client, so the connector is tuned without aiogram internals
+        if self._client is None or self._client.closed:
+            self._client = ClientSession(
+                connector=TCPConnector(
+                    ssl=ssl.create_default_context(cafile=certifi.where()),
+                    **self._connector_options,
+                ),
+                headers={USER_AGENT: f"{SERVER_SOFTWARE} aiogram/{__version__}"},
+            )
+        return self._client
+
+    async def close(self) -> None:
+        if self._client is not None and not self._client.closed:
+            await self._client.close()
+        await super().close()
+
+    async def make_request(
+        self,
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+        timeout: int | None = None,  # noqa: ASYNC109 - aiogram's signature
+    ) -> TelegramType:
+        # Long polling is not a message and would hold a token for its timeout
+        if isinstance(method, GetUpdates):
+            return await super().make_request(bot, method, timeout)
+
+        chat_id = getattr(method, "chat_id", None)
+        attempt = 0
+        while True:
+            await self._limiter.acquire(chat_id)
+            try:
+                return await super().make_request(bot, method, timeout)
+            except TelegramRetryAfter as e:
+                self._limiter.pause(e.retry_after)
+                if attempt >= self._max_retries:
+                    raise
+                attempt += 1
+                logger.warning(
+                    "Flood wait on %s, pausing requests for %d seconds",
+                    method.__api_method__,
+                    e.retry_after,
+                )
@@ -0,0 +1,3 @@
+from .router import admin_router
+
+__all__ = ["admin_router"]
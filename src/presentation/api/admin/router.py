@@ -0,0 +1,42 @@
+from typing import Annotated
+
+from dishka.integrations.litestar import FromDishka, inject
+from litestar import Router, get
+from litestar.exceptions import PermissionDeniedException
+from litestar.params import Parameter
+
+from src.application.admin import DailyStatsDTO, GetDailyStatsInteractor
+from src.application.admin.rollup import MAX_DAYS
+from src.domain.user.vo import UserId
+from src.infrastructure.config import Config
+from src.presentation.api.admin.schemas import DailyStatsResponseSchema
+
+
+def ensure_admin(user_id: UserId, config: Config) -> None:
+    if user_id.value not in config.telegram.admin_ids:
+        raise PermissionDeniedException(detail="Admin access required")
+
+
+@get("/stats/daily", return_dto=DailyStatsResponseSchema)
+@inject
+async def get_daily_stats(
+    user_id: UserId,
+    config: FromDishka[Config],
+    interactor: FromDishka[GetDailyStatsInteractor],
+    days: Annotated[int, Parameter(ge=1, le=MAX_DAYS)] = 30,
+) -> list[DailyStatsDTO]:
+    """
+    Get per-day user stats of the last `days` days, oldest first.
+
+    Reads the daily rollups, so a 90-day chart costs 90 rows.
+    Requires an admin's JWT token in Authorization header.
+    """
+    ensure_admin(user_id, config)
+    return await interactor(days)
+
+
+admin_router = Router(
+    path="/admin",
+    route_handlers=[get_daily_stats],
+    tags=["admin"],
+)
@@ -0,0 +1,5 @@
+from src.application.admin import DailyStatsDTO
+from src.presentation.api.base.schemas import BaseResponseDTO
+
+
+class DailyStatsResponseSchema(BaseResponseDTO[DailyStatsDTO]): ...
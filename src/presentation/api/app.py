@@ -12,7 +12,9 @@ from src.infrastructure.auth import AuthServiceImpl
 from src.infrastructure.config import Config, load_config
 from src.infrastructure.di import interactor_providers
 from src.infrastructure.di.auth import AuthProvider
+from src.infrastructure.di.cache import CacheProvider
 from src.infrastructure.di.db import DBProvider
+from src.infrastructure.i18n import I18nProvider
 
 from .exception import (
     custom_exception_handler,
@@ -63,10 +65,18 @@ def create_app() -> Litestar:
 
     container = make_async_container(
         AuthProvider(),
+        CacheProvider(),
         DBProvider(),
+        I18nProvider(),
         *interactor_provider_instances,
         context={Config: config, AuthService: auth_service},
     )
 
     setup_dishka(container=container, app=app)
+
+    async def close_container() -> None:
+        # dishka does not own the container lifecycle in Litestar
+        await container.close()
+
+    app.on_shutdown.append(close_container)
     return app
@@ -0,0 +1,53 @@
+"""Periodic report of the hit rates of this process's in-memory caches."""
+
+import asyncio
+import logging
+
+from dishka import AsyncContainer
+
+from src.infrastructure.cache import (
+    CacheStats,
+    InMemoryLocaleCache,
+    MessageRenderCache,
+    UserProfileCache,
+)
+from src.presentation.bot.jobs import jobs
+
+logger = logging.getLogger(__name__)
+
+REPORT_JOB_KEY = "cache_stats_report"
+
+
+async def collect_cache_stats(container: AsyncContainer) -> dict[str, CacheStats]:
+    return {
+        "User profile": (await container.get(UserProfileCache)).stats,
+        "Locale": (await container.get(InMemoryLocaleCache)).stats,
+        "Render": (await container.get(MessageRenderCache)).stats,
+    }
+
+
+async def report_cache_stats(container: AsyncContainer) -> None:
+    for name, stats in (await collect_cache_stats(container)).items():
+        logger.info(
+            "%s cache: %d entries, %d hits, %d misses, %.1f%% hit rate",
+            name,
+            stats.size,
+            stats.hits,
+            stats.misses,
+            stats.hit_rate * 100,
+        )
+
+
+async def run_cache_reports(container: AsyncContainer, interval: float) -> None:
+    """Log the cache stats every `interval` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await report_cache_stats(container)
+        except Exception:
+            logger.exception("Failed to report cache stats")
+
+
+def start_cache_reports(container: AsyncContainer, interval: float) -> None:
+    """Report the caches of this process; start it in every bot process."""
+    jobs.start(REPORT_JOB_KEY, run_cache_reports(container, interval))
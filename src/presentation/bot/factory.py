@@ -0,0 +1,90 @@
+"""Bot, dispatcher and container wiring shared by polling and webhook modes."""
+
+from aiogram import Bot, Dispatcher
+from aiogram.client.default import DefaultBotProperties
+from aiogram.enums import ParseMode
+from dishka import AsyncContainer, make_async_container
+from dishka.integrations.aiogram import setup_dishka
+
+from src.infrastructure.config import Config
+from src.infrastructure.di import (
+    AuthProvider,
+    CacheProvider,
+    DBProvider,
+    I18nProvider,
+    interactor_providers,
+)
+from src.infrastructure.telegram import create_session
+from src.presentation.bot.middleware.user_and_locale import UserAndLocaleMiddleware
+from src.presentation.bot.routers import setup_routers
+from src.presentation.bot.routers.admin.broadcast import resume_broadcasts
+from src.presentation.bot.routers.admin.check_alive import (
+    notify_interrupted_checks,
+)
+from src.presentation.bot.routers.admin.daily_stats import start_daily_rollups
+from src.presentation.bot.scheduler import ChatScheduler
+
+
+def create_bot(config: Config, processes: int = 1) -> Bot:
+    """Bot of one of `processes` processes sharing the rate limits."""
+    return Bot(
+        token=config.telegram.bot_token,
+        session=create_session(config.telegram, config.rate_limit, processes),
+        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
+    )
+
+
+def create_container(config: Config) -> AsyncContainer:
+    interactor_provider_instances = [
+        interactor() for interactor in interactor_providers
+    ]
+
+    return make_async_container(
+        AuthProvider(),
+        CacheProvider(),
+        DBProvider(),
+        I18nProvider(),
+        *interactor_provider_instances,
+        context={Config: config},
+    )
+
+
+def create_dispatcher(config: Config, container: AsyncContainer) -> Dispatcher:
+    # Workflow data: `config` for AdminFilter, `app_container` for
+    # background jobs that outlive the update's request scope
+    dp = Dispatcher(config=config, app_container=container)
+    dp.include_router(setup_routers())
+    setup_dishka(container=container, router=dp)
+
+    # Register I18n middleware
+    dp.message.middleware(UserAndLocaleMiddleware())
+    dp.callback_query.middleware(UserAndLocaleMiddleware())
+
+    return dp
+
+
+def create_scheduler(
+    config: Config,
+    bot: Bot,
+    dispatcher: Dispatcher,
+    name: str = "scheduler",
+) -> ChatScheduler:
+    scheduler = config.scheduler
+    return ChatScheduler(
+        bot,
+        dispatcher,
+        max_concurrency=scheduler.max_concurrency or config.postgres.pool_size,
+        queue_size=scheduler.queue_size,
+        report_interval=scheduler.report_interval_seconds,
+        name=name,
+    )
+
+
+async def start_admin_jobs(bot: Bot, container: AsyncContainer, config: Config) -> None:
+    """Resume interrupted admin jobs and start the daily stats rollups.
+
+    Run it in one process only; another one would roll up the stats again.
+    """
+    await resume_broadcasts(bot, container)
+    await notify_interrupted_checks(bot, container)
+    start_daily_rollups(container, config.stats_rollup.interval_seconds)
@@ -0,0 +1,151 @@
+"""Long admin jobs (broadcasts, alive checks) running as background tasks."""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Coroutine
+from contextlib import asynccontextmanager, suppress
+import logging
+import time
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import InlineKeyboardMarkup
+from dishka import AsyncContainer
+
+from src.application.interfaces.lock import JobLock
+
+logger = logging.getLogger(__name__)
+
+# Seconds between progress edits of one job's message
+PROGRESS_INTERVAL = 3.0
+# Lock of the process doing the bot-wide background work
+LEADER_KEY = "leader"
+# Seconds between attempts of the other processes to take over
+LEADER_RETRY_INTERVAL = 30.0
+
+
+class JobRegistry:
+    """Background tasks of this process, at most one per key.
+
+    The key names the job, e.g. "check_alive" for a job only one of which
+    may run at a time, or "broadcast-7" for one per broadcast. Other
+    processes are not seen here: jobs that must run once per bot also
+    hold their key with `exclusive`.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._tasks
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def start(self, key: str, job: Coroutine[Any, Any, None]) -> bool:
+        """Run `job` in the background unless a job with `key` is running."""
+        if key in self._tasks:
+            job.close()
+            return False
+
+        task = asyncio.create_task(job, name=key)
+        self._tasks[key] = task
+        task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return True
+
+    def cancel(self, key: str) -> bool:
+        task = self._tasks.get(key)
+        if task is None:
+            return False
+        task.cancel()
+        return True
+
+    async def wait(self) -> None:
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def stop(self) -> None:
+        """Cancel every job and wait for them to finish."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+jobs = JobRegistry()
+
+
+@asynccontextmanager
+async def exclusive(container: AsyncContainer, key: str) -> AsyncIterator[bool]:
+    """Hold `key` across all bot processes; yields whether it was free."""
+    lock = await container.get(JobLock)
+    async with lock.hold(key) as acquired:
+        yield acquired
+
+
+async def lead(
+    container: AsyncContainer,
+    work: Callable[[], Awaitable[None]],
+    retry_interval: float = LEADER_RETRY_INTERVAL,
+) -> None:
+    """Run `work` in one bot process at a time, then hold on until cancelled.
+
+    The other processes retry every `retry_interval` seconds and run `work`
+    themselves once the leading one is gone.
+    """
+    while True:
+        async with exclusive(container, LEADER_KEY) as leading:
+            if leading:
+                try:
+                    await work()
+                except Exception:
+                    logger.exception("Leader startup work failed")
+                # Keep the lock, and the jobs `work` started, until cancelled
+                await asyncio.Event().wait()
+        await asyncio.sleep(retry_interval)
+
+
+class ProgressMessage:
+    """A message a job reports to, edited at most every `interval` seconds.
+
+    Edits are best effort: the job goes on if the message is gone.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        chat_id: int,
+        message_id: int,
+        interval: float = PROGRESS_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._bot = bot
+        self._chat_id = chat_id
+        self._message_id = message_id
+        self._interval = interval
+        self._clock = clock
+        self._last_edit: float | None = None
+
+    async def update(
+        self, text: str, reply_markup: InlineKeyboardMarkup | None = None
+    ) -> None:
+        """Show progress unless the last edit was less than `interval` ago."""
+        now = self._clock()
+        if self._last_edit is not None and now - self._last_edit < self._interval:
+            return
+        self._last_edit = now
+        await self._edit(text, reply_markup)
+
+    async def finish(
+        self, text: str, reply_markup: InlineKeyboardMarkup | None = None
+    ) -> None:
+        """Show the final state, whenever the last edit was."""
+        await self._edit(text, reply_markup)
+
+    async def _edit(self, text: str, reply_markup: InlineKeyboardMarkup | None) -> None:
+        with suppress(TelegramAPIError):
+            await self._bot.edit_message_text(
+                text=text,
+                chat_id=self._chat_id,
+                message_id=self._message_id,
+                reply_markup=reply_markup,
+            )
@@ -3,24 +3,23 @@ from contextlib import suppress
 import logging
 import sys
 
-from aiogram import Bot, Dispatcher
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
+from aiogram import Bot
 from aiogram.exceptions import TelegramAPIError
-from dishka import make_async_container
-from dishka.integrations.aiogram import setup_dishka
 from fluentogram import TranslatorHub
 
 from src.infrastructure.config import Config, load_config
-from src.infrastructure.di import (
-    AuthProvider,
-    DBProvider,
-    I18nProvider,
-    interactor_providers,
+from src.infrastructure.i18n import DEFAULT_LANGUAGE, create_translator_hub
+from src.presentation.bot.cache_stats import start_cache_reports
+from src.presentation.bot.factory import (
+    create_bot,
+    create_container,
+    create_dispatcher,
+    create_scheduler,
+    start_admin_jobs,
 )
-from src.infrastructure.i18n import DEFAULT_LANGUAGE
-from src.presentation.bot.middleware.user_and_locale import UserAndLocaleMiddleware
-from src.presentation.bot.routers import setup_routers
+from src.presentation.bot.jobs import jobs
+from src.presentation.bot.scheduler import poll_updates
+from src.presentation.bot.sharded import run_supervisor
 
 
 async def notify_admins_on_startup(
@@ -28,48 +27,58 @@ async def notify_admins_on_startup(
 ) -> None:
     """Send notification to admins when bot starts up."""
     i18n = hub.get_translator_by_locale(DEFAULT_LANGUAGE)
-    for admin_id in config.telegram.admin_ids:
+    text = i18n.get("bot-started")
+
+    async def notify(admin_id: int) -> None:
         try:
-            await bot.send_message(chat_id=admin_id, text=i18n.get("bot-started"))
+            await bot.send_message(chat_id=admin_id, text=text)
         except TelegramAPIError as e:
             logging.warning("Failed to notify admin %s: %s", admin_id, e)
 
+    # The bot session paces the messages
+    await asyncio.gather(*(notify(admin_id) for admin_id in config.telegram.admin_ids))
+
 
 async def main() -> None:
     config = load_config()
-    bot = Bot(
-        token=config.telegram.bot_token,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
-
-    interactor_provider_instances = [
-        interactor() for interactor in interactor_providers
-    ]
-
-    dp = Dispatcher()
-    main_router = setup_routers()
-    dp.include_router(main_router)
-
-    container = make_async_container(
-        AuthProvider(),
-        DBProvider(),
-        I18nProvider(),
-        *interactor_provider_instances,
-        context={Config: config},
-    )
-    setup_dishka(container=container, router=dp)
-
-    async with container() as request_container:
-        # Get TranslatorHub and admin notification
-        hub = await request_container.get(TranslatorHub)
-
-        # Register I18n middleware
-        dp.message.middleware(UserAndLocaleMiddleware())
-        dp.callback_query.middleware(UserAndLocaleMiddleware())
-
-        await notify_admins_on_startup(bot, config, hub)
-
-    await dp.start_polling(bot, config=config)
+    if config.sharding.workers > 1:
+        await run_sharded(config)
+        return
+
+    bot = create_bot(config)
+    container = create_container(config)
+    dp = create_dispatcher(config, container)
+
+    try:
+        async with container() as request_container:
+            # Get TranslatorHub and admin notification
+            hub = await request_container.get(TranslatorHub)
+            await notify_admins_on_startup(bot, config, hub)
+
+        await start_admin_jobs(bot, container, config)
+        start_cache_reports(container, config.scheduler.report_interval_seconds)
+        scheduler = create_scheduler(config, bot, dp)
+        try:
+            await poll_updates(bot, dp, scheduler)
+        finally:
+            await scheduler.wait_closed()
+            await jobs.stop()
+    finally:
+        # Runs finalizers of app-scoped dependencies, e.g. drains pending
+        # activity touches and disposes the engine
+        await container.close()
+        await bot.session.close()
+
+
+async def run_sharded(config: Config) -> None:
+    """Receive updates here and process them in `sharding.workers` processes."""
+    bot = create_bot(config)
+    try:
+        await notify_admins_on_startup(bot, config, create_translator_hub())
+    finally:
+        await bot.session.close()
+
+    await run_supervisor(config)
 
 
 if __name__ == "__main__":
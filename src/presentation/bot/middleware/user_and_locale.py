@@ -3,43 +3,104 @@
 from collections.abc import Awaitable, Callable
 from typing import Any
 
-from aiogram import BaseMiddleware
+from aiogram import BaseMiddleware, Router
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.dispatcher.flags import get_flag
 from aiogram.types import TelegramObject
 from aiogram.types import User as AiogramUser
 from dishka import AsyncContainer
 from dishka.integrations.aiogram import CONTAINER_NAME
-from fluentogram import TranslatorHub
+from fluentogram import TranslatorHub, TranslatorRunner
 
 from src.application.user.create import CreateUserInteractor
 from src.application.user.dtos import (
     CreateUserInputDTO,
     CreateUserOutputDTO,
 )
+from src.application.user.interactors import TouchUserDTO, TouchUserInteractor
+from src.domain.user.vo import UserId
+from src.infrastructure.cache import (
+    InMemoryLocaleCache,
+    ProfileFingerprint,
+    UserProfileCache,
+)
 from src.presentation.bot.utils.i18n import extract_language_code
 
+# Handler flag, e.g. `@router.message(Command("ping"), flags={SKIP_USER: True})`
+SKIP_USER = "skip_user"
+
+type Handler = Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]]
 
-class UserAndLocaleMiddleware(BaseMiddleware):
-    """Middleware that loads and injects user and i18n.
 
-    Adds `user` (or None) and `i18n` to handler data dict.
+class UserContext:
+    """Loads the event sender and their translator on first use.
+
+    Both are resolved at most once per update, so handlers may call the
+    getters from several places without extra queries. The user's activity
+    is recorded once per update too.
     """
 
-    async def __call__(
-        self,
-        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
-        event: TelegramObject,
-        data: dict[str, Any],
-    ) -> Any:  # noqa: ANN401
-        from_user: AiogramUser | None = getattr(event, "from_user", None)
-        if from_user is None:
-            return await handler(event, data)
+    def __init__(self, container: AsyncContainer, from_user: AiogramUser) -> None:
+        self._container = container
+        self._from_user = from_user
+        self._user: CreateUserOutputDTO | None = None
+        self._i18n: TranslatorRunner | None = None
+        self._touched = False
+
+    async def get_user(self) -> CreateUserOutputDTO:
+        if self._user is None:
+            self._user = await self._load_user()
+        return self._user
+
+    async def get_i18n(self) -> TranslatorRunner:
+        if self._i18n is None:
+            # Get locale: prefer saved language, fallback to Telegram language
+            locale = await self.get_language() or extract_language_code(
+                self._from_user.language_code
+            )
+            hub = await self._container.get(TranslatorHub)
+            self._i18n = hub.get_translator_by_locale(locale)
+        return self._i18n
+
+    async def get_language(self) -> str | None:
+        """Saved language of the user, read from the locale cache if possible."""
+        locale_cache = await self._container.get(InMemoryLocaleCache)
+        language_code = locale_cache.get(UserId(self._from_user.id))
+        if language_code is not None:
+            await self._touch()
+            return language_code.value
 
-        container: AsyncContainer = data[CONTAINER_NAME]
-        upsert_interactor = await container.get(CreateUserInteractor)
-        hub = await container.get(TranslatorHub)
+        user = await self.get_user()
+        if user.language_code:
+            locale_cache.put(user.id, user.language_code)
+        return user.language_code
+
+    async def _touch(self) -> None:
+        if self._touched:
+            return
+        self._touched = True
+        touch_interactor = await self._container.get(TouchUserInteractor)
+        await touch_interactor(TouchUserDTO(user_id=UserId(self._from_user.id)))
+
+    async def _load_user(self) -> CreateUserOutputDTO:
+        from_user = self._from_user
+        profile_cache = await self._container.get(UserProfileCache)
+
+        user = profile_cache.get(
+            from_user.id,
+            ProfileFingerprint(
+                username=from_user.username,
+                first_name=from_user.first_name,
+                last_name=from_user.last_name,
+            ),
+        )
+        if user is not None:
+            await self._touch()
+            return user
 
         # Create or update user
-        user_dto: CreateUserOutputDTO = await upsert_interactor(
+        upsert_interactor = await self._container.get(CreateUserInteractor)
+        user = await upsert_interactor(
             data=CreateUserInputDTO(
                 id=from_user.id,
                 username=from_user.username,
@@ -47,14 +108,55 @@ class UserAndLocaleMiddleware(BaseMiddleware):
                 last_name=from_user.last_name,
             )
         )
+        # The upsert has recorded the activity already
+        self._touched = True
+        profile_cache.put(user)
+        return user
 
-        # Get locale: prefer saved language, fallback to Telegram language
-        if user_dto.language_code:
-            locale = user_dto.language_code
-        else:
-            locale = extract_language_code(from_user.language_code)
 
-        data["user"] = user_dto
-        data["i18n"] = hub.get_translator_by_locale(locale)
+class UserAndLocaleMiddleware(BaseMiddleware):
+    """Middleware that injects user and i18n on demand.
+
+    Handlers declaring a `user` or `i18n` argument get them loaded before
+    the call; any other handler gets a `user_context` to load them lazily.
+    Handlers flagged with `SKIP_USER`, and routers passed to
+    `skip_user_loading`, get neither.
+    """
+
+    async def __call__(
+        self,
+        handler: Handler,
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        from_user: AiogramUser | None = getattr(event, "from_user", None)
+        if from_user is None or data.get(SKIP_USER) or get_flag(data, SKIP_USER):
+            return await handler(event, data)
+
+        context = UserContext(data[CONTAINER_NAME], from_user)
+        data["user_context"] = context
+
+        handler_object: HandlerObject | None = data.get("handler")
+        params = handler_object.params if handler_object else set()
+        if "user" in params:
+            data["user"] = await context.get_user()
+        if "i18n" in params:
+            data["i18n"] = await context.get_i18n()
 
         return await handler(event, data)
+
+
+async def _mark_skip_user(
+    handler: Handler,
+    event: TelegramObject,
+    data: dict[str, Any],
+) -> Any:  # noqa: ANN401
+    data[SKIP_USER] = True
+    return await handler(event, data)
+
+
+def skip_user_loading(router: Router) -> Router:
+    """Opt all handlers of `router` and its sub-routers out of user loading."""
+    router.message.outer_middleware(_mark_skip_user)
+    router.callback_query.outer_middleware(_mark_skip_user)
+    return router
@@ -1,16 +1,21 @@
 from aiogram import Router
 
 from src.presentation.bot.filters import AdminFilter
+from src.presentation.bot.middleware.user_and_locale import skip_user_loading
 
-from . import check_alive, stats
+from . import broadcast, check_alive, daily_stats, stats
 
 
 def setup_routers() -> Router:
     router = Router(name="admin routers")
     router.message.filter(AdminFilter())
     router.callback_query.filter(AdminFilter())
+    # Admin handlers pick their locale themselves and never need the user row
+    skip_user_loading(router)
     router.include_routers(
         stats.router,
+        daily_stats.router,
         check_alive.router,
+        broadcast.router,
     )
     return router
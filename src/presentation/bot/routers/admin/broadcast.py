@@ -0,0 +1,275 @@
+import html
+import logging
+
+from aiogram import Bot, F, Router
+from aiogram.exceptions import TelegramAPIError
+from aiogram.filters import Command, CommandObject
+from aiogram.types import (
+    CallbackQuery,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    Message,
+)
+from dishka import AsyncContainer
+from dishka.integrations.aiogram import FromDishka, inject
+from fluentogram import TranslatorHub
+from fluentogram.exceptions import KeyNotFoundError
+
+from src.application.broadcast import (
+    BroadcastProgress,
+    CancelBroadcastInteractor,
+    CreateBroadcastDTO,
+    CreateBroadcastInteractor,
+    GetBroadcastInteractor,
+    GetRunningBroadcastsInteractor,
+    RunBroadcastInteractor,
+)
+from src.domain.broadcast import Broadcast, BroadcastStatus
+from src.infrastructure.telegram import bulk_calls
+from src.presentation.bot.jobs import ProgressMessage, exclusive, jobs
+from src.presentation.bot.utils.admin_cb_data import (
+    BroadcastCBAction,
+    BroadcastCBData,
+)
+from src.presentation.bot.utils.i18n import extract_language_code
+
+logger = logging.getLogger(__name__)
+
+router = Router(name="admin_broadcast")
+
+ALREADY_SENDING = "The broadcast is already being sent."
+
+
+def job_key(broadcast_id: int) -> str:
+    return f"broadcast-{broadcast_id}"
+
+
+def _build_confirm_keyboard(broadcast_id: int) -> InlineKeyboardMarkup:
+    """Build send/cancel buttons for a broadcast preview."""
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="Send to all users",
+                    callback_data=BroadcastCBData(
+                        action=BroadcastCBAction.SEND, broadcast_id=broadcast_id
+                    ).pack(),
+                ),
+                InlineKeyboardButton(
+                    text="Cancel",
+                    callback_data=BroadcastCBData(
+                        action=BroadcastCBAction.CANCEL, broadcast_id=broadcast_id
+                    ).pack(),
+                ),
+            ],
+        ],
+    )
+
+
+def _format_progress(progress: BroadcastProgress) -> str:
+    """Format progress message during a broadcast."""
+    broadcast = progress.broadcast
+    total = max(progress.total, broadcast.processed)
+    percent = (broadcast.processed / total * 100) if total > 0 else 0
+    return (
+        f"Broadcast #{broadcast.id} is being sent...\n\n"
+        f"Progress: {broadcast.processed}/{total} ({percent:.1f}%)\n"
+        f"{_format_counts(broadcast)}"
+    )
+
+
+def _format_result(broadcast: Broadcast) -> str:
+    """Format final result message."""
+    return f"Broadcast #{broadcast.id} complete!\n\n{_format_counts(broadcast)}"
+
+
+def _format_counts(broadcast: Broadcast) -> str:
+    return (
+        f"Delivered: {broadcast.delivered}\n"
+        f"Blocked: {broadcast.blocked}\n"
+        f"Failed: {broadcast.failed}"
+    )
+
+
+async def _run_broadcast(
+    bot: Bot,
+    container: AsyncContainer,
+    broadcast_id: int,
+    chat_id: int,
+    message_id: int,
+) -> None:
+    message = ProgressMessage(bot, chat_id, message_id)
+    last_progress = None
+    try:
+        async with container() as request_container:
+            interactor = await request_container.get(RunBroadcastInteractor)
+            with bulk_calls():
+                async for progress in interactor.execute(bot, broadcast_id):
+                    last_progress = progress
+                    if progress.broadcast.status == BroadcastStatus.RUNNING:
+                        await message.update(_format_progress(progress))
+    except Exception:
+        logger.exception("Broadcast %d failed", broadcast_id)
+        await message.finish(
+            f"Broadcast #{broadcast_id} stopped with an error. "
+            "It will resume after the bot restarts.",
+        )
+        return
+
+    if last_progress is None:
+        await message.finish(f"Broadcast #{broadcast_id} has already finished.")
+        return
+    await message.finish(_format_result(last_progress.broadcast))
+
+
+async def _send_broadcast(
+    bot: Bot,
+    container: AsyncContainer,
+    broadcast_id: int,
+    chat_id: int,
+    message_id: int,
+) -> None:
+    """Run the broadcast unless another bot process is sending it."""
+    async with exclusive(container, job_key(broadcast_id)) as acquired:
+        if acquired:
+            await _run_broadcast(bot, container, broadcast_id, chat_id, message_id)
+            return
+
+    await ProgressMessage(bot, chat_id, message_id).finish(
+        f"Broadcast #{broadcast_id} is already being sent."
+    )
+
+
+async def _resume_broadcast(
+    bot: Bot, container: AsyncContainer, broadcast: Broadcast
+) -> None:
+    async with exclusive(container, job_key(broadcast.id)) as acquired:
+        if not acquired:
+            # Another process is sending it, it was not interrupted
+            return
+
+        try:
+            message = await bot.send_message(
+                chat_id=broadcast.created_by,
+                text=f"Resuming broadcast #{broadcast.id}...",
+            )
+        except TelegramAPIError as e:
+            logger.warning("Failed to notify admin %s: %s", broadcast.created_by, e)
+            return
+        await _run_broadcast(
+            bot, container, broadcast.id, message.chat.id, message.message_id
+        )
+
+
+def start_broadcast(
+    bot: Bot,
+    container: AsyncContainer,
+    broadcast_id: int,
+    chat_id: int,
+    message_id: int,
+) -> bool:
+    """Send a broadcast in the background, reporting to the given message.
+
+    Returns False if this process is sending the broadcast already.
+    """
+    return jobs.start(
+        job_key(broadcast_id),
+        _send_broadcast(bot, container, broadcast_id, chat_id, message_id),
+    )
+
+
+async def resume_broadcasts(bot: Bot, container: AsyncContainer) -> None:
+    """Restart broadcasts interrupted by a shutdown from their checkpoints."""
+    async with container() as request_container:
+        interactor = await request_container.get(GetRunningBroadcastsInteractor)
+        broadcasts = await interactor()
+
+    for broadcast in broadcasts:
+        jobs.start(job_key(broadcast.id), _resume_broadcast(bot, container, broadcast))
+
+
+@router.message(Command("broadcast"))
+@inject
+async def broadcast_handler(
+    message: Message,
+    command: CommandObject,
+    hub: FromDishka[TranslatorHub],
+    interactor: FromDishka[CreateBroadcastInteractor],
+) -> None:
+    """Handle /broadcast <message-key> admin command."""
+    message_key = (command.args or "").strip()
+    if not message_key:
+        await message.answer(
+            "Usage: /broadcast &lt;message-key&gt;\n\n"
+            "The message is taken from the locale files and sent to every "
+            "user in their language."
+        )
+        return
+
+    locale = extract_language_code(message.from_user.language_code)
+    try:
+        preview = hub.get_translator_by_locale(locale).get(message_key)
+    except KeyNotFoundError:
+        await message.answer(f"Unknown message key: {html.escape(message_key)}")
+        return
+
+    broadcast = await interactor(
+        CreateBroadcastDTO(message_key=message_key, created_by=message.from_user.id)
+    )
+    await message.answer(
+        f"Broadcast #{broadcast.id} preview:\n\n{preview}",
+        reply_markup=_build_confirm_keyboard(broadcast.id),
+    )
+
+
+@router.callback_query(BroadcastCBData.filter(F.action == BroadcastCBAction.SEND))
+@inject
+async def cb_send_broadcast(
+    callback: CallbackQuery,
+    callback_data: BroadcastCBData,
+    bot: Bot,
+    app_container: AsyncContainer,
+    interactor: FromDishka[GetBroadcastInteractor],
+) -> None:
+    """Start sending a confirmed broadcast."""
+    broadcast_id = callback_data.broadcast_id
+    if job_key(broadcast_id) in jobs:
+        await callback.answer(ALREADY_SENDING, show_alert=True)
+        return
+
+    broadcast = await interactor(broadcast_id)
+    if broadcast is None or broadcast.is_finished:
+        await callback.answer(
+            "The broadcast has already been sent or cancelled.", show_alert=True
+        )
+        return
+
+    await callback.message.edit_text(f"Starting broadcast #{broadcast_id}...")
+    # A double tap may have started it meanwhile; the message is its now
+    if not start_broadcast(
+        bot,
+        app_container,
+        broadcast_id,
+        callback.message.chat.id,
+        callback.message.message_id,
+    ):
+        await callback.answer(ALREADY_SENDING, show_alert=True)
+        return
+    await callback.answer()
+
+
+@router.callback_query(BroadcastCBData.filter(F.action == BroadcastCBAction.CANCEL))
+@inject
+async def cb_cancel_broadcast(
+    callback: CallbackQuery,
+    callback_data: BroadcastCBData,
+    interactor: FromDishka[CancelBroadcastInteractor],
+) -> None:
+    """Cancel a broadcast before it is sent."""
+    broadcast = await interactor(callback_data.broadcast_id)
+    if broadcast is None:
+        await callback.answer("The broadcast has already been started.")
+        return
+
+    await callback.answer()
+    await callback.message.edit_text(f"Broadcast #{broadcast.id} cancelled.")
@@ -1,37 +1,59 @@
-from aiogram import Bot, Router
-from aiogram.types import CallbackQuery, InlineKeyboardButton, InlineKeyboardMarkup
-from dishka.integrations.aiogram import FromDishka, inject
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import logging
+
+from aiogram import Bot, F, Router
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import CallbackQuery, Message
+from dishka import AsyncContainer
 
 from src.application.admin import (
     CheckAliveInput,
     CheckAliveInteractor,
+    CheckAliveProgress,
     CheckAliveResult,
+    Estimate,
+    GetRunningCheckRunsInteractor,
+    SampleCheckInput,
+    SampleEstimate,
+    StartCheckAliveInteractor,
 )
+from src.infrastructure.telegram import bulk_calls
+from src.presentation.bot.jobs import ProgressMessage, exclusive, jobs
 from src.presentation.bot.utils.admin_cb_data import (
+    CancelJobCBData,
     CheckAliveCBData,
     CheckAliveCBFilter,
+    ResumeCheckAliveCBData,
+)
+from src.presentation.bot.utils.markups.admin import (
+    build_resume_check_alive_keyboard,
+    get_back_to_stats_keyboard,
+    get_cancel_job_keyboard,
 )
 
+logger = logging.getLogger(__name__)
+
 router = Router(name="admin_check_alive")
 
+# Only one alive check runs at a time: parallel ones would share the rate limit
+JOB_KEY = "check_alive"
 
-def _build_back_button() -> InlineKeyboardMarkup:
-    """Build back button to return to stats."""
-    return InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text="Back to Stats", callback_data="admin:back_to_stats"
-                )
-            ],
-        ],
-    )
+# Results younger than this are trusted by the "not checked" filter
+STALE_AFTER_DAYS = 7
+
+ALREADY_RUNNING = "An alive check is already running."
 
 
-def _format_progress(processed: int, total: int) -> str:
-    """Format progress message during check."""
+def _format_progress(processed: int, total: int, estimated: bool = False) -> str:
+    """Format progress message during check; estimated totals read ~N."""
     percent = (processed / total * 100) if total > 0 else 0
-    return f"Checking alive users...\n\nProgress: {processed}/{total} ({percent:.1f}%)"
+    total_text = f"~{total}" if estimated else str(total)
+    return (
+        "Checking alive users...\n\n"
+        f"Progress: {processed}/{total_text} ({percent:.1f}%)"
+    )
 
 
 def _format_result(result: CheckAliveResult) -> str:
@@ -57,49 +79,312 @@ def _format_result(result: CheckAliveResult) -> str:
         lines.append(f"Other errors: {result.other_errors} ({other_pct:.1f}%)")
 
     if result.rate_limited > 0:
-        lines.append(f"\nRate limited retries: {result.rate_limited}")
+        lines.append(f"\nStill rate limited after retries: {result.rate_limited}")
 
     return "\n".join(lines)
 
 
+def _format_estimate(estimate: SampleEstimate) -> str:
+    """Format the shares estimated by a sampled check."""
+    if estimate.sample_size == 0:
+        return "No users to sample."
+
+    population = (
+        f"~{estimate.population}"
+        if estimate.population_estimated
+        else str(estimate.population)
+    )
+
+    def line(label: str, share: Estimate) -> str:
+        return (
+            f"{label}: {share.share:.1%} (95% CI {share.low:.1%} to {share.high:.1%})"
+        )
+
+    return "\n".join(
+        [
+            "Sample Check Complete!\n",
+            f"Checked {estimate.sample_size} of {population} users",
+            line("Alive", estimate.alive),
+            line("Blocked bot", estimate.blocked),
+            line("Deleted account", estimate.deleted),
+        ]
+    )
+
+
+async def _run_sample_check(
+    bot: Bot,
+    container: AsyncContainer,
+    chat_id: int,
+    message_id: int,
+) -> None:
+    message = ProgressMessage(bot, chat_id, message_id)
+    cancel_keyboard = get_cancel_job_keyboard(JOB_KEY)
+    estimate = None
+    try:
+        async with container() as request_container:
+            interactor = await request_container.get(CheckAliveInteractor)
+            async for progress in interactor.sample(bot, SampleCheckInput()):
+                estimate = progress.estimate
+                await message.update(
+                    _format_progress(
+                        progress.processed, progress.total, progress.total_estimated
+                    ),
+                    reply_markup=cancel_keyboard,
+                )
+    except asyncio.CancelledError:
+        await message.finish(
+            "Sample check cancelled.", reply_markup=get_back_to_stats_keyboard()
+        )
+        raise
+    except Exception:
+        logger.exception("Sample check failed")
+        await message.finish(
+            "Sample check stopped with an error.",
+            reply_markup=get_back_to_stats_keyboard(),
+        )
+        return
+
+    text = _format_estimate(estimate) if estimate else "Sample check finished."
+    await message.finish(text, reply_markup=get_back_to_stats_keyboard())
+
+
+async def _run_check_alive(
+    bot: Bot,
+    container: AsyncContainer,
+    run_id: int,
+    chat_id: int,
+    message_id: int,
+) -> None:
+    message = ProgressMessage(bot, chat_id, message_id)
+    cancel_keyboard = get_cancel_job_keyboard(JOB_KEY)
+    last_progress: CheckAliveProgress | None = None
+    try:
+        async with container() as request_container:
+            interactor = await request_container.get(CheckAliveInteractor)
+            async for progress in interactor.execute(bot=bot, run_id=run_id):
+                last_progress = progress
+                await message.update(
+                    _format_progress(
+                        progress.processed, progress.total, progress.total_estimated
+                    ),
+                    reply_markup=cancel_keyboard,
+                )
+    except asyncio.CancelledError:
+        paused_at = f" at {last_progress.processed}" if last_progress else ""
+        await message.finish(
+            f"Alive check paused{paused_at}. Results up to the last "
+            "checkpoint are kept.",
+            reply_markup=build_resume_check_alive_keyboard(run_id),
+        )
+        raise
+    except Exception:
+        logger.exception("Alive check %d failed", run_id)
+        await message.finish(
+            "Alive check stopped with an error.",
+            reply_markup=build_resume_check_alive_keyboard(run_id),
+        )
+        return
+
+    if last_progress is None:
+        await message.finish(
+            "This alive check has already finished.",
+            reply_markup=get_back_to_stats_keyboard(),
+        )
+        return
+
+    await message.finish(
+        _format_result(last_progress.current_result),
+        reply_markup=get_back_to_stats_keyboard(),
+    )
+
+
+async def _run_exclusively(
+    bot: Bot,
+    container: AsyncContainer,
+    chat_id: int,
+    message_id: int,
+    check: Callable[[], Awaitable[None]],
+) -> None:
+    """Run `check` unless an alive check is running in any bot process."""
+    async with exclusive(container, JOB_KEY) as acquired:
+        if acquired:
+            with bulk_calls():
+                await check()
+            return
+
+    await ProgressMessage(bot, chat_id, message_id).finish(
+        ALREADY_RUNNING, reply_markup=get_back_to_stats_keyboard()
+    )
+
+
+def _start_check(
+    bot: Bot,
+    container: AsyncContainer,
+    chat_id: int,
+    message_id: int,
+    check: Callable[[], Awaitable[None]],
+) -> bool:
+    return jobs.start(
+        JOB_KEY, _run_exclusively(bot, container, chat_id, message_id, check)
+    )
+
+
+def start_check_alive(
+    bot: Bot,
+    container: AsyncContainer,
+    run_id: int,
+    chat_id: int,
+    message_id: int,
+) -> bool:
+    """Run an alive check in the background unless one is running already."""
+    return _start_check(
+        bot,
+        container,
+        chat_id,
+        message_id,
+        partial(_run_check_alive, bot, container, run_id, chat_id, message_id),
+    )
+
+
+async def _run_new_check_alive(
+    bot: Bot,
+    container: AsyncContainer,
+    data: CheckAliveInput,
+    chat_id: int,
+    message_id: int,
+) -> None:
+    # The run is created by the job itself, so a check that loses the race
+    # for JOB_KEY leaves no run behind to be offered for resuming
+    try:
+        async with container() as request_container:
+            interactor = await request_container.get(StartCheckAliveInteractor)
+            run = await interactor(data)
+    except Exception:
+        logger.exception("Failed to start an alive check")
+        await ProgressMessage(bot, chat_id, message_id).finish(
+            "Alive check could not be started.",
+            reply_markup=get_back_to_stats_keyboard(),
+        )
+        return
+
+    await _run_check_alive(bot, container, run.id, chat_id, message_id)
+
+
+async def _report_already_running(message: Message) -> None:
+    await message.edit_text(ALREADY_RUNNING, reply_markup=get_back_to_stats_keyboard())
+
+
+async def notify_interrupted_checks(bot: Bot, container: AsyncContainer) -> None:
+    """Offer to resume alive checks interrupted by a shutdown."""
+    async with exclusive(container, JOB_KEY) as acquired:
+        if not acquired:
+            # Another process is running the check, it was not interrupted
+            return
+        async with container() as request_container:
+            interactor = await request_container.get(GetRunningCheckRunsInteractor)
+            runs = await interactor()
+
+    for run in runs:
+        try:
+            await bot.send_message(
+                chat_id=run.created_by,
+                text=(
+                    f"Alive check #{run.id} was interrupted after "
+                    f"{run.processed} users."
+                ),
+                reply_markup=build_resume_check_alive_keyboard(run.id),
+            )
+        except TelegramAPIError as e:
+            logger.warning("Failed to notify admin %s: %s", run.created_by, e)
+
+
 @router.callback_query(CheckAliveCBData.filter())
-@inject
 async def cb_check_alive_handler(
     callback: CallbackQuery,
     callback_data: CheckAliveCBData,
     bot: Bot,
-    interactor: FromDishka[CheckAliveInteractor],
+    app_container: AsyncContainer,
 ) -> None:
-    """Execute alive check with selected filter."""
+    """Start an alive check with the selected filter in the background."""
+    if JOB_KEY in jobs:
+        await callback.answer(ALREADY_RUNNING, show_alert=True)
+        return
+
     await callback.answer()
 
     # Parse filter from callback data
     filter_value = callback_data.filter_
+    chat_id, message_id = callback.message.chat.id, callback.message.message_id
+    if filter_value == CheckAliveCBFilter.SAMPLE:
+        await callback.message.edit_text(
+            "Starting sample check of all users...",
+            reply_markup=get_cancel_job_keyboard(JOB_KEY),
+        )
+        # Another check may have started while the message was edited
+        if not _start_check(
+            bot,
+            app_container,
+            chat_id,
+            message_id,
+            partial(_run_sample_check, bot, app_container, chat_id, message_id),
+        ):
+            await _report_already_running(callback.message)
+        return
+
+    data = CheckAliveInput(created_by=callback.from_user.id)
     if filter_value == CheckAliveCBFilter.ALL:
-        active_since_days = None
         filter_label = "all users"
+    elif filter_value == CheckAliveCBFilter.STALE:
+        data.unchecked_for_days = STALE_AFTER_DAYS
+        filter_label = f"users not checked in last {STALE_AFTER_DAYS} days"
     else:
-        active_since_days = int(filter_value.value)
-        filter_label = f"users active in last {active_since_days} day(s)"
-
-    await callback.message.edit_text(f"Starting alive check for {filter_label}...")
+        data.active_since_days = int(filter_value.value)
+        filter_label = f"users active in last {data.active_since_days} day(s)"
 
-    last_result = None
-    async for progress in interactor.execute(
-        bot=bot, data=CheckAliveInput(active_since_days=active_since_days)
+    await callback.message.edit_text(
+        f"Starting alive check for {filter_label}...",
+        reply_markup=get_cancel_job_keyboard(JOB_KEY),
+    )
+    if not _start_check(
+        bot,
+        app_container,
+        chat_id,
+        message_id,
+        partial(_run_new_check_alive, bot, app_container, data, chat_id, message_id),
     ):
-        last_result = progress.current_result
-        await callback.message.edit_text(
-            _format_progress(progress.processed, progress.total)
-        )
+        await _report_already_running(callback.message)
 
-    if last_result is None:
-        await callback.message.edit_text(
-            "No users found.", reply_markup=_build_back_button()
-        )
+
+@router.callback_query(ResumeCheckAliveCBData.filter())
+async def cb_resume_check_alive(
+    callback: CallbackQuery,
+    callback_data: ResumeCheckAliveCBData,
+    bot: Bot,
+    app_container: AsyncContainer,
+) -> None:
+    """Resume an interrupted alive check from its checkpoint."""
+    if JOB_KEY in jobs:
+        await callback.answer(ALREADY_RUNNING, show_alert=True)
         return
 
+    await callback.answer()
     await callback.message.edit_text(
-        _format_result(last_result),
-        reply_markup=_build_back_button(),
+        "Resuming alive check...", reply_markup=get_cancel_job_keyboard(JOB_KEY)
     )
+    if not start_check_alive(
+        bot,
+        app_container,
+        callback_data.run_id,
+        callback.message.chat.id,
+        callback.message.message_id,
+    ):
+        await _report_already_running(callback.message)
+
+
+@router.callback_query(CancelJobCBData.filter(F.key == JOB_KEY))
+async def cb_cancel_check_alive(callback: CallbackQuery) -> None:
+    """Pause the running alive check; it can be resumed from its checkpoint."""
+    if not jobs.cancel(JOB_KEY):
+        await callback.answer("The alive check has already finished.")
+        return
+    await callback.answer("Pausing...")
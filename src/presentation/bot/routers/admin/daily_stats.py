@@ -0,0 +1,122 @@
+"""Per-day stats: the admin view and the job keeping the rollups current."""
+
+import asyncio
+import logging
+
+from aiogram import Router
+from aiogram.types import CallbackQuery
+from dishka import AsyncContainer
+from dishka.integrations.aiogram import FromDishka, inject
+from fluentogram import TranslatorHub, TranslatorRunner
+
+from src.application.admin import (
+    DailyStatsDTO,
+    GetDailyStatsInteractor,
+    RollupDailyStatsInteractor,
+    summarize,
+)
+from src.domain.admin import DailyStats
+from src.presentation.bot.jobs import jobs
+from src.presentation.bot.utils import edit_or_answer
+from src.presentation.bot.utils.admin_cb_data import DailyStatsCBData
+from src.presentation.bot.utils.i18n import extract_language_code
+from src.presentation.bot.utils.markups.admin import get_daily_stats_keyboard
+
+logger = logging.getLogger(__name__)
+
+router = Router(name="admin_daily_stats")
+
+ROLLUP_JOB_KEY = "daily_stats_rollup"
+# Most recent days listed one by one under the totals
+LISTED_DAYS = 14
+# Languages named in the totals, the rest are left out
+LISTED_LANGUAGES = 5
+
+
+def _format_daily_stats(
+    i18n: TranslatorRunner, days: int, stats: list[DailyStatsDTO]
+) -> str:
+    if not stats:
+        return i18n.get("stats-daily-empty")
+
+    summary = summarize(stats)
+    languages = ", ".join(
+        f"{code} {count}"
+        for code, count in list(summary.languages.items())[:LISTED_LANGUAGES]
+    )
+    lines = [
+        i18n.get(
+            "stats-daily-overview",
+            days=days,
+            new=summary.new_users,
+            referred=summary.referred_users,
+            referred_pct=summary.referred_percent,
+            organic=summary.organic_users,
+            organic_pct=summary.organic_percent,
+            active_avg=round(summary.active_average),
+            languages=languages or "—",
+        ),
+        "",
+    ]
+    for day in reversed(stats[-LISTED_DAYS:]):
+        lines.append(
+            i18n.get(
+                "stats-daily-day",
+                day=day.day.isoformat() if day.final else i18n.get("stats-daily-today"),
+                new=day.new_users,
+                active=day.active_users,
+            )
+        )
+    return "\n".join(lines)
+
+
+@router.callback_query(DailyStatsCBData.filter())
+@inject
+async def cb_daily_stats(
+    callback: CallbackQuery,
+    callback_data: DailyStatsCBData,
+    hub: FromDishka[TranslatorHub],
+    interactor: FromDishka[GetDailyStatsInteractor],
+) -> None:
+    """Show totals and days of the chosen period.
+
+    No render cache: the other /stats screens and the admin jobs edit this
+    message directly, so a kept fingerprint could skip a needed edit.
+    """
+    locale = extract_language_code(callback.from_user.language_code)
+    i18n = hub.get_translator_by_locale(locale)
+
+    stats = await interactor(callback_data.days)
+
+    await edit_or_answer(
+        callback,
+        _format_daily_stats(i18n, callback_data.days, stats),
+        get_daily_stats_keyboard(i18n),
+    )
+    await callback.answer()
+
+
+async def rollup_daily_stats(container: AsyncContainer) -> list[DailyStats]:
+    async with container() as request_container:
+        interactor = await request_container.get(RollupDailyStatsInteractor)
+        return await interactor()
+
+
+async def run_daily_rollups(container: AsyncContainer, interval: float) -> None:
+    """Roll up the daily stats every `interval` seconds until cancelled."""
+    while True:
+        try:
+            stats = await rollup_daily_stats(container)
+        except Exception:
+            logger.exception("Failed to roll up daily stats")
+        else:
+            logger.info("Rolled up daily stats of %d days", len(stats))
+        await asyncio.sleep(interval)
+
+
+def start_daily_rollups(container: AsyncContainer, interval: float) -> None:
+    """Keep the daily stats current from this process.
+
+    Start it in one process only; another one would do the same work again.
+    """
+    jobs.start(ROLLUP_JOB_KEY, run_daily_rollups(container, interval))
@@ -1,67 +1,53 @@
 from aiogram import F, Router
 from aiogram.filters import Command
-from aiogram.types import (
-    CallbackQuery,
-    InlineKeyboardButton,
-    InlineKeyboardMarkup,
-    Message,
-)
+from aiogram.types import CallbackQuery, Message
 from dishka.integrations.aiogram import FromDishka, inject
-from fluentogram import TranslatorHub
-
-from src.application.referral.stats import GetStatsInteractor, GetTopReferrersInteractor
-from src.presentation.bot.utils.admin_cb_data import (
-    CheckAliveCBData,
-    CheckAliveCBFilter,
-    StatsCBAction,
-    StatsCBData,
-)
+from fluentogram import TranslatorHub, TranslatorRunner
+
+from src.application.referral.stats import StatsOutputDTO
+from src.infrastructure.cache import AdminStatsCache, Cached
+from src.presentation.bot.utils.admin_cb_data import StatsCBAction, StatsCBData
 from src.presentation.bot.utils.i18n import extract_language_code
+from src.presentation.bot.utils.markups.admin import (
+    BACK_TO_STATS_CB,
+    get_check_alive_keyboard,
+    get_stats_keyboard,
+)
 
 router = Router(name="admin_stats")
 
 
+def _format_stats(i18n: TranslatorRunner, stats: Cached[StatsOutputDTO]) -> str:
+    text = i18n.get(
+        "stats-overview",
+        total=stats.value.total_users,
+        referred=stats.value.referred_count,
+        referred_pct=stats.value.referred_percent,
+        organic=stats.value.organic_count,
+        organic_pct=stats.value.organic_percent,
+        computed_at=stats.computed_at.strftime("%Y-%m-%d %H:%M:%S UTC"),
+    )
+    if stats.value.estimated:
+        text += "\n" + i18n.get("stats-estimated")
+    return text
+
+
 @router.message(Command("stats"))
 @inject
 async def stats_handler(
     message: Message,
     hub: FromDishka[TranslatorHub],
-    interactor: FromDishka[GetStatsInteractor],
+    stats_cache: FromDishka[AdminStatsCache],
 ) -> None:
     """Handle /stats admin command."""
     locale = extract_language_code(message.from_user.language_code)
     i18n = hub.get_translator_by_locale(locale)
 
-    stats = await interactor()
-
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=i18n.get("stats-top-inviters-btn"),
-                    callback_data=StatsCBData(
-                        action=StatsCBAction.TOP_REFERRERS
-                    ).pack(),
-                ),
-                InlineKeyboardButton(
-                    text="Check Alive",
-                    callback_data=StatsCBData(action=StatsCBAction.CHECK_ALIVE).pack(),
-                ),
-            ]
-        ]
-    )
+    stats = await stats_cache.get_stats()
 
-    await message.answer(
-        text=i18n.get(
-            "stats-overview",
-            total=stats.total_users,
-            referred=stats.referred_count,
-            referred_pct=stats.referred_percent,
-            organic=stats.organic_count,
-            organic_pct=stats.organic_percent,
-        ),
-        reply_markup=keyboard,
-    )
+    keyboard = get_stats_keyboard(i18n)
+
+    await message.answer(text=_format_stats(i18n, stats), reply_markup=keyboard)
 
 
 @router.callback_query(StatsCBData.filter(F.action == StatsCBAction.TOP_REFERRERS))
@@ -69,14 +55,14 @@ async def stats_handler(
 async def ref_top_callback(
     callback: CallbackQuery,
     hub: FromDishka[TranslatorHub],
-    interactor: FromDishka[GetTopReferrersInteractor],
+    stats_cache: FromDishka[AdminStatsCache],
 ) -> None:
     """Handle top referrers callback."""
     locale = extract_language_code(callback.from_user.language_code)
     i18n = hub.get_translator_by_locale(locale)
 
     limit = 10
-    top = await interactor(limit)
+    top = (await stats_cache.get_top_referrers(limit)).value
 
     if not top:
         await callback.message.edit_text(text=i18n.get("stats-no-inviters"))
@@ -92,41 +78,6 @@ async def ref_top_callback(
     await callback.answer()
 
 
-check_alive_keyboard = InlineKeyboardMarkup(
-    inline_keyboard=[
-        [
-            InlineKeyboardButton(
-                text="All Users",
-                callback_data=CheckAliveCBData(filter_=CheckAliveCBFilter.ALL).pack(),
-            ),
-            InlineKeyboardButton(
-                text="30 Days",
-                callback_data=CheckAliveCBData(
-                    filter_=CheckAliveCBFilter.DAYS_30
-                ).pack(),
-            ),
-        ],
-        [
-            InlineKeyboardButton(
-                text="7 Days",
-                callback_data=CheckAliveCBData(
-                    filter_=CheckAliveCBFilter.DAYS_7
-                ).pack(),
-            ),
-            InlineKeyboardButton(
-                text="1 Day",
-                callback_data=CheckAliveCBData(
-                    filter_=CheckAliveCBFilter.DAYS_1
-                ).pack(),
-            ),
-        ],
-        [
-            InlineKeyboardButton(text="Back", callback_data="admin:back_to_stats"),
-        ],
-    ],
-)
-
-
 @router.callback_query(StatsCBData.filter(F.action == StatsCBAction.CHECK_ALIVE))
 async def cb_check_alive_from_stats(callback: CallbackQuery) -> None:
     """Redirect to check alive menu from stats."""
@@ -134,49 +85,26 @@ async def cb_check_alive_from_stats(callback: CallbackQuery) -> None:
 
     await callback.message.edit_text(
         "Select users to check:",
-        reply_markup=check_alive_keyboard,
+        reply_markup=get_check_alive_keyboard(),
     )
 
 
-@router.callback_query(F.data == "admin:back_to_stats")
+@router.callback_query(F.data == BACK_TO_STATS_CB)
 @inject
 async def cb_back_to_stats(
     callback: CallbackQuery,
     hub: FromDishka[TranslatorHub],
-    interactor: FromDishka[GetStatsInteractor],
+    stats_cache: FromDishka[AdminStatsCache],
 ) -> None:
     """Return to stats view."""
     locale = extract_language_code(callback.from_user.language_code)
     i18n = hub.get_translator_by_locale(locale)
 
-    stats = await interactor()
-
-    keyboard = InlineKeyboardMarkup(
-        inline_keyboard=[
-            [
-                InlineKeyboardButton(
-                    text=i18n.get("stats-top-inviters-btn"),
-                    callback_data=StatsCBData(
-                        action=StatsCBAction.TOP_REFERRERS
-                    ).pack(),
-                ),
-                InlineKeyboardButton(
-                    text="Check Alive",
-                    callback_data=StatsCBData(action=StatsCBAction.CHECK_ALIVE).pack(),
-                ),
-            ]
-        ]
-    )
+    stats = await stats_cache.get_stats()
+
+    keyboard = get_stats_keyboard(i18n)
 
     await callback.message.edit_text(
-        text=i18n.get(
-            "stats-overview",
-            total=stats.total_users,
-            referred=stats.referred_count,
-            referred_pct=stats.referred_percent,
-            organic=stats.organic_count,
-            organic_pct=stats.organic_percent,
-        ),
-        reply_markup=keyboard,
+        text=_format_stats(i18n, stats), reply_markup=keyboard
     )
     await callback.answer()
@@ -3,12 +3,13 @@ from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorHub
 
+from src.application.user.dtos import CreateUserOutputDTO
 from src.application.user.interactors.update_language import (
     UpdateLanguageDTO,
     UpdateLanguageInteractor,
 )
-from src.domain.user import UserRepository
 from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.cache import MessageRenderCache, UserProfileCache
 from src.presentation.bot.utils import edit_or_answer
 from src.presentation.bot.utils.cb_data import OnboardingCBData
 from src.presentation.bot.utils.markups.settings import get_welcome_keyboard
@@ -21,9 +22,11 @@ router = Router(name="onboarding")
 async def onboarding_language_selected(
     callback: CallbackQuery,
     callback_data: OnboardingCBData,
+    user: CreateUserOutputDTO,
     interactor: FromDishka[UpdateLanguageInteractor],
-    user_repository: FromDishka[UserRepository],
     hub: FromDishka[TranslatorHub],
+    profile_cache: FromDishka[UserProfileCache],
+    render_cache: FromDishka[MessageRenderCache],
 ) -> None:
     """Handle language selection during onboarding."""
     await callback.answer()
@@ -38,14 +41,16 @@ async def onboarding_language_selected(
             language_code=new_language,
         )
     )
+    # The cached profile carries the old language
+    profile_cache.invalidate(user_id.value)
 
-    # Get user and translator for new language
-    user = await user_repository.get_user(user_id)
+    # Get translator for new language
     i18n = hub.get_translator_by_locale(new_language.value)
 
     # Show welcome message in chosen language
     await edit_or_answer(
         callback,
-        text=i18n.get("welcome", name=user.first_name.value if user else "User"),
+        text=i18n.get("welcome", name=user.first_name),
         reply_markup=get_welcome_keyboard(i18n),
+        render_cache=render_cache,
     )
@@ -2,14 +2,13 @@ from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
 from dishka.integrations.aiogram import FromDishka, inject
-from fluentogram import TranslatorHub
+from fluentogram import TranslatorRunner
 
 from src.application.referral.get_info import (
     GetReferralInfoInputDTO,
     GetReferralInfoInteractor,
 )
 from src.infrastructure.config import Config
-from src.presentation.bot.utils.i18n import extract_language_code
 
 router = Router(name="referral")
 
@@ -18,14 +17,11 @@ router = Router(name="referral")
 @inject
 async def referral_handler(
     message: Message,
-    hub: FromDishka[TranslatorHub],
+    i18n: TranslatorRunner,
     get_referral_info: FromDishka[GetReferralInfoInteractor],
     config: FromDishka[Config],
 ) -> None:
     """Show user's referral link and statistics."""
-    locale = extract_language_code(message.from_user.language_code)
-    i18n = hub.get_translator_by_locale(locale)
-
     user_id = message.from_user.id
     info = await get_referral_info(GetReferralInfoInputDTO(user_id=user_id))
 
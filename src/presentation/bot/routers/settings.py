@@ -5,12 +5,14 @@ from aiogram.types import CallbackQuery
 from dishka.integrations.aiogram import FromDishka, inject
 from fluentogram import TranslatorHub, TranslatorRunner
 
+from src.application.user.dtos import CreateUserOutputDTO
 from src.application.user.interactors.update_language import (
     UpdateLanguageDTO,
     UpdateLanguageInteractor,
 )
-from src.domain.user import UserRepository
 from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.cache import MessageRenderCache, UserProfileCache
+from src.presentation.bot.middleware.user_and_locale import UserContext
 from src.presentation.bot.utils import edit_or_answer
 from src.presentation.bot.utils.cb_data import (
     LanguageCBData,
@@ -33,6 +35,7 @@ router = Router(name="settings")
 async def settings_menu(
     callback: CallbackQuery,
     i18n: TranslatorRunner,
+    render_cache: FromDishka[MessageRenderCache],
 ) -> None:
     """Handle Settings button from main menu."""
     logger.info("User %s opened settings menu", callback.from_user.id)
@@ -40,6 +43,7 @@ async def settings_menu(
         update=callback,
         text=i18n.get("settings-title"),
         reply_markup=get_settings_keyboard(i18n),
+        render_cache=render_cache,
     )
     await callback.answer()
 
@@ -49,18 +53,19 @@ async def settings_menu(
 async def language_menu(
     callback: CallbackQuery,
     i18n: TranslatorRunner,
-    user_repository: FromDishka[UserRepository],
+    user_context: UserContext,
+    render_cache: FromDishka[MessageRenderCache],
 ) -> None:
     """Handle Language button in settings."""
     logger.info("User %s opened language menu", callback.from_user.id)
-    user_id = UserId(callback.from_user.id)
-    user = await user_repository.get_user(user_id)
-    current_language = user.language_code if user else None
+    saved_language = await user_context.get_language()
+    current_language = LanguageCode(saved_language) if saved_language else None
 
     await edit_or_answer(
         update=callback,
         text=i18n.get("settings-language-title"),
         reply_markup=get_language_keyboard(i18n, current_language),
+        render_cache=render_cache,
     )
     await callback.answer()
 
@@ -72,6 +77,8 @@ async def change_language(
     callback_data: LanguageCBData,
     interactor: FromDishka[UpdateLanguageInteractor],
     hub: FromDishka[TranslatorHub],
+    profile_cache: FromDishka[UserProfileCache],
+    render_cache: FromDishka[MessageRenderCache],
 ) -> None:
     """Handle language selection from settings."""
     user_id = UserId(callback.from_user.id)
@@ -86,6 +93,8 @@ async def change_language(
             language_code=new_language,
         )
     )
+    # The cached profile carries the old language
+    profile_cache.invalidate(user_id.value)
 
     # Get translator for new language and redraw
     i18n = hub.get_translator_by_locale(new_language.value)
@@ -94,6 +103,7 @@ async def change_language(
         update=callback,
         text=i18n.get("settings-language-changed"),
         reply_markup=get_settings_keyboard(i18n),
+        render_cache=render_cache,
     )
     await callback.answer()
 
@@ -103,16 +113,16 @@ async def change_language(
 async def back_to_main_menu(
     callback: CallbackQuery,
     i18n: TranslatorRunner,
-    user_repository: FromDishka[UserRepository],
+    user: CreateUserOutputDTO,
+    render_cache: FromDishka[MessageRenderCache],
 ) -> None:
     """Handle Back button to return to main menu."""
     logger.info("User %s returned to main menu from settings", callback.from_user.id)
-    user_id = UserId(callback.from_user.id)
-    user = await user_repository.get_user(user_id)
 
     await edit_or_answer(
         update=callback,
-        text=i18n.get("welcome", name=user.first_name.value if user else "User"),
+        text=i18n.get("welcome", name=user.first_name),
         reply_markup=get_welcome_keyboard(i18n),
+        render_cache=render_cache,
     )
     await callback.answer()
@@ -0,0 +1,220 @@
+"""Concurrent update processing that keeps the order of each chat."""
+
+import asyncio
+from collections import deque
+from collections.abc import Callable, Hashable
+from contextlib import suppress
+from dataclasses import dataclass
+import logging
+import time
+
+from aiogram import Bot, Dispatcher
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+from aiogram.methods import GetUpdates
+from aiogram.types import Update
+
+logger = logging.getLogger(__name__)
+
+# How long a stopping scheduler waits for updates it already accepted
+SHUTDOWN_TIMEOUT = 10
+POLLING_TIMEOUT = 30
+# Pause after a failed getUpdates call
+RETRY_DELAY = 5
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    # Accepted updates waiting for their chat or for a free slot
+    queued: int
+    running: int
+    # Updates started since the last report and how long they waited
+    started: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.started if self.started else 0.0
+
+
+def chat_key(update: Update) -> int | None:
+    """Id of the chat (or user) whose updates must not be reordered."""
+    context = UserContextMiddleware.resolve_event_context(update)
+    if context.chat is not None:
+        return context.chat.id
+    if context.user is not None:
+        return context.user.id
+    return None
+
+
+class ChatScheduler:
+    """Feeds updates to the dispatcher, several chats at a time.
+
+    Updates of one chat are processed strictly one after another, different
+    chats run concurrently, at most `max_concurrency` at once. `submit`
+    waits while `queue_size` accepted updates are unfinished, which slows
+    the update source down instead of piling up tasks.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        dispatcher: Dispatcher,
+        max_concurrency: int,
+        queue_size: int,
+        report_interval: float | None = None,
+        name: str = "scheduler",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._bot = bot
+        self._dispatcher = dispatcher
+        self._capacity = asyncio.Semaphore(queue_size)
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._report_interval = report_interval
+        self._name = name
+        self._clock = clock
+        self._chats: dict[Hashable, deque[tuple[Update, float]]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._queued = 0
+        self._running = 0
+        self._reset_window()
+
+    @property
+    def stats(self) -> SchedulerStats:
+        return SchedulerStats(
+            queued=self._queued,
+            running=self._running,
+            started=self._started,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
+
+    async def submit(self, update: Update) -> None:
+        """Accept an update, waiting while the scheduler is full."""
+        await self._capacity.acquire()
+        self._queued += 1
+        self._maybe_report()
+
+        key: Hashable = chat_key(update)
+        if key is None:
+            # Nothing to keep in order with
+            key = object()
+
+        pending = self._chats.get(key)
+        if pending is not None:
+            pending.append((update, self._clock()))
+            return
+
+        self._chats[key] = deque([(update, self._clock())])
+        task = asyncio.create_task(self._drain(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def wait_closed(self) -> None:
+        if self._tasks:
+            _, pending = await asyncio.wait(self._tasks, timeout=SHUTDOWN_TIMEOUT)
+            if pending:
+                for task in pending:
+                    task.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning("Cancelled updates of %d chats", len(pending))
+        self.report()
+
+    def report(self) -> None:
+        stats = self.stats
+        logger.info(
+            "%s: %d queued, %d running, %d started, wait %.3fs mean / %.3fs max",
+            self._name,
+            stats.queued,
+            stats.running,
+            stats.started,
+            stats.mean_wait,
+            stats.max_wait,
+        )
+        self._reset_window()
+
+    async def _drain(self, key: Hashable) -> None:
+        # Runs while the chat has pending updates; `submit` appends to them
+        pending = self._chats[key]
+        try:
+            while pending:
+                async with self._slots:
+                    update, submitted_at = pending.popleft()
+                    self._queued -= 1
+                    self._running += 1
+                    self._record_wait(self._clock() - submitted_at)
+                    try:
+                        await self._process(update)
+                    finally:
+                        self._running -= 1
+                        self._capacity.release()
+        finally:
+            del self._chats[key]
+            for _ in pending:
+                self._queued -= 1
+                self._capacity.release()
+
+    async def _process(self, update: Update) -> None:
+        try:
+            await self._dispatcher.feed_update(self._bot, update)
+        except Exception:
+            logger.exception("Failed to process update %s", update.update_id)
+
+    def _record_wait(self, wait: float) -> None:
+        self._started += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+
+    def _maybe_report(self) -> None:
+        if self._report_interval is None:
+            return
+        if self._clock() - self._window_start >= self._report_interval:
+            self.report()
+
+    def _reset_window(self) -> None:
+        self._window_start = self._clock()
+        self._started = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+
+async def poll_updates(
+    bot: Bot, dispatcher: Dispatcher, scheduler: ChatScheduler
+) -> None:
+    """Long-poll Telegram, handing updates to `scheduler`.
+
+    The offset moves past an update only once the scheduler accepted it,
+    and the next batch is requested after the whole previous one was
+    accepted, so a full scheduler pauses polling.
+    """
+    allowed_updates = dispatcher.resolve_used_update_types()
+    offset: int | None = None
+    try:
+        while True:
+            try:
+                updates = await bot(
+                    GetUpdates(
+                        offset=offset,
+                        timeout=POLLING_TIMEOUT,
+                        allowed_updates=allowed_updates,
+                    ),
+                    request_timeout=POLLING_TIMEOUT + 10,
+                )
+            except TelegramRetryAfter as e:
+                logger.warning("getUpdates failed: %s", e)
+                await asyncio.sleep(e.retry_after)
+                continue
+            except TelegramAPIError as e:
+                logger.warning("getUpdates failed: %s", e)
+                await asyncio.sleep(RETRY_DELAY)
+                continue
+
+            for update in updates:
+                await scheduler.submit(update)
+                offset = update.update_id + 1
+    finally:
+        if offset is not None:
+            # Confirm accepted updates so a restart does not receive them again
+            with suppress(TelegramAPIError):
+                await bot(GetUpdates(offset=offset, timeout=0, limit=1))
@@ -0,0 +1,293 @@
+"""Sharded runtime: one receiver process and N worker processes.
+
+The receiver long-polls `getUpdates` without parsing updates into aiogram
+objects and routes each one to worker `user_id % N`, so all updates of a
+user are handled by the same worker. Every worker runs its own dispatcher,
+container and engine, and processes its shard with a `ChatScheduler`.
+
+Updates of admins all go to worker 0, the one that also resumes their
+jobs (broadcasts, alive checks) after a restart.
+"""
+
+import asyncio
+from collections.abc import Collection
+from contextlib import suppress
+import logging
+import multiprocessing
+from multiprocessing.context import SpawnContext, SpawnProcess
+from multiprocessing.queues import Queue
+from queue import Full
+import signal
+import sys
+import time
+from typing import Any
+
+from aiogram import Dispatcher
+from aiogram.types import Update
+import aiohttp
+
+from src.infrastructure.config import Config
+from src.infrastructure.telegram import create_api_server
+from src.presentation.bot.cache_stats import start_cache_reports
+from src.presentation.bot.factory import (
+    create_bot,
+    create_container,
+    create_dispatcher,
+    create_scheduler,
+    start_admin_jobs,
+)
+from src.presentation.bot.jobs import jobs
+from src.presentation.bot.routers import setup_routers
+
+logger = logging.getLogger(__name__)
+
+type RawUpdate = dict[str, Any]
+
+POLLING_TIMEOUT = 30
+# Pause after a failed getUpdates call
+RETRY_DELAY = 5
+# Seconds a put may wait on a full queue before the worker is checked again
+PUT_TIMEOUT = 5.0
+# A worker that dies sooner after its start is not restarted
+MIN_UPTIME = 30.0
+
+
+def routing_key(update: RawUpdate) -> int:
+    """Id of the user (or chat) an update belongs to; 0 if there is none."""
+    for key, payload in update.items():
+        if key == "update_id" or not isinstance(payload, dict):
+            continue
+        for sender_key in ("from", "user", "chat"):
+            sender = payload.get(sender_key)
+            if isinstance(sender, dict) and isinstance(sender.get("id"), int):
+                return sender["id"]
+    return 0
+
+
+def shard_for(update: RawUpdate, shards: int, admin_ids: Collection[int] = ()) -> int:
+    key = routing_key(update)
+    if key in admin_ids:
+        return 0
+    return key % shards
+
+
+class ThroughputMeter:
+    """Counts processed updates and logs the rate every `interval` seconds."""
+
+    def __init__(self, name: str, interval: float) -> None:
+        self._name = name
+        self._interval = interval
+        self._processed = 0
+        self._window_start = time.monotonic()
+
+    def tick(self) -> None:
+        self._processed += 1
+        elapsed = time.monotonic() - self._window_start
+        if elapsed >= self._interval:
+            self.report(elapsed)
+
+    def report(self, elapsed: float | None = None) -> None:
+        if elapsed is None:
+            elapsed = time.monotonic() - self._window_start
+        rate = self._processed / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            "%s: %d updates in %.0fs (%.1f/s)",
+            self._name,
+            self._processed,
+            elapsed,
+            rate,
+        )
+        self._processed = 0
+        self._window_start = time.monotonic()
+
+
+async def fetch_updates(
+    session: aiohttp.ClientSession,
+    url: str,
+    offset: int | None,
+    allowed_updates: list[str],
+) -> list[RawUpdate]:
+    async with session.post(
+        url,
+        json={
+            "offset": offset,
+            "timeout": POLLING_TIMEOUT,
+            "allowed_updates": allowed_updates,
+        },
+    ) as response:
+        payload = await response.json()
+
+    if not payload.get("ok"):
+        retry_after = payload.get("parameters", {}).get("retry_after")
+        logger.warning("getUpdates failed: %s", payload.get("description"))
+        await asyncio.sleep(retry_after or RETRY_DELAY)
+        return []
+
+    return payload["result"]
+
+
+class WorkerPool:
+    """Worker processes with their queues; replaces workers that exited."""
+
+    def __init__(self, config: Config, context: SpawnContext) -> None:
+        self._config = config
+        self._context = context
+        self.queues: list[Queue[RawUpdate | None]] = [
+            context.Queue(maxsize=config.sharding.queue_size)
+            for _ in range(config.sharding.workers)
+        ]
+        self._processes = [self._spawn(index) for index in range(len(self.queues))]
+        self._started_at = [0.0] * len(self.queues)
+
+    def __len__(self) -> int:
+        return len(self.queues)
+
+    def start(self) -> None:
+        for index in range(len(self)):
+            self._start(index)
+
+    def ensure_alive(self, index: int) -> None:
+        """Restart worker `index` if it has exited.
+
+        Raises `RuntimeError` if it exited within `MIN_UPTIME` of its start:
+        such a worker would most likely fail again right away.
+        """
+        process = self._processes[index]
+        if process.is_alive():
+            return
+
+        uptime = time.monotonic() - self._started_at[index]
+        if uptime < MIN_UPTIME:
+            msg = (
+                f"{process.name} exited with code {process.exitcode} "
+                f"{uptime:.0f}s after its start"
+            )
+            raise RuntimeError(msg)
+
+        logger.error(
+            "%s exited with code %s, restarting it", process.name, process.exitcode
+        )
+        self._processes[index] = self._spawn(index)
+        self._start(index)
+
+    def stop(self) -> None:
+        """Ask running workers to drain their queues and wait for them."""
+        for process, queue in zip(self._processes, self.queues, strict=True):
+            while process.is_alive():
+                with suppress(Full):
+                    queue.put(None, timeout=PUT_TIMEOUT)
+                    break
+        for process in self._processes:
+            process.join()
+
+    def _spawn(self, index: int) -> SpawnProcess:
+        return self._context.Process(
+            target=run_worker,
+            args=(index, self._config, self.queues[index]),
+            name=f"bot-worker-{index}",
+        )
+
+    def _start(self, index: int) -> None:
+        self._processes[index].start()
+        self._started_at[index] = time.monotonic()
+
+
+async def dispatch(pool: WorkerPool, index: int, update: RawUpdate) -> None:
+    """Queue `update` for worker `index`, restarting the worker if it exited."""
+    loop = asyncio.get_running_loop()
+    queue = pool.queues[index]
+    while True:
+        pool.ensure_alive(index)
+        try:
+            # Blocks while the worker's queue is full: that is backpressure
+            await loop.run_in_executor(None, queue.put, update, True, PUT_TIMEOUT)
+        except Full:
+            continue
+        return
+
+
+async def run_receiver(config: Config, pool: WorkerPool) -> None:
+    # Routers alone tell which update types the handlers use
+    probe = Dispatcher()
+    probe.include_router(setup_routers())
+    allowed_updates = probe.resolve_used_update_types()
+
+    meter = ThroughputMeter("receiver", config.sharding.report_interval_seconds)
+    admin_ids = frozenset(config.telegram.admin_ids)
+    offset: int | None = None
+    timeout = aiohttp.ClientTimeout(total=POLLING_TIMEOUT + 10)
+    url = create_api_server(config.telegram).api_url(
+        config.telegram.bot_token, "getUpdates"
+    )
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        try:
+            while True:
+                try:
+                    updates = await fetch_updates(session, url, offset, allowed_updates)
+                except (aiohttp.ClientError, TimeoutError) as e:
+                    logger.warning("getUpdates request failed: %s", e)
+                    await asyncio.sleep(RETRY_DELAY)
+                    continue
+
+                for update in updates:
+                    await dispatch(
+                        pool, shard_for(update, len(pool), admin_ids), update
+                    )
+                    offset = update["update_id"] + 1
+                    meter.tick()
+        finally:
+            if offset is not None:
+                # Confirm queued updates so a restart does not receive them again
+                with suppress(aiohttp.ClientError, TimeoutError):
+                    async with session.post(
+                        url,
+                        json={"offset": offset, "timeout": 0, "limit": 1},
+                    ):
+                        pass
+
+
+async def _run_worker(
+    index: int, config: Config, queue: Queue[RawUpdate | None]
+) -> None:
+    bot = create_bot(config, processes=config.sharding.workers)
+    config = config.for_processes(config.sharding.workers)
+    container = create_container(config)
+    dp = create_dispatcher(config, container)
+    scheduler = create_scheduler(config, bot, dp, name=f"worker {index}")
+    loop = asyncio.get_running_loop()
+    if index == 0:
+        # Admin updates are routed here too
+        await start_admin_jobs(bot, container, config)
+    start_cache_reports(container, config.scheduler.report_interval_seconds)
+
+    try:
+        while (raw_update := await loop.run_in_executor(None, queue.get)) is not None:
+            update = Update.model_validate(raw_update, context={"bot": bot})
+            # Stops reading the queue while the scheduler is full
+            await scheduler.submit(update)
+    finally:
+        await scheduler.wait_closed()
+        await jobs.stop()
+        await container.close()
+        await bot.session.close()
+
+
+def run_worker(index: int, config: Config, queue: Queue[RawUpdate | None]) -> None:
+    """Worker process entry point; stops on a `None` sentinel."""
+    # Ctrl+C reaches the whole process group; let the supervisor drain us
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=logging.INFO, stream=sys.stdout)
+    asyncio.run(_run_worker(index, config, queue))
+
+
+async def run_supervisor(config: Config) -> None:
+    pool = WorkerPool(config, multiprocessing.get_context("spawn"))
+    pool.start()
+    logger.info("Started %d bot workers", len(pool))
+
+    try:
+        with suppress(asyncio.CancelledError):
+            await run_receiver(config, pool)
+    finally:
+        pool.stop()
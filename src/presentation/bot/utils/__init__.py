@@ -2,21 +2,49 @@ from aiogram import types
 from aiogram.exceptions import TelegramBadRequest
 from aiogram.types import InlineKeyboardMarkup
 
+from src.infrastructure.cache import MessageRenderCache
+
+
+def render_fingerprint(text: str, reply_markup: InlineKeyboardMarkup | None) -> int:
+    markup = reply_markup.model_dump_json(exclude_none=True) if reply_markup else None
+    return hash((text, markup))
+
 
 async def edit_or_answer(
     update: types.Message | types.CallbackQuery,
     text: str,
     reply_markup: InlineKeyboardMarkup | None = None,
+    render_cache: MessageRenderCache | None = None,
 ) -> None:
     """
     Attempts to edit the message if it's a callback query,
     otherwise sends a new message.
+
+    With a `render_cache`, an edit that would leave the message as it is
+    (e.g. a double-tapped button) is skipped without calling the Bot API.
     """
-    try:
-        if isinstance(update, types.CallbackQuery) and update.message:
-            await update.message.edit_text(text, reply_markup=reply_markup)
-        else:
-            await update.answer(text, reply_markup=reply_markup)
-    except TelegramBadRequest:
-        # Fallback if editing fails (e.g., message content is identical)
-        await update.answer(text, reply_markup=reply_markup)
+    fingerprint = render_fingerprint(text, reply_markup)
+    if isinstance(update, types.CallbackQuery) and update.message:
+        message = update.message
+        chat_id = message.chat.id
+        if render_cache and render_cache.is_rendered(
+            chat_id, message.message_id, fingerprint
+        ):
+            return
+
+        try:
+            await message.edit_text(text, reply_markup=reply_markup)
+        except TelegramBadRequest as e:
+            if "message is not modified" not in e.message:
+                if render_cache:
+                    render_cache.invalidate(chat_id, message.message_id)
+                # Fallback if editing fails (e.g., message is too old)
+                await update.answer(text, reply_markup=reply_markup)
+                return
+        if render_cache:
+            render_cache.put(chat_id, message.message_id, fingerprint)
+        return
+
+    sent = await update.answer(text, reply_markup=reply_markup)
+    if render_cache and isinstance(sent, types.Message):
+        render_cache.put(sent.chat.id, sent.message_id, fingerprint)
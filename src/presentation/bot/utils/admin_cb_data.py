@@ -8,12 +8,25 @@ class CheckAliveCBFilter(StrEnum):
     DAYS_30 = "30"
     DAYS_7 = "7"
     DAYS_1 = "1"
+    # Users not checked within STALE_AFTER_DAYS
+    STALE = "stale"
+    # A random sample of all users, for the shares only
+    SAMPLE = "sample"
 
 
 class CheckAliveCBData(CallbackData, prefix="check_alive"):
     filter_: CheckAliveCBFilter
 
 
+class ResumeCheckAliveCBData(CallbackData, prefix="resume_check_alive"):
+    run_id: int
+
+
+class CancelJobCBData(CallbackData, prefix="cancel_job"):
+    # JobRegistry key; must not contain ":"
+    key: str
+
+
 class StatsCBAction(StrEnum):
     TOP_REFERRERS = "top_referrers"
     CHECK_ALIVE = "check_alive"
@@ -21,3 +34,17 @@ class StatsCBAction(StrEnum):
 
 class StatsCBData(CallbackData, prefix="stats"):
     action: StatsCBAction
+
+
+class DailyStatsCBData(CallbackData, prefix="stats_daily"):
+    days: int
+
+
+class BroadcastCBAction(StrEnum):
+    SEND = "send"
+    CANCEL = "cancel"
+
+
+class BroadcastCBData(CallbackData, prefix="broadcast"):
+    action: BroadcastCBAction
+    broadcast_id: int
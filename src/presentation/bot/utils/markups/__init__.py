@@ -1,3 +1,11 @@
+from .admin import (
+    get_back_to_stats_keyboard,
+    get_cancel_job_keyboard,
+    get_check_alive_keyboard,
+    get_daily_stats_keyboard,
+    get_stats_keyboard,
+)
+from .registry import KeyboardRegistry, keyboards
 from .settings import (
     get_language_keyboard,
     get_onboarding_language_keyboard,
@@ -6,8 +14,15 @@ from .settings import (
 )
 
 __all__ = [
+    "KeyboardRegistry",
+    "get_back_to_stats_keyboard",
+    "get_cancel_job_keyboard",
+    "get_check_alive_keyboard",
+    "get_daily_stats_keyboard",
     "get_language_keyboard",
     "get_onboarding_language_keyboard",
     "get_settings_keyboard",
+    "get_stats_keyboard",
     "get_welcome_keyboard",
+    "keyboards",
 ]
@@ -0,0 +1,167 @@
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from fluentogram import TranslatorRunner
+
+from src.application.admin.check_alive import SAMPLE_MARGIN
+from src.presentation.bot.utils.admin_cb_data import (
+    CancelJobCBData,
+    CheckAliveCBData,
+    CheckAliveCBFilter,
+    DailyStatsCBData,
+    ResumeCheckAliveCBData,
+    StatsCBAction,
+    StatsCBData,
+)
+from src.presentation.bot.utils.markups.registry import keyboards, locale_of
+
+BACK_TO_STATS_CB = "admin:back_to_stats"
+TOP_REFERRERS_CB = StatsCBData(action=StatsCBAction.TOP_REFERRERS).pack()
+CHECK_ALIVE_CB = StatsCBData(action=StatsCBAction.CHECK_ALIVE).pack()
+# Periods of the daily stats view, the first one opens it
+DAILY_STATS_PERIODS = (7, 30, 90)
+
+
+def get_stats_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
+    """Create stats overview keyboard."""
+    return keyboards.get(
+        ("admin_stats", locale_of(i18n)), lambda: build_stats_keyboard(i18n)
+    )
+
+
+def get_daily_stats_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
+    """Create daily stats period selection keyboard."""
+    return keyboards.get(
+        ("admin_daily_stats", locale_of(i18n)),
+        lambda: build_daily_stats_keyboard(i18n),
+    )
+
+
+def get_check_alive_keyboard() -> InlineKeyboardMarkup:
+    """Create check alive filter selection keyboard."""
+    return keyboards.get(("admin_check_alive",), build_check_alive_keyboard)
+
+
+def get_back_to_stats_keyboard() -> InlineKeyboardMarkup:
+    """Create back button to return to stats."""
+    return keyboards.get(("admin_back_to_stats",), build_back_to_stats_keyboard)
+
+
+def get_cancel_job_keyboard(key: str) -> InlineKeyboardMarkup:
+    """Create Cancel button for a background job."""
+    return keyboards.get(
+        ("admin_cancel_job", key), lambda: build_cancel_job_keyboard(key)
+    )
+
+
+def build_stats_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("stats-top-inviters-btn"),
+                    callback_data=TOP_REFERRERS_CB,
+                ),
+                InlineKeyboardButton(text="Check Alive", callback_data=CHECK_ALIVE_CB),
+            ],
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("stats-daily-btn"),
+                    callback_data=DailyStatsCBData(days=DAILY_STATS_PERIODS[0]).pack(),
+                ),
+            ],
+        ]
+    )
+
+
+def build_daily_stats_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("stats-daily-period-btn", days=days),
+                    callback_data=DailyStatsCBData(days=days).pack(),
+                )
+                for days in DAILY_STATS_PERIODS
+            ],
+            [
+                InlineKeyboardButton(
+                    text=i18n.get("btn-back"), callback_data=BACK_TO_STATS_CB
+                ),
+            ],
+        ]
+    )
+
+
+def build_check_alive_keyboard() -> InlineKeyboardMarkup:
+    def button(text: str, filter_: CheckAliveCBFilter) -> InlineKeyboardButton:
+        return InlineKeyboardButton(
+            text=text, callback_data=CheckAliveCBData(filter_=filter_).pack()
+        )
+
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                button("All Users", CheckAliveCBFilter.ALL),
+                button("30 Days", CheckAliveCBFilter.DAYS_30),
+            ],
+            [
+                button("7 Days", CheckAliveCBFilter.DAYS_7),
+                button("1 Day", CheckAliveCBFilter.DAYS_1),
+            ],
+            [
+                button("Not Checked in 7 Days", CheckAliveCBFilter.STALE),
+            ],
+            [
+                button(
+                    f"Estimate from Sample (±{SAMPLE_MARGIN:.0%})",
+                    CheckAliveCBFilter.SAMPLE,
+                ),
+            ],
+            [
+                InlineKeyboardButton(text="Back", callback_data=BACK_TO_STATS_CB),
+            ],
+        ],
+    )
+
+
+def build_back_to_stats_keyboard() -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="Back to Stats", callback_data=BACK_TO_STATS_CB
+                )
+            ],
+        ],
+    )
+
+
+def build_cancel_job_keyboard(key: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="Cancel", callback_data=CancelJobCBData(key=key).pack()
+                )
+            ],
+        ],
+    )
+
+
+def build_resume_check_alive_keyboard(run_id: int) -> InlineKeyboardMarkup:
+    """Create Resume button for an interrupted alive check."""
+    # Not cached: each run has its own, shown once
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text="Resume",
+                    callback_data=ResumeCheckAliveCBData(run_id=run_id).pack(),
+                )
+            ],
+            [
+                InlineKeyboardButton(
+                    text="Back to Stats", callback_data=BACK_TO_STATS_CB
+                )
+            ],
+        ],
+    )
@@ -0,0 +1,66 @@
+"""Keyboards built once per (locale, variant) and shared between updates."""
+
+from collections.abc import Callable, Hashable
+
+from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup
+from fluentogram import TranslatorRunner
+from pydantic import ConfigDict
+
+type KeyboardKey = tuple[Hashable, ...]
+
+
+class FrozenInlineKeyboardButton(InlineKeyboardButton):
+    model_config = ConfigDict(frozen=True)
+
+
+class FrozenInlineKeyboardMarkup(InlineKeyboardMarkup):
+    """Markup shared by many updates; assigning its fields raises."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+def freeze(markup: InlineKeyboardMarkup) -> FrozenInlineKeyboardMarkup:
+    return FrozenInlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                FrozenInlineKeyboardButton(**button.model_dump(exclude_unset=True))
+                for button in row
+            ]
+            for row in markup.inline_keyboard
+        ]
+    )
+
+
+def locale_of(i18n: TranslatorRunner) -> str:
+    """Locale a translator renders, i.e. the first one of its chain."""
+    return next(iter(i18n.translators)).locale
+
+
+class KeyboardRegistry:
+    """Builds each keyboard on first use and returns the same instance after.
+
+    A key names the keyboard and everything its content depends on, e.g.
+    `("settings", "en")`, so a builder must not read anything else.
+    """
+
+    def __init__(self) -> None:
+        self._markups: dict[KeyboardKey, FrozenInlineKeyboardMarkup] = {}
+
+    def __len__(self) -> int:
+        return len(self._markups)
+
+    def get(
+        self,
+        key: KeyboardKey,
+        build: Callable[[], InlineKeyboardMarkup],
+    ) -> FrozenInlineKeyboardMarkup:
+        markup = self._markups.get(key)
+        if markup is None:
+            markup = self._markups[key] = freeze(build())
+        return markup
+
+    def clear(self) -> None:
+        self._markups.clear()
+
+
+keyboards = KeyboardRegistry()
@@ -9,50 +9,79 @@ from src.presentation.bot.utils.cb_data import (
     SettingsCBAction,
     SettingsCBData,
 )
+from src.presentation.bot.utils.markups.registry import keyboards, locale_of
+
+SETTINGS_MENU_CB = SettingsCBData(action=SettingsCBAction.MENU).pack()
+SETTINGS_LANGUAGE_CB = SettingsCBData(action=SettingsCBAction.LANGUAGE).pack()
+SETTINGS_BACK_CB = SettingsCBData(action=SettingsCBAction.BACK).pack()
+LANGUAGE_EN_CB = LanguageCBData(code=LanguageCBCode.EN).pack()
+LANGUAGE_RU_CB = LanguageCBData(code=LanguageCBCode.RU).pack()
+ONBOARDING_EN_CB = OnboardingCBData(code=LanguageCBCode.EN).pack()
+ONBOARDING_RU_CB = OnboardingCBData(code=LanguageCBCode.RU).pack()
 
 
 def get_welcome_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
     """Create welcome/main menu keyboard."""
+    return keyboards.get(
+        ("welcome", locale_of(i18n)), lambda: build_welcome_keyboard(i18n)
+    )
+
+
+def get_settings_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
+    """Create settings menu keyboard."""
+    return keyboards.get(
+        ("settings", locale_of(i18n)), lambda: build_settings_keyboard(i18n)
+    )
+
+
+def get_language_keyboard(
+    i18n: TranslatorRunner, current: LanguageCode | None
+) -> InlineKeyboardMarkup:
+    """Create language selection keyboard with current language marked."""
+    current_code = current.value if current else None
+    return keyboards.get(
+        ("language", locale_of(i18n), current_code),
+        lambda: build_language_keyboard(i18n, current_code),
+    )
+
+
+def get_onboarding_language_keyboard() -> InlineKeyboardMarkup:
+    """Create onboarding language selection keyboard (no localization needed)."""
+    return keyboards.get(("onboarding",), build_onboarding_language_keyboard)
+
+
+def build_welcome_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
-                    text=i18n.get("btn-settings"),
-                    callback_data=SettingsCBData(action=SettingsCBAction.MENU).pack(),
+                    text=i18n.get("btn-settings"), callback_data=SETTINGS_MENU_CB
                 ),
             ],
         ]
     )
 
 
-def get_settings_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
-    """Create settings menu keyboard."""
+def build_settings_keyboard(i18n: TranslatorRunner) -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
-                    text=i18n.get("btn-language"),
-                    callback_data=SettingsCBData(
-                        action=SettingsCBAction.LANGUAGE
-                    ).pack(),
+                    text=i18n.get("btn-language"), callback_data=SETTINGS_LANGUAGE_CB
                 ),
             ],
             [
                 InlineKeyboardButton(
-                    text=i18n.get("btn-back"),
-                    callback_data=SettingsCBData(action=SettingsCBAction.BACK).pack(),
+                    text=i18n.get("btn-back"), callback_data=SETTINGS_BACK_CB
                 ),
             ],
         ]
     )
 
 
-def get_language_keyboard(
-    i18n: TranslatorRunner, current: LanguageCode | None
+def build_language_keyboard(
+    i18n: TranslatorRunner, current_code: str | None
 ) -> InlineKeyboardMarkup:
-    """Create language selection keyboard with current language marked."""
-    current_code = current.value if current else None
-
     def make_label(key: str, code: str) -> str:
         label = i18n.get(key)
         if current_code == code:
@@ -63,41 +92,31 @@ def get_language_keyboard(
         inline_keyboard=[
             [
                 InlineKeyboardButton(
-                    text=make_label("lang-en", "en"),
-                    callback_data=LanguageCBData(code=LanguageCBCode.EN).pack(),
+                    text=make_label("lang-en", "en"), callback_data=LANGUAGE_EN_CB
                 ),
             ],
             [
                 InlineKeyboardButton(
-                    text=make_label("lang-ru", "ru"),
-                    callback_data=LanguageCBData(code=LanguageCBCode.RU).pack(),
+                    text=make_label("lang-ru", "ru"), callback_data=LANGUAGE_RU_CB
                 ),
             ],
             [
                 InlineKeyboardButton(
-                    text=i18n.get("btn-back"),
-                    callback_data=SettingsCBData(action=SettingsCBAction.MENU).pack(),
+                    text=i18n.get("btn-back"), callback_data=SETTINGS_MENU_CB
                 ),
             ],
         ]
     )
 
 
-def get_onboarding_language_keyboard() -> InlineKeyboardMarkup:
-    """Create onboarding language selection keyboard (no localization needed)."""
+def build_onboarding_language_keyboard() -> InlineKeyboardMarkup:
     return InlineKeyboardMarkup(
         inline_keyboard=[
             [
-                InlineKeyboardButton(
-                    text="🇬🇧 English",
-                    callback_data=OnboardingCBData(code=LanguageCBCode.EN).pack(),
-                ),
+                InlineKeyboardButton(text="🇬🇧 English", callback_data=ONBOARDING_EN_CB),
             ],
             [
-                InlineKeyboardButton(
-                    text="🇷🇺 Русский",
-                    callback_data=OnboardingCBData(code=LanguageCBCode.RU).pack(),
-                ),
+                InlineKeyboardButton(text="🇷🇺 Русский", callback_data=ONBOARDING_RU_CB),
             ],
         ]
     )
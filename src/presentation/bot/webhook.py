@@ -0,0 +1,108 @@
+"""Webhook delivery mode: a Litestar app feeding updates to the dispatcher.
+
+Run it with entrypoint-bot-webhook.sh, which starts granian with
+`webhook.workers` workers; the rate limit and caches are split by that
+number, so granian must not run a different one.
+"""
+
+from functools import partial
+import hmac
+import logging
+from typing import Any
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError
+from aiogram.types import Update
+from litestar import Litestar, Request, post
+from litestar.exceptions import NotAuthorizedException, ValidationException
+from litestar.response import Response
+from pydantic import ValidationError
+
+from src.infrastructure.config import WebhookConfig, load_config
+from src.presentation.bot.cache_stats import start_cache_reports
+from src.presentation.bot.factory import (
+    create_bot,
+    create_container,
+    create_dispatcher,
+    create_scheduler,
+    start_admin_jobs,
+)
+from src.presentation.bot.jobs import LEADER_KEY, jobs, lead
+from src.presentation.bot.scheduler import ChatScheduler
+
+logger = logging.getLogger(__name__)
+
+SECRET_TOKEN_HEADER = "X-Telegram-Bot-Api-Secret-Token"  # noqa: S105
+
+
+def prepare_webhook_app(
+    bot: Bot,
+    scheduler: ChatScheduler,
+    webhook: WebhookConfig,
+) -> Litestar:
+    secret_token = webhook.secret_token.encode()
+
+    @post(webhook.path, status_code=200)
+    async def receive_update(request: Request[Any, Any, Any]) -> Response[None]:
+        received_token = request.headers.get(SECRET_TOKEN_HEADER, "").encode()
+        if not hmac.compare_digest(received_token, secret_token):
+            raise NotAuthorizedException
+
+        try:
+            update = Update.model_validate(await request.json(), context={"bot": bot})
+        except ValidationError as e:
+            raise ValidationException(detail="Malformed update") from e
+
+        # Answering late slows Telegram down while the scheduler is full
+        await scheduler.submit(update)
+        return Response(content=None, status_code=200)
+
+    return Litestar(
+        route_handlers=[receive_update],
+        on_shutdown=[scheduler.wait_closed],
+    )
+
+
+def create_app() -> Litestar:
+    config = load_config()
+    if config.webhook is None:
+        raise RuntimeError("`webhook` section is required in webhook mode")
+    webhook = config.webhook
+
+    bot = create_bot(config, processes=webhook.workers)
+    config = config.for_processes(webhook.workers)
+    container = create_container(config)
+    dp = create_dispatcher(config, container)
+    app = prepare_webhook_app(bot, create_scheduler(config, bot, dp), webhook)
+
+    async def set_webhook() -> None:
+        # Every worker sets the same values, so the call is idempotent
+        try:
+            await bot.set_webhook(
+                url=webhook.url,
+                secret_token=webhook.secret_token,
+                allowed_updates=dp.resolve_used_update_types(),
+            )
+        except TelegramAPIError as e:
+            logger.warning("Failed to set webhook: %s", e)
+
+    async def start_leading() -> None:
+        # Admin jobs are resumed and stats rolled up by one worker at a time
+        jobs.start(
+            LEADER_KEY,
+            lead(container, partial(start_admin_jobs, bot, container, config)),
+        )
+
+    async def start_reporting() -> None:
+        start_cache_reports(container, config.scheduler.report_interval_seconds)
+
+    async def shutdown() -> None:
+        await jobs.stop()
+        await container.close()
+        await bot.session.close()
+
+    app.on_startup.append(set_webhook)
+    app.on_startup.append(start_leading)
+    app.on_startup.append(start_reporting)
+    app.on_shutdown.append(shutdown)
+    return app
@@ -0,0 +1,45 @@
+"""Rebuild the user counters behind /stats from a full count of the users.
+
+The counters are kept current by a trigger on `users`; run this after
+changing users with the trigger disabled, or if /stats looks wrong:
+
+    python -m src.presentation.cli.recount_stats
+
+Writes to `users` wait until the recount is committed.
+"""
+
+import asyncio
+import logging
+
+from dishka import AsyncContainer
+
+from src.application.referral.stats import RecountStatsInteractor, StatsOutputDTO
+from src.infrastructure.config import load_config
+from src.presentation.bot.factory import create_container
+
+logger = logging.getLogger(__name__)
+
+
+async def recount(container: AsyncContainer) -> StatsOutputDTO:
+    async with container() as request_container:
+        interactor = await request_container.get(RecountStatsInteractor)
+        return await interactor()
+
+
+async def main() -> None:
+    container = create_container(load_config())
+    try:
+        stats = await recount(container)
+    finally:
+        await container.close()
+    logger.info(
+        "Recounted %d users: %d referred, %d organic",
+        stats.total_users,
+        stats.referred_count,
+        stats.organic_count,
+    )
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,30 @@
+"""Roll up the per-day user stats once.
+
+The bot does it periodically when it polls for updates. Webhook workers do
+not, so schedule this instead, e.g. hourly from cron:
+
+    python -m src.presentation.cli.rollup_stats
+"""
+
+import asyncio
+import logging
+
+from src.infrastructure.config import load_config
+from src.presentation.bot.factory import create_container
+from src.presentation.bot.routers.admin.daily_stats import rollup_daily_stats
+
+logger = logging.getLogger(__name__)
+
+
+async def main() -> None:
+    container = create_container(load_config())
+    try:
+        stats = await rollup_daily_stats(container)
+    finally:
+        await container.close()
+    logger.info("Rolled up daily stats of %d days", len(stats))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main())
@@ -0,0 +1,80 @@
+"""Sends per second through the bot session at different pool sizes.
+
+Runs against a local mock Bot API server that answers every call after a
+fixed delay, standing in for the network round trip:
+
+    pytest tests/benchmarks -m benchmark -n 0 --no-cov
+"""
+
+import asyncio
+import time
+
+from aiogram import Bot
+from aiohttp import web
+import pytest
+
+from src.infrastructure.config import BotSessionConfig, RateLimitConfig, TelegramConfig
+from src.infrastructure.telegram import create_session
+
+pytestmark = pytest.mark.benchmark
+
+LATENCY = 0.02
+MESSAGES = 200
+POOL_SIZES = [1, 4, 16, 64]
+
+SENT_MESSAGE = {
+    "message_id": 1,
+    "date": 1731441609,
+    "chat": {"id": 1, "type": "private"},
+    "text": "hi",
+}
+
+
+@pytest.fixture
+async def api_server_url():
+    async def handle(request: web.Request) -> web.Response:
+        await asyncio.sleep(LATENCY)
+        return web.json_response({"ok": True, "result": SENT_MESSAGE})
+
+    app = web.Application()
+    app.router.add_post("/bot{token}/{method}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    yield f"http://127.0.0.1:{port}"
+    await runner.cleanup()
+
+
+async def sends_per_second(api_server_url: str, pool_size: int) -> float:
+    telegram = TelegramConfig(
+        bot_token="42:TEST",
+        admin_ids=[],
+        bot_username="test_bot",
+        session=BotSessionConfig(pool_size=pool_size, api_server=api_server_url),
+    )
+    # Limits high enough to measure the session, not the limiter
+    rate_limit = RateLimitConfig(global_rate=1e6, global_burst=1e6)
+    bot = Bot(token=telegram.bot_token, session=create_session(telegram, rate_limit))
+    try:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(bot.send_message(chat_id=i, text="hi") for i in range(MESSAGES))
+        )
+        return MESSAGES / (time.perf_counter() - started)
+    finally:
+        await bot.session.close()
+
+
+async def test_throughput_grows_with_pool_size(api_server_url: str):
+    results = {
+        pool_size: await sends_per_second(api_server_url, pool_size)
+        for pool_size in POOL_SIZES
+    }
+
+    for pool_size, rate in results.items():
+        print(f"pool_size={pool_size:>3}: {rate:8.1f} sends/s")
+    # One connection is bound by the round trip
+    assert results[1] < 1 / LATENCY * 1.1
+    assert results[POOL_SIZES[-1]] > results[1] * 4
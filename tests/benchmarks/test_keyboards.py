@@ -0,0 +1,65 @@
+"""Per-update cost of building keyboards versus taking them from the registry.
+
+pytest tests/benchmarks -m benchmark -n 0 --no-cov
+"""
+
+from collections.abc import Callable
+import timeit
+
+from aiogram.types import InlineKeyboardMarkup
+import pytest
+
+from src.domain.user.vo import LanguageCode
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.utils.markups import (
+    get_language_keyboard,
+    get_settings_keyboard,
+    get_stats_keyboard,
+    get_welcome_keyboard,
+)
+from src.presentation.bot.utils.markups.admin import build_stats_keyboard
+from src.presentation.bot.utils.markups.settings import (
+    build_language_keyboard,
+    build_settings_keyboard,
+    build_welcome_keyboard,
+)
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 2000
+
+i18n = create_translator_hub().get_translator_by_locale("ru")
+
+CASES: dict[str, tuple[Callable[[], InlineKeyboardMarkup], ...]] = {
+    "welcome": (
+        lambda: build_welcome_keyboard(i18n),
+        lambda: get_welcome_keyboard(i18n),
+    ),
+    "settings": (
+        lambda: build_settings_keyboard(i18n),
+        lambda: get_settings_keyboard(i18n),
+    ),
+    "language": (
+        lambda: build_language_keyboard(i18n, "ru"),
+        lambda: get_language_keyboard(i18n, LanguageCode("ru")),
+    ),
+    "stats": (
+        lambda: build_stats_keyboard(i18n),
+        lambda: get_stats_keyboard(i18n),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", CASES)
+def test_registry_is_cheaper_than_rebuilding(name: str):
+    build, get = CASES[name]
+    get()  # first use builds the shared instance
+
+    built = timeit.timeit(build, number=ROUNDS) / ROUNDS
+    cached = timeit.timeit(get, number=ROUNDS) / ROUNDS
+
+    print(
+        f"{name:>8}: build {built * 1e6:6.1f} us, registry {cached * 1e6:5.2f} us "
+        f"({built / cached:.0f}x)"
+    )
+    assert cached < built
@@ -0,0 +1,84 @@
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+from httpx import AsyncClient
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.interfaces.auth import AuthService
+from src.domain.admin import DailyStats
+from src.infrastructure.db.repos.daily_stats import DailyStatsRepositoryImpl
+
+
+class TestDailyStats:
+    url = "admin/stats/daily"
+
+    def authorize(
+        self, test_client: AsyncClient, test_auth_service: AuthService, user_id: int
+    ) -> AsyncClient:
+        token = test_auth_service.create_access_token(user_id)
+        test_client.headers.update({"Authorization": f"Bearer {token}"})
+        return test_client
+
+    @pytest.fixture
+    async def rollups(self, native_db_session: AsyncSession) -> None:
+        today = datetime.now(UTC).date()
+        await DailyStatsRepositoryImpl(native_db_session).save(
+            [
+                DailyStats(
+                    day=today - timedelta(days=offset),
+                    new_users=offset + 1,
+                    referred_users=1,
+                    active_users=5,
+                    languages={"en": offset + 1},
+                    final=offset > 0,
+                )
+                for offset in range(10)
+            ]
+        )
+        await native_db_session.commit()
+
+    async def test_admin_reads_rollups(
+        self, test_client: AsyncClient, test_auth_service: AuthService, rollups
+    ):
+        client = self.authorize(test_client, test_auth_service, user_id=1)
+
+        response = await client.get(self.url, params={"days": 3})
+
+        assert response.status_code == HTTPStatus.OK
+        days = response.json()
+        assert len(days) == 3
+        assert days[-1] == {
+            "day": datetime.now(UTC).date().isoformat(),
+            "newUsers": 1,
+            "referredUsers": 1,
+            "organicUsers": 0,
+            "activeUsers": 5,
+            "languages": {"en": 1},
+            "final": False,
+        }
+        assert [day["final"] for day in days] == [True, True, False]
+
+    async def test_non_admin_is_forbidden(
+        self, test_client: AsyncClient, test_auth_service: AuthService
+    ):
+        client = self.authorize(test_client, test_auth_service, user_id=5167898484)
+
+        response = await client.get(self.url)
+
+        assert response.status_code == HTTPStatus.FORBIDDEN
+
+    @pytest.mark.parametrize("days", [0, 367])
+    async def test_rejects_period_out_of_range(
+        self, test_client: AsyncClient, test_auth_service: AuthService, days: int
+    ):
+        client = self.authorize(test_client, test_auth_service, user_id=1)
+
+        response = await client.get(self.url, params={"days": days})
+
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+
+    async def test_requires_authentication(self, test_client: AsyncClient):
+        response = await test_client.get(self.url)
+
+        assert response.status_code == HTTPStatus.UNAUTHORIZED
@@ -22,7 +22,9 @@ from src.infrastructure.config import Config
 from src.infrastructure.db.models.base import BaseORMModel
 from src.infrastructure.di import (
     AuthProvider,
+    CacheProvider,
     DBProvider,
+    I18nProvider,
     interactor_providers,
 )
 from src.presentation.api.app import prepare_app
@@ -163,7 +165,9 @@ async def dishka_container_for_tests(
 
     container = make_async_container(
         AuthProvider(),
+        CacheProvider(),
         DBProvider(worker_postgres_config),
+        I18nProvider(),
         *interactor_provider_instances,
         context={Config: worker_config, AuthService: test_auth_service},
     )
@@ -0,0 +1,202 @@
+import asyncio
+from contextlib import AbstractAsyncContextManager
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.domain.user import User
+from src.domain.user.vo import UserId
+from src.infrastructure.db.activity import ActivityBuffer
+from src.infrastructure.db.repos.user import UserRepositoryImpl
+from tests.integration.repos.test_user import create_test_user
+
+
+class TestActivityBuffer:
+    @pytest.fixture
+    def session_maker(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+    ) -> async_sessionmaker[AsyncSession]:
+        # native_db_session truncates the tables before each test
+        return async_session_maker
+
+    @pytest.fixture
+    async def buffer(self, session_maker: async_sessionmaker[AsyncSession]):
+        buffer = ActivityBuffer(session_maker, flush_interval=60, max_batch_size=100)
+        yield buffer
+        await buffer.close()
+
+    async def _create_user(
+        self, session_maker: async_sessionmaker[AsyncSession], user_id: int
+    ) -> User:
+        async with session_maker() as session:
+            user = await UserRepositoryImpl(session).create_user(
+                create_test_user(user_id)
+            )
+            await session.commit()
+        return user
+
+    async def _last_login_at(
+        self, session_maker: async_sessionmaker[AsyncSession], user_id: int
+    ) -> datetime:
+        async with session_maker() as session:
+            user = await UserRepositoryImpl(session).get_user(UserId(user_id))
+        assert user is not None
+        return user.last_login_at
+
+    async def test_flush_updates_last_login_at(
+        self, buffer: ActivityBuffer, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test pending touches of several users are written by one flush."""
+        first = await self._create_user(session_maker, 1001)
+        second = await self._create_user(session_maker, 1002)
+
+        seen_at = first.last_login_at + timedelta(minutes=5)
+        buffer.record(UserId(1001), seen_at)
+        buffer.record(UserId(1002), seen_at)
+
+        assert await buffer.flush() == 2
+        assert buffer.pending == 0
+        assert await self._last_login_at(session_maker, 1001) == seen_at
+        assert await self._last_login_at(session_maker, 1002) == seen_at
+        assert second.last_login_at < seen_at
+
+    async def test_flush_keeps_touches_paired_with_users(
+        self, buffer: ActivityBuffer, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test touches recorded out of id order land on their own users."""
+        user = await self._create_user(session_maker, 1005)
+        await self._create_user(session_maker, 1004)
+
+        later = user.last_login_at + timedelta(minutes=7)
+        earlier = user.last_login_at + timedelta(minutes=3)
+        buffer.record(UserId(1005), later)
+        buffer.record(UserId(1004), earlier)
+
+        assert await buffer.flush() == 2
+        assert await self._last_login_at(session_maker, 1004) == earlier
+        assert await self._last_login_at(session_maker, 1005) == later
+
+    async def test_keeps_latest_touch_per_user(
+        self, buffer: ActivityBuffer, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test only the newest touch of a user is kept."""
+        user = await self._create_user(session_maker, 1003)
+
+        latest = user.last_login_at + timedelta(minutes=10)
+        buffer.record(UserId(1003), latest)
+        buffer.record(UserId(1003), user.last_login_at + timedelta(minutes=1))
+
+        assert buffer.pending == 1
+        await buffer.flush()
+        assert await self._last_login_at(session_maker, 1003) == latest
+
+    async def test_never_moves_last_login_at_back(
+        self, buffer: ActivityBuffer, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test a stale touch does not overwrite a newer upsert."""
+        user = await self._create_user(session_maker, 1004)
+
+        buffer.record(UserId(1004), user.last_login_at - timedelta(hours=1))
+        await buffer.flush()
+
+        assert await self._last_login_at(session_maker, 1004) == user.last_login_at
+
+    async def test_flush_without_pending_touches(self, buffer: ActivityBuffer):
+        assert await buffer.flush() == 0
+
+    async def test_close_drains_pending_touches(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test closing the buffer persists what the periodic flush has not."""
+        user = await self._create_user(session_maker, 1005)
+        buffer = ActivityBuffer(session_maker, flush_interval=60, max_batch_size=100)
+
+        seen_at = user.last_login_at + timedelta(minutes=1)
+        buffer.record(UserId(1005), seen_at)
+        await buffer.close()
+
+        assert buffer.pending == 0
+        assert await self._last_login_at(session_maker, 1005) == seen_at
+
+    async def test_full_batch_triggers_flush(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test reaching max_batch_size flushes before the interval elapses."""
+        user = await self._create_user(session_maker, 1006)
+        buffer = ActivityBuffer(session_maker, flush_interval=60, max_batch_size=1)
+
+        seen_at = user.last_login_at + timedelta(minutes=1)
+        buffer.record(UserId(1006), seen_at)
+        try:
+            for _ in range(500):
+                await asyncio.sleep(0.01)
+                if await self._last_login_at(session_maker, 1006) == seen_at:
+                    break
+            else:
+                pytest.fail("Full batch was not flushed")
+        finally:
+            await buffer.close()
+
+    async def _wait_for_login(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        user_id: int,
+        seen_at: datetime,
+    ) -> None:
+        for _ in range(500):
+            await asyncio.sleep(0.01)
+            if await self._last_login_at(session_maker, user_id) == seen_at:
+                return
+        pytest.fail("Touch was not flushed")
+
+    async def test_flusher_survives_unexpected_errors(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        caplog: pytest.LogCaptureFixture,
+    ):
+        """Test an error outside SQLAlchemy is logged and the next flush retries."""
+        user = await self._create_user(session_maker, 1007)
+        calls = 0
+
+        def flaky_maker() -> AbstractAsyncContextManager[AsyncSession]:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise OSError("connection reset")
+            return session_maker()
+
+        buffer = ActivityBuffer(
+            flaky_maker,  # type: ignore[arg-type]
+            flush_interval=0.05,
+            max_batch_size=100,
+        )
+
+        seen_at = user.last_login_at + timedelta(minutes=1)
+        buffer.record(UserId(1007), seen_at)
+        try:
+            await self._wait_for_login(session_maker, 1007, seen_at)
+        finally:
+            await buffer.close()
+
+        assert "Failed to flush 1 activity touches" in caplog.text
+
+    async def test_record_restarts_dead_flusher(
+        self, session_maker: async_sessionmaker[AsyncSession]
+    ):
+        """Test a touch starts a new flusher when the previous one has stopped."""
+        user = await self._create_user(session_maker, 1008)
+        buffer = ActivityBuffer(session_maker, flush_interval=0.05, max_batch_size=100)
+        buffer.record(UserId(1008), user.last_login_at)
+        assert buffer._flusher is not None
+        buffer._flusher.cancel()
+        await asyncio.sleep(0)
+
+        seen_at = user.last_login_at + timedelta(minutes=1)
+        buffer.record(UserId(1008), seen_at)
+        try:
+            await self._wait_for_login(session_maker, 1008, seen_at)
+        finally:
+            await buffer.close()
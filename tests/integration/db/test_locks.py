@@ -0,0 +1,20 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.db.locks import AdvisoryJobLock
+
+
+class TestAdvisoryJobLock:
+    async def test_key_is_held_by_one_connection(self, sqlalchemy_engine: AsyncEngine):
+        """Test a held key is refused to a second holder and freed on exit."""
+        first = AdvisoryJobLock(sqlalchemy_engine)
+        second = AdvisoryJobLock(sqlalchemy_engine)
+
+        async with first.hold("check_alive") as acquired:
+            assert acquired
+            async with second.hold("check_alive") as taken:
+                assert not taken
+            async with second.hold("broadcast-7") as other:
+                assert other
+
+        async with second.hold("check_alive") as acquired:
+            assert acquired
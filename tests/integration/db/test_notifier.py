@@ -0,0 +1,98 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.infrastructure.db.notifier import PostgresLocaleNotifier
+
+
+class TestPostgresLocaleNotifier:
+    async def test_subscriber_receives_published_change(
+        self, sqlalchemy_engine: AsyncEngine
+    ):
+        """Test a change published by one notifier reaches another one."""
+        listener = PostgresLocaleNotifier(sqlalchemy_engine)
+        publisher = PostgresLocaleNotifier(sqlalchemy_engine)
+        received: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+
+        await listener.subscribe(lambda *change: received.put_nowait(change))
+        try:
+            await publisher.publish(123456, "ru")
+            change = await asyncio.wait_for(received.get(), timeout=5)
+        finally:
+            await listener.close()
+
+        assert change == (123456, "ru")
+
+    async def test_malformed_payload_is_ignored(self, sqlalchemy_engine: AsyncEngine):
+        notifier = PostgresLocaleNotifier(sqlalchemy_engine)
+        received: list[tuple[int, str]] = []
+        await notifier.subscribe(lambda *change: received.append(change))
+        await notifier.subscribe(lambda *change: received.append(change))
+
+        notifier._on_notification(None, 0, "channel", "not-a-user:ru")
+        notifier._on_notification(None, 0, "channel", "1:en")
+
+        await notifier.close()
+        await notifier.close()
+
+        assert received == [(1, "en"), (1, "en")]
+
+    async def test_listens_again_after_connection_loss(
+        self, sqlalchemy_engine: AsyncEngine
+    ):
+        """Test a terminated listener reconnects and reports the gap."""
+        listener = PostgresLocaleNotifier(sqlalchemy_engine, reconnect_delay=0.01)
+        publisher = PostgresLocaleNotifier(sqlalchemy_engine)
+        received: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        reconnected = asyncio.Event()
+
+        await listener.subscribe(
+            lambda *change: received.put_nowait(change), reconnected.set
+        )
+        try:
+            assert listener._listener is not None
+            raw_connection = await listener._listener.get_raw_connection()
+            pid = raw_connection.driver_connection.get_server_pid()
+            async with sqlalchemy_engine.connect() as connection:
+                await connection.execute(
+                    text("SELECT pg_terminate_backend(:pid)"), {"pid": pid}
+                )
+
+            await asyncio.wait_for(reconnected.wait(), timeout=5)
+            await publisher.publish(654321, "en")
+            change = await asyncio.wait_for(received.get(), timeout=5)
+        finally:
+            await listener.close()
+
+        assert change == (654321, "en")
+
+    async def test_reconnect_retries_with_backoff(self, sqlalchemy_engine: AsyncEngine):
+        """Test failed reconnects are retried with a growing delay."""
+        notifier = PostgresLocaleNotifier(
+            sqlalchemy_engine, reconnect_delay=0.01, max_reconnect_delay=0.02
+        )
+        reconnected = asyncio.Event()
+        await notifier.subscribe(lambda *change: None, reconnected.set)
+        await notifier.close()
+
+        listen = AsyncMock(side_effect=[OSError, OSError, OSError, None])
+        notifier._listen = listen  # type: ignore[method-assign]
+        notifier._on_termination(None)
+        notifier._on_termination(None)
+
+        await asyncio.wait_for(reconnected.wait(), timeout=5)
+
+        assert listen.await_count == 4
+        assert notifier._reconnecting is None
+
+    async def test_close_stops_reconnecting(self, sqlalchemy_engine: AsyncEngine):
+        notifier = PostgresLocaleNotifier(sqlalchemy_engine, reconnect_delay=60)
+        notifier._listen = AsyncMock(side_effect=OSError)  # type: ignore[method-assign]
+        notifier._on_termination(None)
+        await asyncio.sleep(0)
+
+        await notifier.close()
+
+        assert notifier._reconnecting is None
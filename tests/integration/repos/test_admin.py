@@ -0,0 +1,181 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.admin import Reachability, ReachabilityCheck
+from src.infrastructure.db import estimates
+from src.infrastructure.db.models.user import UserModel
+from src.infrastructure.db.repos.admin import AdminRepositoryImpl
+from src.infrastructure.db.repos.user import UserRepositoryImpl
+from tests.integration.repos.test_user import add_many_users, create_test_user
+
+
+class TestAdminRepository:
+    @pytest.fixture
+    def repo(self, native_db_session: AsyncSession) -> AdminRepositoryImpl:
+        return AdminRepositoryImpl(native_db_session)
+
+    @pytest.fixture
+    async def users(self, native_db_session: AsyncSession) -> list[int]:
+        user_repo = UserRepositoryImpl(native_db_session)
+        user_ids = [5005, 1001, 3003, 2002, 4004]
+        for user_id in user_ids:
+            await user_repo.create_user(create_test_user(user_id))
+        # 1001 and 4004 have been idle for 10 days
+        await native_db_session.execute(
+            update(UserModel)
+            .where(UserModel.id.in_([1001, 4004]))
+            .values(last_login_at=datetime.now(UTC) - timedelta(days=10))
+        )
+        return sorted(user_ids)
+
+    async def test_streams_all_ids_in_order(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        streamed = [user_id async for user_id in repo.iter_user_ids(page_size=2)]
+
+        assert streamed == users
+        assert all(type(user_id) is int for user_id in streamed)
+        assert await repo.count_users() == 5
+
+    async def test_page_size_equal_to_total(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        streamed = [user_id async for user_id in repo.iter_user_ids(page_size=5)]
+
+        assert streamed == users
+
+    async def test_filters_by_activity(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        streamed = [
+            user_id
+            async for user_id in repo.iter_user_ids(active_since_days=7, page_size=2)
+        ]
+
+        assert streamed == [2002, 3003, 5005]
+        assert await repo.count_users(active_since_days=7) == 3
+
+    async def test_save_reachability(
+        self,
+        repo: AdminRepositoryImpl,
+        native_db_session: AsyncSession,
+        users: list[int],
+    ):
+        checked_at = datetime.now(UTC)
+        await repo.save_reachability(
+            [
+                ReachabilityCheck(1001, Reachability.BLOCKED, checked_at),
+                ReachabilityCheck(2002, Reachability.ALIVE, checked_at),
+                ReachabilityCheck(9999, Reachability.ALIVE, checked_at),
+            ]
+        )
+
+        rows = await native_db_session.execute(
+            select(
+                UserModel.id, UserModel.reachability, UserModel.reachability_checked_at
+            ).order_by(UserModel.id)
+        )
+        saved = {user_id.value: (status, at) for user_id, status, at in rows}
+        assert saved[1001] == (Reachability.BLOCKED, checked_at)
+        assert saved[2002] == (Reachability.ALIVE, checked_at)
+        assert saved[3003] == (None, None)
+
+    async def test_skips_recently_checked_users(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        now = datetime.now(UTC)
+        await repo.save_reachability(
+            [
+                ReachabilityCheck(1001, Reachability.ALIVE, now - timedelta(days=1)),
+                ReachabilityCheck(2002, Reachability.ALIVE, now - timedelta(days=30)),
+            ]
+        )
+
+        streamed = [
+            user_id async for user_id in repo.iter_user_ids(unchecked_for_days=7)
+        ]
+
+        assert streamed == [2002, 3003, 4004, 5005]
+        assert await repo.count_users(unchecked_for_days=7) == 4
+
+    async def test_resumes_after_user_id(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        streamed = [
+            user_id
+            async for user_id in repo.iter_user_ids(after_user_id=2002, page_size=2)
+        ]
+
+        assert streamed == [3003, 4004, 5005]
+        assert await repo.count_users(after_user_id=2002) == 3
+
+    async def test_sample_of_everyone(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        # A sample as large as the population keeps every row
+        assert await repo.sample_user_ids(size=10) == users
+
+    async def test_sample_is_random_subset(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        samples = [await repo.sample_user_ids(size=2) for _ in range(20)]
+
+        for sample in samples:
+            assert len(sample) <= 2
+            assert sample == sorted(sample)
+            assert set(sample) <= set(users)
+        assert len({tuple(sample) for sample in samples}) > 1
+
+    async def test_sample_respects_filters(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        sample = await repo.sample_user_ids(size=5, active_since_days=7)
+
+        assert sample == [2002, 3003, 5005]
+
+    async def test_no_users(self, repo: AdminRepositoryImpl):
+        assert await repo.sample_user_ids(size=10) == []
+        assert [user_id async for user_id in repo.iter_user_ids()] == []
+        assert await repo.count_users() == 0
+
+    async def test_sample_uses_given_population(
+        self, repo: AdminRepositoryImpl, users: list[int]
+    ):
+        # A population claimed as small as the sample keeps every row
+        assert await repo.sample_user_ids(size=5, population=5) == users
+
+
+class TestEstimateUsers:
+    @pytest.fixture
+    def repo(self, native_db_session: AsyncSession) -> AdminRepositoryImpl:
+        return AdminRepositoryImpl(native_db_session)
+
+    async def test_small_table_is_counted(
+        self, repo: AdminRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await add_many_users(native_db_session, 100)
+
+        assert await repo.estimate_users() == 100
+        assert await repo.estimate_users(active_since_days=7) == 50
+        assert await repo.estimate_users(after_user_id=90) == 10
+
+    async def test_no_users(self, repo: AdminRepositoryImpl):
+        assert await repo.estimate_users() == 0
+
+    async def test_large_table_is_estimated(
+        self,
+        repo: AdminRepositoryImpl,
+        native_db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(estimates, "SAMPLE_ROWS", 1000)
+        await add_many_users(native_db_session, 4000)
+
+        # Table statistics, without reading the users
+        assert await repo.estimate_users() == 4000
+        # Half the users are active: every sampled page holds both kinds
+        assert 1600 < await repo.estimate_users(active_since_days=7) < 2400
+        assert await repo.estimate_users(after_user_id=4000) == 0
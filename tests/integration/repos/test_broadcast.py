@@ -0,0 +1,135 @@
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.admin import Reachability, ReachabilityCheck
+from src.domain.broadcast import BroadcastStatus, Delivery, DeliveryStatus
+from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.db.models.user import IS_REACHABLE, UserModel
+from src.infrastructure.db.repos.admin import AdminRepositoryImpl
+from src.infrastructure.db.repos.broadcast import BroadcastRepositoryImpl
+from src.infrastructure.db.repos.user import UserRepositoryImpl
+from tests.integration.repos.test_user import create_test_user
+
+
+class TestBroadcastRepository:
+    @pytest.fixture
+    def repo(self, native_db_session: AsyncSession) -> BroadcastRepositoryImpl:
+        return BroadcastRepositoryImpl(native_db_session)
+
+    @pytest.fixture
+    async def users(self, native_db_session: AsyncSession) -> list[int]:
+        user_repo = UserRepositoryImpl(native_db_session)
+        user_ids = [3003, 1001, 2002, 4004]
+        for user_id in user_ids:
+            await user_repo.create_user(create_test_user(user_id))
+        await user_repo.update_language(
+            user_id=UserId(2002), language_code=LanguageCode("ru")
+        )
+        return sorted(user_ids)
+
+    async def test_reachable_filter_matches_partial_index(
+        self, native_db_session: AsyncSession
+    ):
+        """Test the filter is sent with the value the index condition names."""
+        statement = select(UserModel.id).where(IS_REACHABLE)
+        sql = str(
+            statement.compile(
+                dialect=native_db_session.bind.dialect,
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+        assert "'alive'" in sql
+
+        await native_db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = (await native_db_session.execute(text(f"EXPLAIN {sql}"))).scalars()
+
+        assert "ix_users_reachable_id" in "\n".join(plan)
+
+    async def test_create_and_get(self, repo: BroadcastRepositoryImpl):
+        created = await repo.create(message_key="broadcast-example", created_by=1)
+
+        found = await repo.get(created.id)
+
+        assert found == created
+        assert found.status == BroadcastStatus.DRAFT
+        assert found.last_user_id is None
+        assert found.processed == 0
+
+    async def test_get_missing(self, repo: BroadcastRepositoryImpl):
+        assert await repo.get(404) is None
+
+    async def test_recipients_are_paged_by_user_id(
+        self, repo: BroadcastRepositoryImpl, users: list[int]
+    ):
+        first = await repo.get_recipients(after_user_id=None, limit=3)
+        second = await repo.get_recipients(after_user_id=first[-1].user_id, limit=3)
+
+        assert [r.user_id for r in first] == users[:3]
+        assert [r.user_id for r in second] == users[3:]
+        assert {r.user_id: r.language_code for r in first}[2002] == "ru"
+        assert await repo.get_recipients(after_user_id=users[-1], limit=3) == []
+        assert await repo.count_recipients() == 4
+
+    async def test_recipients_skip_unreachable_users(
+        self,
+        repo: BroadcastRepositoryImpl,
+        native_db_session: AsyncSession,
+        users: list[int],
+    ):
+        checked_at = datetime.now(UTC)
+        await AdminRepositoryImpl(native_db_session).save_reachability(
+            [
+                ReachabilityCheck(1001, Reachability.BLOCKED, checked_at),
+                ReachabilityCheck(2002, Reachability.ALIVE, checked_at),
+                ReachabilityCheck(3003, Reachability.DELETED, checked_at),
+            ]
+        )
+
+        recipients = await repo.get_recipients(after_user_id=None, limit=10)
+
+        assert [r.user_id for r in recipients] == [2002, 4004]
+        assert await repo.count_recipients() == 2
+
+    async def test_save_stores_checkpoint_and_deliveries(
+        self,
+        repo: BroadcastRepositoryImpl,
+        native_db_session: AsyncSession,
+        users: list[int],
+    ):
+        broadcast = await repo.create(message_key="broadcast-example", created_by=1)
+        broadcast.status = BroadcastStatus.RUNNING
+        deliveries = [
+            Delivery(user_id=1001, status=DeliveryStatus.DELIVERED),
+            Delivery(user_id=2002, status=DeliveryStatus.BLOCKED),
+        ]
+        broadcast.record(deliveries, last_user_id=2002)
+
+        await repo.save(broadcast, deliveries)
+        # A re-sent page after a restart keeps the first results
+        await repo.save(
+            broadcast, [Delivery(user_id=1001, status=DeliveryStatus.FAILED)]
+        )
+        native_db_session.expunge_all()
+
+        found = await repo.get(broadcast.id)
+        assert found is not None
+        assert found.status == BroadcastStatus.RUNNING
+        assert found.last_user_id == 2002
+        assert (found.delivered, found.blocked, found.failed) == (1, 1, 0)
+        assert await repo.get_running() == [found]
+
+    async def test_get_running_skips_other_statuses(
+        self, repo: BroadcastRepositoryImpl
+    ):
+        running = await repo.create(message_key="a", created_by=1)
+        running.status = BroadcastStatus.RUNNING
+        await repo.save(running)
+        await repo.create(message_key="b", created_by=1)
+        completed = await repo.create(message_key="c", created_by=1)
+        completed.status = BroadcastStatus.COMPLETED
+        await repo.save(completed)
+
+        assert [b.id for b in await repo.get_running()] == [running.id]
@@ -0,0 +1,58 @@
+from dataclasses import replace
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.admin import CheckRunStatus
+from src.infrastructure.db.repos.check_run import CheckRunRepositoryImpl
+
+
+class TestCheckRunRepository:
+    @pytest.fixture
+    def repo(self, native_db_session: AsyncSession) -> CheckRunRepositoryImpl:
+        return CheckRunRepositoryImpl(native_db_session)
+
+    async def test_create_and_get(self, repo: CheckRunRepositoryImpl):
+        created = await repo.create(created_by=1, unchecked_for_days=7)
+
+        found = await repo.get(created.id)
+
+        assert found == created
+        assert found.status == CheckRunStatus.RUNNING
+        assert (found.active_since_days, found.unchecked_for_days) == (None, 7)
+        assert found.last_user_id is None
+        assert found.processed == 0
+
+    async def test_get_missing(self, repo: CheckRunRepositoryImpl):
+        assert await repo.get(404) is None
+
+    async def test_save_checkpoint(
+        self, repo: CheckRunRepositoryImpl, native_db_session: AsyncSession
+    ):
+        run = await repo.create(created_by=1)
+
+        await repo.save(
+            replace(run, last_user_id=2002, alive=3, blocked=1, rate_limited=1)
+        )
+        native_db_session.expunge_all()
+        found = await repo.get(run.id)
+
+        assert found.last_user_id == 2002
+        assert (found.alive, found.blocked, found.rate_limited) == (3, 1, 1)
+        assert found.processed == 5
+
+    async def test_abandon_running(
+        self, repo: CheckRunRepositoryImpl, native_db_session: AsyncSession
+    ):
+        first = await repo.create(created_by=1)
+        completed = await repo.create(created_by=1)
+        await repo.save(replace(completed, status=CheckRunStatus.COMPLETED))
+        running = await repo.create(created_by=2)
+        assert [run.id for run in await repo.get_running()] == [first.id, running.id]
+
+        await repo.abandon_running()
+        native_db_session.expunge_all()
+
+        assert await repo.get_running() == []
+        assert (await repo.get(first.id)).status == CheckRunStatus.ABANDONED
+        assert (await repo.get(completed.id)).status == CheckRunStatus.COMPLETED
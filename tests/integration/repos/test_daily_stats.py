@@ -0,0 +1,96 @@
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.domain.admin import DailyStats
+from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.db.models import UserModel
+from src.infrastructure.db.repos.daily_stats import (
+    UNKNOWN_LANGUAGE,
+    DailyStatsRepositoryImpl,
+)
+
+DAY = date(2026, 10, 17)
+
+
+def at(day: date, hour: int) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, tzinfo=UTC)
+
+
+class TestDailyStatsRepository:
+    @pytest.fixture
+    def repo(self, native_db_session: AsyncSession) -> DailyStatsRepositoryImpl:
+        return DailyStatsRepositoryImpl(native_db_session)
+
+    async def test_aggregate_counts_users_per_day(
+        self, repo, create_user, native_db_session: AsyncSession
+    ):
+        previous = DAY - timedelta(days=1)
+        await create_user(id=1, created_at=at(previous, 23), last_login_at=at(DAY, 1))
+        await create_user(
+            id=2,
+            created_at=at(DAY, 0),
+            last_login_at=at(DAY, 5),
+            referred_by=UserId(1),
+            language_code=LanguageCode("ru"),
+        )
+        await create_user(
+            id=3,
+            created_at=at(DAY, 23),
+            last_login_at=at(DAY + timedelta(days=1), 0),
+        )
+        # The column defaults to "en" when the value is left out
+        await native_db_session.execute(
+            update(UserModel).where(UserModel.id == 3).values(language_code=None)
+        )
+
+        stats = await repo.aggregate(DAY, DAY + timedelta(days=1))
+
+        assert stats == [
+            DailyStats(
+                day=DAY,
+                new_users=2,
+                referred_users=1,
+                active_users=2,
+                languages={"ru": 1, UNKNOWN_LANGUAGE: 1},
+            ),
+            DailyStats(day=DAY + timedelta(days=1), active_users=1),
+        ]
+
+    async def test_first_signup_day(self, repo, create_user):
+        assert await repo.get_first_signup_day() is None
+
+        await create_user(id=1, created_at=at(DAY, 23))
+        await create_user(id=2, created_at=at(DAY + timedelta(days=3), 1))
+
+        assert await repo.get_first_signup_day() == DAY
+
+    async def test_save_and_list(self, repo):
+        older = DailyStats(day=DAY - timedelta(days=1), new_users=1, final=True)
+        await repo.save([older, DailyStats(day=DAY, new_users=2, languages={"en": 2})])
+
+        assert await repo.list_since(DAY) == [
+            DailyStats(day=DAY, new_users=2, languages={"en": 2})
+        ]
+        assert (await repo.list_since(DAY - timedelta(days=7)))[0] == older
+        assert await repo.get_watermark() == DAY - timedelta(days=1)
+
+    async def test_save_overwrites_day_keeping_more_active_users(
+        self, repo, native_db_session: AsyncSession
+    ):
+        await repo.save([DailyStats(day=DAY, new_users=1, active_users=10)])
+
+        await repo.save([DailyStats(day=DAY, new_users=3, active_users=7, final=True)])
+        native_db_session.expunge_all()
+
+        assert await repo.list_since(DAY) == [
+            DailyStats(day=DAY, new_users=3, active_users=10, final=True)
+        ]
+        assert await repo.get_watermark() == DAY
+
+    async def test_save_nothing(self, repo):
+        await repo.save([])
+
+        assert await repo.get_watermark() is None
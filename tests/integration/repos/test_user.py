@@ -1,9 +1,12 @@
+import asyncio
 from datetime import UTC, datetime
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from src.domain.user import User
+from src.domain.user.repository import ReferralStats
 from src.domain.user.vo import (
     FirstName,
     LanguageCode,
@@ -11,6 +14,11 @@ from src.domain.user.vo import (
     UserId,
     Username,
 )
+from src.infrastructure.db import estimates
+from src.infrastructure.db.holder import HolderDao
+from src.infrastructure.db.identity_map import StatementCounter
+from src.infrastructure.db.models.counters import SLOTS, UserCounterModel
+from src.infrastructure.db.models.user import UserModel
 from src.infrastructure.db.repos.user import UserRepositoryImpl
 
 
@@ -33,6 +41,28 @@ def create_test_user(
     )
 
 
+async def add_many_users(session: AsyncSession, count: int) -> None:
+    """Insert users in bulk and analyze them, so the planner knows the table.
+
+    Even users are active; every fourth one was referred by the first.
+    """
+    await session.execute(
+        text(
+            """
+            INSERT INTO users (id, first_name, last_login_at, referred_by)
+            SELECT
+                id,
+                'User',
+                CASE WHEN id % 2 = 0 THEN now() ELSE now() - interval '30 days' END,
+                CASE WHEN id % 4 = 0 THEN 1 END
+            FROM generate_series(1, :count) AS id
+            """
+        ),
+        {"count": count},
+    )
+    await session.execute(text("ANALYZE users"))
+
+
 class TestUserRepository:
     @pytest.fixture
     def user_repo(self, native_db_session: AsyncSession) -> UserRepositoryImpl:
@@ -89,6 +119,45 @@ class TestUserRepository:
         assert result.last_name is not None
         assert result.last_name.value == "Name"
 
+    async def test_upsert_user_inserts_new_user(self, user_repo: UserRepositoryImpl):
+        """Test upserting an unknown user inserts it and marks it as new."""
+        user = create_test_user(123459, username="fresh")
+
+        result = await user_repo.upsert_user(user)
+
+        assert result.id.value == 123459
+        assert result.username is not None
+        assert result.username.value == "fresh"
+        assert result.is_new
+
+    async def test_upsert_user_updates_existing_user(
+        self, user_repo: UserRepositoryImpl
+    ):
+        """Test upserting a known user keeps created_at and language."""
+        user = create_test_user(123460, first_name="Original")
+        created = await user_repo.upsert_user(user)
+        await user_repo.update_language(UserId(123460), LanguageCode("ru"))
+
+        later = datetime.now(UTC)
+        result = await user_repo.upsert_user(
+            User(
+                id=UserId(123460),
+                first_name=FirstName("Renamed"),
+                last_name=LastName("Name"),
+                username=Username("renamed"),
+                bio=None,
+                created_at=later,
+                updated_at=later,
+                last_login_at=later,
+            )
+        )
+
+        assert result.first_name.value == "Renamed"
+        assert result.created_at == created.created_at
+        assert result.last_login_at == later
+        assert result.language_code == LanguageCode("ru")
+        assert not result.is_new
+
     async def test_set_referred_by(self, user_repo: UserRepositoryImpl):
         """Test setting referrer for a user."""
         referrer = create_test_user(111111, first_name="Referrer")
@@ -163,3 +232,296 @@ class TestUserRepository:
         # Verify
         updated = await user_repo.get_user(UserId(888888))
         assert updated is not None
+
+
+class TestUserCounters:
+    @pytest.fixture
+    def user_repo(self, native_db_session: AsyncSession) -> UserRepositoryImpl:
+        return UserRepositoryImpl(native_db_session)
+
+    async def counter_rows(self, session: AsyncSession) -> dict[str, int]:
+        rows = await session.execute(
+            select(UserCounterModel.name, func.count()).group_by(UserCounterModel.name)
+        )
+        return dict(rows.tuples().all())
+
+    async def test_counters_follow_writes(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        for user_id in (1, 2, 3, 17):
+            await user_repo.create_user(create_test_user(user_id))
+        await user_repo.upsert_user(create_test_user(3, first_name="Again"))
+        await user_repo.set_referred_by(UserId(2), UserId(1))
+        await user_repo.set_referred_by(UserId(17), UserId(1))
+        await user_repo.set_referred_by(UserId(17), UserId(1))
+        await native_db_session.execute(delete(UserModel).where(UserModel.id == 17))
+
+        stats = await user_repo.get_referral_stats()
+
+        assert stats == ReferralStats(total_users=3, referred_count=1, organic_count=2)
+        assert stats == await user_repo.count_referral_stats()
+        # Users 1 and 17 share a slot
+        assert (await self.counter_rows(native_db_session))["users"] == 3
+
+    async def test_falls_back_to_scan_without_counters(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await user_repo.create_user(create_test_user(1))
+        await user_repo.create_user(create_test_user(2))
+        await user_repo.set_referred_by(UserId(2), UserId(1))
+        await native_db_session.execute(delete(UserCounterModel))
+
+        stats = await user_repo.get_referral_stats()
+
+        assert stats == ReferralStats(total_users=2, referred_count=1, organic_count=1)
+
+    async def test_recount_repairs_counters(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        for user_id in range(1, 6):
+            await user_repo.create_user(create_test_user(user_id))
+        await user_repo.set_referred_by(UserId(5), UserId(1))
+        await native_db_session.execute(
+            update(UserCounterModel).values(value=UserCounterModel.value + 7)
+        )
+
+        stats = await user_repo.recount_referral_stats()
+
+        assert stats == ReferralStats(total_users=5, referred_count=1, organic_count=4)
+        assert await user_repo.get_referral_stats() == stats
+        assert await self.counter_rows(native_db_session) == {
+            "users": SLOTS,
+            "referred_users": SLOTS,
+        }
+
+    async def test_estimate_reads_counters(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await add_many_users(native_db_session, 100)
+
+        stats = await user_repo.estimate_referral_stats()
+
+        assert stats == ReferralStats(
+            total_users=100, referred_count=25, organic_count=75
+        )
+
+    async def test_estimate_counts_small_table_without_counters(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession
+    ):
+        await add_many_users(native_db_session, 100)
+        await native_db_session.execute(delete(UserCounterModel))
+
+        stats = await user_repo.estimate_referral_stats()
+
+        assert stats == ReferralStats(
+            total_users=100, referred_count=25, organic_count=75
+        )
+
+    async def test_estimate_samples_large_table_without_counters(
+        self,
+        user_repo: UserRepositoryImpl,
+        native_db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(estimates, "SAMPLE_ROWS", 1000)
+        await add_many_users(native_db_session, 4000)
+        await native_db_session.execute(delete(UserCounterModel))
+
+        stats = await user_repo.estimate_referral_stats()
+
+        assert stats.estimated
+        assert stats.total_users == 4000
+        assert 700 < stats.referred_count < 1300
+        assert stats.organic_count == 4000 - stats.referred_count
+
+    async def test_recount_of_empty_base(self, user_repo: UserRepositoryImpl):
+        stats = await user_repo.recount_referral_stats()
+
+        assert stats == ReferralStats(total_users=0, referred_count=0, organic_count=0)
+
+
+class TestApplyReferral:
+    @pytest.fixture
+    def user_repo(self, native_db_session: AsyncSession) -> UserRepositoryImpl:
+        return UserRepositoryImpl(native_db_session)
+
+    @pytest.fixture
+    async def users(self, user_repo: UserRepositoryImpl) -> None:
+        await user_repo.create_user(create_test_user(1, first_name="Referrer"))
+        await user_repo.create_user(create_test_user(2, first_name="Invited"))
+
+    async def referral_of(
+        self, session: AsyncSession, user_id: int
+    ) -> tuple[UserId | None, int]:
+        """Referrer of the user and the referral count of user 1."""
+        referred_by = await session.scalar(
+            select(UserModel.referred_by).where(UserModel.id == user_id)
+        )
+        count = await session.scalar(
+            select(UserModel.referral_count).where(UserModel.id == 1)
+        )
+        return referred_by, count.value
+
+    async def test_applies_once(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession, users
+    ):
+        assert await user_repo.apply_referral(UserId(2), UserId(1))
+        assert not await user_repo.apply_referral(UserId(2), UserId(1))
+
+        assert await self.referral_of(native_db_session, 2) == (UserId(1), 1)
+
+    async def test_keeps_first_referrer(
+        self, user_repo: UserRepositoryImpl, native_db_session: AsyncSession, users
+    ):
+        await user_repo.create_user(create_test_user(3))
+        await user_repo.apply_referral(UserId(2), UserId(1))
+
+        assert not await user_repo.apply_referral(UserId(2), UserId(3))
+        assert (await user_repo.get_user(UserId(3))).referral_count.value == 0
+
+    @pytest.mark.parametrize(
+        ("user_id", "referrer_id"),
+        [(2, 404), (2, 2), (404, 1)],
+        ids=["missing referrer", "self referral", "missing user"],
+    )
+    async def test_not_applied(
+        self,
+        user_repo: UserRepositoryImpl,
+        native_db_session: AsyncSession,
+        users,
+        user_id: int,
+        referrer_id: int,
+    ):
+        assert not await user_repo.apply_referral(UserId(user_id), UserId(referrer_id))
+
+        assert await self.referral_of(native_db_session, 2) == (None, 0)
+
+    async def test_evicts_cached_users(self, user_repo: UserRepositoryImpl, users):
+        referrer = await user_repo.get_user(UserId(1))
+
+        await user_repo.apply_referral(UserId(2), UserId(1))
+
+        assert (await user_repo.get_user(UserId(1))) is not referrer
+        assert (await user_repo.get_user(UserId(1))).referral_count.value == 1
+        assert (await user_repo.get_user(UserId(2))).referred_by == UserId(1)
+
+    async def test_concurrent_starts_credit_once(
+        self,
+        native_db_session: AsyncSession,
+        async_session_maker: async_sessionmaker[AsyncSession],
+        users,
+    ):
+        await native_db_session.commit()
+
+        async def start() -> bool:
+            async with async_session_maker() as session:
+                applied = await UserRepositoryImpl(session).apply_referral(
+                    UserId(2), UserId(1)
+                )
+                await session.commit()
+                return applied
+
+        assert sorted(await asyncio.gather(start(), start())) == [False, True]
+        assert await self.referral_of(native_db_session, 2) == (UserId(1), 1)
+
+
+class TestUserIdentityMap:
+    @pytest.fixture
+    def holder(self, native_db_session: AsyncSession) -> HolderDao:
+        return HolderDao(native_db_session)
+
+    @pytest.fixture
+    def statements(self, native_db_session: AsyncSession):
+        counter = StatementCounter(native_db_session)
+        yield counter
+        counter.close()
+
+    async def test_textual_statements_are_not_writes(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        await holder.session.execute(text("SELECT 1"))
+
+        assert statements.writes == 0
+        assert statements.other == 1
+        assert statements.total == 1
+
+    def test_holder_shares_its_map_with_the_repo(self, holder: HolderDao):
+        # An empty map is falsy, so it must not be swapped for a new one
+        assert holder.user_repo._identity_map is holder.users
+
+    async def test_repeated_get_user_reads_once(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        """Test a user is read from the DB once per request."""
+        await UserRepositoryImpl(holder.session).create_user(create_test_user(1))
+
+        first = await holder.user_repo.get_user(UserId(1))
+        second = await holder.user_repo.get_user(UserId(1))
+
+        assert first is not None
+        assert second is first
+        assert statements.reads == 1
+
+    async def test_get_user_after_upsert_hits_no_db(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        """Test the upserted user is served from memory afterwards."""
+        upserted = await holder.user_repo.upsert_user(create_test_user(2))
+
+        found = await holder.user_repo.get_user(UserId(2))
+
+        assert found is upserted
+        assert statements.reads == 0
+        assert statements.writes == 1
+        assert statements.total == 1
+
+    async def test_get_user_by_username_fills_map(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        await holder.user_repo.create_user(create_test_user(3, username="mapped"))
+        holder.users.clear()
+
+        assert len(holder.users) == 0
+
+        await holder.user_repo.get_user(Username("mapped"))
+        await holder.user_repo.get_user(UserId(3))
+
+        assert statements.reads == 1
+
+    async def test_missing_user_is_not_cached(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        assert await holder.user_repo.get_user(UserId(4)) is None
+        assert await holder.user_repo.get_user(UserId(4)) is None
+
+        assert statements.reads == 2
+
+    async def test_update_language_updates_entry(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        await holder.user_repo.create_user(create_test_user(5))
+
+        await holder.user_repo.update_language(UserId(5), LanguageCode("ru"))
+        user = await holder.user_repo.get_user(UserId(5))
+
+        assert user is not None
+        assert user.language_code == LanguageCode("ru")
+        assert statements.reads == 0
+
+    async def test_referral_writes_evict_entries(
+        self, holder: HolderDao, statements: StatementCounter
+    ):
+        await holder.user_repo.create_user(create_test_user(6))
+        await holder.user_repo.create_user(create_test_user(7))
+
+        await holder.user_repo.set_referred_by(UserId(7), UserId(6))
+        await holder.user_repo.increment_referral_count(UserId(6))
+        referrer = await holder.user_repo.get_user(UserId(6))
+        referred = await holder.user_repo.get_user(UserId(7))
+
+        assert referrer is not None
+        assert referrer.referral_count is not None
+        assert referrer.referral_count.value == 1
+        assert referred is not None
+        assert referred.referred_by == UserId(6)
+        assert statements.reads == 2
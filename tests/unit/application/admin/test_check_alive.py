@@ -0,0 +1,465 @@
+from collections.abc import AsyncIterator
+from dataclasses import replace
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+from aiogram.methods import SendChatAction
+import pytest
+
+from src.application.admin import (
+    CheckAliveInput,
+    CheckAliveInteractor,
+    CheckAliveProgress,
+    SampleCheckInput,
+    StartCheckAliveInteractor,
+)
+from src.application.admin import check_alive as check_alive_module
+from src.domain.admin import CheckRun, CheckRunStatus, Reachability, ReachabilityCheck
+
+
+def flood_wait(chat_id: int, action: str) -> TelegramRetryAfter:
+    return TelegramRetryAfter(
+        method=SendChatAction(chat_id=chat_id, action=action),
+        message="Too Many Requests: retry after 1",
+        retry_after=1,
+    )
+
+
+class InMemoryAdminRepository:
+    def __init__(
+        self,
+        user_ids: list[int],
+        count: int | None = None,
+        estimate: int | None = None,
+    ) -> None:
+        self.user_ids = user_ids
+        self.count = len(user_ids) if count is None else count
+        # What estimate_users returns instead of the count
+        self.estimate = estimate
+        self.counted = 0
+        self.sampled_populations: list[int | None] = []
+        self.streamed = 0
+        self.page_sizes: list[int] = []
+        self.saved: dict[int, Reachability] = {}
+
+    async def iter_user_ids(
+        self,
+        active_since_days: int | None = None,
+        page_size: int = 1000,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> AsyncIterator[int]:
+        self.page_sizes.append(page_size)
+        for user_id in self.user_ids:
+            if after_user_id is not None and user_id <= after_user_id:
+                continue
+            self.streamed += 1
+            yield user_id
+
+    async def count_users(
+        self,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> int:
+        self.counted += 1
+        if after_user_id is None:
+            return self.count
+        return sum(user_id > after_user_id for user_id in self.user_ids)
+
+    async def estimate_users(
+        self,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        after_user_id: int | None = None,
+    ) -> int:
+        assert self.estimate is not None
+        return self.estimate
+
+    async def sample_user_ids(
+        self,
+        size: int,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+        population: int | None = None,
+    ) -> list[int]:
+        self.sampled_populations.append(population)
+        return sorted(random.sample(self.user_ids, min(size, len(self.user_ids))))
+
+    async def save_reachability(self, checks: list[ReachabilityCheck]) -> None:
+        for check in checks:
+            self.saved[check.user_id] = check.reachability
+
+
+class InMemoryCheckRunRepository:
+    def __init__(self) -> None:
+        self.runs: dict[int, CheckRun] = {}
+        # Copies of the run as saved, in order
+        self.checkpoints: list[CheckRun] = []
+
+    async def create(
+        self,
+        created_by: int,
+        active_since_days: int | None = None,
+        unchecked_for_days: int | None = None,
+    ) -> CheckRun:
+        run = CheckRun(
+            id=len(self.runs) + 1,
+            created_by=created_by,
+            active_since_days=active_since_days,
+            unchecked_for_days=unchecked_for_days,
+        )
+        self.runs[run.id] = run
+        return replace(run)
+
+    async def get(self, run_id: int) -> CheckRun | None:
+        run = self.runs.get(run_id)
+        return replace(run) if run else None
+
+    async def get_running(self) -> list[CheckRun]:
+        return [
+            replace(run)
+            for run in self.runs.values()
+            if run.status == CheckRunStatus.RUNNING
+        ]
+
+    async def save(self, run: CheckRun) -> None:
+        self.runs[run.id] = replace(run)
+        self.checkpoints.append(replace(run))
+
+    async def abandon_running(self) -> None:
+        for run in self.runs.values():
+            if run.status == CheckRunStatus.RUNNING:
+                run.status = CheckRunStatus.ABANDONED
+
+
+def make_interactor(
+    repo: InMemoryAdminRepository,
+    runs: InMemoryCheckRunRepository,
+    **kwargs: int,
+) -> CheckAliveInteractor:
+    return CheckAliveInteractor(repo, runs, AsyncMock(), **kwargs)
+
+
+async def start_run(runs: InMemoryCheckRunRepository) -> int:
+    interactor = StartCheckAliveInteractor(runs, AsyncMock())
+    run = await interactor(CheckAliveInput(created_by=1))
+    return run.id
+
+
+class TestCheckAliveInteractor:
+    @pytest.fixture
+    def bot(self) -> MagicMock:
+        bot = MagicMock()
+        bot.send_chat_action = AsyncMock()
+        return bot
+
+    @pytest.fixture
+    def runs(self) -> InMemoryCheckRunRepository:
+        return InMemoryCheckRunRepository()
+
+    async def run_check(
+        self,
+        bot: MagicMock,
+        repo: InMemoryAdminRepository,
+        runs: InMemoryCheckRunRepository,
+        **kwargs: int,
+    ) -> list[CheckAliveProgress]:
+        interactor = make_interactor(repo, runs, **kwargs)
+        run_id = await start_run(runs)
+        return [p async for p in interactor.execute(bot, run_id)]
+
+    async def test_counts_results(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        async def send_chat_action(chat_id: int, action: str) -> bool:
+            if chat_id % 2:
+                raise TelegramForbiddenError(
+                    method=SendChatAction(chat_id=chat_id, action=action),
+                    message="Forbidden: bot was blocked by the user",
+                )
+            return True
+
+        bot.send_chat_action.side_effect = send_chat_action
+        repo = InMemoryAdminRepository(list(range(250)))
+
+        progress = await self.run_check(bot, repo, runs, page_size=50)
+
+        assert [p.processed for p in progress] == [100, 200, 250]
+        result = progress[-1].current_result
+        assert (result.total, result.alive, result.blocked) == (250, 125, 125)
+        assert repo.page_sizes == [50]
+        assert len(repo.saved) == 250
+        assert repo.saved[0] == Reachability.ALIVE
+        assert repo.saved[1] == Reachability.BLOCKED
+
+    async def test_streams_ids_lazily(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        repo = InMemoryAdminRepository(list(range(1000)))
+        interactor = make_interactor(repo, runs, page_size=150)
+
+        progress = interactor.execute(bot, await start_run(runs))
+        first = await anext(progress)
+        await progress.aclose()
+
+        assert first.processed == 100
+        assert first.total == 1000
+        assert repo.streamed < 1000
+
+    async def test_total_follows_stream_when_count_is_stale(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        repo = InMemoryAdminRepository(list(range(30)), count=25)
+
+        progress = await self.run_check(bot, repo, runs)
+
+        assert len(progress) == 1
+        assert progress[0].processed == progress[0].total == 30
+        assert progress[0].current_result.total == 30
+
+    async def test_approximate_total_is_labelled_until_done(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        repo = InMemoryAdminRepository(list(range(250)), estimate=240)
+
+        progress = await self.run_check(bot, repo, runs, approximate_counts=True)
+
+        assert [(p.total, p.total_estimated) for p in progress] == [
+            (240, True),
+            (240, True),
+            (250, False),
+        ]
+        assert repo.counted == 0
+
+    async def test_flood_waited_users_are_retried(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        attempts: dict[int, int] = {}
+
+        async def send_chat_action(chat_id: int, action: str) -> bool:
+            attempts[chat_id] = attempts.get(chat_id, 0) + 1
+            if chat_id < 10 and attempts[chat_id] == 1:
+                raise flood_wait(chat_id, action)
+            return True
+
+        bot.send_chat_action.side_effect = send_chat_action
+        repo = InMemoryAdminRepository(list(range(50)))
+
+        progress = await self.run_check(bot, repo, runs)
+
+        result = progress[-1].current_result
+        assert (result.total, result.alive, result.rate_limited) == (50, 50, 0)
+        assert sum(attempts.values()) == 60
+
+    async def test_gives_up_after_max_attempts(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        async def send_chat_action(chat_id: int, action: str) -> bool:
+            if chat_id == 0:
+                raise flood_wait(chat_id, action)
+            return True
+
+        bot.send_chat_action.side_effect = send_chat_action
+        repo = InMemoryAdminRepository(list(range(5)))
+
+        progress = await self.run_check(bot, repo, runs)
+
+        result = progress[-1].current_result
+        assert (result.alive, result.rate_limited) == (4, 1)
+        # Rate limiting says nothing about the user
+        assert 0 not in repo.saved
+        assert bot.send_chat_action.await_count == 4 + check_alive_module.MAX_ATTEMPTS
+
+    async def test_stream_error_is_raised(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        class FailingRepository(InMemoryAdminRepository):
+            async def iter_user_ids(
+                self,
+                active_since_days: int | None = None,
+                page_size: int = 1000,
+                unchecked_for_days: int | None = None,
+                after_user_id: int | None = None,
+            ) -> AsyncIterator[int]:
+                yield 1
+                raise ConnectionError("database went away")
+
+        with pytest.raises(ConnectionError):
+            await self.run_check(bot, FailingRepository([1]), runs)
+
+    async def test_no_users(self, bot: MagicMock, runs: InMemoryCheckRunRepository):
+        progress = await self.run_check(bot, InMemoryAdminRepository([]), runs)
+
+        assert [p.processed for p in progress] == [0]
+        assert runs.runs[1].status == CheckRunStatus.COMPLETED
+
+
+class TestCheckpoints:
+    @pytest.fixture
+    def bot(self) -> MagicMock:
+        bot = MagicMock()
+        bot.send_chat_action = AsyncMock()
+        return bot
+
+    @pytest.fixture
+    def runs(self) -> InMemoryCheckRunRepository:
+        return InMemoryCheckRunRepository()
+
+    async def test_checkpoints_every_interval(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        repo = InMemoryAdminRepository(list(range(1, 501)))
+        interactor = make_interactor(repo, runs, page_size=50, checkpoint_interval=100)
+
+        [p async for p in interactor.execute(bot, await start_run(runs))]
+
+        checkpoints = runs.checkpoints
+        assert len(checkpoints) >= 4
+        for checkpoint in checkpoints:
+            # Counters and checkpoint agree: every user up to it is counted
+            assert checkpoint.processed == (checkpoint.last_user_id or 0)
+        assert checkpoints[-1].status == CheckRunStatus.COMPLETED
+        assert checkpoints[-1].alive == 500
+
+    async def test_checkpoint_waits_for_slower_users(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        attempts = 0
+
+        async def send_chat_action(chat_id: int, action: str) -> bool:
+            nonlocal attempts
+            # User 1 is flood-waited twice, so later users finish first
+            if chat_id == 1 and (attempts := attempts + 1) < 3:
+                raise flood_wait(chat_id, action)
+            return True
+
+        bot.send_chat_action.side_effect = send_chat_action
+        repo = InMemoryAdminRepository(list(range(1, 301)))
+        interactor = make_interactor(repo, runs, page_size=50, checkpoint_interval=10)
+
+        [p async for p in interactor.execute(bot, await start_run(runs))]
+
+        assert len(runs.checkpoints) > 1
+        for checkpoint in runs.checkpoints:
+            assert checkpoint.processed == (checkpoint.last_user_id or 0)
+        assert runs.runs[1].alive == 300
+
+    async def test_resumes_from_checkpoint(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        repo = InMemoryAdminRepository(list(range(1, 301)))
+        run_id = await start_run(runs)
+        # Interrupted after the first 120 users, 20 of them blocked
+        await runs.save(
+            replace(runs.runs[run_id], last_user_id=120, alive=100, blocked=20)
+        )
+        interactor = make_interactor(repo, runs)
+
+        progress = [p async for p in interactor.execute(bot, run_id)]
+
+        checked = {call.kwargs["chat_id"] for call in bot.send_chat_action.mock_calls}
+        assert checked == set(range(121, 301))
+        assert [p.processed for p in progress] == [200, 300, 300]
+        assert progress[0].total == 300
+        result = progress[-1].current_result
+        assert (result.total, result.alive, result.blocked) == (300, 280, 20)
+        assert runs.runs[run_id].status == CheckRunStatus.COMPLETED
+
+    async def test_finished_run_is_not_resumed(
+        self, bot: MagicMock, runs: InMemoryCheckRunRepository
+    ):
+        repo = InMemoryAdminRepository(list(range(1, 11)))
+        interactor = make_interactor(repo, runs)
+        run_id = await start_run(runs)
+        [p async for p in interactor.execute(bot, run_id)]
+        bot.send_chat_action.reset_mock()
+
+        progress = [p async for p in interactor.execute(bot, run_id)]
+        missing = [p async for p in interactor.execute(bot, 404)]
+
+        assert progress == missing == []
+        bot.send_chat_action.assert_not_awaited()
+
+
+class TestStartCheckAlive:
+    async def test_abandons_unfinished_runs(self):
+        runs = InMemoryCheckRunRepository()
+        interactor = StartCheckAliveInteractor(runs, AsyncMock())
+
+        first = await interactor(CheckAliveInput(created_by=1))
+        second = await interactor(CheckAliveInput(created_by=2, unchecked_for_days=7))
+
+        assert runs.runs[first.id].status == CheckRunStatus.ABANDONED
+        assert second.status == CheckRunStatus.RUNNING
+        assert (second.created_by, second.unchecked_for_days) == (2, 7)
+        assert [run.id for run in await runs.get_running()] == [second.id]
+
+
+class TestSampleCheck:
+    async def test_estimates_shares_from_sample(self):
+        async def send_chat_action(chat_id: int, action: str) -> bool:
+            # A fifth of the users blocked the bot
+            if chat_id % 5 == 0:
+                raise TelegramForbiddenError(
+                    method=SendChatAction(chat_id=chat_id, action=action),
+                    message="Forbidden: bot was blocked by the user",
+                )
+            return True
+
+        bot = MagicMock()
+        bot.send_chat_action = AsyncMock(side_effect=send_chat_action)
+        repo = InMemoryAdminRepository(list(range(1, 20_001)))
+        runs = InMemoryCheckRunRepository()
+        interactor = make_interactor(repo, runs)
+
+        progress = [
+            p async for p in interactor.sample(bot, SampleCheckInput(margin=0.05))
+        ]
+
+        estimate = progress[-1].estimate
+        assert estimate is not None
+        assert estimate.population == 20_000
+        # About 385 users for +-5 points, not the whole base
+        assert 350 < estimate.sample_size < 400
+        assert bot.send_chat_action.await_count == estimate.sample_size
+        assert estimate.blocked.low < estimate.blocked.share < estimate.blocked.high
+        assert estimate.blocked.margin <= 0.05
+        assert estimate.alive.share + estimate.blocked.share == pytest.approx(1)
+        assert all(p.estimate is None for p in progress[:-1])
+        # Sampled users are remembered, but there is no run to resume
+        assert len(repo.saved) == estimate.sample_size
+        assert runs.runs == {}
+        # The population is counted once and handed to the sampling
+        assert repo.counted == 1
+        assert repo.sampled_populations == [20_000]
+        assert not estimate.population_estimated
+
+    async def test_approximate_population(self):
+        bot = MagicMock()
+        bot.send_chat_action = AsyncMock()
+        repo = InMemoryAdminRepository(list(range(1, 2001)), estimate=1900)
+        interactor = make_interactor(
+            repo, InMemoryCheckRunRepository(), approximate_counts=True
+        )
+
+        progress = [p async for p in interactor.sample(bot, SampleCheckInput())]
+
+        estimate = progress[-1].estimate
+        assert estimate.population == 1900
+        assert estimate.population_estimated
+        assert repo.sampled_populations == [1900]
+        assert repo.counted == 0
+
+    async def test_no_users(self):
+        bot = MagicMock()
+        bot.send_chat_action = AsyncMock()
+        interactor = make_interactor(
+            InMemoryAdminRepository([]), InMemoryCheckRunRepository()
+        )
+
+        progress = [p async for p in interactor.sample(bot, SampleCheckInput())]
+
+        assert progress[-1].estimate.sample_size == 0
+        bot.send_chat_action.assert_not_awaited()
@@ -0,0 +1,222 @@
+from dataclasses import replace
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.admin import (
+    DailyStatsDTO,
+    GetDailyStatsInteractor,
+    RollupDailyStatsInteractor,
+    summarize,
+)
+from src.application.admin.rollup import MAX_DAYS
+from src.domain.admin import DailyStats
+
+TODAY = date(2026, 10, 18)
+NOW = datetime(2026, 10, 18, 15, 0, tzinfo=UTC)
+
+
+class InMemoryDailyStatsRepository:
+    def __init__(self, first_signup_day: date | None = None) -> None:
+        self.first_signup_day = first_signup_day
+        # What aggregating `users` would count per day; zeros elsewhere
+        self.counts: dict[date, DailyStats] = {}
+        self.rows: dict[date, DailyStats] = {}
+        self.aggregated: list[tuple[date, date]] = []
+
+    async def get_watermark(self) -> date | None:
+        return max((day for day, row in self.rows.items() if row.final), default=None)
+
+    async def get_first_signup_day(self) -> date | None:
+        return self.first_signup_day
+
+    async def aggregate(self, since: date, until: date) -> list[DailyStats]:
+        self.aggregated.append((since, until))
+        return [
+            replace(self.counts.get(day, DailyStats(day=day)))
+            for day in (
+                since + timedelta(days=offset)
+                for offset in range((until - since).days + 1)
+            )
+        ]
+
+    async def save(self, stats: list[DailyStats]) -> None:
+        for day in stats:
+            saved = self.rows.get(day.day)
+            active_users = max(day.active_users, saved.active_users if saved else 0)
+            self.rows[day.day] = replace(day, active_users=active_users)
+
+    async def list_since(self, since: date) -> list[DailyStats]:
+        return [replace(row) for day, row in sorted(self.rows.items()) if day >= since]
+
+
+class TestRollupDailyStatsInteractor:
+    @pytest.fixture
+    def transaction_manager(self) -> AsyncMock:
+        return AsyncMock()
+
+    def make_interactor(
+        self, repository: InMemoryDailyStatsRepository, transaction_manager, now=NOW
+    ) -> RollupDailyStatsInteractor:
+        return RollupDailyStatsInteractor(
+            daily_stats_repository=repository,
+            transaction_manager=transaction_manager,
+            clock=lambda: now,
+        )
+
+    async def test_first_run_starts_at_first_signup(self, transaction_manager):
+        repository = InMemoryDailyStatsRepository(TODAY - timedelta(days=2))
+
+        stats = await self.make_interactor(repository, transaction_manager)()
+
+        assert repository.aggregated == [(TODAY - timedelta(days=2), TODAY)]
+        assert [(day.day, day.final) for day in stats] == [
+            (TODAY - timedelta(days=2), True),
+            (TODAY - timedelta(days=1), True),
+            (TODAY, False),
+        ]
+        transaction_manager.commit.assert_awaited_once()
+
+    async def test_without_users_rolls_up_today(self, transaction_manager):
+        repository = InMemoryDailyStatsRepository()
+
+        await self.make_interactor(repository, transaction_manager)()
+
+        assert repository.aggregated == [(TODAY, TODAY)]
+
+    async def test_processes_only_days_after_watermark(self, transaction_manager):
+        repository = InMemoryDailyStatsRepository(TODAY - timedelta(days=30))
+        await self.make_interactor(
+            repository, transaction_manager, now=NOW - timedelta(days=2)
+        )()
+
+        await self.make_interactor(repository, transaction_manager)()
+
+        # The day that was still running is rolled up again and finalized
+        assert repository.aggregated[-1] == (TODAY - timedelta(days=2), TODAY)
+        assert repository.rows[TODAY - timedelta(days=2)].final
+
+    async def test_today_is_rolled_up_by_every_run(self, transaction_manager):
+        repository = InMemoryDailyStatsRepository(TODAY)
+        repository.counts[TODAY] = DailyStats(day=TODAY, new_users=1)
+        await self.make_interactor(repository, transaction_manager)()
+        repository.counts[TODAY] = DailyStats(day=TODAY, new_users=3)
+
+        await self.make_interactor(repository, transaction_manager)()
+
+        assert repository.aggregated == [(TODAY, TODAY), (TODAY, TODAY)]
+        assert repository.rows[TODAY].new_users == 3
+        assert not repository.rows[TODAY].final
+
+    async def test_closing_day_keeps_active_users_seen_during_it(
+        self, transaction_manager
+    ):
+        yesterday = TODAY - timedelta(days=1)
+        repository = InMemoryDailyStatsRepository(yesterday)
+        repository.counts[yesterday] = DailyStats(day=yesterday, active_users=10)
+        await self.make_interactor(
+            repository, transaction_manager, now=NOW - timedelta(days=1)
+        )()
+        # Some of them were seen again today, so fewer were last seen yesterday
+        repository.counts[yesterday] = DailyStats(day=yesterday, active_users=7)
+
+        await self.make_interactor(repository, transaction_manager)()
+
+        assert repository.rows[yesterday].active_users == 10
+        assert repository.rows[yesterday].final
+
+    async def test_nothing_to_do_when_clock_is_behind_watermark(
+        self, transaction_manager
+    ):
+        repository = InMemoryDailyStatsRepository()
+        repository.rows[TODAY] = DailyStats(day=TODAY, final=True)
+
+        assert await self.make_interactor(repository, transaction_manager)() == []
+        assert repository.aggregated == []
+        transaction_manager.commit.assert_not_awaited()
+
+
+class TestGetDailyStatsInteractor:
+    @pytest.fixture
+    def repository(self) -> InMemoryDailyStatsRepository:
+        repository = InMemoryDailyStatsRepository()
+        for offset in range(10):
+            day = TODAY - timedelta(days=offset)
+            repository.rows[day] = DailyStats(
+                day=day,
+                new_users=offset,
+                referred_users=1 if offset else 0,
+                languages={"en": offset} if offset else {},
+                final=day < TODAY,
+            )
+        return repository
+
+    def make_interactor(self, repository) -> GetDailyStatsInteractor:
+        return GetDailyStatsInteractor(
+            daily_stats_repository=repository, clock=lambda: NOW
+        )
+
+    async def test_returns_last_days_oldest_first(self, repository):
+        stats = await self.make_interactor(repository)(3)
+
+        assert [day.day for day in stats] == [
+            TODAY - timedelta(days=2),
+            TODAY - timedelta(days=1),
+            TODAY,
+        ]
+        assert stats[0] == DailyStatsDTO(
+            day=TODAY - timedelta(days=2),
+            new_users=2,
+            referred_users=1,
+            organic_users=1,
+            active_users=0,
+            languages={"en": 2},
+            final=True,
+        )
+        assert not stats[-1].final
+
+    @pytest.mark.parametrize(("days", "expected"), [(0, 1), (MAX_DAYS + 1, 10)])
+    async def test_period_is_clamped(self, repository, days, expected):
+        assert len(await self.make_interactor(repository)(days)) == expected
+
+
+class TestSummarize:
+    def test_totals(self):
+        stats = [
+            DailyStatsDTO(
+                day=TODAY - timedelta(days=1),
+                new_users=3,
+                referred_users=1,
+                organic_users=2,
+                active_users=10,
+                languages={"en": 2, "ru": 1},
+                final=True,
+            ),
+            DailyStatsDTO(
+                day=TODAY,
+                new_users=1,
+                referred_users=0,
+                organic_users=1,
+                active_users=4,
+                languages={"ru": 1},
+                final=False,
+            ),
+        ]
+
+        summary = summarize(stats)
+
+        assert summary.days == 2
+        assert (summary.new_users, summary.referred_users) == (4, 1)
+        assert summary.organic_users == 3
+        assert (summary.referred_percent, summary.organic_percent) == (25.0, 75.0)
+        assert summary.active_average == 7
+        assert list(summary.languages.items()) == [("en", 2), ("ru", 2)]
+
+    def test_empty(self):
+        summary = summarize([])
+
+        assert summary.new_users == 0
+        assert summary.referred_percent == 0
+        assert summary.active_average == 0
+        assert summary.languages == {}
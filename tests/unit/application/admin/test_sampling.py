@@ -0,0 +1,51 @@
+import pytest
+
+from src.application.admin.sampling import estimate_share, sample_size
+
+
+class TestSampleSize:
+    def test_large_population(self):
+        # The textbook ~1067 for +-3% at 95%, a bit less after correction
+        assert 1060 <= sample_size(10_000_000, 0.03) <= 1068
+
+    def test_size_grows_with_the_square_of_precision(self):
+        wide = sample_size(10_000_000, 0.03)
+
+        assert sample_size(10_000_000, 0.01) == pytest.approx(9 * wide, rel=0.01)
+
+    def test_small_population_is_mostly_checked(self):
+        assert 90 <= sample_size(100, 0.03) <= 100
+        assert sample_size(1, 0.03) == 1
+
+    def test_no_users(self):
+        assert sample_size(0, 0.03) == 0
+
+
+class TestEstimateShare:
+    def test_margin_matches_sample_size(self):
+        population = 1_000_000
+        size = sample_size(population, 0.03)
+
+        estimate = estimate_share(size // 2, size, population)
+
+        assert estimate.low < 0.5 < estimate.high
+        assert estimate.margin == pytest.approx(0.03, abs=0.001)
+
+    def test_stays_within_bounds(self):
+        none = estimate_share(0, 1000, 1_000_000)
+        everyone = estimate_share(1000, 1000, 1_000_000)
+
+        assert none.low == pytest.approx(0.0)
+        assert 0 < none.high < 0.01
+        assert everyone.high == pytest.approx(1.0)
+        assert 0.99 < everyone.low < 1
+
+    def test_census_has_no_uncertainty(self):
+        estimate = estimate_share(30, 100, 100)
+
+        assert estimate.low == estimate.share == estimate.high == 0.3
+
+    def test_empty_sample(self):
+        estimate = estimate_share(0, 0, 1000)
+
+        assert (estimate.low, estimate.high) == (0.0, 1.0)
@@ -0,0 +1,314 @@
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramForbiddenError,
+    TelegramNetworkError,
+)
+from aiogram.methods import SendMessage
+import pytest
+
+from src.application.broadcast import (
+    CancelBroadcastInteractor,
+    CreateBroadcastDTO,
+    CreateBroadcastInteractor,
+    RunBroadcastInteractor,
+)
+from src.application.broadcast import run as run_module
+from src.domain.broadcast import (
+    Broadcast,
+    BroadcastStatus,
+    Delivery,
+    DeliveryStatus,
+    Recipient,
+)
+
+
+class InMemoryBroadcastRepository:
+    """Keeps one broadcast and a sorted list of recipients."""
+
+    def __init__(self, broadcast: Broadcast, recipients: list[Recipient]) -> None:
+        self.broadcast = broadcast
+        self.recipients = recipients
+        self.deliveries: dict[int, DeliveryStatus] = {}
+        self.saved: list[Broadcast] = []
+
+    async def get(self, broadcast_id: int) -> Broadcast | None:
+        if broadcast_id != self.broadcast.id:
+            return None
+        return replace(self.broadcast)
+
+    async def count_recipients(self) -> int:
+        return len(self.recipients)
+
+    async def get_recipients(
+        self, after_user_id: int | None, limit: int
+    ) -> list[Recipient]:
+        after = after_user_id if after_user_id is not None else -1
+        return [r for r in self.recipients if r.user_id > after][:limit]
+
+    async def save(
+        self, broadcast: Broadcast, deliveries: list[Delivery] | None = None
+    ) -> None:
+        for delivery in deliveries or []:
+            self.deliveries.setdefault(delivery.user_id, delivery.status)
+        self.broadcast = replace(broadcast)
+        self.saved.append(replace(broadcast))
+
+
+def make_hub() -> MagicMock:
+    hub = MagicMock()
+
+    def get_translator_by_locale(locale: str) -> MagicMock:
+        translator = MagicMock()
+        translator.get.side_effect = lambda key: f"{key}@{locale}"
+        return translator
+
+    hub.get_translator_by_locale.side_effect = get_translator_by_locale
+    return hub
+
+
+def recipients(count: int, language_code: str | None = "en") -> list[Recipient]:
+    return [Recipient(user_id=i, language_code=language_code) for i in range(count)]
+
+
+class TestRunBroadcastInteractor:
+    @pytest.fixture
+    def broadcast(self) -> Broadcast:
+        return Broadcast(id=1, message_key="broadcast-example", created_by=99)
+
+    @pytest.fixture
+    def hub(self) -> MagicMock:
+        return make_hub()
+
+    @pytest.fixture
+    def bot(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def transaction_manager(self) -> AsyncMock:
+        return AsyncMock()
+
+    def make_interactor(
+        self,
+        repo: InMemoryBroadcastRepository,
+        hub: MagicMock,
+        transaction_manager: AsyncMock,
+    ) -> RunBroadcastInteractor:
+        return RunBroadcastInteractor(
+            broadcast_repository=repo,  # type: ignore[arg-type]
+            transaction_manager=transaction_manager,
+            hub=hub,
+            default_locale="en",
+        )
+
+    async def run(self, interactor: RunBroadcastInteractor, bot: AsyncMock):
+        return [progress async for progress in interactor.execute(bot, 1)]
+
+    async def test_sends_to_every_recipient(
+        self,
+        broadcast: Broadcast,
+        hub: MagicMock,
+        bot: AsyncMock,
+        transaction_manager: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(run_module, "PAGE_SIZE", 3)
+        repo = InMemoryBroadcastRepository(broadcast, recipients(7))
+        interactor = self.make_interactor(repo, hub, transaction_manager)
+
+        progress = await self.run(interactor, bot)
+
+        assert bot.send_message.await_count == 7
+        assert {
+            call.kwargs["chat_id"] for call in bot.send_message.await_args_list
+        } == set(range(7))
+        final = progress[-1].broadcast
+        assert final.status == BroadcastStatus.COMPLETED
+        assert final.delivered == 7
+        assert progress[-1].total == 7
+        # One checkpoint per page, plus start and completion
+        assert [b.last_user_id for b in repo.saved] == [None, 2, 5, 6, 6]
+
+    async def test_renders_once_per_locale(
+        self,
+        broadcast: Broadcast,
+        hub: MagicMock,
+        bot: AsyncMock,
+        transaction_manager: AsyncMock,
+    ):
+        repo = InMemoryBroadcastRepository(
+            broadcast,
+            [
+                Recipient(user_id=1, language_code="en"),
+                Recipient(user_id=2, language_code="ru"),
+                Recipient(user_id=3, language_code="ru"),
+                Recipient(user_id=4, language_code=None),
+            ],
+        )
+        interactor = self.make_interactor(repo, hub, transaction_manager)
+
+        await self.run(interactor, bot)
+
+        assert hub.get_translator_by_locale.call_count == 2
+        texts = {
+            call.kwargs["chat_id"]: call.kwargs["text"]
+            for call in bot.send_message.await_args_list
+        }
+        assert texts == {
+            1: "broadcast-example@en",
+            2: "broadcast-example@ru",
+            3: "broadcast-example@ru",
+            4: "broadcast-example@en",
+        }
+
+    async def test_classifies_delivery_errors(
+        self,
+        broadcast: Broadcast,
+        hub: MagicMock,
+        bot: AsyncMock,
+        transaction_manager: AsyncMock,
+    ):
+        method = SendMessage(chat_id=1, text="x")
+        errors = {
+            1: TelegramForbiddenError(method, "bot was blocked by the user"),
+            2: TelegramBadRequest(method, "Bad Request: chat not found"),
+            3: TelegramBadRequest(method, "Bad Request: message is too long"),
+            4: TelegramNetworkError(method, "timeout"),
+        }
+
+        async def send_message(chat_id: int, text: str) -> None:
+            if chat_id in errors:
+                raise errors[chat_id]
+
+        bot.send_message.side_effect = send_message
+        repo = InMemoryBroadcastRepository(broadcast, recipients(6))
+        interactor = self.make_interactor(repo, hub, transaction_manager)
+
+        await self.run(interactor, bot)
+
+        assert repo.deliveries == {
+            0: DeliveryStatus.DELIVERED,
+            1: DeliveryStatus.BLOCKED,
+            2: DeliveryStatus.BLOCKED,
+            3: DeliveryStatus.FAILED,
+            4: DeliveryStatus.FAILED,
+            5: DeliveryStatus.DELIVERED,
+        }
+        assert repo.broadcast.delivered == 2
+        assert repo.broadcast.blocked == 2
+        assert repo.broadcast.failed == 2
+
+    async def test_resumes_after_checkpoint(
+        self,
+        broadcast: Broadcast,
+        hub: MagicMock,
+        bot: AsyncMock,
+        transaction_manager: AsyncMock,
+    ):
+        broadcast.status = BroadcastStatus.RUNNING
+        broadcast.last_user_id = 4
+        broadcast.delivered = 5
+        repo = InMemoryBroadcastRepository(broadcast, recipients(8))
+        interactor = self.make_interactor(repo, hub, transaction_manager)
+
+        await self.run(interactor, bot)
+
+        sent_to = [call.kwargs["chat_id"] for call in bot.send_message.await_args_list]
+        assert sorted(sent_to) == [5, 6, 7]
+        assert repo.broadcast.delivered == 8
+
+    @pytest.mark.parametrize(
+        "status", [BroadcastStatus.COMPLETED, BroadcastStatus.CANCELLED]
+    )
+    async def test_finished_broadcast_is_not_sent(
+        self,
+        broadcast: Broadcast,
+        hub: MagicMock,
+        bot: AsyncMock,
+        transaction_manager: AsyncMock,
+        status: BroadcastStatus,
+    ):
+        broadcast.status = status
+        repo = InMemoryBroadcastRepository(broadcast, recipients(3))
+        interactor = self.make_interactor(repo, hub, transaction_manager)
+
+        assert await self.run(interactor, bot) == []
+        bot.send_message.assert_not_awaited()
+
+    async def test_progress_is_throttled(
+        self,
+        broadcast: Broadcast,
+        hub: MagicMock,
+        bot: AsyncMock,
+        transaction_manager: AsyncMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr(run_module, "PAGE_SIZE", 1)
+        now = 0.0
+
+        def clock() -> float:
+            return now
+
+        async def send_message(chat_id: int, text: str) -> None:
+            nonlocal now
+            now += 2
+
+        bot.send_message.side_effect = send_message
+        repo = InMemoryBroadcastRepository(broadcast, recipients(6))
+        interactor = RunBroadcastInteractor(
+            broadcast_repository=repo,  # type: ignore[arg-type]
+            transaction_manager=transaction_manager,
+            hub=hub,
+            default_locale="en",
+            clock=clock,
+        )
+
+        progress = await self.run(interactor, bot)
+
+        # Every third page passes the 5 second interval, plus the final one
+        assert [p.broadcast.processed for p in progress] == [3, 6, 6]
+
+
+class TestCreateBroadcastInteractor:
+    async def test_creates_and_commits(self):
+        repo = AsyncMock()
+        repo.create.return_value = Broadcast(
+            id=1, message_key="broadcast-example", created_by=99
+        )
+        transaction_manager = AsyncMock()
+        interactor = CreateBroadcastInteractor(repo, transaction_manager)
+
+        broadcast = await interactor(
+            CreateBroadcastDTO(message_key="broadcast-example", created_by=99)
+        )
+
+        assert broadcast.id == 1
+        repo.create.assert_awaited_once_with(
+            message_key="broadcast-example", created_by=99
+        )
+        transaction_manager.commit.assert_awaited_once()
+
+
+class TestCancelBroadcastInteractor:
+    async def test_cancels_draft(self):
+        repo = AsyncMock()
+        repo.get.return_value = Broadcast(id=1, message_key="k", created_by=99)
+        interactor = CancelBroadcastInteractor(repo, AsyncMock())
+
+        broadcast = await interactor(1)
+
+        assert broadcast is not None
+        assert broadcast.status == BroadcastStatus.CANCELLED
+        repo.save.assert_awaited_once_with(broadcast)
+
+    async def test_started_broadcast_is_not_cancelled(self):
+        repo = AsyncMock()
+        repo.get.return_value = Broadcast(
+            id=1, message_key="k", created_by=99, status=BroadcastStatus.RUNNING
+        )
+        interactor = CancelBroadcastInteractor(repo, AsyncMock())
+
+        assert await interactor(1) is None
+        repo.save.assert_not_awaited()
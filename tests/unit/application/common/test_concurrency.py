@@ -0,0 +1,78 @@
+import asyncio
+
+import pytest
+
+from src.application.common.concurrency import AdaptiveConcurrency
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAdaptiveConcurrency:
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    async def test_fast_calls_raise_limit(self, clock: FakeClock):
+        concurrency = AdaptiveConcurrency(initial=2, target_latency=1.0, clock=clock)
+
+        # +1/2, +1/2.5, +1/2.9: about one slot per round of calls
+        for _ in range(3):
+            started = await concurrency.acquire()
+            await concurrency.release(started)
+
+        assert concurrency.limit == 3
+
+    async def test_limit_stays_within_maximum(self, clock: FakeClock):
+        concurrency = AdaptiveConcurrency(initial=2, maximum=2, clock=clock)
+
+        for _ in range(10):
+            await concurrency.release(await concurrency.acquire())
+
+        assert concurrency.limit == 2
+
+    async def test_slow_call_halves_limit(self, clock: FakeClock):
+        concurrency = AdaptiveConcurrency(initial=8, target_latency=1.0, clock=clock)
+
+        started = await concurrency.acquire()
+        clock.now = 5.0
+        await concurrency.release(started)
+
+        assert concurrency.limit == 4
+
+    async def test_burst_of_flood_waits_halves_once(self, clock: FakeClock):
+        concurrency = AdaptiveConcurrency(initial=8, minimum=2, clock=clock)
+
+        calls = [await concurrency.acquire() for _ in range(4)]
+        clock.now = 0.5
+        for started in calls:
+            await concurrency.release(started, overloaded=True)
+
+        assert concurrency.limit == 4
+
+        # A call started after the decrease may decrease again, down to minimum
+        for _ in range(3):
+            await concurrency.release(await concurrency.acquire(), overloaded=True)
+            clock.now += 0.1
+        assert concurrency.limit == 2
+
+    async def test_acquire_waits_for_free_slot(self, clock: FakeClock):
+        concurrency = AdaptiveConcurrency(initial=1, maximum=1, clock=clock)
+        started = await concurrency.acquire()
+
+        waiter = asyncio.create_task(concurrency.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await concurrency.release(started)
+        await asyncio.wait_for(waiter, timeout=1)
+        assert concurrency.in_flight == 1
+
+    def test_rejects_inconsistent_bounds(self):
+        with pytest.raises(ValueError):
+            AdaptiveConcurrency(initial=5, maximum=4)
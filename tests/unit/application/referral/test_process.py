@@ -6,8 +6,8 @@ from src.application.referral.process import (
     ProcessReferralInputDTO,
     ProcessReferralInteractor,
 )
-from src.domain.user.entity import User
 from src.domain.user.services.referral import encode_referral
+from src.domain.user.vo import UserId
 
 
 @pytest.fixture
@@ -41,27 +41,27 @@ def interactor(
 
 
 class TestProcessReferralInteractor:
-    async def test_valid_referral_sets_referred_by(
+    async def test_valid_referral_is_applied(
         self,
         interactor: ProcessReferralInteractor,
         user_repository: Mock,
+        transaction_manager: Mock,
         secret_key: str,
     ) -> None:
         referrer_id = 100
         new_user_id = 200
         code = encode_referral(referrer_id, secret_key)
-
-        referrer = Mock(spec=User)
-        user_repository.get_user = AsyncMock(return_value=referrer)
-        user_repository.set_referred_by = AsyncMock()
-        user_repository.increment_referral_count = AsyncMock()
+        user_repository.apply_referral = AsyncMock(return_value=True)
 
         result = await interactor(
             ProcessReferralInputDTO(new_user_id=new_user_id, referral_code=code)
         )
 
         assert result is True
-        user_repository.set_referred_by.assert_called_once()
+        user_repository.apply_referral.assert_awaited_once_with(
+            UserId(new_user_id), UserId(referrer_id)
+        )
+        transaction_manager.commit.assert_awaited_once()
 
     async def test_invalid_code_returns_false(
         self,
@@ -87,17 +87,20 @@ class TestProcessReferralInteractor:
 
         assert result is False
 
-    async def test_nonexistent_referrer_returns_false(
+    async def test_referral_not_applied_returns_false(
         self,
         interactor: ProcessReferralInteractor,
         user_repository: Mock,
+        transaction_manager: Mock,
         secret_key: str,
     ) -> None:
+        # Missing referrer, or the user was referred already
         code = encode_referral(100, secret_key)
-        user_repository.get_user = AsyncMock(return_value=None)
+        user_repository.apply_referral = AsyncMock(return_value=False)
 
         result = await interactor(
             ProcessReferralInputDTO(new_user_id=200, referral_code=code)
         )
 
         assert result is False
+        transaction_manager.commit.assert_not_awaited()
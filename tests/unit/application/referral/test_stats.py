@@ -5,6 +5,7 @@ import pytest
 from src.application.referral.stats import (
     GetStatsInteractor,
     GetTopReferrersInteractor,
+    RecountStatsInteractor,
     StatsOutputDTO,
     TopReferrerDTO,
 )
@@ -56,6 +57,44 @@ class TestGetStatsInteractor:
         assert result.referred_percent == 0
         assert result.organic_percent == 0
 
+    async def test_approximate_mode_estimates(self, user_repository: Mock) -> None:
+        user_repository.estimate_referral_stats = AsyncMock(
+            return_value=ReferralStats(
+                total_users=1_000_000,
+                referred_count=250_000,
+                organic_count=750_000,
+                estimated=True,
+            )
+        )
+        interactor = GetStatsInteractor(
+            user_repository=user_repository, approximate=True
+        )
+
+        result = await interactor()
+
+        assert result.estimated
+        assert result.referred_percent == 25.0
+        user_repository.estimate_referral_stats.assert_awaited_once()
+
+
+class TestRecountStatsInteractor:
+    async def test_recounts_and_commits(self) -> None:
+        user_repository = Mock()
+        user_repository.recount_referral_stats = AsyncMock(
+            return_value=ReferralStats(
+                total_users=10,
+                referred_count=3,
+                organic_count=7,
+            )
+        )
+        transaction_manager = AsyncMock()
+        interactor = RecountStatsInteractor(user_repository, transaction_manager)
+
+        result = await interactor()
+
+        assert (result.total_users, result.referred_percent) == (10, 30.0)
+        transaction_manager.commit.assert_awaited_once()
+
 
 class TestGetTopReferrersInteractor:
     @pytest.fixture
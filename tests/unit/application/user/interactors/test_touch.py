@@ -0,0 +1,26 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.application.user.interactors.touch import TouchUserDTO, TouchUserInteractor
+from src.domain.user.vo import UserId
+
+
+class TestTouchUserInteractor:
+    @pytest.fixture
+    def mock_user_service(self) -> Mock:
+        return Mock()
+
+    @pytest.fixture
+    def interactor(self, mock_user_service: Mock) -> TouchUserInteractor:
+        return TouchUserInteractor(user_service=mock_user_service)
+
+    async def test_touch_delegates_to_service(
+        self,
+        interactor: TouchUserInteractor,
+        mock_user_service: Mock,
+    ) -> None:
+        result = await interactor(TouchUserDTO(user_id=UserId(123456)))
+
+        assert result is None
+        mock_user_service.touch.assert_called_once_with(UserId(123456))
@@ -1,4 +1,4 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -18,13 +18,21 @@ class TestUpdateLanguageInteractor:
     def mock_transaction_manager(self) -> AsyncMock:
         return AsyncMock()
 
+    @pytest.fixture
+    def mock_locale_cache(self) -> AsyncMock:
+        return AsyncMock()
+
     @pytest.fixture
     def interactor(
-        self, mock_user_repository: AsyncMock, mock_transaction_manager: AsyncMock
+        self,
+        mock_user_repository: AsyncMock,
+        mock_transaction_manager: AsyncMock,
+        mock_locale_cache: AsyncMock,
     ) -> UpdateLanguageInteractor:
         return UpdateLanguageInteractor(
             user_repository=mock_user_repository,
             transaction_manager=mock_transaction_manager,
+            locale_cache=mock_locale_cache,
         )
 
     async def test_update_language_calls_repository(
@@ -70,3 +78,23 @@ class TestUpdateLanguageInteractor:
         )
 
         assert result is None
+
+    async def test_update_language_writes_through_cache_after_commit(
+        self,
+        interactor: UpdateLanguageInteractor,
+        mock_user_repository: AsyncMock,
+        mock_transaction_manager: AsyncMock,
+        mock_locale_cache: AsyncMock,
+    ) -> None:
+        user_id = UserId(123456)
+        language_code = LanguageCode("ru")
+        calls = Mock()
+        calls.attach_mock(mock_transaction_manager.commit, "commit")
+        calls.attach_mock(mock_locale_cache.set, "set")
+
+        await interactor(
+            UpdateLanguageDTO(user_id=user_id, language_code=language_code)
+        )
+
+        assert [call[0] for call in calls.mock_calls] == ["commit", "set"]
+        mock_locale_cache.set.assert_awaited_once_with(user_id, language_code)
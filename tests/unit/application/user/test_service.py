@@ -1,11 +1,11 @@
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from src.application.user.service import UpsertUserData, UserService
 from src.domain.user import User
-from src.domain.user.vo import Bio, FirstName, UserId, Username
+from src.domain.user.vo import Bio, FirstName, LastName, UserId, Username
 
 
 class TestUserService:
@@ -14,8 +14,12 @@ class TestUserService:
         return AsyncMock()
 
     @pytest.fixture
-    def user_service(self, mock_user_repo):
-        return UserService(mock_user_repo)
+    def mock_activity_recorder(self):
+        return Mock()
+
+    @pytest.fixture
+    def user_service(self, mock_user_repo, mock_activity_recorder):
+        return UserService(mock_user_repo, mock_activity_recorder)
 
     @pytest.fixture
     def base_user(self):
@@ -33,9 +37,8 @@ class TestUserService:
         )
 
     async def test_upsert_new_user(self, user_service, mock_user_repo, base_user):
-        """Test creating a new user when user doesn't exist."""
-        mock_user_repo.get_user.return_value = None
-        mock_user_repo.create_user.return_value = base_user
+        """Test upserting a user that doesn't exist yet."""
+        mock_user_repo.upsert_user.return_value = base_user
 
         data = UpsertUserData(
             id=123,
@@ -47,35 +50,47 @@ class TestUserService:
         result = await user_service.upsert_user(data)
 
         assert result.id.value == 123
-        mock_user_repo.create_user.assert_called_once()
+        assert result.is_new
+        mock_user_repo.upsert_user.assert_awaited_once()
+        mock_user_repo.get_user.assert_not_called()
+        mock_user_repo.create_user.assert_not_called()
         mock_user_repo.update_user.assert_not_called()
 
-    async def test_upsert_existing_user(self, user_service, mock_user_repo, base_user):
-        """Test updating existing user and preserving bio/created_at."""
-        existing_user = User(
-            id=UserId(123),
-            first_name=FirstName("Old"),
-            last_name=None,
-            username=Username("old_name"),
-            bio=Bio("Existing bio"),
-            created_at=datetime(2024, 1, 1, tzinfo=UTC),
-            updated_at=datetime(2024, 1, 1, tzinfo=UTC),
-            last_login_at=datetime(2024, 1, 1, tzinfo=UTC),
+    async def test_upsert_passes_fresh_timestamps(self, user_service, mock_user_repo):
+        """Test the entity handed to the repository is stamped with one instant."""
+        mock_user_repo.upsert_user.side_effect = lambda user: user
+
+        data = UpsertUserData(
+            id=123,
+            username="john_doe",
+            first_name="John",
+            last_name="Doe",
         )
-        mock_user_repo.get_user.return_value = existing_user
 
+        await user_service.upsert_user(data)
+
+        (user,) = mock_user_repo.upsert_user.await_args.args
+        assert user.id == UserId(123)
+        assert user.username == Username("john_doe")
+        assert user.first_name == FirstName("John")
+        assert user.last_name == LastName("Doe")
+        assert user.bio is None
+        assert user.created_at == user.updated_at == user.last_login_at
+
+    async def test_upsert_existing_user(self, user_service, mock_user_repo):
+        """Test the repository result for an existing user is returned as is."""
         now = datetime.now(UTC)
         updated_user = User(
             id=UserId(123),
             first_name=FirstName("New"),
             last_name=None,
             username=Username("new_name"),
-            bio=existing_user.bio,  # preserved
-            created_at=existing_user.created_at,  # preserved
+            bio=Bio("Existing bio"),  # preserved by the repository
+            created_at=datetime(2024, 1, 1, tzinfo=UTC),  # preserved
             updated_at=now,
             last_login_at=now,
         )
-        mock_user_repo.update_user.return_value = updated_user
+        mock_user_repo.upsert_user.return_value = updated_user
 
         data = UpsertUserData(
             id=123,
@@ -86,16 +101,13 @@ class TestUserService:
 
         result = await user_service.upsert_user(data)
 
-        assert result.first_name.value == "New"
-        mock_user_repo.update_user.assert_called_once()
-        mock_user_repo.create_user.assert_not_called()
+        assert result is updated_user
+        assert not result.is_new
+        mock_user_repo.upsert_user.assert_awaited_once()
 
-    async def test_upsert_user_with_no_last_name(
-        self, user_service, mock_user_repo, base_user
-    ):
+    async def test_upsert_user_with_no_last_name(self, user_service, mock_user_repo):
         """Test upsert when last_name is None."""
-        mock_user_repo.get_user.return_value = None
-        mock_user_repo.create_user.return_value = base_user
+        mock_user_repo.upsert_user.side_effect = lambda user: user
 
         data = UpsertUserData(
             id=123,
@@ -109,12 +121,9 @@ class TestUserService:
         assert result.last_name is None
         assert result.username is None
 
-    async def test_upsert_user_with_no_username(
-        self, user_service, mock_user_repo, base_user
-    ):
+    async def test_upsert_user_with_no_username(self, user_service, mock_user_repo):
         """Test upsert when username is None."""
-        mock_user_repo.get_user.return_value = None
-        mock_user_repo.create_user.return_value = base_user
+        mock_user_repo.upsert_user.side_effect = lambda user: user
 
         data = UpsertUserData(
             id=123,
@@ -126,3 +135,19 @@ class TestUserService:
         result = await user_service.upsert_user(data)
 
         assert result.username is None
+        assert result.last_name == LastName("Doe")
+
+    def test_touch_records_activity(
+        self, user_service, mock_user_repo, mock_activity_recorder
+    ):
+        """Test touch only records activity and never writes the row itself."""
+        before = datetime.now(UTC)
+
+        user_service.touch(UserId(123))
+
+        mock_activity_recorder.record.assert_called_once()
+        user_id, seen_at = mock_activity_recorder.record.call_args.args
+        assert user_id == UserId(123)
+        assert seen_at >= before
+        mock_user_repo.upsert_user.assert_not_called()
+        mock_user_repo.update_user.assert_not_called()
@@ -0,0 +1,47 @@
+from src.domain.broadcast import (
+    Broadcast,
+    BroadcastStatus,
+    Delivery,
+    DeliveryStatus,
+)
+
+
+class TestBroadcast:
+    def test_record_counts_deliveries_and_moves_checkpoint(self):
+        broadcast = Broadcast(id=1, message_key="broadcast-example", created_by=1)
+
+        broadcast.record(
+            [
+                Delivery(user_id=10, status=DeliveryStatus.DELIVERED),
+                Delivery(user_id=11, status=DeliveryStatus.BLOCKED),
+                Delivery(user_id=12, status=DeliveryStatus.DELIVERED),
+                Delivery(user_id=13, status=DeliveryStatus.FAILED),
+            ],
+            last_user_id=13,
+        )
+
+        assert broadcast.delivered == 2
+        assert broadcast.blocked == 1
+        assert broadcast.failed == 1
+        assert broadcast.processed == 4
+        assert broadcast.last_user_id == 13
+
+    def test_record_accumulates_pages(self):
+        broadcast = Broadcast(id=1, message_key="broadcast-example", created_by=1)
+
+        broadcast.record([Delivery(10, DeliveryStatus.DELIVERED)], last_user_id=10)
+        broadcast.record([Delivery(20, DeliveryStatus.DELIVERED)], last_user_id=20)
+
+        assert broadcast.delivered == 2
+        assert broadcast.last_user_id == 20
+
+    def test_is_finished(self):
+        broadcast = Broadcast(id=1, message_key="broadcast-example", created_by=1)
+        assert not broadcast.is_finished
+
+        broadcast.status = BroadcastStatus.RUNNING
+        assert not broadcast.is_finished
+
+        for status in (BroadcastStatus.COMPLETED, BroadcastStatus.CANCELLED):
+            broadcast.status = status
+            assert broadcast.is_finished
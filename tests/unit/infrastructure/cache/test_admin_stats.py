@@ -0,0 +1,85 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from dishka import Provider, Scope, make_async_container, provide
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.application.referral.stats import (
+    GetStatsInteractor,
+    GetTopReferrersInteractor,
+    StatsOutputDTO,
+    TopReferrerDTO,
+)
+from src.infrastructure.cache import AdminStatsCache
+from src.infrastructure.config import Config, StatsCacheConfig
+from src.infrastructure.di import CacheProvider
+
+STATS = StatsOutputDTO(
+    total_users=4,
+    referred_count=1,
+    referred_percent=25.0,
+    organic_count=3,
+    organic_percent=75.0,
+)
+TOP = [TopReferrerDTO(user_id=1, username="alice", first_name="Alice", count=1)]
+
+
+class FakeInteractorProvider(Provider):
+    """The interactors and what else `CacheProvider` needs from other providers."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_stats = AsyncMock(spec=GetStatsInteractor, return_value=STATS)
+        self.get_top_referrers = AsyncMock(
+            spec=GetTopReferrersInteractor, return_value=TOP
+        )
+
+    @provide(scope=Scope.APP)
+    def config(self) -> Config:
+        config = MagicMock(spec=Config)
+        config.stats_cache = StatsCacheConfig()
+        return config
+
+    @provide(scope=Scope.APP)
+    def engine(self) -> AsyncEngine:
+        return MagicMock(spec=AsyncEngine)
+
+    @provide(scope=Scope.REQUEST)
+    def stats_interactor(self) -> GetStatsInteractor:
+        return self.get_stats
+
+    @provide(scope=Scope.REQUEST)
+    def top_referrers_interactor(self) -> GetTopReferrersInteractor:
+        return self.get_top_referrers
+
+
+class TestAdminStatsCache:
+    @pytest.fixture
+    def interactors(self):
+        return FakeInteractorProvider()
+
+    @pytest.fixture
+    async def container(self, interactors):
+        container = make_async_container(CacheProvider(), interactors)
+        yield container
+        await container.close()
+
+    async def test_caches_stats_across_requests(self, container, interactors):
+        for _ in range(2):
+            async with container() as request_container:
+                stats_cache = await request_container.get(AdminStatsCache)
+                stats = await stats_cache.get_stats()
+
+        assert stats.value == STATS
+        assert interactors.get_stats.await_count == 1
+
+    async def test_caches_top_referrers_by_limit(self, container, interactors):
+        stats_cache = await container.get(AdminStatsCache)
+
+        await stats_cache.get_top_referrers(10)
+        top = await stats_cache.get_top_referrers(10)
+        await stats_cache.get_top_referrers(5)
+
+        assert top.value == TOP
+        assert interactors.get_top_referrers.await_count == 2
+        assert interactors.get_top_referrers.await_args.args == (5,)
@@ -0,0 +1,69 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.cache import InMemoryLocaleCache, NullLocaleNotifier, TTLCache
+
+
+class TestInMemoryLocaleCache:
+    @pytest.fixture
+    def notifier(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def cache(self, notifier: AsyncMock) -> InMemoryLocaleCache:
+        return InMemoryLocaleCache(TTLCache(max_size=10, ttl_seconds=60), notifier)
+
+    def test_get_unknown_user(self, cache: InMemoryLocaleCache) -> None:
+        assert cache.get(UserId(1)) is None
+        assert cache.stats.misses == 1
+
+    async def test_set_stores_and_publishes(
+        self, cache: InMemoryLocaleCache, notifier: AsyncMock
+    ) -> None:
+        await cache.set(UserId(1), LanguageCode("ru"))
+
+        assert cache.get(UserId(1)) == LanguageCode("ru")
+        notifier.publish.assert_awaited_once_with(1, "ru")
+
+    def test_put_stays_local(
+        self, cache: InMemoryLocaleCache, notifier: AsyncMock
+    ) -> None:
+        cache.put(1, "en")
+
+        assert cache.get(UserId(1)) == LanguageCode("en")
+        notifier.publish.assert_not_called()
+
+    def test_invalidate(self, cache: InMemoryLocaleCache) -> None:
+        cache.put(1, "en")
+        cache.invalidate(1)
+
+        assert cache.get(UserId(1)) is None
+
+    def test_clear(self, cache: InMemoryLocaleCache) -> None:
+        cache.put(1, "en")
+        cache.put(2, "ru")
+        cache.clear()
+
+        assert cache.stats.size == 0
+
+    def test_stats(self, cache: InMemoryLocaleCache) -> None:
+        cache.put(1, "en")
+        cache.get(UserId(1))
+        cache.get(UserId(2))
+
+        assert cache.stats.size == 1
+        assert cache.stats.hit_rate == 0.5
+
+
+class TestNullLocaleNotifier:
+    async def test_is_a_no_op(self) -> None:
+        notifier = NullLocaleNotifier()
+        callback = AsyncMock()
+
+        await notifier.subscribe(callback)
+        await notifier.publish(1, "en")
+        await notifier.close()
+
+        callback.assert_not_called()
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock
+
+from dishka import Provider, Scope, make_async_container, provide
+import pytest
+
+from src.infrastructure.cache import MessageRenderCache, TTLCache
+from src.infrastructure.config import Config, RenderCacheConfig, WebhookConfig
+from src.infrastructure.di import CacheProvider
+
+
+class TestMessageRenderCache:
+    @pytest.fixture
+    def cache(self):
+        return MessageRenderCache(TTLCache(max_size=2, ttl_seconds=60))
+
+    def test_miss_for_unknown_message(self, cache):
+        assert not cache.is_rendered(1, 10, 42)
+        assert cache.stats.misses == 1
+
+    def test_hit_for_same_content(self, cache):
+        cache.put(1, 10, 42)
+
+        assert cache.is_rendered(1, 10, 42)
+        assert cache.stats.hits == 1
+
+    def test_miss_for_changed_content(self, cache):
+        cache.put(1, 10, 42)
+
+        assert not cache.is_rendered(1, 10, 43)
+
+    def test_messages_are_keyed_by_chat(self, cache):
+        cache.put(1, 10, 42)
+
+        assert not cache.is_rendered(2, 10, 42)
+
+    def test_invalidate(self, cache):
+        cache.put(1, 10, 42)
+        cache.invalidate(1, 10)
+
+        assert not cache.is_rendered(1, 10, 42)
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.put(1, 10, 42)
+        cache.put(1, 11, 42)
+        cache.is_rendered(1, 10, 42)
+        cache.put(1, 12, 42)
+
+        assert cache.is_rendered(1, 10, 42)
+        assert not cache.is_rendered(1, 11, 42)
+        assert cache.stats.size == 2
+
+    def test_disabled_cache_never_skips_an_edit(self):
+        cache = MessageRenderCache(TTLCache(max_size=2, ttl_seconds=60), enabled=False)
+        cache.put(1, 10, 42)
+
+        assert not cache.is_rendered(1, 10, 42)
+        assert cache.stats.size == 0
+
+
+class TestRenderCacheProvider:
+    class ConfigProvider(Provider):
+        def __init__(self, webhook_workers: int | None) -> None:
+            super().__init__()
+            self.webhook_workers = webhook_workers
+
+        @provide(scope=Scope.APP)
+        def config(self) -> Config:
+            config = MagicMock(spec=Config)
+            config.render_cache = RenderCacheConfig()
+            config.webhook = (
+                None
+                if self.webhook_workers is None
+                else WebhookConfig(
+                    url="https://bot.example.com/webhook",
+                    secret_token="secret",
+                    workers=self.webhook_workers,
+                )
+            )
+            return config
+
+    @pytest.mark.parametrize(
+        ("webhook_workers", "enabled"), [(None, True), (1, True), (4, False)]
+    )
+    async def test_off_with_several_webhook_workers(
+        self, webhook_workers: int | None, enabled: bool
+    ):
+        # Only the render cache is resolved; the other caches need a database
+        container = make_async_container(
+            CacheProvider(), self.ConfigProvider(webhook_workers), skip_validation=True
+        )
+        try:
+            render_cache = await container.get(MessageRenderCache)
+            render_cache.put(1, 10, 42)
+
+            assert render_cache.is_rendered(1, 10, 42) is enabled
+        finally:
+            await container.close()
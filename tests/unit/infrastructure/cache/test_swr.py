@@ -0,0 +1,168 @@
+import asyncio
+import logging
+
+import pytest
+
+from src.infrastructure.cache import StaleWhileRevalidateCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def settle() -> None:
+    """Let started refreshes run to the end."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class Loader:
+    """Returns "<key>-<call number>"; holds calls while `gate` is clear."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+        self.error: Exception | None = None
+
+    async def __call__(self, key: str) -> str:
+        self.calls += 1
+        call = self.calls
+        await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return f"{key}-{call}"
+
+
+class TestStaleWhileRevalidateCache:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def load(self):
+        return Loader()
+
+    @pytest.fixture
+    async def cache(self, load, clock):
+        cache = StaleWhileRevalidateCache[str, str](
+            load, ttl_seconds=10, max_stale_seconds=100, clock=clock
+        )
+        yield cache
+        await cache.close()
+
+    async def test_loads_missing_key(self, cache, load):
+        result = await cache.get("a")
+
+        assert result.value == "a-1"
+        assert result.computed_at.tzinfo is not None
+        assert cache.stats.misses == 1
+
+    async def test_fresh_result_is_not_reloaded(self, cache, load, clock):
+        first = await cache.get("a")
+        clock.now = 9
+
+        assert await cache.get("a") is first
+        assert load.calls == 1
+        assert not cache.is_refreshing("a")
+        assert cache.stats.hits == 1
+
+    async def test_concurrent_callers_share_one_load(self, cache, load):
+        load.gate.clear()
+        waiters = [asyncio.create_task(cache.get("a")) for _ in range(5)]
+        await asyncio.sleep(0)
+        load.gate.set()
+
+        results = await asyncio.gather(*waiters)
+
+        assert {result.value for result in results} == {"a-1"}
+        assert load.calls == 1
+
+    async def test_keys_are_loaded_separately(self, cache, load):
+        assert (await cache.get("a")).value == "a-1"
+        assert (await cache.get("b")).value == "b-2"
+        assert len(cache) == 2
+
+    async def test_stale_result_is_served_while_refreshing(self, cache, load, clock):
+        await cache.get("a")
+        load.gate.clear()
+        clock.now = 50
+
+        # Returns at once although the refresh is still waiting
+        stale = await cache.get("a")
+        again = await cache.get("a")
+        await settle()
+
+        assert stale.value == again.value == "a-1"
+        assert cache.is_refreshing("a")
+        assert load.calls == 2
+
+        load.gate.set()
+        await settle()
+        assert not cache.is_refreshing("a")
+        assert (await cache.get("a")).value == "a-2"
+
+    async def test_too_stale_result_is_waited_for(self, cache, load, clock):
+        await cache.get("a")
+        clock.now = 110
+
+        assert (await cache.get("a")).value == "a-2"
+
+    async def test_failed_refresh_keeps_stale_result(self, cache, load, clock, caplog):
+        await cache.get("a")
+        load.error = RuntimeError("database is down")
+        clock.now = 50
+
+        with caplog.at_level(logging.WARNING):
+            assert (await cache.get("a")).value == "a-1"
+            await settle()
+
+        assert "Failed to refresh 'a'" in caplog.text
+        assert not cache.is_refreshing("a")
+
+        # The next caller tries again
+        load.error = None
+        await cache.get("a")
+        await settle()
+        assert (await cache.get("a")).value == "a-3"
+
+    async def test_failed_load_reaches_all_waiters(self, cache, load):
+        load.gate.clear()
+        load.error = RuntimeError("database is down")
+        waiters = [asyncio.create_task(cache.get("a")) for _ in range(2)]
+        await asyncio.sleep(0)
+        load.gate.set()
+
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert load.calls == 1
+        assert len(cache) == 0
+
+    async def test_cancelled_caller_does_not_cancel_load(self, cache, load):
+        load.gate.clear()
+        impatient = asyncio.create_task(cache.get("a"))
+        await asyncio.sleep(0)
+        impatient.cancel()
+        waiting = asyncio.create_task(cache.get("a"))
+        await asyncio.sleep(0)
+        load.gate.set()
+
+        assert (await waiting).value == "a-1"
+        assert impatient.cancelled()
+        assert load.calls == 1
+
+    async def test_close_cancels_refreshes(self, cache, load, clock):
+        await cache.get("a")
+        load.gate.clear()
+        clock.now = 50
+        await cache.get("a")
+
+        await cache.close()
+
+        assert not cache.is_refreshing("a")
+        assert (await cache.get("a")).value == "a-1"
@@ -0,0 +1,87 @@
+import pytest
+
+from src.infrastructure.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def cache(self, clock):
+        return TTLCache[str, int](max_size=2, ttl_seconds=10, clock=clock)
+
+    def test_get_missing_key(self, cache):
+        assert cache.get("a") is None
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 0
+
+    def test_set_and_get(self, cache):
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.stats.hits == 1
+        assert len(cache) == 1
+
+    def test_entry_expires_after_ttl(self, cache, clock):
+        cache.set("a", 1)
+        clock.now = 10
+
+        assert cache.get("a") is None
+        assert len(cache) == 0
+        assert cache.stats.misses == 1
+
+    def test_set_refreshes_ttl(self, cache, clock):
+        cache.set("a", 1)
+        clock.now = 9
+        cache.set("a", 2)
+        clock.now = 15
+
+        assert cache.get("a") == 2
+
+    def test_evicts_least_recently_used(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert len(cache) == 2
+
+    def test_pop(self, cache):
+        cache.set("a", 1)
+
+        assert cache.pop("a") == 1
+        assert cache.pop("a") is None
+        assert len(cache) == 0
+
+    def test_clear(self, cache):
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_hit_rate(self, cache):
+        assert cache.stats.hit_rate == 0.0
+
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.stats.hit_rate == 0.5
+
+    def test_invalid_max_size(self):
+        with pytest.raises(ValueError, match="max_size"):
+            TTLCache(max_size=0, ttl_seconds=1)
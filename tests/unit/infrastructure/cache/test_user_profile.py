@@ -0,0 +1,73 @@
+import pytest
+
+from src.application.user.dtos import CreateUserOutputDTO
+from src.infrastructure.cache import ProfileFingerprint, TTLCache, UserProfileCache
+
+
+class TestUserProfileCache:
+    @pytest.fixture
+    def cache(self):
+        return UserProfileCache(TTLCache(max_size=10, ttl_seconds=60))
+
+    @pytest.fixture
+    def user(self):
+        return CreateUserOutputDTO(
+            id=123,
+            username="john_doe",
+            first_name="John",
+            last_name=None,
+            language_code="en",
+            is_new=True,
+        )
+
+    @pytest.fixture
+    def fingerprint(self):
+        return ProfileFingerprint(
+            username="john_doe", first_name="John", last_name=None
+        )
+
+    def test_miss_for_unknown_user(self, cache, fingerprint):
+        assert cache.get(123, fingerprint) is None
+        assert cache.stats.misses == 1
+
+    def test_hit_for_unchanged_profile(self, cache, user, fingerprint):
+        cache.put(user)
+
+        cached = cache.get(123, fingerprint)
+
+        assert cached is not None
+        assert cached.language_code == "en"
+        assert cache.stats.hits == 1
+        assert cache.stats.size == 1
+
+    def test_cached_user_is_not_new(self, cache, user, fingerprint):
+        cache.put(user)
+
+        cached = cache.get(123, fingerprint)
+
+        assert cached is not None
+        assert cached.is_new is False
+        assert user.is_new is True
+
+    def test_miss_for_changed_profile(self, cache, user):
+        cache.put(user)
+
+        changed = ProfileFingerprint(
+            username="renamed", first_name="John", last_name=None
+        )
+
+        assert cache.get(123, changed) is None
+        assert cache.stats.misses == 1
+
+    def test_invalidate(self, cache, user, fingerprint):
+        cache.put(user)
+        cache.invalidate(123)
+
+        assert cache.get(123, fingerprint) is None
+        assert cache.stats.size == 0
+
+    def test_clear(self, cache, user, fingerprint):
+        cache.put(user)
+        cache.clear()
+
+        assert cache.get(123, fingerprint) is None
@@ -0,0 +1,73 @@
+from aiogram.client.telegram import PRODUCTION
+
+from src.infrastructure.config import BotSessionConfig, RateLimitConfig, TelegramConfig
+from src.infrastructure.telegram import create_api_server, create_session
+
+
+def telegram_config(**session: object) -> TelegramConfig:
+    return TelegramConfig(
+        bot_token="42:TEST",
+        admin_ids=[],
+        bot_username="test_bot",
+        session=BotSessionConfig.model_validate(session),
+    )
+
+
+class TestCreateApiServer:
+    def test_public_api_by_default(self):
+        assert create_api_server(telegram_config()) is PRODUCTION
+
+    def test_self_hosted_server(self):
+        server = create_api_server(
+            telegram_config(api_server="http://bot-api:8081/", api_server_local=True)
+        )
+
+        assert server.api_url("42:TEST", "sendMessage") == (
+            "http://bot-api:8081/bot42:TEST/sendMessage"
+        )
+        assert server.is_local
+
+
+class TestCreateSession:
+    async def test_connector_is_tuned(self):
+        session = create_session(
+            telegram_config(
+                pool_size=16,
+                pool_size_per_host=8,
+                keepalive_timeout=30,
+                dns_cache_ttl=600,
+                request_timeout=20,
+            ),
+            RateLimitConfig(),
+        )
+
+        client = await session.create_session()
+        try:
+            assert await session.create_session() is client
+            assert client.connector is not None
+            assert client.connector.limit == 16
+            assert client.connector.limit_per_host == 8
+        finally:
+            await session.close()
+
+        assert client.closed
+        assert session.timeout == 20
+        assert session.api is PRODUCTION
+
+    def test_global_limit_is_split_between_processes(self):
+        session = create_session(
+            telegram_config(),
+            RateLimitConfig(global_rate=30, global_burst=5),
+            processes=4,
+        )
+
+        assert session._limiter._global._rate == 7.5
+        assert session._limiter._global._capacity == 1.25
+        assert session._limiter._bulk._rate == 6
+
+    def test_burst_stays_at_least_one_call(self):
+        session = create_session(
+            telegram_config(), RateLimitConfig(global_burst=5), processes=10
+        )
+
+        assert session._limiter._global._capacity == 1
@@ -0,0 +1,232 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.infrastructure.telegram import RateLimiter, TokenBucket, bulk_calls
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestTokenBucket:
+    def test_burst_is_free(self, clock: FakeClock):
+        bucket = TokenBucket(rate=10, capacity=3, clock=clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_calls_over_burst_are_spaced(self, clock: FakeClock):
+        bucket = TokenBucket(rate=10, capacity=1, clock=clock)
+
+        delays = [bucket.reserve() for _ in range(3)]
+
+        assert delays == pytest.approx([0, 0.1, 0.2])
+
+    def test_refills_over_time(self, clock: FakeClock):
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+
+        clock.now = 0.1
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1)
+
+    def test_refill_is_capped_by_capacity(self, clock: FakeClock):
+        bucket = TokenBucket(rate=10, capacity=2, clock=clock)
+
+        clock.now = 60
+        delays = [bucket.reserve() for _ in range(3)]
+
+        assert delays == pytest.approx([0, 0, 0.1])
+
+
+class TestRateLimiter:
+    @pytest.fixture
+    def limiter(self, clock: FakeClock) -> RateLimiter:
+        return RateLimiter(
+            global_rate=30,
+            global_burst=30,
+            chat_rate=1,
+            group_rate=0.5,
+            chat_burst=1,
+            clock=clock,
+        )
+
+    @pytest.fixture
+    def sleep(self, clock: FakeClock):
+        async def advance(seconds: float) -> None:
+            clock.now += seconds
+
+        with patch(
+            "src.infrastructure.telegram.rate_limit.asyncio.sleep",
+            new=AsyncMock(side_effect=advance),
+        ) as sleep:
+            yield sleep
+
+    async def test_different_chats_do_not_wait(
+        self, limiter: RateLimiter, sleep: AsyncMock
+    ):
+        for chat_id in range(10):
+            await limiter.acquire(chat_id)
+
+        sleep.assert_not_awaited()
+
+    async def test_same_chat_waits_for_its_limit(
+        self, limiter: RateLimiter, sleep: AsyncMock
+    ):
+        await limiter.acquire(1)
+        await limiter.acquire(1)
+
+        sleep.assert_awaited_once_with(pytest.approx(1))
+
+    async def test_groups_have_stricter_limit(
+        self, limiter: RateLimiter, sleep: AsyncMock
+    ):
+        await limiter.acquire(-100)
+        await limiter.acquire(-100)
+
+        sleep.assert_awaited_once_with(pytest.approx(2))
+
+    async def test_global_limit_applies_without_chat(self, sleep: AsyncMock):
+        limiter = RateLimiter(
+            global_rate=10,
+            global_burst=1,
+            chat_rate=1,
+            group_rate=1,
+            chat_burst=1,
+            clock=FakeClock(),
+        )
+
+        await limiter.acquire()
+        await limiter.acquire()
+
+        sleep.assert_awaited_once_with(pytest.approx(0.1))
+
+    async def test_chat_wait_does_not_hold_global_token(
+        self, clock: FakeClock, sleep: AsyncMock
+    ):
+        limiter = RateLimiter(
+            global_rate=1,
+            global_burst=1,
+            chat_rate=0.5,
+            group_rate=0.5,
+            chat_burst=1,
+            clock=clock,
+        )
+        await limiter.acquire(1)
+
+        async def other_chat_meanwhile(seconds: float) -> None:
+            # Another chat calls while this one waits for its chat
+            if sleep.await_count == 1:
+                await limiter.acquire(2)
+            clock.now += seconds
+
+        sleep.side_effect = other_chat_meanwhile
+        await limiter.acquire(1)
+
+        assert [call.args[0] for call in sleep.await_args_list] == [
+            pytest.approx(2),
+            pytest.approx(1),
+        ]
+
+    async def test_bulk_calls_leave_headroom(self, clock: FakeClock, sleep: AsyncMock):
+        limiter = RateLimiter(
+            global_rate=10,
+            global_burst=1,
+            chat_rate=1,
+            group_rate=1,
+            chat_burst=1,
+            bulk_rate=5,
+            clock=clock,
+        )
+
+        with bulk_calls():
+            await limiter.acquire(1)
+            await limiter.acquire(2)
+        assert clock.now == pytest.approx(0.2)
+
+        # A call answering a user is not queued behind the bulk rate
+        clock.now += 0.1
+        await limiter.acquire(3)
+        assert clock.now == pytest.approx(0.3)
+
+    async def test_bulk_mark_is_reset(self, clock: FakeClock, sleep: AsyncMock):
+        limiter = RateLimiter(
+            global_rate=10,
+            global_burst=10,
+            chat_rate=1,
+            group_rate=1,
+            chat_burst=1,
+            bulk_rate=1,
+            clock=clock,
+        )
+
+        with bulk_calls():
+            await limiter.acquire(1)
+        await limiter.acquire(2)
+
+        sleep.assert_not_awaited()
+
+    async def test_pause_holds_every_caller(
+        self, limiter: RateLimiter, clock: FakeClock, sleep: AsyncMock
+    ):
+        limiter.pause(5)
+        clock.now = 2
+
+        await limiter.acquire(1)
+
+        sleep.assert_awaited_once_with(3)
+
+    async def test_shorter_pause_does_not_shorten_longer_one(
+        self, limiter: RateLimiter, sleep: AsyncMock
+    ):
+        limiter.pause(5)
+        limiter.pause(1)
+
+        await limiter.acquire(1)
+
+        sleep.assert_awaited_once_with(5)
+
+    async def test_pause_started_during_bucket_wait_holds_the_call(
+        self, limiter: RateLimiter, clock: FakeClock, sleep: AsyncMock
+    ):
+        await limiter.acquire(1)
+
+        async def flood_wait_meanwhile(seconds: float) -> None:
+            # Another call hits a flood wait while this one sleeps
+            if clock.now == 0:
+                limiter.pause(5)
+            clock.now += seconds
+
+        sleep.side_effect = flood_wait_meanwhile
+        await limiter.acquire(1)
+
+        assert [call.args[0] for call in sleep.await_args_list] == [
+            pytest.approx(1),
+            pytest.approx(4),
+        ]
+        assert clock.now == pytest.approx(5)
+
+    async def test_pause_extended_during_pause_is_waited_out(
+        self, limiter: RateLimiter, clock: FakeClock, sleep: AsyncMock
+    ):
+        limiter.pause(2)
+
+        async def extend_meanwhile(seconds: float) -> None:
+            if clock.now == 0:
+                limiter.pause(3)
+            clock.now += seconds
+
+        sleep.side_effect = extend_meanwhile
+        await limiter.acquire(1)
+
+        assert clock.now == pytest.approx(3)
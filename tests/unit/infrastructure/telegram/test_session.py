@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock, patch
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import GetUpdates, SendMessage
+import pytest
+
+from src.infrastructure.telegram import RateLimitedSession, RateLimiter
+
+
+def retry_after(method: SendMessage, seconds: int) -> TelegramRetryAfter:
+    return TelegramRetryAfter(
+        method=method, message="Too Many Requests", retry_after=seconds
+    )
+
+
+class TestRateLimitedSession:
+    @pytest.fixture
+    def limiter(self) -> AsyncMock:
+        return AsyncMock(spec=RateLimiter)
+
+    @pytest.fixture
+    def session(self, limiter: AsyncMock) -> RateLimitedSession:
+        return RateLimitedSession(limiter, max_retries=2)
+
+    @pytest.fixture
+    def bot(self, session: RateLimitedSession) -> Bot:
+        return Bot(token="42:TEST", session=session)
+
+    @pytest.fixture
+    def send(self):
+        with patch(
+            "aiogram.client.session.aiohttp.AiohttpSession.make_request",
+            new=AsyncMock(),
+        ) as send:
+            yield send
+
+    async def test_waits_for_chat_limit(
+        self,
+        session: RateLimitedSession,
+        bot: Bot,
+        limiter: AsyncMock,
+        send: AsyncMock,
+    ):
+        send.return_value = "sent"
+        method = SendMessage(chat_id=123, text="hi")
+
+        assert await session.make_request(bot, method) == "sent"
+        limiter.acquire.assert_awaited_once_with(123)
+
+    async def test_get_updates_is_not_limited(
+        self,
+        session: RateLimitedSession,
+        bot: Bot,
+        limiter: AsyncMock,
+        send: AsyncMock,
+    ):
+        await session.make_request(bot, GetUpdates(timeout=30))
+
+        limiter.acquire.assert_not_awaited()
+        send.assert_awaited_once()
+
+    async def test_flood_wait_pauses_and_retries(
+        self,
+        session: RateLimitedSession,
+        bot: Bot,
+        limiter: AsyncMock,
+        send: AsyncMock,
+    ):
+        method = SendMessage(chat_id=123, text="hi")
+        send.side_effect = [retry_after(method, 7), "sent"]
+
+        assert await session.make_request(bot, method) == "sent"
+        limiter.pause.assert_called_once_with(7)
+        assert limiter.acquire.await_count == 2
+
+    async def test_gives_up_after_max_retries(
+        self,
+        session: RateLimitedSession,
+        bot: Bot,
+        limiter: AsyncMock,
+        send: AsyncMock,
+    ):
+        method = SendMessage(chat_id=123, text="hi")
+        send.side_effect = retry_after(method, 1)
+
+        with pytest.raises(TelegramRetryAfter):
+            await session.make_request(bot, method)
+
+        assert send.await_count == 3
+        assert limiter.pause.call_count == 3
@@ -7,10 +7,22 @@ import pytest
 import yaml
 
 from src.infrastructure.config import (
+    ActivityConfig,
     AuthConfig,
+    BotSessionConfig,
     Config,
+    LocaleCacheConfig,
     PostgresConfig,
+    RateLimitConfig,
+    RenderCacheConfig,
+    SchedulerConfig,
+    ShardingConfig,
+    StatsCacheConfig,
+    StatsCountsConfig,
+    StatsRollupConfig,
     TelegramConfig,
+    UserCacheConfig,
+    WebhookConfig,
     load_config,
 )
 
@@ -39,6 +51,29 @@ class TestPostgresConfig:
 
         assert config.echo is False
 
+    def test_pool_default_values(self):
+        config = PostgresConfig(
+            host="localhost", port=5432, user="user", password="pass", db="db"
+        )
+
+        assert config.pool_size == 30
+        assert config.max_overflow == 20
+
+    @pytest.mark.parametrize(
+        "processes,pool_size,max_overflow",
+        [(1, 30, 20), (4, 7, 5), (40, 1, 0)],
+    )
+    def test_split_pool(self, processes, pool_size, max_overflow):
+        config = PostgresConfig(
+            host="localhost", port=5432, user="user", password="pass", db="db"
+        )
+
+        split = config.split(processes)
+
+        assert split.pool_size == pool_size
+        assert split.max_overflow == max_overflow
+        assert split.url == config.url
+
     def test_echo_explicit_value(self):
         config = PostgresConfig(
             host="localhost",
@@ -248,6 +283,210 @@ class TestTelegramConfig:
         assert config.bot_token == expected
 
 
+class TestUserCacheConfig:
+    def test_defaults(self):
+        config = UserCacheConfig()
+
+        assert config.max_size == 10_000
+        assert config.ttl_seconds == 300
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("max_size", 0),
+            ("ttl_seconds", 0),
+            ("ttl_seconds", -1),
+        ],
+    )
+    def test_non_positive_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            UserCacheConfig(**{field: value})
+
+
+class TestRenderCacheConfig:
+    def test_defaults(self):
+        config = RenderCacheConfig()
+
+        assert config.max_size == 10_000
+        assert config.ttl_seconds == 3_600
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("max_size", 0),
+            ("ttl_seconds", 0),
+        ],
+    )
+    def test_non_positive_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            RenderCacheConfig(**{field: value})
+
+
+class TestStatsCacheConfig:
+    def test_defaults(self):
+        config = StatsCacheConfig()
+
+        assert config.ttl_seconds == 60
+        assert config.max_stale_seconds == 86_400
+
+    def test_stale_results_can_be_disabled(self):
+        assert StatsCacheConfig(max_stale_seconds=0).max_stale_seconds == 0
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("ttl_seconds", 0),
+            ("max_stale_seconds", -1),
+        ],
+    )
+    def test_invalid_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            StatsCacheConfig(**{field: value})
+
+
+class TestStatsRollupConfig:
+    def test_defaults(self):
+        assert StatsRollupConfig().interval_seconds == 3_600
+
+    def test_non_positive_interval_rejected(self):
+        with pytest.raises(ValidationError):
+            StatsRollupConfig(interval_seconds=0)
+
+
+class TestStatsCountsConfig:
+    def test_exact_by_default(self):
+        assert not StatsCountsConfig().approximate
+
+
+class TestActivityConfig:
+    def test_defaults(self):
+        config = ActivityConfig()
+
+        assert config.flush_interval_seconds == 5
+        assert config.max_batch_size == 1_000
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("flush_interval_seconds", 0),
+            ("max_batch_size", 0),
+        ],
+    )
+    def test_non_positive_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            ActivityConfig(**{field: value})
+
+
+class TestShardingConfig:
+    def test_defaults(self):
+        config = ShardingConfig()
+
+        assert config.workers == 1
+        assert config.queue_size == 1_000
+        assert config.report_interval_seconds == 60
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("workers", 0),
+            ("queue_size", 0),
+            ("report_interval_seconds", 0),
+        ],
+    )
+    def test_non_positive_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            ShardingConfig(**{field: value})
+
+
+class TestBotSessionConfig:
+    def test_defaults(self):
+        config = BotSessionConfig()
+
+        assert config.pool_size == 100
+        assert config.pool_size_per_host == 0
+        assert config.api_server is None
+        assert config.api_server_local is False
+
+    def test_telegram_config_has_default_session(self):
+        config = TelegramConfig(bot_token="t", admin_ids=[], bot_username="bot")
+
+        assert config.session == BotSessionConfig()
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("pool_size", 0),
+            ("pool_size_per_host", -1),
+            ("keepalive_timeout", 0),
+            ("request_timeout", 0),
+        ],
+    )
+    def test_invalid_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            BotSessionConfig(**{field: value})
+
+
+class TestRateLimitConfig:
+    def test_defaults(self):
+        config = RateLimitConfig()
+
+        assert config.global_rate == 30
+        assert config.chat_rate == 1
+        assert config.group_rate == pytest.approx(1 / 3)
+        assert config.max_retries == 3
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("global_rate", 0),
+            ("chat_rate", 0),
+            ("group_rate", 0),
+            ("global_burst", 0.5),
+            ("max_retries", -1),
+        ],
+    )
+    def test_invalid_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            RateLimitConfig(**{field: value})
+
+
+class TestSchedulerConfig:
+    def test_defaults(self):
+        config = SchedulerConfig()
+
+        assert config.max_concurrency is None
+        assert config.queue_size == 1_000
+        assert config.report_interval_seconds == 60
+
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("max_concurrency", 0),
+            ("queue_size", 0),
+            ("report_interval_seconds", 0),
+        ],
+    )
+    def test_non_positive_values_rejected(self, field, value):
+        with pytest.raises(ValidationError):
+            SchedulerConfig(**{field: value})
+
+
+class TestLocaleCacheConfig:
+    def test_defaults(self):
+        config = LocaleCacheConfig()
+
+        assert config.max_size == 100_000
+        assert config.ttl_seconds == 3_600
+        assert config.notifier == "none"
+
+    def test_postgres_notifier(self):
+        assert LocaleCacheConfig(notifier="postgres").notifier == "postgres"
+
+    def test_unknown_notifier_rejected(self):
+        with pytest.raises(ValidationError):
+            LocaleCacheConfig(notifier="redis")
+
+
 class TestConfig:
     def test_valid_config(self):
         postgres_config = PostgresConfig(
@@ -270,6 +509,65 @@ class TestConfig:
         assert config.postgres == postgres_config
         assert config.auth == auth_config
         assert config.telegram == telegram_config
+        assert config.user_cache == UserCacheConfig()
+        assert config.activity == ActivityConfig()
+        assert config.locale_cache == LocaleCacheConfig()
+        assert config.render_cache == RenderCacheConfig()
+        assert config.stats_cache == StatsCacheConfig()
+        assert config.stats_rollup == StatsRollupConfig()
+        assert config.stats_counts == StatsCountsConfig()
+
+    @staticmethod
+    def _config(**kwargs) -> Config:
+        return Config(
+            postgres=PostgresConfig(
+                host="localhost", port=5432, user="user", password="pass", db="db"
+            ),
+            auth=AuthConfig(
+                secret_key="test_secret_key",
+                algorithm="HS256",
+                access_token_expire_minutes=30,
+            ),
+            telegram=TelegramConfig(
+                bot_token="123456789:ABCdefGHIjklMNOpqrsTUVwxyz",
+                admin_ids=[123456789],
+                bot_username="test_bot",
+            ),
+            **kwargs,
+        )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"sharding": ShardingConfig(workers=2)},
+            {
+                "webhook": WebhookConfig(
+                    url="https://bot.example.com/webhook",
+                    secret_token="s3cret",
+                    workers=4,
+                )
+            },
+        ],
+    )
+    def test_several_workers_require_locale_notifier(self, kwargs):
+        with pytest.raises(ValidationError, match="locale_cache.notifier"):
+            self._config(**kwargs)
+
+        config = self._config(
+            locale_cache=LocaleCacheConfig(notifier="postgres"), **kwargs
+        )
+        assert config.bot_processes > 1
+
+    def test_single_worker_needs_no_notifier(self):
+        assert self._config().bot_processes == 1
+
+    def test_processes_share_database_pool(self):
+        config = self._config()
+
+        shared = config.for_processes(2)
+
+        assert shared.postgres == config.postgres.split(2)
+        assert shared.telegram == config.telegram
 
     @pytest.mark.parametrize(
         "postgres,should_raise",
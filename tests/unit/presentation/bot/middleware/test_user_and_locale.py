@@ -0,0 +1,386 @@
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram import Router
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.types import Message, User
+from dishka.integrations.aiogram import CONTAINER_NAME
+from fluentogram import TranslatorHub, TranslatorRunner
+import pytest
+
+from src.application.user.create import CreateUserInteractor
+from src.application.user.dtos import CreateUserOutputDTO
+from src.application.user.interactors import TouchUserDTO, TouchUserInteractor
+from src.domain.user.vo import LanguageCode, UserId
+from src.infrastructure.cache import (
+    InMemoryLocaleCache,
+    NullLocaleNotifier,
+    TTLCache,
+    UserProfileCache,
+)
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.middleware.user_and_locale import (
+    SKIP_USER,
+    UserAndLocaleMiddleware,
+    UserContext,
+    skip_user_loading,
+)
+
+
+async def handler_with_user_and_i18n(
+    message: Message, user: CreateUserOutputDTO, i18n: TranslatorRunner
+) -> None: ...
+
+
+async def handler_with_i18n(message: Message, i18n: TranslatorRunner) -> None: ...
+
+
+async def handler_without_user(message: Message) -> None: ...
+
+
+class TestUserAndLocaleMiddleware:
+    @pytest.fixture
+    def hub(self) -> TranslatorHub:
+        locales_dir = (
+            Path(__file__).parent.parent.parent.parent.parent.parent / "locales"
+        )
+        return create_translator_hub(locales_dir)
+
+    @pytest.fixture
+    def profile_cache(self) -> UserProfileCache:
+        return UserProfileCache(TTLCache(max_size=10, ttl_seconds=60))
+
+    @pytest.fixture
+    def locale_cache(self) -> InMemoryLocaleCache:
+        return InMemoryLocaleCache(
+            TTLCache(max_size=10, ttl_seconds=60), NullLocaleNotifier()
+        )
+
+    @pytest.fixture
+    def saved_user(self) -> CreateUserOutputDTO:
+        return CreateUserOutputDTO(
+            id=123456,
+            username="testuser",
+            first_name="John",
+            last_name="Doe",
+            language_code="ru",
+            is_new=False,
+        )
+
+    @pytest.fixture
+    def upsert_interactor(self, saved_user: CreateUserOutputDTO) -> AsyncMock:
+        return AsyncMock(return_value=saved_user)
+
+    @pytest.fixture
+    def touch_interactor(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def container(
+        self,
+        hub: TranslatorHub,
+        profile_cache: UserProfileCache,
+        locale_cache: InMemoryLocaleCache,
+        upsert_interactor: AsyncMock,
+        touch_interactor: AsyncMock,
+    ) -> MagicMock:
+        dependencies: dict[type, object] = {
+            TranslatorHub: hub,
+            UserProfileCache: profile_cache,
+            InMemoryLocaleCache: locale_cache,
+            CreateUserInteractor: upsert_interactor,
+            TouchUserInteractor: touch_interactor,
+        }
+        container = MagicMock()
+        container.get = AsyncMock(side_effect=lambda dep_type: dependencies[dep_type])
+        return container
+
+    @pytest.fixture
+    def message(self) -> MagicMock:
+        message = MagicMock(spec=Message)
+        message.from_user = MagicMock(spec=User)
+        message.from_user.id = 123456
+        message.from_user.username = "testuser"
+        message.from_user.first_name = "John"
+        message.from_user.last_name = "Doe"
+        message.from_user.language_code = "en"
+        return message
+
+    def _data(
+        self, container: MagicMock, callback: Any, **flags: Any
+    ) -> dict[str, Any]:
+        return {
+            CONTAINER_NAME: container,
+            "handler": HandlerObject(callback=callback, flags=flags),
+        }
+
+    async def test_loads_declared_user_and_i18n(
+        self,
+        container: MagicMock,
+        message: MagicMock,
+        upsert_interactor: AsyncMock,
+        saved_user: CreateUserOutputDTO,
+    ) -> None:
+        data = self._data(container, handler_with_user_and_i18n)
+        handler = AsyncMock()
+
+        await UserAndLocaleMiddleware()(handler, message, data)
+
+        upsert_interactor.assert_awaited_once()
+        assert data["user"] is saved_user
+        # Saved language wins over the Telegram one
+        assert data["i18n"].translators[0].locale == "ru"
+        handler.assert_awaited_once_with(message, data)
+
+    async def test_i18n_only_handler_gets_no_user(
+        self, container: MagicMock, message: MagicMock
+    ) -> None:
+        data = self._data(container, handler_with_i18n)
+
+        await UserAndLocaleMiddleware()(AsyncMock(), message, data)
+
+        assert "user" not in data
+        assert "i18n" in data
+
+    async def test_undeclared_user_is_not_loaded(
+        self, container: MagicMock, message: MagicMock
+    ) -> None:
+        data = self._data(container, handler_without_user)
+
+        await UserAndLocaleMiddleware()(AsyncMock(), message, data)
+
+        container.get.assert_not_called()
+        assert "user" not in data
+        assert "i18n" not in data
+        assert isinstance(data["user_context"], UserContext)
+
+    async def test_handler_flag_skips_loading(
+        self, container: MagicMock, message: MagicMock
+    ) -> None:
+        data = self._data(container, handler_with_user_and_i18n, **{SKIP_USER: True})
+        handler = AsyncMock()
+
+        await UserAndLocaleMiddleware()(handler, message, data)
+
+        container.get.assert_not_called()
+        assert "user_context" not in data
+        handler.assert_awaited_once()
+
+    async def test_router_marker_skips_loading(
+        self, container: MagicMock, message: MagicMock
+    ) -> None:
+        data = self._data(container, handler_with_user_and_i18n)
+        router = skip_user_loading(Router())
+        handler = AsyncMock()
+
+        (mark_skip_user,) = router.message.outer_middleware
+        await mark_skip_user(
+            lambda event, data: UserAndLocaleMiddleware()(handler, event, data),
+            message,
+            data,
+        )
+
+        container.get.assert_not_called()
+        assert "user_context" not in data
+        assert router.callback_query.outer_middleware[0] is mark_skip_user
+
+    async def test_event_without_sender(self, container: MagicMock) -> None:
+        event = MagicMock(spec=Message)
+        event.from_user = None
+        data = self._data(container, handler_with_user_and_i18n)
+
+        await UserAndLocaleMiddleware()(AsyncMock(), event, data)
+
+        container.get.assert_not_called()
+        assert "user" not in data
+
+
+class TestUserContext:
+    @pytest.fixture
+    def from_user(self) -> MagicMock:
+        from_user = MagicMock(spec=User)
+        from_user.id = 123456
+        from_user.username = None
+        from_user.first_name = "John"
+        from_user.last_name = None
+        from_user.language_code = "ru"
+        return from_user
+
+    @pytest.fixture
+    def user(self) -> CreateUserOutputDTO:
+        return CreateUserOutputDTO(
+            id=123456,
+            username=None,
+            first_name="John",
+            last_name=None,
+            language_code=None,
+            is_new=True,
+        )
+
+    @pytest.fixture
+    def profile_cache(self) -> UserProfileCache:
+        return UserProfileCache(TTLCache(max_size=10, ttl_seconds=60))
+
+    @pytest.fixture
+    def locale_cache(self) -> InMemoryLocaleCache:
+        return InMemoryLocaleCache(
+            TTLCache(max_size=10, ttl_seconds=60), NullLocaleNotifier()
+        )
+
+    @pytest.fixture
+    def upsert_interactor(self, user: CreateUserOutputDTO) -> AsyncMock:
+        return AsyncMock(return_value=user)
+
+    @pytest.fixture
+    def touch_interactor(self) -> AsyncMock:
+        return AsyncMock()
+
+    @pytest.fixture
+    def container(
+        self,
+        profile_cache: UserProfileCache,
+        locale_cache: InMemoryLocaleCache,
+        upsert_interactor: AsyncMock,
+        touch_interactor: AsyncMock,
+    ) -> MagicMock:
+        locales_dir = Path(__file__).parent.parent.parent.parent.parent.parent
+        dependencies: dict[type, object] = {
+            TranslatorHub: create_translator_hub(locales_dir / "locales"),
+            UserProfileCache: profile_cache,
+            InMemoryLocaleCache: locale_cache,
+            CreateUserInteractor: upsert_interactor,
+            TouchUserInteractor: touch_interactor,
+        }
+        container = MagicMock()
+        container.get = AsyncMock(side_effect=lambda dep_type: dependencies[dep_type])
+        return container
+
+    async def test_user_is_loaded_once(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        upsert_interactor: AsyncMock,
+        user: CreateUserOutputDTO,
+    ) -> None:
+        context = UserContext(container, from_user)
+
+        assert await context.get_user() is user
+        assert await context.get_user() is user
+        upsert_interactor.assert_awaited_once()
+
+    async def test_i18n_falls_back_to_telegram_language(
+        self, container: MagicMock, from_user: MagicMock
+    ) -> None:
+        context = UserContext(container, from_user)
+
+        i18n = await context.get_i18n()
+
+        assert i18n.translators[0].locale == "ru"
+        assert await context.get_i18n() is i18n
+
+    async def test_cache_hit_touches_instead_of_upserting(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        profile_cache: UserProfileCache,
+        upsert_interactor: AsyncMock,
+        touch_interactor: AsyncMock,
+        user: CreateUserOutputDTO,
+    ) -> None:
+        profile_cache.put(user)
+        context = UserContext(container, from_user)
+
+        cached = await context.get_user()
+
+        assert cached.id == user.id
+        assert cached.is_new is False
+        upsert_interactor.assert_not_called()
+        touch_interactor.assert_awaited_once_with(TouchUserDTO(user_id=UserId(123456)))
+
+    async def test_cache_miss_fills_cache(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        profile_cache: UserProfileCache,
+    ) -> None:
+        await UserContext(container, from_user).get_user()
+
+        assert profile_cache.stats.size == 1
+
+    async def test_locale_cache_hit_skips_user_loading(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        locale_cache: InMemoryLocaleCache,
+        upsert_interactor: AsyncMock,
+        touch_interactor: AsyncMock,
+    ) -> None:
+        locale_cache.put(123456, "en")
+        context = UserContext(container, from_user)
+
+        i18n = await context.get_i18n()
+
+        assert i18n.translators[0].locale == "en"
+        upsert_interactor.assert_not_called()
+        touch_interactor.assert_awaited_once()
+
+    async def test_locale_and_profile_cache_hits_touch_once(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        locale_cache: InMemoryLocaleCache,
+        profile_cache: UserProfileCache,
+        touch_interactor: AsyncMock,
+        user: CreateUserOutputDTO,
+    ) -> None:
+        locale_cache.put(123456, "en")
+        profile_cache.put(user)
+        context = UserContext(container, from_user)
+
+        await context.get_i18n()
+        await context.get_language()
+        await context.get_user()
+
+        touch_interactor.assert_awaited_once()
+
+    async def test_upserted_user_is_not_touched(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        locale_cache: InMemoryLocaleCache,
+        touch_interactor: AsyncMock,
+    ) -> None:
+        context = UserContext(container, from_user)
+
+        await context.get_user()
+        locale_cache.put(123456, "en")
+        await context.get_language()
+
+        touch_interactor.assert_not_called()
+
+    async def test_saved_language_fills_locale_cache(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        locale_cache: InMemoryLocaleCache,
+        upsert_interactor: AsyncMock,
+        user: CreateUserOutputDTO,
+    ) -> None:
+        upsert_interactor.return_value = replace(user, language_code="ru")
+        context = UserContext(container, from_user)
+
+        assert await context.get_language() == "ru"
+        assert locale_cache.get(UserId(123456)) == LanguageCode("ru")
+
+    async def test_missing_language_is_not_cached(
+        self,
+        container: MagicMock,
+        from_user: MagicMock,
+        locale_cache: InMemoryLocaleCache,
+    ) -> None:
+        context = UserContext(container, from_user)
+
+        assert await context.get_language() is None
+        assert locale_cache.stats.size == 0
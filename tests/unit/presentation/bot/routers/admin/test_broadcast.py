@@ -0,0 +1,271 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.types import CallbackQuery, Chat, Message
+import pytest
+
+from src.application.broadcast import (
+    BroadcastProgress,
+    GetBroadcastInteractor,
+    GetRunningBroadcastsInteractor,
+    RunBroadcastInteractor,
+)
+from src.domain.broadcast import Broadcast, BroadcastStatus
+from src.presentation.bot.jobs import jobs
+from src.presentation.bot.routers.admin.broadcast import (
+    _format_progress,
+    _format_result,
+    cb_send_broadcast,
+    job_key,
+    resume_broadcasts,
+    start_broadcast,
+)
+from src.presentation.bot.utils.admin_cb_data import (
+    BroadcastCBAction,
+    BroadcastCBData,
+)
+from tests.unit.presentation.bot.test_jobs import FakeJobLock, with_job_lock
+
+
+def make_broadcast(**kwargs) -> Broadcast:
+    return Broadcast(id=7, message_key="broadcast-example", created_by=1, **kwargs)
+
+
+def make_container(interactor: object) -> MagicMock:
+    request_container = AsyncMock()
+    request_container.get.return_value = interactor
+    container = MagicMock()
+    container.return_value.__aenter__.return_value = request_container
+    return with_job_lock(container)
+
+
+class TestFormatting:
+    def test_progress(self):
+        progress = BroadcastProgress(
+            broadcast=make_broadcast(delivered=40, blocked=8, failed=2), total=200
+        )
+
+        text = _format_progress(progress)
+
+        assert "Progress: 50/200 (25.0%)" in text
+        assert "Delivered: 40\nBlocked: 8\nFailed: 2" in text
+
+    def test_result(self):
+        text = _format_result(make_broadcast(delivered=3))
+
+        assert text.startswith("Broadcast #7 complete!")
+        assert "Delivered: 3" in text
+
+
+class TestBackgroundRun:
+    async def test_reports_result_to_admin_message(self):
+        completed = make_broadcast(status=BroadcastStatus.COMPLETED, delivered=3)
+
+        async def execute(bot, broadcast_id):
+            yield BroadcastProgress(broadcast=completed, total=3)
+
+        interactor = MagicMock(spec=RunBroadcastInteractor)
+        interactor.execute = execute
+        bot = AsyncMock()
+
+        start_broadcast(bot, make_container(interactor), 7, chat_id=1, message_id=2)
+        await jobs.wait()
+
+        bot.edit_message_text.assert_awaited_once_with(
+            text=_format_result(completed), chat_id=1, message_id=2, reply_markup=None
+        )
+        assert job_key(7) not in jobs
+
+    async def test_stop_cancels_running_broadcasts(self):
+        started = asyncio.Event()
+
+        async def execute(bot, broadcast_id):
+            started.set()
+            await asyncio.sleep(60)
+            yield
+
+        interactor = MagicMock(spec=RunBroadcastInteractor)
+        interactor.execute = execute
+
+        start_broadcast(
+            AsyncMock(), make_container(interactor), 7, chat_id=1, message_id=2
+        )
+        # Starting the same broadcast twice does not send it twice
+        start_broadcast(
+            AsyncMock(), make_container(interactor), 7, chat_id=1, message_id=2
+        )
+        assert len(jobs) == 1
+        await started.wait()
+
+        await jobs.stop()
+        await asyncio.sleep(0)
+
+        assert job_key(7) not in jobs
+
+    async def test_broadcast_sent_by_another_process(self):
+        interactor = MagicMock(spec=RunBroadcastInteractor)
+        lock = FakeJobLock()
+        lock.held.add(job_key(7))
+        container = with_job_lock(make_container(interactor), lock)
+        bot = AsyncMock()
+
+        start_broadcast(bot, container, 7, chat_id=1, message_id=2)
+        await jobs.wait()
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == (
+            "Broadcast #7 is already being sent."
+        )
+
+
+class TestResumeBroadcasts:
+    async def test_resumes_broadcasts_no_process_is_sending(self):
+        sent: list[int] = []
+
+        async def execute(bot, broadcast_id):
+            sent.append(broadcast_id)
+            yield BroadcastProgress(
+                broadcast=make_broadcast(status=BroadcastStatus.COMPLETED), total=0
+            )
+
+        run = MagicMock(spec=RunBroadcastInteractor)
+        run.execute = execute
+        running = AsyncMock(spec=GetRunningBroadcastsInteractor)
+        running.return_value = [
+            Broadcast(id=7, message_key="a", created_by=1),
+            Broadcast(id=8, message_key="b", created_by=1),
+        ]
+        container = make_container(run)
+        request_container = container.return_value.__aenter__.return_value
+        request_container.get.side_effect = lambda cls: (
+            running if cls is GetRunningBroadcastsInteractor else run
+        )
+        lock = FakeJobLock()
+        lock.held.add(job_key(8))
+        bot = AsyncMock()
+
+        await resume_broadcasts(bot, with_job_lock(container, lock))
+        await jobs.wait()
+
+        assert sent == [7]
+        bot.send_message.assert_awaited_once_with(
+            chat_id=1, text="Resuming broadcast #7..."
+        )
+
+
+class TestSendBroadcast:
+    def make_callback(self) -> MagicMock:
+        callback = MagicMock(spec=CallbackQuery)
+        callback.message = MagicMock(spec=Message)
+        callback.message.chat = MagicMock(spec=Chat)
+        callback.message.chat.id = 1
+        callback.message.message_id = 2
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        return callback
+
+    async def send(
+        self,
+        callback: MagicMock,
+        broadcast: Broadcast | None,
+        bot: AsyncMock,
+        wait: bool = True,
+    ) -> None:
+        async def execute(bot, broadcast_id):
+            yield BroadcastProgress(
+                broadcast=make_broadcast(status=BroadcastStatus.COMPLETED), total=0
+            )
+
+        run = MagicMock(spec=RunBroadcastInteractor)
+        run.execute = execute
+        get = AsyncMock(spec=GetBroadcastInteractor, return_value=broadcast)
+        dishka_container = MagicMock()
+        dishka_container.get = AsyncMock(side_effect=lambda cls, component="": get)
+
+        await cb_send_broadcast(
+            callback,
+            BroadcastCBData(action=BroadcastCBAction.SEND, broadcast_id=7),
+            bot,
+            make_container(run),
+            dishka_container=dishka_container,
+        )
+        if wait:
+            await jobs.wait()
+
+    async def test_starts_draft(self):
+        callback = self.make_callback()
+        bot = AsyncMock()
+
+        await self.send(callback, make_broadcast(), bot)
+
+        callback.message.edit_text.assert_awaited_once_with("Starting broadcast #7...")
+        callback.answer.assert_awaited_once_with()
+        assert bot.edit_message_text.await_args.kwargs["text"].startswith(
+            "Broadcast #7 complete!"
+        )
+
+    @pytest.mark.parametrize(
+        "broadcast",
+        [
+            None,
+            make_broadcast(status=BroadcastStatus.COMPLETED),
+            make_broadcast(status=BroadcastStatus.CANCELLED),
+        ],
+    )
+    async def test_finished_broadcast_is_not_started(self, broadcast):
+        callback = self.make_callback()
+
+        await self.send(callback, broadcast, AsyncMock())
+
+        callback.answer.assert_awaited_once_with(
+            "The broadcast has already been sent or cancelled.", show_alert=True
+        )
+        callback.message.edit_text.assert_not_awaited()
+
+    async def test_broadcast_being_sent_is_not_started_again(self):
+        callback = self.make_callback()
+        jobs.start(job_key(7), asyncio.sleep(60))
+
+        try:
+            await self.send(callback, make_broadcast(), AsyncMock(), wait=False)
+        finally:
+            jobs.cancel(job_key(7))
+            await jobs.wait()
+
+        callback.answer.assert_awaited_once_with(
+            "The broadcast is already being sent.", show_alert=True
+        )
+        callback.message.edit_text.assert_not_awaited()
+
+    async def test_double_tap_starts_one_broadcast(self):
+        callback = self.make_callback()
+
+        async def edit_text(text: str) -> None:
+            jobs.start(job_key(7), asyncio.sleep(60))
+
+        callback.message.edit_text.side_effect = edit_text
+
+        try:
+            await self.send(callback, make_broadcast(), AsyncMock(), wait=False)
+        finally:
+            jobs.cancel(job_key(7))
+            await jobs.wait()
+
+        callback.answer.assert_awaited_once_with(
+            "The broadcast is already being sent.", show_alert=True
+        )
+
+    async def test_reports_broadcast_finished_meanwhile(self):
+        async def execute(bot, broadcast_id):
+            return
+            yield
+
+        interactor = MagicMock(spec=RunBroadcastInteractor)
+        interactor.execute = execute
+        bot = AsyncMock()
+
+        start_broadcast(bot, make_container(interactor), 7, chat_id=1, message_id=2)
+        await jobs.wait()
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == (
+            "Broadcast #7 has already finished."
+        )
@@ -0,0 +1,389 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.types import CallbackQuery, Chat, Message, User
+
+from src.application.admin import (
+    CheckAliveInteractor,
+    CheckAliveProgress,
+    CheckAliveResult,
+    Estimate,
+    GetRunningCheckRunsInteractor,
+    SampleEstimate,
+    StartCheckAliveInteractor,
+)
+from src.domain.admin import CheckRun
+from src.presentation.bot.jobs import jobs
+from src.presentation.bot.routers.admin.check_alive import (
+    JOB_KEY,
+    _format_estimate,
+    _format_progress,
+    _format_result,
+    cb_cancel_check_alive,
+    cb_check_alive_handler,
+    cb_resume_check_alive,
+    notify_interrupted_checks,
+)
+from src.presentation.bot.utils.admin_cb_data import (
+    CheckAliveCBData,
+    CheckAliveCBFilter,
+    ResumeCheckAliveCBData,
+)
+from tests.unit.presentation.bot.test_jobs import FakeJobLock, with_job_lock
+
+
+def make_container(interactor: object) -> MagicMock:
+    start = AsyncMock(spec=StartCheckAliveInteractor)
+    start.return_value = CheckRun(id=7, created_by=1)
+    interactors = {StartCheckAliveInteractor: start}
+    request_container = AsyncMock()
+    request_container.get.side_effect = lambda cls: interactors.get(cls, interactor)
+    container = MagicMock()
+    container.return_value.__aenter__.return_value = request_container
+    return with_job_lock(container)
+
+
+def make_callback() -> MagicMock:
+    callback = MagicMock(spec=CallbackQuery)
+    callback.from_user = MagicMock(spec=User)
+    callback.from_user.id = 1
+    callback.message = MagicMock(spec=Message)
+    callback.message.chat = MagicMock(spec=Chat)
+    callback.message.chat.id = 1
+    callback.message.message_id = 2
+    callback.message.edit_text = AsyncMock()
+    callback.answer = AsyncMock()
+    return callback
+
+
+class TestCheckAliveJob:
+    async def test_runs_in_background_and_reports_result(self):
+        result = CheckAliveResult(total=2, alive=2)
+        release = asyncio.Event()
+
+        async def execute(bot, run_id):
+            await release.wait()
+            yield CheckAliveProgress(processed=2, total=2, current_result=result)
+
+        interactor = MagicMock(spec=CheckAliveInteractor)
+        interactor.execute = execute
+        bot = AsyncMock()
+
+        await cb_check_alive_handler(
+            make_callback(),
+            CheckAliveCBData(filter_=CheckAliveCBFilter.ALL),
+            bot,
+            make_container(interactor),
+        )
+
+        # The handler returned while the check is still running
+        assert JOB_KEY in jobs
+        release.set()
+        await jobs.wait()
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == _format_result(result)
+
+    async def test_one_check_at_a_time(self):
+        async def execute(bot, run_id):
+            await asyncio.sleep(60)
+            yield
+
+        interactor = MagicMock(spec=CheckAliveInteractor)
+        interactor.execute = execute
+        container = make_container(interactor)
+        data = CheckAliveCBData(filter_=CheckAliveCBFilter.DAYS_7)
+
+        await cb_check_alive_handler(make_callback(), data, AsyncMock(), container)
+        second = make_callback()
+        await cb_check_alive_handler(second, data, AsyncMock(), container)
+
+        second.answer.assert_awaited_once_with(
+            "An alive check is already running.", show_alert=True
+        )
+        second.message.edit_text.assert_not_awaited()
+
+        await cb_cancel_check_alive(make_callback())
+        await jobs.wait()
+        assert JOB_KEY not in jobs
+
+    async def test_check_started_meanwhile_is_reported(self):
+        """Test a check started while the message was edited wins the race."""
+        container = make_container(MagicMock(spec=CheckAliveInteractor))
+        callback = make_callback()
+        texts: list[str] = []
+
+        async def edit_text(text: str, **kwargs: object) -> None:
+            texts.append(text)
+            if len(texts) == 1:
+                jobs.start(JOB_KEY, asyncio.sleep(60))
+
+        callback.message.edit_text.side_effect = edit_text
+
+        await cb_check_alive_handler(
+            callback,
+            CheckAliveCBData(filter_=CheckAliveCBFilter.ALL),
+            AsyncMock(),
+            container,
+        )
+
+        assert texts[-1] == "An alive check is already running."
+        # No run was created for the check that did not start
+        container.return_value.__aenter__.return_value.get.assert_not_awaited()
+
+        jobs.cancel(JOB_KEY)
+        await jobs.wait()
+
+    async def test_check_running_in_another_process(self):
+        """Test a check running elsewhere keeps this one from creating a run."""
+        lock = FakeJobLock()
+        lock.held.add(JOB_KEY)
+        container = with_job_lock(
+            make_container(MagicMock(spec=CheckAliveInteractor)), lock
+        )
+        bot = AsyncMock()
+
+        await cb_check_alive_handler(
+            make_callback(),
+            CheckAliveCBData(filter_=CheckAliveCBFilter.ALL),
+            bot,
+            container,
+        )
+        await jobs.wait()
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == (
+            "An alive check is already running."
+        )
+        container.return_value.__aenter__.return_value.get.assert_not_awaited()
+
+    async def test_reports_failed_start(self):
+        container = make_container(MagicMock(spec=CheckAliveInteractor))
+        request_container = container.return_value.__aenter__.return_value
+        request_container.get.side_effect = RuntimeError
+        bot = AsyncMock()
+
+        await cb_check_alive_handler(
+            make_callback(),
+            CheckAliveCBData(filter_=CheckAliveCBFilter.ALL),
+            bot,
+            container,
+        )
+        await jobs.wait()
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == (
+            "Alive check could not be started."
+        )
+
+    async def test_cancel_reports_cancellation(self):
+        started = asyncio.Event()
+
+        async def execute(bot, run_id):
+            started.set()
+            await asyncio.sleep(60)
+            yield
+
+        interactor = MagicMock(spec=CheckAliveInteractor)
+        interactor.execute = execute
+        bot = AsyncMock()
+
+        await cb_check_alive_handler(
+            make_callback(),
+            CheckAliveCBData(filter_=CheckAliveCBFilter.ALL),
+            bot,
+            make_container(interactor),
+        )
+        await started.wait()
+        await cb_cancel_check_alive(make_callback())
+        await jobs.wait()
+
+        kwargs = bot.edit_message_text.await_args.kwargs
+        assert kwargs["text"].startswith("Alive check paused.")
+        resume = kwargs["reply_markup"].inline_keyboard[0][0]
+        assert resume.callback_data == ResumeCheckAliveCBData(run_id=7).pack()
+
+    async def test_cancel_without_running_check(self):
+        callback = make_callback()
+
+        await cb_cancel_check_alive(callback)
+
+        callback.answer.assert_awaited_once_with(
+            "The alive check has already finished."
+        )
+
+
+class TestResumeCheckAlive:
+    async def test_resumes_run(self):
+        resumed: list[int] = []
+
+        async def execute(bot, run_id):
+            resumed.append(run_id)
+            yield CheckAliveProgress(
+                processed=0, total=0, current_result=CheckAliveResult()
+            )
+
+        interactor = MagicMock(spec=CheckAliveInteractor)
+        interactor.execute = execute
+        callback = make_callback()
+
+        await cb_resume_check_alive(
+            callback,
+            ResumeCheckAliveCBData(run_id=3),
+            AsyncMock(),
+            make_container(interactor),
+        )
+        await jobs.wait()
+
+        assert resumed == [3]
+        callback.message.edit_text.assert_awaited_once()
+
+    async def test_check_started_meanwhile_is_reported(self):
+        callback = make_callback()
+
+        async def edit_text(text: str, **kwargs: object) -> None:
+            if text == "Resuming alive check...":
+                jobs.start(JOB_KEY, asyncio.sleep(60))
+
+        callback.message.edit_text.side_effect = edit_text
+
+        await cb_resume_check_alive(
+            callback,
+            ResumeCheckAliveCBData(run_id=3),
+            AsyncMock(),
+            make_container(MagicMock(spec=CheckAliveInteractor)),
+        )
+
+        assert callback.message.edit_text.await_args.args == (
+            "An alive check is already running.",
+        )
+
+        jobs.cancel(JOB_KEY)
+        await jobs.wait()
+
+    async def test_finished_run(self):
+        async def execute(bot, run_id):
+            return
+            yield
+
+        interactor = MagicMock(spec=CheckAliveInteractor)
+        interactor.execute = execute
+        bot = AsyncMock()
+
+        await cb_resume_check_alive(
+            make_callback(),
+            ResumeCheckAliveCBData(run_id=3),
+            bot,
+            make_container(interactor),
+        )
+        await jobs.wait()
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == (
+            "This alive check has already finished."
+        )
+
+    async def test_notifies_admins_of_interrupted_runs(self):
+        interactor = AsyncMock(spec=GetRunningCheckRunsInteractor)
+        interactor.return_value = [
+            CheckRun(id=4, created_by=10, last_user_id=500, alive=450, blocked=50)
+        ]
+        bot = AsyncMock()
+
+        await notify_interrupted_checks(bot, make_container(interactor))
+
+        kwargs = bot.send_message.await_args.kwargs
+        assert kwargs["chat_id"] == 10
+        assert kwargs["text"] == "Alive check #4 was interrupted after 500 users."
+        resume = kwargs["reply_markup"].inline_keyboard[0][0]
+        assert resume.callback_data == ResumeCheckAliveCBData(run_id=4).pack()
+
+    async def test_check_running_elsewhere_is_not_interrupted(self):
+        interactor = AsyncMock(spec=GetRunningCheckRunsInteractor)
+        lock = FakeJobLock()
+        lock.held.add(JOB_KEY)
+        bot = AsyncMock()
+
+        await notify_interrupted_checks(
+            bot, with_job_lock(make_container(interactor), lock)
+        )
+
+        interactor.assert_not_awaited()
+        bot.send_message.assert_not_awaited()
+
+
+class TestSampleCheck:
+    async def test_reports_estimate(self):
+        estimate = SampleEstimate(
+            population=50_000,
+            sample_size=1000,
+            alive=Estimate(share=0.8, low=0.775, high=0.823),
+            blocked=Estimate(share=0.15, low=0.129, high=0.174),
+            deleted=Estimate(share=0.05, low=0.038, high=0.065),
+        )
+
+        async def sample(bot, data):
+            yield CheckAliveProgress(
+                processed=1000,
+                total=1000,
+                current_result=CheckAliveResult(total=1000),
+                estimate=estimate,
+            )
+
+        interactor = MagicMock(spec=CheckAliveInteractor)
+        interactor.sample = sample
+        bot = AsyncMock()
+
+        await cb_check_alive_handler(
+            make_callback(),
+            CheckAliveCBData(filter_=CheckAliveCBFilter.SAMPLE),
+            bot,
+            make_container(interactor),
+        )
+        await jobs.wait()
+
+        text = bot.edit_message_text.await_args.kwargs["text"]
+        assert "Checked 1000 of 50000 users" in text
+        assert "Alive: 80.0% (95% CI 77.5% to 82.3%)" in text
+        assert "Blocked bot: 15.0% (95% CI 12.9% to 17.4%)" in text
+
+    async def test_check_started_meanwhile_is_reported(self):
+        callback = make_callback()
+
+        async def edit_text(text: str, **kwargs: object) -> None:
+            if text.startswith("Starting"):
+                jobs.start(JOB_KEY, asyncio.sleep(60))
+
+        callback.message.edit_text.side_effect = edit_text
+
+        await cb_check_alive_handler(
+            callback,
+            CheckAliveCBData(filter_=CheckAliveCBFilter.SAMPLE),
+            AsyncMock(),
+            make_container(MagicMock(spec=CheckAliveInteractor)),
+        )
+
+        assert callback.message.edit_text.await_args.args == (
+            "An alive check is already running.",
+        )
+
+        jobs.cancel(JOB_KEY)
+        await jobs.wait()
+
+    def test_labels_estimated_population(self):
+        estimate = SampleEstimate(
+            population=50_000,
+            sample_size=1000,
+            alive=Estimate(share=1, low=1, high=1),
+            blocked=Estimate(share=0, low=0, high=0),
+            deleted=Estimate(share=0, low=0, high=0),
+            population_estimated=True,
+        )
+
+        assert "Checked 1000 of ~50000 users" in _format_estimate(estimate)
+
+
+class TestProgress:
+    def test_exact_total(self):
+        assert _format_progress(100, 400).endswith("Progress: 100/400 (25.0%)")
+
+    def test_estimated_total(self):
+        assert _format_progress(100, 400, estimated=True).endswith(
+            "Progress: 100/~400 (25.0%)"
+        )
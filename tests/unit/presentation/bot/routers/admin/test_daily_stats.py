@@ -0,0 +1,165 @@
+import asyncio
+from datetime import date
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.types import CallbackQuery, Chat, Message, User
+from fluentogram import TranslatorHub
+
+from src.application.admin import (
+    DailyStatsDTO,
+    GetDailyStatsInteractor,
+    RollupDailyStatsInteractor,
+)
+from src.domain.admin import DailyStats
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.jobs import jobs
+from src.presentation.bot.routers.admin.daily_stats import (
+    LISTED_DAYS,
+    ROLLUP_JOB_KEY,
+    _format_daily_stats,
+    cb_daily_stats,
+    rollup_daily_stats,
+    run_daily_rollups,
+    start_daily_rollups,
+)
+from src.presentation.bot.utils.admin_cb_data import DailyStatsCBData
+
+hub = create_translator_hub()
+en = hub.get_translator_by_locale("en")
+
+
+def plain(text: str) -> str:
+    """Text without the bidi isolation marks Fluent puts around arguments."""
+    return text.replace("\u2068", "").replace("\u2069", "")
+
+
+def make_day(day: int, new_users: int = 2, final: bool = True) -> DailyStatsDTO:
+    return DailyStatsDTO(
+        day=date(2026, 10, day),
+        new_users=new_users,
+        referred_users=1,
+        organic_users=new_users - 1,
+        active_users=4,
+        languages={"en": new_users},
+        final=final,
+    )
+
+
+def make_container(interactor: object) -> MagicMock:
+    request_container = AsyncMock()
+    request_container.get.return_value = interactor
+    container = MagicMock()
+    container.return_value.__aenter__.return_value = request_container
+    return container
+
+
+class TestDailyStatsView:
+    def test_totals_and_days_newest_first(self):
+        text = plain(
+            _format_daily_stats(
+                en, 7, [make_day(16), make_day(17), make_day(18, 4, final=False)]
+            )
+        )
+
+        assert "Last 7 days" in text
+        assert "New users: 8" in text
+        assert "Referred: 3 (37.5%)" in text
+        assert "Languages: en 8" in text
+        assert text.index("today: +4 new") < text.index("2026-10-17: +2 new")
+
+    def test_lists_recent_days_only(self):
+        stats = [make_day(day) for day in range(1, 31)]
+
+        text = plain(_format_daily_stats(en, 30, stats))
+
+        assert text.count(" new, ") == LISTED_DAYS
+        assert "2026-10-01" not in text
+
+    def test_without_rollups(self):
+        assert _format_daily_stats(en, 7, []) == en.get("stats-daily-empty")
+
+    async def test_shows_chosen_period(self):
+        interactor = AsyncMock(spec=GetDailyStatsInteractor)
+        interactor.return_value = [make_day(18, final=False)]
+        dependencies = {
+            TranslatorHub: hub,
+            GetDailyStatsInteractor: interactor,
+        }
+        container = MagicMock()
+        container.get = AsyncMock(
+            side_effect=lambda cls, component="": dependencies[cls]
+        )
+        callback = MagicMock(spec=CallbackQuery)
+        callback.from_user = MagicMock(spec=User)
+        callback.from_user.language_code = "en"
+        callback.message = MagicMock(spec=Message)
+        callback.message.chat = MagicMock(spec=Chat)
+        callback.message.chat.id = 1
+        callback.message.message_id = 2
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+
+        await cb_daily_stats(
+            callback, DailyStatsCBData(days=30), dishka_container=container
+        )
+
+        assert interactor.await_args.args == (30,)
+        assert "Last 30 days" in plain(callback.message.edit_text.await_args.args[0])
+        callback.answer.assert_awaited_once()
+
+        # Back to the overview edits the message directly; coming back to the
+        # same period must edit it again
+        await cb_daily_stats(
+            callback, DailyStatsCBData(days=30), dishka_container=container
+        )
+
+        assert callback.message.edit_text.await_count == 2
+
+
+class TestDailyRollups:
+    async def test_rollup_runs_interactor_in_request_scope(self):
+        stats = [DailyStats(day=date(2026, 10, 18))]
+        interactor = AsyncMock(spec=RollupDailyStatsInteractor, return_value=stats)
+        container = make_container(interactor)
+
+        assert await rollup_daily_stats(container) == stats
+        container.return_value.__aenter__.return_value.get.assert_awaited_once_with(
+            RollupDailyStatsInteractor
+        )
+
+    async def test_keeps_running_after_failure(self, caplog):
+        interactor = AsyncMock(spec=RollupDailyStatsInteractor)
+        runs = 0
+        # Set by the third run, once the second one has been logged
+        third_run = asyncio.Event()
+
+        async def rollup() -> list[DailyStats]:
+            nonlocal runs
+            runs += 1
+            if runs == 1:
+                raise RuntimeError("database is down")
+            if runs == 3:
+                third_run.set()
+            return []
+
+        interactor.side_effect = rollup
+        job = asyncio.create_task(run_daily_rollups(make_container(interactor), 0))
+        with caplog.at_level(logging.INFO):
+            await third_run.wait()
+            job.cancel()
+            await asyncio.gather(job, return_exceptions=True)
+
+        assert "Failed to roll up daily stats" in caplog.text
+        assert "Rolled up daily stats of 0 days" in caplog.text
+
+    async def test_started_as_background_job(self):
+        interactor = AsyncMock(spec=RollupDailyStatsInteractor, return_value=[])
+
+        start_daily_rollups(make_container(interactor), 3600)
+        try:
+            assert ROLLUP_JOB_KEY in jobs
+            await asyncio.sleep(0)
+            interactor.assert_awaited_once()
+        finally:
+            await jobs.stop()
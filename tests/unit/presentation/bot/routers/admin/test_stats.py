@@ -0,0 +1,112 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.types import CallbackQuery, Message, User
+from fluentogram import TranslatorHub
+
+from src.application.referral.stats import StatsOutputDTO, TopReferrerDTO
+from src.infrastructure.cache import AdminStatsCache, Cached
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.routers.admin.stats import (
+    _format_stats,
+    cb_back_to_stats,
+    ref_top_callback,
+    stats_handler,
+)
+
+COMPUTED_AT = datetime(2026, 10, 18, 12, 30, 5, tzinfo=UTC)
+STATS = Cached(
+    value=StatsOutputDTO(
+        total_users=4,
+        referred_count=1,
+        referred_percent=25.0,
+        organic_count=3,
+        organic_percent=75.0,
+    ),
+    computed_at=COMPUTED_AT,
+)
+
+
+def plain(text: str) -> str:
+    """Text without the bidi isolation marks Fluent puts around arguments."""
+    return text.replace("\u2068", "").replace("\u2069", "")
+
+
+def make_container(stats_cache: AdminStatsCache) -> MagicMock:
+    dependencies = {
+        TranslatorHub: create_translator_hub(),
+        AdminStatsCache: stats_cache,
+    }
+    container = MagicMock()
+    container.get = AsyncMock(side_effect=lambda cls, component="": dependencies[cls])
+    return container
+
+
+def make_stats_cache() -> AsyncMock:
+    stats_cache = AsyncMock(spec=AdminStatsCache)
+    stats_cache.get_stats.return_value = STATS
+    stats_cache.get_top_referrers.return_value = Cached(
+        value=[
+            TopReferrerDTO(user_id=1, username="alice", first_name="Alice", count=3)
+        ],
+        computed_at=COMPUTED_AT,
+    )
+    return stats_cache
+
+
+def make_user() -> MagicMock:
+    user = MagicMock(spec=User)
+    user.language_code = "en"
+    return user
+
+
+class TestStats:
+    async def test_shows_when_stats_were_computed(self):
+        message = MagicMock(spec=Message)
+        message.from_user = make_user()
+        message.answer = AsyncMock()
+        stats_cache = make_stats_cache()
+
+        await stats_handler(message, dishka_container=make_container(stats_cache))
+
+        text = plain(message.answer.await_args.kwargs["text"])
+        assert "Total users: 4" in text
+        assert "Updated: 2026-10-18 12:30:05 UTC" in text
+        assert "Estimates" not in text
+        stats_cache.get_stats.assert_awaited_once()
+
+    def test_labels_estimates(self):
+        en = create_translator_hub().get_translator_by_locale("en")
+        stats = replace(STATS, value=replace(STATS.value, estimated=True))
+
+        text = plain(_format_stats(en, stats))
+
+        assert text.endswith(en.get("stats-estimated"))
+
+    async def test_back_to_stats_uses_cache(self):
+        callback = MagicMock(spec=CallbackQuery)
+        callback.from_user = make_user()
+        callback.message = MagicMock(spec=Message)
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+
+        await cb_back_to_stats(
+            callback, dishka_container=make_container(make_stats_cache())
+        )
+
+        text = plain(callback.message.edit_text.await_args.kwargs["text"])
+        assert "Updated: 2026-10-18 12:30:05 UTC" in text
+
+    async def test_top_referrers_use_cache(self):
+        callback = MagicMock(spec=CallbackQuery)
+        callback.from_user = make_user()
+        callback.message = MagicMock(spec=Message)
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        stats_cache = make_stats_cache()
+
+        await ref_top_callback(callback, dishka_container=make_container(stats_cache))
+
+        assert "1. @alice — 3" in callback.message.edit_text.await_args.kwargs["text"]
+        stats_cache.get_top_referrers.assert_awaited_once_with(10)
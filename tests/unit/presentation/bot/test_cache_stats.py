@@ -0,0 +1,86 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.cache import (
+    InMemoryLocaleCache,
+    MessageRenderCache,
+    NullLocaleNotifier,
+    TTLCache,
+    UserProfileCache,
+)
+from src.presentation.bot.cache_stats import (
+    REPORT_JOB_KEY,
+    collect_cache_stats,
+    report_cache_stats,
+    run_cache_reports,
+    start_cache_reports,
+)
+from src.presentation.bot.jobs import jobs
+
+
+def make_container() -> MagicMock:
+    dependencies: dict[type, object] = {
+        UserProfileCache: UserProfileCache(TTLCache(max_size=10, ttl_seconds=60)),
+        InMemoryLocaleCache: InMemoryLocaleCache(
+            TTLCache(max_size=10, ttl_seconds=60), NullLocaleNotifier()
+        ),
+        MessageRenderCache: MessageRenderCache(TTLCache(max_size=10, ttl_seconds=60)),
+    }
+    container = MagicMock()
+    container.get = AsyncMock(side_effect=lambda dep_type: dependencies[dep_type])
+    return container
+
+
+class TestCacheStats:
+    async def test_collects_every_cache(self):
+        container = make_container()
+        locale_cache = await container.get(InMemoryLocaleCache)
+        locale_cache.put(1, "en")
+
+        stats = await collect_cache_stats(container)
+
+        assert set(stats) == {"User profile", "Locale", "Render"}
+        assert stats["Locale"].size == 1
+
+    async def test_report_logs_hit_rates(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.INFO):
+            await report_cache_stats(make_container())
+
+        assert "Locale cache: 0 entries, 0 hits, 0 misses, 0.0% hit rate" in (
+            caplog.text
+        )
+
+    async def test_reports_until_cancelled(self, caplog: pytest.LogCaptureFixture):
+        caches = make_container()
+        reported = asyncio.Event()
+        failed = False
+
+        async def get(dep_type: type) -> object:
+            nonlocal failed
+            if not failed:
+                failed = True
+                raise RuntimeError("boom")
+            if dep_type is MessageRenderCache:
+                reported.set()
+            return await caches.get(dep_type)
+
+        container = MagicMock()
+        container.get = AsyncMock(side_effect=get)
+        job = asyncio.create_task(run_cache_reports(container, 0))
+        with caplog.at_level(logging.INFO):
+            await reported.wait()
+            job.cancel()
+            await asyncio.gather(job, return_exceptions=True)
+
+        assert "Failed to report cache stats" in caplog.text
+        assert "User profile cache: 0 entries" in caplog.text
+
+    async def test_started_as_background_job(self):
+        start_cache_reports(make_container(), 3600)
+        try:
+            assert REPORT_JOB_KEY in jobs
+        finally:
+            await jobs.stop()
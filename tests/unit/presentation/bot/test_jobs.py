@@ -0,0 +1,192 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import EditMessageText
+
+from src.application.interfaces.lock import JobLock
+from src.presentation.bot.jobs import (
+    LEADER_KEY,
+    JobRegistry,
+    ProgressMessage,
+    exclusive,
+    lead,
+)
+
+
+class FakeJobLock(JobLock):
+    """Locks of one process standing in for the Postgres advisory locks."""
+
+    def __init__(self) -> None:
+        self.held: set[str] = set()
+
+    @asynccontextmanager
+    async def hold(self, key: str) -> AsyncIterator[bool]:
+        if key in self.held:
+            yield False
+            return
+
+        self.held.add(key)
+        try:
+            yield True
+        finally:
+            self.held.discard(key)
+
+
+def with_job_lock(container: MagicMock, lock: JobLock | None = None) -> MagicMock:
+    """Let `container` provide a job lock, as the app container does."""
+    container.get = AsyncMock(return_value=lock or FakeJobLock())
+    return container
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestJobRegistry:
+    async def test_one_job_per_key(self):
+        registry = JobRegistry()
+        release = asyncio.Event()
+        runs = 0
+
+        async def job() -> None:
+            nonlocal runs
+            runs += 1
+            await release.wait()
+
+        assert registry.start("check_alive", job())
+        assert not registry.start("check_alive", job())
+        assert "check_alive" in registry
+
+        release.set()
+        await registry.wait()
+        await asyncio.sleep(0)
+
+        assert runs == 1
+        assert "check_alive" not in registry
+        # A finished job frees its key
+        assert registry.start("check_alive", job())
+        await registry.wait()
+
+    async def test_cancel(self):
+        registry = JobRegistry()
+        cancelled = asyncio.Event()
+
+        async def job() -> None:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        registry.start("check_alive", job())
+        await asyncio.sleep(0)
+
+        assert registry.cancel("check_alive")
+        await registry.wait()
+        assert cancelled.is_set()
+        assert not registry.cancel("check_alive")
+
+    async def test_stop_cancels_every_job(self):
+        registry = JobRegistry()
+        registry.start("broadcast-1", asyncio.sleep(60))
+        registry.start("broadcast-2", asyncio.sleep(60))
+
+        await registry.stop()
+        await asyncio.sleep(0)
+
+        assert len(registry) == 0
+
+
+class TestProgressMessage:
+    async def test_updates_are_throttled(self):
+        bot = AsyncMock()
+        clock = FakeClock()
+        message = ProgressMessage(bot, 1, 2, interval=3.0, clock=clock)
+
+        await message.update("10%")
+        clock.now = 1.0
+        await message.update("20%")
+        clock.now = 3.5
+        await message.update("30%")
+
+        texts = [call.kwargs["text"] for call in bot.edit_message_text.await_args_list]
+        assert texts == ["10%", "30%"]
+
+    async def test_finish_is_never_throttled(self):
+        bot = AsyncMock()
+        message = ProgressMessage(bot, 1, 2, interval=3.0, clock=FakeClock())
+
+        await message.update("10%")
+        await message.finish("Done")
+
+        assert bot.edit_message_text.await_args.kwargs["text"] == "Done"
+
+    async def test_edit_errors_are_ignored(self):
+        bot = AsyncMock()
+        bot.edit_message_text.side_effect = TelegramBadRequest(
+            method=EditMessageText(text="Done"),
+            message="Bad Request: message to edit not found",
+        )
+
+        await ProgressMessage(bot, 1, 2).finish("Done")
+
+
+class TestExclusive:
+    async def test_key_is_held_once(self):
+        container = with_job_lock(MagicMock())
+
+        async with exclusive(container, "check_alive") as first:
+            async with exclusive(container, "check_alive") as second:
+                assert (first, second) == (True, False)
+
+        async with exclusive(container, "check_alive") as again:
+            assert again
+
+
+class TestLead:
+    async def test_one_process_leads(self):
+        lock = FakeJobLock()
+        led = asyncio.Event()
+        work = AsyncMock(side_effect=lambda: led.set())
+        follower_work = AsyncMock()
+
+        leader = asyncio.create_task(lead(with_job_lock(MagicMock(), lock), work))
+        await led.wait()
+        follower = asyncio.create_task(
+            lead(with_job_lock(MagicMock(), lock), follower_work, retry_interval=0.01)
+        )
+        await asyncio.sleep(0.05)
+
+        assert LEADER_KEY in lock.held
+        follower_work.assert_not_awaited()
+
+        # The follower takes over once the leader is gone
+        leader.cancel()
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if follower_work.await_count:
+                break
+        follower.cancel()
+        await asyncio.gather(leader, follower, return_exceptions=True)
+
+        work.assert_awaited_once()
+        follower_work.assert_awaited_once()
+
+    async def test_keeps_leading_after_failed_work(self):
+        lock = FakeJobLock()
+        work = AsyncMock(side_effect=RuntimeError)
+
+        leader = asyncio.create_task(lead(with_job_lock(MagicMock(), lock), work))
+        await asyncio.sleep(0.01)
+
+        assert LEADER_KEY in lock.held
+        leader.cancel()
+        await asyncio.gather(leader, return_exceptions=True)
+        assert not lock.held
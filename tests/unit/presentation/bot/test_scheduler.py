@@ -0,0 +1,240 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from aiogram import Bot, Dispatcher
+from aiogram.exceptions import TelegramNetworkError, TelegramRetryAfter
+from aiogram.methods import GetUpdates
+from aiogram.types import Message, Update
+import pytest
+
+from src.presentation.bot.scheduler import (
+    RETRY_DELAY,
+    ChatScheduler,
+    chat_key,
+    poll_updates,
+)
+
+
+def message_update(update_id: int, chat_id: int, text: str = "hi") -> Update:
+    return Update.model_validate(
+        {
+            "update_id": update_id,
+            "message": {
+                "message_id": update_id,
+                "date": 1731441609,
+                "chat": {"id": chat_id, "type": "private", "first_name": "John"},
+                "from": {"id": chat_id, "is_bot": False, "first_name": "John"},
+                "text": text,
+            },
+        }
+    )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestChatKey:
+    def test_message_keyed_by_chat(self):
+        assert chat_key(message_update(1, 123456)) == 123456
+
+    def test_update_without_chat_or_user(self):
+        update = Update.model_validate(
+            {
+                "update_id": 2,
+                "poll": {
+                    "id": "p",
+                    "question": "?",
+                    "options": [],
+                    "total_voter_count": 0,
+                    "is_closed": False,
+                    "is_anonymous": True,
+                    "type": "regular",
+                    "allows_multiple_answers": False,
+                },
+            }
+        )
+        assert chat_key(update) is None
+
+
+class TestChatScheduler:
+    @pytest.fixture
+    def bot(self) -> Bot:
+        return Bot(token="42:TEST")
+
+    async def test_same_chat_is_processed_in_order(self, bot: Bot):
+        dp = Dispatcher()
+        events: list[str] = []
+
+        @dp.message()
+        async def record(message: Message) -> None:
+            events.append(f"start {message.text}")
+            # Yield so a concurrent update would interleave here
+            await asyncio.sleep(0.01)
+            events.append(f"end {message.text}")
+
+        scheduler = ChatScheduler(bot, dp, max_concurrency=4, queue_size=10)
+        for update_id, text in enumerate(["a", "b", "c"]):
+            await scheduler.submit(message_update(update_id, 1, text))
+        await scheduler.wait_closed()
+
+        assert events == ["start a", "end a", "start b", "end b", "start c", "end c"]
+
+    async def test_concurrency_is_bounded(self, bot: Bot):
+        dp = Dispatcher()
+        running = 0
+        peak = 0
+        release = asyncio.Event()
+
+        @dp.message()
+        async def hold(message: Message) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+
+        scheduler = ChatScheduler(bot, dp, max_concurrency=2, queue_size=10)
+        for chat_id in range(5):
+            await scheduler.submit(message_update(chat_id, chat_id))
+        await asyncio.sleep(0.01)
+
+        assert scheduler.stats.running == 2
+        assert scheduler.stats.queued == 3
+
+        release.set()
+        await scheduler.wait_closed()
+        assert peak == 2
+        assert scheduler.stats.running == 0
+        assert scheduler.stats.queued == 0
+
+    async def test_submit_waits_while_full(self, bot: Bot):
+        dp = Dispatcher()
+        release = asyncio.Event()
+
+        @dp.message()
+        async def hold(message: Message) -> None:
+            await release.wait()
+
+        scheduler = ChatScheduler(bot, dp, max_concurrency=4, queue_size=2)
+        await scheduler.submit(message_update(1, 1))
+        await scheduler.submit(message_update(2, 2))
+
+        third = asyncio.create_task(scheduler.submit(message_update(3, 3)))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        release.set()
+        await asyncio.wait_for(third, timeout=5)
+        await scheduler.wait_closed()
+
+    async def test_records_wait_time(self, bot: Bot):
+        dp = Dispatcher()
+        clock = FakeClock()
+
+        @dp.message()
+        async def tick(message: Message) -> None:
+            clock.now += 2
+
+        scheduler = ChatScheduler(
+            bot, dp, max_concurrency=1, queue_size=10, clock=clock
+        )
+        await scheduler.submit(message_update(1, 1))
+        await scheduler.submit(message_update(2, 1))
+        for _ in range(100):
+            await asyncio.sleep(0)
+            if scheduler.stats.started == 2:
+                break
+
+        stats = scheduler.stats
+        assert stats.started == 2
+        # The second update waited while the first one took 2 seconds
+        assert stats.max_wait == 2
+        assert stats.mean_wait == 1
+        await scheduler.wait_closed()
+
+    async def test_failing_update_is_logged_not_raised(
+        self, bot: Bot, caplog: pytest.LogCaptureFixture
+    ):
+        dp = Dispatcher()
+
+        @dp.message()
+        async def fail(message: Message) -> None:
+            raise RuntimeError("boom")
+
+        scheduler = ChatScheduler(bot, dp, max_concurrency=1, queue_size=10)
+        await scheduler.submit(message_update(10001, 1))
+        await scheduler.wait_closed()
+
+        assert "Failed to process update 10001" in caplog.text
+
+    async def test_wait_closed_cancels_stuck_updates(
+        self, bot: Bot, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr("src.presentation.bot.scheduler.SHUTDOWN_TIMEOUT", 0.01)
+        dp = Dispatcher()
+        started = asyncio.Event()
+
+        @dp.message()
+        async def hang(message: Message) -> None:
+            started.set()
+            await asyncio.sleep(60)
+
+        scheduler = ChatScheduler(bot, dp, max_concurrency=1, queue_size=10)
+        await scheduler.submit(message_update(1, 1))
+        await scheduler.submit(message_update(2, 1))
+        await started.wait()
+
+        await scheduler.wait_closed()
+
+        assert not scheduler._tasks
+        assert scheduler.stats.queued == 0
+
+
+class RecordingScheduler:
+    def __init__(self) -> None:
+        self.submitted: list[int] = []
+
+    async def submit(self, update: Update) -> None:
+        self.submitted.append(update.update_id)
+
+
+async def test_poll_updates_submits_in_order():
+    updates = [message_update(i, i) for i in range(3)]
+    bot = AsyncMock(side_effect=[updates, asyncio.CancelledError, []])
+    scheduler = RecordingScheduler()
+
+    with pytest.raises(asyncio.CancelledError):
+        await poll_updates(bot, Dispatcher(), scheduler)  # type: ignore[arg-type]
+
+    assert scheduler.submitted == [0, 1, 2]
+    first, second, confirm = (call.args[0] for call in bot.await_args_list)
+    assert first.offset is None
+    assert second.offset == 3
+    # Accepted updates are confirmed on the way out
+    assert (confirm.offset, confirm.timeout, confirm.limit) == (3, 0, 1)
+
+
+async def test_poll_updates_waits_after_errors():
+    method = GetUpdates()
+    bot = AsyncMock(
+        side_effect=[
+            TelegramRetryAfter(method, "Too Many Requests", retry_after=7),
+            TelegramNetworkError(method, "Connection reset"),
+            asyncio.CancelledError,
+        ]
+    )
+
+    with (
+        patch("src.presentation.bot.scheduler.asyncio.sleep", new=AsyncMock()) as sleep,
+        pytest.raises(asyncio.CancelledError),
+    ):
+        await poll_updates(bot, Dispatcher(), RecordingScheduler())  # type: ignore[arg-type]
+
+    assert [call.args[0] for call in sleep.await_args_list] == [7, RETRY_DELAY]
+    # Nothing was accepted, so there is nothing to confirm
+    assert bot.await_count == 3
@@ -0,0 +1,213 @@
+import logging
+import queue
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.config import Config, ShardingConfig
+from src.presentation.bot.sharded import (
+    MIN_UPTIME,
+    RETRY_DELAY,
+    ThroughputMeter,
+    WorkerPool,
+    dispatch,
+    fetch_updates,
+    routing_key,
+    shard_for,
+)
+
+URL = "https://api.telegram.org/bot42:TEST/getUpdates"
+
+
+def message_update(update_id: int, user_id: int) -> dict[str, Any]:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": 1,
+            "date": 1731441609,
+            "chat": {"id": user_id, "type": "private"},
+            "from": {"id": user_id, "is_bot": False, "first_name": "John"},
+            "text": "hi",
+        },
+    }
+
+
+class TestRouting:
+    def test_message_routed_by_sender(self):
+        assert routing_key(message_update(1, 123456)) == 123456
+
+    def test_callback_query_routed_by_sender(self):
+        update = {
+            "update_id": 2,
+            "callback_query": {"id": "1", "from": {"id": 777}, "data": "x"},
+        }
+        assert routing_key(update) == 777
+
+    def test_member_update_routed_by_chat(self):
+        update = {"update_id": 3, "my_chat_member": {"chat": {"id": -100}}}
+        assert routing_key(update) == -100
+
+    def test_update_without_sender(self):
+        assert routing_key({"update_id": 4, "poll": {"id": "p"}}) == 0
+
+    def test_same_user_always_gets_same_shard(self):
+        shards = {shard_for(message_update(i, 1005), 4) for i in range(10)}
+        assert shards == {1005 % 4}
+
+    def test_users_spread_across_shards(self):
+        shards = {shard_for(message_update(1, user_id), 4) for user_id in range(8)}
+        assert shards == {0, 1, 2, 3}
+
+    def test_admins_go_to_first_shard(self):
+        assert shard_for(message_update(1, 7), 4, admin_ids={7}) == 0
+        assert shard_for(message_update(1, 5), 4, admin_ids={7}) == 1
+
+
+class TestWorkerPool:
+    @pytest.fixture
+    def context(self) -> MagicMock:
+        context = MagicMock()
+        context.Queue.side_effect = lambda maxsize: queue.Queue(maxsize)
+        context.Process.side_effect = lambda **kwargs: MagicMock(
+            name=kwargs["name"], exitcode=1
+        )
+        return context
+
+    @pytest.fixture
+    def pool(self, context: MagicMock) -> WorkerPool:
+        config = MagicMock(spec=Config)
+        config.sharding = ShardingConfig(workers=2, queue_size=1)
+        with patch("src.presentation.bot.sharded.time.monotonic", return_value=0.0):
+            pool = WorkerPool(config, context)
+            pool.start()
+        return pool
+
+    def test_live_worker_is_kept(self, pool: WorkerPool):
+        process = pool._processes[1]
+        process.is_alive.return_value = True
+
+        pool.ensure_alive(1)
+
+        assert pool._processes[1] is process
+
+    def test_exited_worker_is_restarted(self, pool: WorkerPool):
+        process = pool._processes[1]
+        process.is_alive.return_value = False
+
+        with patch(
+            "src.presentation.bot.sharded.time.monotonic", return_value=MIN_UPTIME
+        ):
+            pool.ensure_alive(1)
+
+        assert pool._processes[1] is not process
+        pool._processes[1].start.assert_called_once()
+
+    def test_worker_exiting_right_after_start_fails(self, pool: WorkerPool):
+        pool._processes[0].is_alive.return_value = False
+
+        with (
+            patch("src.presentation.bot.sharded.time.monotonic", return_value=1.0),
+            pytest.raises(RuntimeError, match="exited with code 1 1s after"),
+        ):
+            pool.ensure_alive(0)
+
+    async def test_dispatch_queues_update(self, pool: WorkerPool):
+        pool._processes[0].is_alive.return_value = True
+
+        await dispatch(pool, 0, message_update(1, 2))
+
+        assert pool.queues[0].get_nowait() == message_update(1, 2)
+
+    async def test_dispatch_checks_worker_while_queue_is_full(self, pool: WorkerPool):
+        pool.queues[0].put_nowait(message_update(1, 2))
+        pool._processes[0].is_alive.side_effect = [True, False]
+
+        with (
+            patch("src.presentation.bot.sharded.PUT_TIMEOUT", 0.01),
+            patch("src.presentation.bot.sharded.time.monotonic", return_value=1.0),
+            pytest.raises(RuntimeError),
+        ):
+            await dispatch(pool, 0, message_update(2, 2))
+
+    def test_stop_sends_sentinel_to_live_workers(self, pool: WorkerPool):
+        pool._processes[0].is_alive.return_value = True
+        pool._processes[1].is_alive.return_value = False
+
+        pool.stop()
+
+        assert pool.queues[0].get_nowait() is None
+        assert pool.queues[1].empty()
+        for process in pool._processes:
+            process.join.assert_called_once()
+
+
+class TestThroughputMeter:
+    def test_reports_after_interval(self, caplog: pytest.LogCaptureFixture):
+        with patch("src.presentation.bot.sharded.time.monotonic") as monotonic:
+            monotonic.return_value = 0.0
+            meter = ThroughputMeter("worker 0", interval=10)
+
+            with caplog.at_level(logging.INFO):
+                meter.tick()
+                assert not caplog.records
+
+                monotonic.return_value = 10.0
+                meter.tick()
+
+        assert caplog.messages == ["worker 0: 2 updates in 10s (0.2/s)"]
+
+    def test_report_resets_window(self, caplog: pytest.LogCaptureFixture):
+        with patch("src.presentation.bot.sharded.time.monotonic") as monotonic:
+            monotonic.return_value = 0.0
+            meter = ThroughputMeter("receiver", interval=10)
+            meter.tick()
+
+            monotonic.return_value = 4.0
+            with caplog.at_level(logging.INFO):
+                meter.report()
+                meter.report()
+
+        assert caplog.messages == [
+            "receiver: 1 updates in 4s (0.2/s)",
+            "receiver: 0 updates in 0s (0.0/s)",
+        ]
+
+
+class TestFetchUpdates:
+    def _session(self, payload: dict[str, Any]) -> MagicMock:
+        response = MagicMock()
+        response.json = AsyncMock(return_value=payload)
+        session = MagicMock()
+        session.post.return_value.__aenter__.return_value = response
+        return session
+
+    async def test_returns_raw_updates(self):
+        updates = [message_update(10, 1), message_update(11, 2)]
+        session = self._session({"ok": True, "result": updates})
+
+        result = await fetch_updates(session, URL, 10, ["message"])
+
+        assert result == updates
+        assert session.post.call_args.args[0] == URL
+        assert session.post.call_args.kwargs["json"]["offset"] == 10
+
+    @pytest.mark.parametrize(
+        "parameters,delay",
+        [
+            ({"retry_after": 3}, 3),
+            ({}, RETRY_DELAY),
+        ],
+    )
+    async def test_waits_after_error(self, parameters, delay):
+        session = self._session(
+            {"ok": False, "description": "Too Many Requests", "parameters": parameters}
+        )
+
+        with patch(
+            "src.presentation.bot.sharded.asyncio.sleep", new=AsyncMock()
+        ) as sleep:
+            result = await fetch_updates(session, URL, None, [])
+
+        assert result == []
+        sleep.assert_awaited_once_with(delay)
@@ -0,0 +1,97 @@
+import asyncio
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Message
+from litestar.testing import AsyncTestClient
+import pytest
+
+from src.infrastructure.config import WebhookConfig
+from src.presentation.bot.scheduler import ChatScheduler
+from src.presentation.bot.webhook import SECRET_TOKEN_HEADER, prepare_webhook_app
+
+# Recorded from a real /start delivery
+START_UPDATE: dict[str, Any] = {
+    "update_id": 10001,
+    "message": {
+        "message_id": 42,
+        "date": 1731441609,
+        "chat": {"id": 123456, "type": "private", "first_name": "John"},
+        "from": {
+            "id": 123456,
+            "is_bot": False,
+            "first_name": "John",
+            "username": "john_doe",
+            "language_code": "en",
+        },
+        "text": "/start",
+        "entities": [{"type": "bot_command", "offset": 0, "length": 6}],
+    },
+}
+
+
+class TestWebhookApp:
+    @pytest.fixture
+    def webhook(self) -> WebhookConfig:
+        return WebhookConfig(
+            url="https://bot.example.com/webhook", secret_token="s3cret"
+        )
+
+    @pytest.fixture
+    def bot(self) -> Bot:
+        return Bot(token="42:TEST")
+
+    @pytest.fixture
+    def received(self) -> asyncio.Queue[Message]:
+        return asyncio.Queue()
+
+    @pytest.fixture
+    def dispatcher(self, received: asyncio.Queue[Message]) -> Dispatcher:
+        dp = Dispatcher()
+
+        @dp.message()
+        async def record(message: Message) -> None:
+            received.put_nowait(message)
+
+        return dp
+
+    @pytest.fixture
+    async def client(self, bot: Bot, dispatcher: Dispatcher, webhook: WebhookConfig):
+        scheduler = ChatScheduler(bot, dispatcher, max_concurrency=4, queue_size=10)
+        app = prepare_webhook_app(bot, scheduler, webhook)
+        async with AsyncTestClient(app=app) as client:
+            yield client
+
+    async def test_update_is_fed_to_dispatcher(
+        self, client: AsyncTestClient, received: asyncio.Queue[Message]
+    ) -> None:
+        response = await client.post(
+            "/webhook", json=START_UPDATE, headers={SECRET_TOKEN_HEADER: "s3cret"}
+        )
+
+        assert response.status_code == 200
+        message = await asyncio.wait_for(received.get(), timeout=5)
+        assert message.text == "/start"
+        assert message.from_user is not None
+        assert message.from_user.id == 123456
+
+    @pytest.mark.parametrize("headers", [{}, {SECRET_TOKEN_HEADER: "wrong"}])
+    async def test_wrong_secret_is_rejected(
+        self,
+        client: AsyncTestClient,
+        received: asyncio.Queue[Message],
+        headers: dict[str, str],
+    ) -> None:
+        response = await client.post("/webhook", json=START_UPDATE, headers=headers)
+
+        assert response.status_code == 401
+        assert received.empty()
+
+    async def test_malformed_update_is_rejected(self, client: AsyncTestClient) -> None:
+        response = await client.post(
+            "/webhook",
+            json={"message": "nope"},
+            headers={SECRET_TOKEN_HEADER: "s3cret"},
+        )
+
+        assert response.status_code == 400
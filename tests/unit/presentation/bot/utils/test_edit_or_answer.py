@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import EditMessageText
+from aiogram.types import CallbackQuery, Chat, Message
+import pytest
+
+from src.infrastructure.cache import MessageRenderCache, TTLCache
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.utils import edit_or_answer, render_fingerprint
+from src.presentation.bot.utils.markups import get_settings_keyboard
+
+i18n = create_translator_hub().get_translator_by_locale("en")
+
+
+def bad_request(description: str) -> TelegramBadRequest:
+    return TelegramBadRequest(
+        method=EditMessageText(text="text"), message=f"Bad Request: {description}"
+    )
+
+
+class TestEditOrAnswer:
+    @pytest.fixture
+    def render_cache(self) -> MessageRenderCache:
+        return MessageRenderCache(TTLCache(max_size=10, ttl_seconds=60))
+
+    @pytest.fixture
+    def callback(self) -> MagicMock:
+        callback = MagicMock(spec=CallbackQuery)
+        callback.message = MagicMock(spec=Message)
+        callback.message.chat = MagicMock(spec=Chat)
+        callback.message.chat.id = 1
+        callback.message.message_id = 10
+        callback.message.edit_text = AsyncMock()
+        callback.answer = AsyncMock()
+        return callback
+
+    async def test_skips_identical_edit(self, callback, render_cache):
+        """Test a double tap edits the message once."""
+        keyboard = get_settings_keyboard(i18n)
+
+        await edit_or_answer(callback, "Settings", keyboard, render_cache)
+        await edit_or_answer(callback, "Settings", keyboard, render_cache)
+
+        callback.message.edit_text.assert_awaited_once()
+        callback.answer.assert_not_awaited()
+        assert render_cache.stats.hits == 1
+
+    async def test_edits_changed_content(self, callback, render_cache):
+        await edit_or_answer(callback, "Settings", None, render_cache)
+        await edit_or_answer(
+            callback, "Settings", get_settings_keyboard(i18n), render_cache
+        )
+
+        assert callback.message.edit_text.await_count == 2
+
+    async def test_not_modified_is_not_answered(self, callback, render_cache):
+        """Test an edit Telegram rejects as a no-op is remembered, not resent."""
+        callback.message.edit_text.side_effect = bad_request("message is not modified")
+
+        await edit_or_answer(callback, "Settings", None, render_cache)
+        await edit_or_answer(callback, "Settings", None, render_cache)
+
+        callback.message.edit_text.assert_awaited_once()
+        callback.answer.assert_not_awaited()
+
+    async def test_answers_when_edit_fails(self, callback, render_cache):
+        callback.message.edit_text.side_effect = bad_request("message can't be edited")
+
+        await edit_or_answer(callback, "Settings", None, render_cache)
+        await edit_or_answer(callback, "Settings", None, render_cache)
+
+        assert callback.answer.await_count == 2
+
+    async def test_without_cache_always_edits(self, callback):
+        await edit_or_answer(callback, "Settings")
+        await edit_or_answer(callback, "Settings")
+
+        assert callback.message.edit_text.await_count == 2
+
+    async def test_remembers_sent_message(self, render_cache):
+        message = MagicMock(spec=Message)
+        sent = MagicMock(spec=Message)
+        sent.chat = MagicMock(spec=Chat)
+        sent.chat.id = 1
+        sent.message_id = 11
+        message.answer = AsyncMock(return_value=sent)
+
+        await edit_or_answer(message, "Welcome", None, render_cache)
+
+        assert render_cache.is_rendered(1, 11, render_fingerprint("Welcome", None))
@@ -0,0 +1,97 @@
+from aiogram.methods import SendMessage
+from pydantic import ValidationError
+import pytest
+
+from src.domain.user.vo import LanguageCode
+from src.infrastructure.i18n import create_translator_hub
+from src.presentation.bot.utils.markups import (
+    KeyboardRegistry,
+    get_check_alive_keyboard,
+    get_daily_stats_keyboard,
+    get_language_keyboard,
+    get_settings_keyboard,
+    get_stats_keyboard,
+)
+from src.presentation.bot.utils.markups.registry import locale_of
+from src.presentation.bot.utils.markups.settings import build_settings_keyboard
+
+hub = create_translator_hub()
+en = hub.get_translator_by_locale("en")
+ru = hub.get_translator_by_locale("ru")
+
+
+class TestKeyboardRegistry:
+    def test_builds_once_per_key(self) -> None:
+        registry = KeyboardRegistry()
+        calls = 0
+
+        def build():
+            nonlocal calls
+            calls += 1
+            return build_settings_keyboard(en)
+
+        first = registry.get(("settings", "en"), build)
+        second = registry.get(("settings", "en"), build)
+
+        assert first is second
+        assert calls == 1
+        assert len(registry) == 1
+
+    def test_shared_markup_is_frozen(self) -> None:
+        markup = KeyboardRegistry().get(
+            ("settings", "en"), lambda: build_settings_keyboard(en)
+        )
+
+        with pytest.raises(ValidationError):
+            markup.inline_keyboard = []
+        with pytest.raises(ValidationError):
+            markup.inline_keyboard[0][0].text = "changed"
+
+    def test_frozen_markup_serializes_like_original(self) -> None:
+        original = build_settings_keyboard(en)
+        markup = KeyboardRegistry().get(("settings", "en"), lambda: original)
+
+        assert markup.model_dump() == original.model_dump()
+        assert SendMessage(chat_id=1, text="hi", reply_markup=markup).reply_markup
+
+
+class TestKeyboards:
+    def test_locale_of_fallback_translator(self) -> None:
+        assert locale_of(hub.get_translator_by_locale("de")) == "en"
+
+    def test_same_instance_per_locale(self) -> None:
+        assert get_settings_keyboard(en) is get_settings_keyboard(
+            hub.get_translator_by_locale("en")
+        )
+        assert get_stats_keyboard(ru) is get_stats_keyboard(ru)
+        assert get_check_alive_keyboard() is get_check_alive_keyboard()
+
+    def test_locales_get_own_texts(self) -> None:
+        english = get_settings_keyboard(en)
+        russian = get_settings_keyboard(ru)
+
+        assert english is not russian
+        assert english.inline_keyboard[0][0].text == en.get("btn-language")
+        assert russian.inline_keyboard[0][0].text == ru.get("btn-language")
+
+    def test_daily_stats_keyboard_per_locale(self) -> None:
+        english = get_daily_stats_keyboard(en)
+
+        assert get_daily_stats_keyboard(ru) is not english
+        assert [button.text for button in english.inline_keyboard[0]] == [
+            en.get("stats-daily-period-btn", days=days) for days in (7, 30, 90)
+        ]
+
+    def test_language_keyboard_variant_per_current_language(self) -> None:
+        marked_en = get_language_keyboard(en, LanguageCode("en"))
+        marked_ru = get_language_keyboard(en, LanguageCode("ru"))
+
+        assert marked_en is not marked_ru
+        assert marked_en is get_language_keyboard(en, LanguageCode("en"))
+        assert marked_en.inline_keyboard[0][0].text.endswith(" ✓")
+        assert not marked_ru.inline_keyboard[0][0].text.endswith(" ✓")
+        assert (
+            not get_language_keyboard(en, None)
+            .inline_keyboard[1][0]
+            .text.endswith(" ✓")
+        )
@@ -0,0 +1,22 @@
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.referral.stats import RecountStatsInteractor, StatsOutputDTO
+from src.presentation.cli.recount_stats import recount
+
+
+async def test_recount_runs_interactor_in_request_scope():
+    stats = StatsOutputDTO(
+        total_users=10,
+        referred_count=3,
+        referred_percent=30.0,
+        organic_count=7,
+        organic_percent=70.0,
+    )
+    interactor = AsyncMock(spec=RecountStatsInteractor, return_value=stats)
+    request_container = AsyncMock()
+    request_container.get.return_value = interactor
+    container = MagicMock()
+    container.return_value.__aenter__.return_value = request_container
+
+    assert await recount(container) == stats
+    request_container.get.assert_awaited_once_with(RecountStatsInteractor)